@@ -2,10 +2,16 @@
 
 import os
 import asyncio
+import base64
+import hashlib
 import logging
 import json
-from typing import Any, Optional
-from datetime import datetime
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+from datetime import date, datetime, timedelta
 
 from dotenv import load_dotenv
 
@@ -25,6 +31,7 @@ logger = logging.getLogger(__name__)
 
 # Import Neo4j driver
 from neo4j import GraphDatabase
+from neo4j.exceptions import TransientError
 
 # Import our modules
 from .queries import get_query_templates, format_query_result
@@ -42,6 +49,22 @@ NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "canadagpt2024")
 NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", "neo4j")
 GRAPHQL_SCHEMA_PATH = os.getenv("GRAPHQL_SCHEMA_PATH", "")
 
+# Default result budgets for execute_cypher (overridable per call)
+CYPHER_MAX_ROWS = int(os.getenv("CYPHER_MAX_ROWS", "1000"))
+CYPHER_MAX_BYTES = int(os.getenv("CYPHER_MAX_BYTES", str(2 * 1024 * 1024)))
+CYPHER_TIMEOUT_SECONDS = float(os.getenv("CYPHER_TIMEOUT_SECONDS", "30"))
+
+# Seconds get_database_statistics results are reused
+DB_STATS_TTL_SECONDS = float(os.getenv("DB_STATS_TTL_SECONDS", "60"))
+
+# SPOKE_AT backfill: rows per inner transaction, retries per window, checkpoint directory
+SPOKE_AT_BATCH_ROWS = int(os.getenv("SPOKE_AT_BATCH_ROWS", "5000"))
+SPOKE_AT_MAX_ATTEMPTS = 3
+SPOKE_AT_CHECKPOINT_DIR = os.getenv(
+    "SPOKE_AT_CHECKPOINT_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "canadagpt_neo4j", "spoke_at_backfill")
+)
+
 # Create Neo4j driver instance
 try:
     neo4j_driver = GraphDatabase.driver(
@@ -66,11 +89,65 @@ async def run_sync(func, *args, **kwargs):
     return await asyncio.to_thread(func, *args, **kwargs)
 
 
-def execute_cypher(query: str, parameters: dict = None, allow_writes: bool = False) -> dict:
-    """Execute Cypher query and return results."""
+def _query_fingerprint(query: str, parameters: dict) -> str:
+    payload = json.dumps([query, parameters], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _encode_skip_token(query: str, parameters: dict, offset: int) -> str:
+    token = json.dumps({"q": _query_fingerprint(query, parameters), "o": offset})
+    return base64.urlsafe_b64encode(token.encode("utf-8")).decode("ascii")
+
+
+def _decode_skip_token(token: str, query: str, parameters: dict) -> int:
+    """Return the row offset stored in a skip token issued for this exact query."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+        offset = int(data["o"])
+    except (ValueError, KeyError, TypeError):
+        raise ValueError("Invalid skip_token")
+    if data.get("q") != _query_fingerprint(query, parameters) or offset < 0:
+        raise ValueError("skip_token does not belong to this query and parameters")
+    return offset
+
+
+_ORDER_BY_RE = re.compile(r"\bORDER\s+BY\b", re.IGNORECASE)
+
+
+def _paged_query(query: str) -> str:
+    """Wrap a read query so the server skips the rows of earlier pages."""
+    return f"CALL {{\n{query.strip().rstrip(';')}\n}}\nRETURN * SKIP $__offset LIMIT $__limit"
+
+
+def execute_cypher(
+    query: str,
+    parameters: dict = None,
+    allow_writes: bool = False,
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    timeout_seconds: Optional[float] = None,
+    skip_token: Optional[str] = None,
+) -> dict:
+    """Execute Cypher query and return results within row, byte and time budgets.
+
+    Records are streamed and converted one at a time; once a budget is hit the
+    transaction is rolled back, which cancels the query server-side. Truncated
+    results carry a ``next_skip_token`` that resumes after the last returned
+    row when passed back with the same query and parameters. Later pages run
+    the query as ``CALL { <query> } RETURN * SKIP $__offset LIMIT $__limit``,
+    so earlier rows are skipped server-side and count against neither the
+    budgets nor the wire. Tokens are only issued for queries with an
+    ``ORDER BY``; without one, Neo4j does not guarantee the same row order on
+    the next run and pages could repeat or miss rows.
+    """
     if not neo4j_driver:
         return {"error": "Neo4j driver not initialized"}
 
+    parameters = parameters or {}
+    max_rows = max_rows or CYPHER_MAX_ROWS
+    max_bytes = max_bytes or CYPHER_MAX_BYTES
+    timeout_seconds = timeout_seconds or CYPHER_TIMEOUT_SECONDS
+
     # Safety check for write operations
     query_upper = query.strip().upper()
     is_write_query = any(
@@ -85,159 +162,398 @@ def execute_cypher(query: str, parameters: dict = None, allow_writes: bool = Fal
         }
 
     try:
-        with neo4j_driver.session(database=NEO4J_DATABASE) as session:
-            start_time = datetime.now()
-            result = session.run(query, parameters or {})
-            records = [dict(record) for record in result]
-            execution_time = (datetime.now() - start_time).total_seconds()
+        offset = _decode_skip_token(skip_token, query, parameters) if skip_token else 0
+    except ValueError as e:
+        return {"error": str(e), "query": query, "parameters": parameters}
+    if offset and is_write_query:
+        return {"error": "skip_token paging is only supported for read queries", "query": query}
+
+    records = []
+    total_bytes = 0
+    truncated_by = None
+    has_more = False
+    start_time = time.monotonic()
 
+    try:
+        with neo4j_driver.session(database=NEO4J_DATABASE, fetch_size=min(max_rows + 1, 1000)) as session:
+            tx = session.begin_transaction(timeout=timeout_seconds)
+            try:
+                if offset:
+                    result = tx.run(
+                        _paged_query(query),
+                        {**parameters, "__offset": offset, "__limit": max_rows + 1},
+                    )
+                else:
+                    result = tx.run(query, parameters)
+                for record in result:
+                    if len(records) >= max_rows:
+                        truncated_by, has_more = "rows", True
+                        break
+                    if time.monotonic() - start_time > timeout_seconds:
+                        truncated_by, has_more = "time", True
+                        break
+
+                    row = dict(record)
+                    row_bytes = len(json.dumps(row, default=str))
+                    if records and total_bytes + row_bytes > max_bytes:
+                        truncated_by, has_more = "bytes", True
+                        break
+                    records.append(row)
+                    total_bytes += row_bytes
+
+                if is_write_query:
+                    tx.commit()
+                else:
+                    # Rolling back stops the server from producing the remaining rows
+                    tx.rollback()
+            finally:
+                tx.close()
+    except Exception as e:
+        code = getattr(e, "code", "") or ""
+        if records and ("TransactionTimedOut" in code or "Terminated" in code):
+            truncated_by, has_more = "time", True
+        else:
+            logger.error(f"Query error: {e}")
             return {
-                "records": records,
-                "row_count": len(records),
-                "execution_time_seconds": execution_time,
+                "error": str(e),
                 "query": query,
-                "parameters": parameters or {}
+                "parameters": parameters
             }
-    except Exception as e:
-        logger.error(f"Query error: {e}")
-        return {
-            "error": str(e),
-            "query": query,
-            "parameters": parameters or {}
-        }
+
+    response = {
+        "records": records,
+        "row_count": len(records),
+        "offset": offset,
+        "truncated": truncated_by is not None,
+        "execution_time_seconds": round(time.monotonic() - start_time, 3),
+        "query": query,
+        "parameters": parameters
+    }
+    if truncated_by:
+        response["truncated_by"] = truncated_by
+        response["budget"] = {"max_rows": max_rows, "max_bytes": max_bytes, "timeout_seconds": timeout_seconds}
+        if has_more and not is_write_query:
+            if _ORDER_BY_RE.search(query):
+                response["next_skip_token"] = _encode_skip_token(query, parameters, offset + len(records))
+            else:
+                response["paging"] = "Add an ORDER BY to the query to page through the remaining rows"
+    return response
+
+
+SPOKE_AT_HANSARD_QUERY = """
+MATCH (mp:MP)<-[:MADE_BY]-(s:Statement)-[:PART_OF]->(d:Document)
+WHERE d.date >= $date_from AND d.date <= $date_to
+"""
+
+SPOKE_AT_COMMITTEE_QUERY = """
+MATCH (mp:MP)<-[:TESTIFIED_BY]-(t:CommitteeTestimony)-[:GIVEN_IN]->(e:CommitteeEvidence)
+WHERE e.date >= $date_from AND e.date <= $date_to
+"""
+
+# One relationship per statement/testimony, keyed on a single property
+SPOKE_AT_HANSARD_MERGE = """
+CALL {{
+    WITH mp, s, d
+    MERGE (mp)-[spoke:SPOKE_AT {{statement_id: s.id}}]->(d)
+    SET spoke.timestamp = s.time,
+        spoke.intervention_id = s.intervention_id,
+        spoke.person_db_id = s.person_db_id
+}} IN TRANSACTIONS OF {batch_rows} ROWS
+"""
+
+SPOKE_AT_COMMITTEE_MERGE = """
+CALL {{
+    WITH mp, t, e
+    MERGE (mp)-[spoke:SPOKE_AT {{testimony_id: t.id}}]->(e)
+    SET spoke.intervention_id = t.intervention_id,
+        spoke.person_db_id = t.person_db_id,
+        spoke.timestamp_hour = t.timestamp_hour,
+        spoke.timestamp_minute = t.timestamp_minute
+}} IN TRANSACTIONS OF {batch_rows} ROWS
+"""
+
+_checkpoint_lock = threading.Lock()
+
+
+def _date_windows(date_from: str, date_to: str, window_days: int) -> list[tuple[str, str]]:
+    """Split an inclusive ISO date range into consecutive windows of window_days days."""
+    start = date.fromisoformat(date_from)
+    last = date.fromisoformat(date_to)
+    windows = []
+    while start <= last:
+        end = min(start + timedelta(days=window_days - 1), last)
+        windows.append((start.isoformat(), end.isoformat()))
+        start = end + timedelta(days=1)
+    return windows
+
+
+def _spoke_at_checkpoint_path(date_from: str, date_to: str, window_days: int) -> str:
+    """Checkpoint file for one backfill run (range and window size)."""
+    return os.path.join(SPOKE_AT_CHECKPOINT_DIR, f"{date_from}_{date_to}_{window_days}d.json")
+
+
+def _load_spoke_at_checkpoint(path: str) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"completed": {}}
+
+
+def _save_spoke_at_checkpoint(path: str, checkpoint: dict) -> None:
+    tmp_path = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(tmp_path, "w") as f:
+            json.dump(checkpoint, f, indent=1)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not save SPOKE_AT checkpoint: {e}")
+
+
+def _backfill_spoke_at_window(window_from: str, window_to: str, batch_rows: int) -> dict:
+    """MERGE SPOKE_AT for one date window, committing every batch_rows rows."""
+    params = {"date_from": window_from, "date_to": window_to}
+    counts = {}
+    for key, match_query, merge_query in (
+        ("hansard", SPOKE_AT_HANSARD_QUERY, SPOKE_AT_HANSARD_MERGE),
+        ("committee", SPOKE_AT_COMMITTEE_QUERY, SPOKE_AT_COMMITTEE_MERGE),
+    ):
+        query = match_query + merge_query.format(batch_rows=int(batch_rows))
+        for attempt in range(1, SPOKE_AT_MAX_ATTEMPTS + 1):
+            try:
+                # CALL { } IN TRANSACTIONS requires an auto-commit transaction (session.run)
+                with neo4j_driver.session(database=NEO4J_DATABASE) as session:
+                    summary = session.run(query, params).consume()
+                counts[key] = summary.counters.relationships_created
+                break
+            except TransientError as e:
+                # Concurrent windows can deadlock on shared MP nodes; retrying is safe
+                # because the MERGE is idempotent
+                if attempt == SPOKE_AT_MAX_ATTEMPTS:
+                    raise
+                logger.warning(f"SPOKE_AT window {window_from}..{window_to} retry {attempt}: {e}")
+                time.sleep(attempt)
+    return counts
 
 
 def backfill_spoke_at_relationships(
     date_from: str,
     date_to: str,
-    dry_run: bool = True
+    dry_run: bool = True,
+    window_days: int = 7,
+    max_concurrency: int = 1,
+    resume: bool = True,
+    batch_rows: int = SPOKE_AT_BATCH_ROWS,
+    progress: Optional[Callable[[dict], None]] = None,
 ) -> dict:
-    """Create SPOKE_AT relationships from Statement and CommitteeTestimony nodes."""
+    """
+    Create SPOKE_AT relationships from Statement and CommitteeTestimony nodes.
+
+    The range is processed in windows of window_days days. Each window runs as
+    CALL { } IN TRANSACTIONS so no single transaction holds more than batch_rows
+    rows. Completed windows are recorded in a checkpoint file keyed by the
+    range and window size, so rerunning an interrupted backfill of the same
+    range resumes where it stopped; the checkpoint is removed once every
+    window has succeeded, so a later run of the range starts afresh.
+
+    Args:
+        date_from: Start date (YYYY-MM-DD)
+        date_to: End date (YYYY-MM-DD)
+        dry_run: Only count the relationships that would be merged
+        window_days: Days per window (1 for daily, 7 for weekly)
+        max_concurrency: Windows processed in parallel
+        resume: Skip windows an interrupted run of this range already completed
+        batch_rows: Rows committed per inner transaction
+        progress: Optional callback receiving a progress dict after each window
+
+    Returns:
+        Dict with relationship counts per source, window counts and failures
+    """
     if not neo4j_driver:
         return {"error": "Neo4j driver not initialized"}
 
     try:
-        with neo4j_driver.session(database=NEO4J_DATABASE) as session:
-            # Hansard SPOKE_AT relationships
-            hansard_query = """
-            MATCH (mp:MP)<-[:MADE_BY]-(s:Statement)-[:PART_OF]->(d:Document)
-            WHERE d.date >= $date_from AND d.date <= $date_to
-            """
-
-            if dry_run:
-                count_query = hansard_query + " RETURN count(*) as count"
-                result = session.run(count_query, {"date_from": date_from, "date_to": date_to})
-                hansard_count = result.single()["count"]
-            else:
-                merge_query = hansard_query + """
-                MERGE (mp)-[spoke:SPOKE_AT {
-                    timestamp: s.time,
-                    statement_id: s.id,
-                    intervention_id: s.intervention_id,
-                    person_db_id: s.person_db_id
-                }]->(d)
-                RETURN count(*) as count
-                """
-                result = session.run(merge_query, {"date_from": date_from, "date_to": date_to})
-                hansard_count = result.single()["count"]
-
-            # Committee SPOKE_AT relationships
-            committee_query = """
-            MATCH (mp:MP)<-[:TESTIFIED_BY]-(t:CommitteeTestimony)-[:GIVEN_IN]->(e:CommitteeEvidence)
-            WHERE e.date >= $date_from AND e.date <= $date_to
-            """
-
-            if dry_run:
-                count_query = committee_query + " RETURN count(*) as count"
-                result = session.run(count_query, {"date_from": date_from, "date_to": date_to})
-                committee_count = result.single()["count"]
-            else:
-                merge_query = committee_query + """
-                MERGE (mp)-[spoke:SPOKE_AT {
-                    testimony_id: t.id,
-                    intervention_id: t.intervention_id,
-                    person_db_id: t.person_db_id,
-                    timestamp_hour: t.timestamp_hour,
-                    timestamp_minute: t.timestamp_minute
-                }]->(e)
-                RETURN count(*) as count
-                """
-                result = session.run(merge_query, {"date_from": date_from, "date_to": date_to})
-                committee_count = result.single()["count"]
+        windows = _date_windows(date_from, date_to, max(1, int(window_days)))
+    except ValueError as e:
+        return {"error": f"Invalid date range: {e}"}
 
+    try:
+        if dry_run:
+            params = {"date_from": date_from, "date_to": date_to}
+            with neo4j_driver.session(database=NEO4J_DATABASE) as session:
+                hansard_count = session.run(
+                    SPOKE_AT_HANSARD_QUERY + " RETURN count(*) as count", params
+                ).single()["count"]
+                committee_count = session.run(
+                    SPOKE_AT_COMMITTEE_QUERY + " RETURN count(*) as count", params
+                ).single()["count"]
             return {
-                "dry_run": dry_run,
+                "dry_run": True,
                 "date_from": date_from,
                 "date_to": date_to,
+                "windows": len(windows),
                 "hansard_relationships": hansard_count,
                 "committee_relationships": committee_count,
                 "total_relationships": hansard_count + committee_count,
-                "message": "Dry run - no changes made" if dry_run else "Relationships created successfully"
+                "message": "Dry run - no changes made"
             }
     except Exception as e:
         logger.error(f"Backfill error: {e}")
         return {"error": str(e)}
 
+    window_days = max(1, int(window_days))
+    checkpoint_path = _spoke_at_checkpoint_path(date_from, date_to, window_days)
+    checkpoint = _load_spoke_at_checkpoint(checkpoint_path) if resume else {"completed": {}}
+    completed = checkpoint.setdefault("completed", {})
+    pending = [w for w in windows if f"{w[0]}..{w[1]}" not in completed]
+    skipped = len(windows) - len(pending)
+    if skipped:
+        logger.info(f"SPOKE_AT backfill resuming: {skipped}/{len(windows)} windows already done")
+
+    totals = {"hansard": 0, "committee": 0}
+    failed = []
+    done = 0
+    started = time.time()
+
+    def run_window(window: tuple[str, str]) -> None:
+        nonlocal done
+        key = f"{window[0]}..{window[1]}"
+        try:
+            counts = _backfill_spoke_at_window(window[0], window[1], batch_rows)
+        except Exception as e:
+            logger.error(f"SPOKE_AT window {key} failed: {e}")
+            with _checkpoint_lock:
+                failed.append({"window": key, "error": str(e)})
+            return
+
+        with _checkpoint_lock:
+            completed[key] = {**counts, "completed_at": datetime.now().isoformat()}
+            _save_spoke_at_checkpoint(checkpoint_path, checkpoint)
+            for source, created in counts.items():
+                totals[source] += created
+            done += 1
+            report = {
+                "window": key,
+                "windows_done": done + skipped,
+                "windows_total": len(windows),
+                "hansard_created": counts.get("hansard", 0),
+                "committee_created": counts.get("committee", 0),
+                "elapsed_seconds": round(time.time() - started, 1),
+            }
+        logger.info(
+            f"SPOKE_AT {key}: +{report['hansard_created']} hansard, +{report['committee_created']} committee "
+            f"({report['windows_done']}/{report['windows_total']} windows)"
+        )
+        if progress:
+            progress(report)
+
+    with ThreadPoolExecutor(max_workers=max(1, int(max_concurrency))) as executor:
+        list(executor.map(run_window, pending))
+
+    if not failed:
+        try:
+            os.remove(checkpoint_path)
+        except OSError:
+            pass
+
+    return {
+        "dry_run": False,
+        "date_from": date_from,
+        "date_to": date_to,
+        "windows": len(windows),
+        "windows_completed": done,
+        "windows_skipped": skipped,
+        "windows_failed": failed,
+        "hansard_relationships": totals["hansard"],
+        "committee_relationships": totals["committee"],
+        "total_relationships": totals["hansard"] + totals["committee"],
+        "checkpoint": checkpoint_path if failed else None,
+        "elapsed_seconds": round(time.time() - started, 1),
+        "message": (
+            f"{len(failed)} windows failed - rerun with resume=true to retry them"
+            if failed else "Relationships created successfully"
+        )
+    }
+
+
+STATS_NODE_LABELS = ["MP", "Document", "Statement", "Vote", "Bill", "Committee",
+                     "CommitteeEvidence", "CommitteeTestimony", "Party", "Riding",
+                     "LobbyRegistration", "LobbyCommunication"]
+STATS_REL_TYPES = ["MADE_BY", "SPOKE_AT", "CAST_IN", "TESTIFIED_BY", "REPRESENTS",
+                   "MEMBER_OF", "HELD_MEETING", "HAS_EVIDENCE"]
+STATS_LATEST_DATES = {
+    "hansard": ("Document", "date"),
+    "votes": ("Vote", "date"),
+    "committee_evidence": ("CommitteeEvidence", "date"),
+}
+
+_stats_cache: dict = {"value": None, "at": 0.0}
+
+
+def _build_statistics_query() -> str:
+    """One query whose counts are all answered from the count store.
+
+    Single-label node counts, single-type relationship counts and the
+    unlabelled totals are count-store lookups; latest dates use
+    ORDER BY ... LIMIT 1 so a range index on the date property is used
+    when one exists.
+    """
+    parts = []
+    for i, label in enumerate(STATS_NODE_LABELS):
+        parts.append(f"CALL {{ MATCH (n:`{label}`) RETURN count(n) AS n{i} }}")
+    for i, rel_type in enumerate(STATS_REL_TYPES):
+        parts.append(f"CALL {{ MATCH ()-[r:`{rel_type}`]->() RETURN count(r) AS r{i} }}")
+    parts.append("CALL { MATCH (n) RETURN count(n) AS total_nodes }")
+    parts.append("CALL { MATCH ()-[r]->() RETURN count(r) AS total_relationships }")
+    for key, (label, prop) in STATS_LATEST_DATES.items():
+        parts.append(
+            f"CALL {{ OPTIONAL MATCH (x:`{label}`) WHERE x.{prop} IS NOT NULL "
+            f"WITH x ORDER BY x.{prop} DESC LIMIT 1 RETURN x.{prop} AS latest_{key} }}"
+        )
+    parts.append("RETURN *")
+    return "\n".join(parts)
+
+
+def get_database_statistics(refresh: bool = False) -> dict:
+    """Get comprehensive database statistics.
 
-def get_database_statistics() -> dict:
-    """Get comprehensive database statistics."""
+    All counts come from the count store in a single round trip, so cost does
+    not grow with graph size; results are cached for DB_STATS_TTL_SECONDS.
+    """
     if not neo4j_driver:
         return {"error": "Neo4j driver not initialized"}
 
+    now = time.monotonic()
+    cached = _stats_cache["value"]
+    if cached is not None and not refresh and now - _stats_cache["at"] < DB_STATS_TTL_SECONDS:
+        return {**cached, "cached": True, "cache_age_seconds": round(now - _stats_cache["at"], 1)}
+
     try:
         with neo4j_driver.session(database=NEO4J_DATABASE) as session:
-            # Node counts
-            node_labels = ["MP", "Document", "Statement", "Vote", "Bill", "Committee",
-                          "CommitteeEvidence", "CommitteeTestimony", "Party", "Riding",
-                          "LobbyRegistration", "LobbyCommunication"]
-            node_counts = {}
-            for label in node_labels:
-                result = session.run(f"MATCH (n:{label}) RETURN count(n) as count")
-                node_counts[label] = result.single()["count"]
-
-            # Relationship counts
-            rel_types = ["MADE_BY", "SPOKE_AT", "CAST_IN", "TESTIFIED_BY", "REPRESENTS",
-                        "MEMBER_OF", "HELD_MEETING", "HAS_EVIDENCE"]
-            relationship_counts = {}
-            for rel_type in rel_types:
-                result = session.run(f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count")
-                relationship_counts[rel_type] = result.single()["count"]
-
-            # Storage info
-            storage_query = """
-            MATCH (n)
-            OPTIONAL MATCH ()-[r]->()
-            RETURN count(DISTINCT n) as nodes,
-                   count(DISTINCT r) as relationships,
-                   sum([k IN keys(n) | 1]) as properties
-            """
-            storage_result = session.run(storage_query).single()
-
-            # Latest data dates
-            latest_dates = {}
-            date_queries = {
-                "hansard": "MATCH (d:Document) RETURN max(d.date) as latest_date",
-                "votes": "MATCH (v:Vote) RETURN max(v.date) as latest_date",
-                "committee_evidence": "MATCH (e:CommitteeEvidence) RETURN max(e.date) as latest_date"
-            }
-            for key, query in date_queries.items():
-                result = session.run(query).single()
-                latest_dates[key] = result["latest_date"] if result and result["latest_date"] else "N/A"
-
-            return {
-                "node_counts": node_counts,
-                "relationship_counts": relationship_counts,
-                "storage_info": {
-                    "nodes": storage_result["nodes"],
-                    "relationships": storage_result["relationships"],
-                    "properties": storage_result["properties"]
-                },
-                "latest_data_dates": latest_dates
-            }
+            row = session.run(_build_statistics_query()).single()
+
+        stats = {
+            "node_counts": {label: row[f"n{i}"] for i, label in enumerate(STATS_NODE_LABELS)},
+            "relationship_counts": {rel: row[f"r{i}"] for i, rel in enumerate(STATS_REL_TYPES)},
+            "storage_info": {
+                "nodes": row["total_nodes"],
+                "relationships": row["total_relationships"],
+            },
+            "latest_data_dates": {
+                key: str(row[f"latest_{key}"]) if row[f"latest_{key}"] is not None else "N/A"
+                for key in STATS_LATEST_DATES
+            },
+            "generated_at": datetime.now().isoformat(),
+        }
     except Exception as e:
         logger.error(f"Statistics error: {e}")
         return {"error": str(e)}
 
+    _stats_cache["value"] = stats
+    _stats_cache["at"] = now
+    return {**stats, "cached": False}
+
 
 # MCP Tool Handlers
 
@@ -247,7 +563,7 @@ async def list_tools() -> list[Tool]:
     return [
         Tool(
             name="execute_cypher_query",
-            description="Execute a Cypher query against the Neo4j database. Returns results as JSON with row count and execution time. Write operations require allow_writes=true.",
+            description="Execute a Cypher query against the Neo4j database. Returns results as JSON with row count and execution time. Results are capped by row, byte and time budgets; truncated results of queries with an ORDER BY include next_skip_token to fetch the next page. Write operations require allow_writes=true.",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -264,6 +580,25 @@ async def list_tools() -> list[Tool]:
                         "type": "boolean",
                         "description": "Allow CREATE/MERGE/DELETE operations",
                         "default": False
+                    },
+                    "max_rows": {
+                        "type": "integer",
+                        "description": f"Maximum rows to return (default {CYPHER_MAX_ROWS})",
+                        "minimum": 1
+                    },
+                    "max_bytes": {
+                        "type": "integer",
+                        "description": f"Maximum serialized result size in bytes (default {CYPHER_MAX_BYTES})",
+                        "minimum": 1
+                    },
+                    "timeout_seconds": {
+                        "type": "number",
+                        "description": f"Time budget in seconds (default {CYPHER_TIMEOUT_SECONDS:g})",
+                        "minimum": 0.1
+                    },
+                    "skip_token": {
+                        "type": "string",
+                        "description": "next_skip_token from a previous truncated result, to fetch the next page (the query needs a deterministic ORDER BY)"
                     }
                 },
                 "required": ["query"]
@@ -300,7 +635,7 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="backfill_spoke_at",
-            description="Create SPOKE_AT relationships from Statement and CommitteeTestimony nodes for a date range. Use dry_run=true to preview changes.",
+            description="Create SPOKE_AT relationships from Statement and CommitteeTestimony nodes for a date range, in resumable day/week windows. Use dry_run=true to preview changes.",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -316,6 +651,21 @@ async def list_tools() -> list[Tool]:
                         "type": "boolean",
                         "description": "Preview changes without creating relationships",
                         "default": True
+                    },
+                    "window_days": {
+                        "type": "integer",
+                        "description": "Days per backfill window (1 = daily, 7 = weekly)",
+                        "default": 7
+                    },
+                    "max_concurrency": {
+                        "type": "integer",
+                        "description": "Windows processed in parallel",
+                        "default": 1
+                    },
+                    "resume": {
+                        "type": "boolean",
+                        "description": "Skip windows completed by an interrupted run of the same range and window size (checkpoint)",
+                        "default": True
                     }
                 },
                 "required": ["date_from", "date_to"]
@@ -341,10 +691,16 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="get_database_stats",
-            description="Get comprehensive database statistics including node counts, relationship counts, storage info, and latest data dates.",
+            description="Get comprehensive database statistics including node counts, relationship counts, storage info, and latest data dates. Results are cached briefly.",
             inputSchema={
                 "type": "object",
-                "properties": {}
+                "properties": {
+                    "refresh": {
+                        "type": "boolean",
+                        "description": "Bypass the statistics cache",
+                        "default": False
+                    }
+                }
             }
         ),
         Tool(
@@ -384,7 +740,16 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             parameters = arguments.get("parameters", {})
             allow_writes = arguments.get("allow_writes", False)
 
-            result = await run_sync(execute_cypher, query, parameters, allow_writes)
+            result = await run_sync(
+                execute_cypher,
+                query,
+                parameters,
+                allow_writes,
+                max_rows=arguments.get("max_rows"),
+                max_bytes=arguments.get("max_bytes"),
+                timeout_seconds=arguments.get("timeout_seconds"),
+                skip_token=arguments.get("skip_token"),
+            )
             return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
 
         elif name == "get_cypher_template":
@@ -423,7 +788,15 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             date_to = arguments.get("date_to", "")
             dry_run = arguments.get("dry_run", True)
 
-            result = await run_sync(backfill_spoke_at_relationships, date_from, date_to, dry_run)
+            result = await run_sync(
+                backfill_spoke_at_relationships,
+                date_from,
+                date_to,
+                dry_run,
+                window_days=arguments.get("window_days", 7),
+                max_concurrency=arguments.get("max_concurrency", 1),
+                resume=arguments.get("resume", True),
+            )
             return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
         elif name == "diagnose_mp_linking":
@@ -434,7 +807,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
             return [TextContent(type="text", text=json.dumps(result, indent=2, default=str))]
 
         elif name == "get_database_stats":
-            result = await run_sync(get_database_statistics)
+            result = await run_sync(get_database_statistics, arguments.get("refresh", False))
             return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
         elif name == "check_data_freshness":
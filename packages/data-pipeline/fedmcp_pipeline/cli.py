@@ -2,11 +2,14 @@
 
 import argparse
 import sys
+from datetime import datetime
 from pathlib import Path
+from typing import List, Optional
 
 from .utils.config import Config
 from .utils.neo4j_client import Neo4jClient
 from .utils.progress import logger
+from .utils.stages import COMPLETED, RESUMED, Stage, StageResult, run_stages
 
 from .ingest.parliament import ingest_parliament_data
 from .ingest.lobbying import ingest_lobbying_data
@@ -18,8 +21,115 @@ from .relationships.lobbying import build_lobbying_network
 from .relationships.financial import build_financial_flows
 
 
-def run_full_pipeline(config: Config) -> None:
-    """Run complete data ingestion pipeline."""
+# Concurrent stages in a full pipeline run
+PIPELINE_WORKERS = 4
+
+
+def pipeline_stages(client: Neo4jClient, batch_size: int) -> List[Stage]:
+    """
+    Full pipeline stages with the graph resources each one reads and writes.
+
+    Lobbying and finance ingestion both wait for parliament: lobbying resolves
+    DPOH names against MP nodes (CONTACTED) and links subject matters to Bill
+    nodes (LOBBIED_ON), and finance ingestion resolves expense names against
+    MP nodes. The two then run alongside each other.
+
+    The relationship stages also run concurrently and all MERGE edges onto MP
+    nodes; the deadlocks this can cause are retried by :class:`Neo4jClient`.
+    """
+    return [
+        Stage(
+            "parliament",
+            lambda: ingest_parliament_data(client, batch_size=batch_size),
+            outputs=("MP", "Party", "Riding", "Bill", "Vote", "Committee", "Role"),
+        ),
+        Stage(
+            "lobbying",
+            lambda: ingest_lobbying_data(client, batch_size=batch_size),
+            inputs=("MP", "Bill"),
+            outputs=(
+                "LobbyRegistration", "LobbyCommunication", "Lobbyist", "Organization",
+                "ON_BEHALF_OF", "REGISTERED_FOR", "COMMUNICATION_BY", "CONDUCTED_BY", "CONTACTED", "LOBBIED_ON",
+            ),
+        ),
+        Stage(
+            "finances",
+            lambda: ingest_financial_data(client, batch_size=batch_size),
+            inputs=("MP",),
+            outputs=("Expense",),
+        ),
+        Stage(
+            "political_structure",
+            lambda: build_political_structure(client, batch_size=batch_size),
+            inputs=("MP", "Party", "Riding"),
+            outputs=("MEMBER_OF", "REPRESENTS"),
+        ),
+        Stage(
+            "legislative",
+            lambda: build_legislative_relationships(client, batch_size=batch_size),
+            inputs=("MP", "Bill", "Vote"),
+            outputs=("SPONSORED", "VOTED", "SUBJECT_OF"),
+        ),
+        Stage(
+            "lobbying_network",
+            lambda: build_lobbying_network(client, batch_size=batch_size),
+            inputs=("MP", "LobbyRegistration", "LobbyCommunication", "Lobbyist", "Organization"),
+            outputs=("WORKS_FOR", "REGISTERED_FOR", "ON_BEHALF_OF", "CONTACTED", "MET_WITH"),
+        ),
+        Stage(
+            "financial_flows",
+            lambda: build_financial_flows(client, batch_size=batch_size),
+            inputs=("MP", "Expense"),
+            outputs=("INCURRED",),
+        ),
+    ]
+
+
+def _latest_pipeline_run(client: Neo4jClient) -> Optional[str]:
+    """Run id of the most recent full pipeline run with a completed stage."""
+    result = client.run_query("""
+        MATCH (s:PipelineStage)
+        RETURN s.run_id AS run_id
+        ORDER BY s.completed_at DESC
+        LIMIT 1
+    """)
+    return result[0]["run_id"] if result else None
+
+
+def _completed_stages(client: Neo4jClient, run_id: str) -> set:
+    result = client.run_query("""
+        MATCH (s:PipelineStage {run_id: $run_id, status: $status})
+        RETURN s.name AS name
+    """, {"run_id": run_id, "status": COMPLETED})
+    return {row["name"] for row in result}
+
+
+def _record_stage(client: Neo4jClient, run_id: str, stage: Stage, result: StageResult) -> None:
+    """Persist a completion marker (in the graph, so resume works on ephemeral hosts)."""
+    client.run_query("""
+        MERGE (s:PipelineStage {name: $name})
+        SET s.run_id = $run_id,
+            s.status = $status,
+            s.duration_seconds = $duration,
+            s.outputs = $outputs,
+            s.completed_at = datetime()
+    """, {
+        "name": stage.name,
+        "run_id": run_id,
+        "status": result.status,
+        "duration": round(result.duration_seconds, 1),
+        "outputs": list(stage.outputs),
+    })
+
+
+def run_full_pipeline(config: Config, resume: bool = False, max_workers: int = PIPELINE_WORKERS) -> None:
+    """
+    Run complete data ingestion pipeline.
+
+    Stages run as a DAG (see pipeline_stages): independent stages execute
+    concurrently and a failed stage only skips its downstream stages. With
+    resume=True, stages already completed by the previous run are skipped.
+    """
     logger.info("🚀 Starting FULL PIPELINE")
     logger.info(f"Neo4j URI: {config.neo4j_uri}")
     logger.info(f"Batch size: {config.batch_size:,}")
@@ -29,25 +139,31 @@ def run_full_pipeline(config: Config) -> None:
         # Test connection
         client.test_connection()
 
-        # 1. Parliament data
-        ingest_parliament_data(client, batch_size=config.batch_size)
-
-        # 2. Lobbying data
-        ingest_lobbying_data(client, batch_size=config.batch_size)
+        run_id = _latest_pipeline_run(client) if resume else None
+        done = _completed_stages(client, run_id) if run_id else set()
+        if run_id:
+            logger.info(f"Resuming run {run_id} ({len(done)} stages already complete)")
+        else:
+            run_id = datetime.now().strftime("%Y%m%dT%H%M%S")
+
+        started = datetime.now()
+        results = run_stages(
+            pipeline_stages(client, config.batch_size),
+            max_workers=max_workers,
+            is_complete=lambda stage: stage.name in done,
+            on_complete=lambda stage, result: _record_stage(client, run_id, stage, result),
+        )
+        elapsed = (datetime.now() - started).total_seconds()
 
-        # 3. Financial data
-        ingest_financial_data(client, batch_size=config.batch_size)
-
-        # 4. Build relationships
-        build_political_structure(client, batch_size=config.batch_size)
-        build_legislative_relationships(client, batch_size=config.batch_size)
-        build_lobbying_network(client, batch_size=config.batch_size)
-        build_financial_flows(client, batch_size=config.batch_size)
+        logger.info("=" * 60)
+        logger.info("Stage timings:")
+        for result in results.values():
+            logger.info(f"  {result.name:<20} {result.status:<10} {result.duration_seconds:8.1f}s")
+        logger.info(f"Wall clock: {elapsed:.1f}s")
 
-        # 5. Show final stats
+        # Show final stats
         stats = client.get_stats()
         logger.info("=" * 60)
-        logger.success("✅ FULL PIPELINE COMPLETE")
         logger.info(f"Total nodes: {stats['total_nodes']:,}")
         logger.info(f"Total relationships: {stats['total_relationships']:,}")
         logger.info("")
@@ -60,6 +176,11 @@ def run_full_pipeline(config: Config) -> None:
             logger.info(f"  {rel_type}: {count:,}")
         logger.info("=" * 60)
 
+        unfinished = [r.name for r in results.values() if r.status not in (COMPLETED, RESUMED)]
+        if unfinished:
+            raise RuntimeError(f"Stages not completed: {', '.join(unfinished)} (rerun with --resume to continue)")
+        logger.success("✅ FULL PIPELINE COMPLETE")
+
 
 def run_parliament_only(config: Config) -> None:
     """Run only parliamentary data ingestion."""
@@ -138,6 +259,9 @@ Examples:
   # Run full pipeline (initial load, ~4-6 hours)
   canadagpt-ingest --full
 
+  # Continue a failed/interrupted full run, skipping completed stages
+  canadagpt-ingest --full --resume
+
   # Test connection and show stats
   canadagpt-ingest --test
 
@@ -167,6 +291,10 @@ Examples:
     parser.add_argument("--env-file", type=Path, help="Path to .env file (default: auto-detect)")
     parser.add_argument("--batch-size", type=int, help="Batch size for Neo4j operations (default: 10000)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
+    parser.add_argument("--resume", action="store_true",
+                        help="With --full: skip stages completed by the previous run")
+    parser.add_argument("--workers", type=int, default=PIPELINE_WORKERS,
+                        help=f"With --full: stages run concurrently (default: {PIPELINE_WORKERS})")
 
     args = parser.parse_args()
 
@@ -199,7 +327,7 @@ Examples:
             test_connection(config)
 
         elif args.full:
-            run_full_pipeline(config)
+            run_full_pipeline(config, resume=args.resume, max_workers=args.workers)
 
         elif args.parliament:
             run_parliament_only(config)
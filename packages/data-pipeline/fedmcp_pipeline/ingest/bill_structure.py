@@ -66,6 +66,7 @@ from fedmcp.clients.bill_text_xml import (
 from ..utils.neo4j_client import Neo4jClient
 from ..utils.progress import logger, ProgressTracker
 from .bill_full_text_extractor import extract_continuous_text, validate_extracted_text
+from .parliament_sessions import get_current_session
 
 
 def create_bill_structure_schema(neo4j_client: Neo4jClient) -> None:
@@ -773,6 +774,7 @@ def ingest_bill_structure(
     is_government: bool = False,
     include_all_versions: bool = True,
     include_full_text: bool = True,
+    client: Optional[BillTextXMLClient] = None,
 ) -> Dict[str, Any]:
     """Ingest complete bill structure from Parliament.ca XML.
 
@@ -787,6 +789,8 @@ def ingest_bill_structure(
         is_government: True for government bills
         include_all_versions: If True, fetch and store all available versions
         include_full_text: If True, extract and store full narrative text (en + fr)
+        client: Shared bill XML client (bulk runs pass one so the HTTP
+            session and version cache are reused across bills)
 
     Returns:
         Dictionary with counts for each node type created and full text extraction status
@@ -806,7 +810,7 @@ def ingest_bill_structure(
         return {"error": f"Bill {bill_id} not found"}
 
     # Fetch and parse bill with history
-    client = BillTextXMLClient()
+    client = client or BillTextXMLClient(current_session=get_current_session(neo4j_client))
 
     try:
         bill = client.parse_bill_with_history(
@@ -895,6 +899,10 @@ def ingest_bills_from_list(
     """
     logger.info(f"Ingesting structure for {len(bills)} bills...")
 
+    # One client for the whole run: version lists are cached on disk and
+    # each XML body is only downloaded when it is parsed
+    client = BillTextXMLClient(current_session=get_current_session(neo4j_client))
+
     progress = ProgressTracker(
         total=len(bills),
         desc="Ingesting bill structures",
@@ -944,6 +952,7 @@ def ingest_bills_from_list(
             bill_number=bill_number,
             version=default_version,
             is_government=is_government,
+            client=client,
         )
 
         if "error" in bill_result:
@@ -47,6 +47,7 @@ def create_bill_text_schema(neo4j_client: Neo4jClient) -> None:
     Creates:
         - Unique constraint on BillText.id
         - Index on BillText.docid
+        - Index on Bill.postgres_id
         - Full-text index on text_en
         - Full-text index on text_fr
         - Full-text index on summary_en
@@ -68,6 +69,12 @@ def create_bill_text_schema(neo4j_client: Neo4jClient) -> None:
         FOR (bt:BillText) ON (bt.docid)
     """)
 
+    # Index the Bill key that BillText.bill_id points to (HAS_TEXT joins)
+    neo4j_client.run_query("""
+        CREATE INDEX bill_postgres_id IF NOT EXISTS
+        FOR (b:Bill) ON (b.postgres_id)
+    """)
+
     # Create full-text indexes
     try:
         neo4j_client.run_query("""
@@ -96,14 +103,34 @@ def create_bill_text_schema(neo4j_client: Neo4jClient) -> None:
     logger.info("✅ Bill text schema created")
 
 
+BILL_TEXT_QUERY = """
+    SELECT
+        id,
+        bill_id,
+        docid,
+        created,
+        text_en,
+        text_fr,
+        summary_en
+    FROM bills_billtext
+    WHERE %(after)s IS NULL OR id > %(after)s
+    ORDER BY id
+    LIMIT %(page_size)s
+"""
+
+
 def ingest_bill_texts(
     neo4j_client: Neo4jClient,
     postgres_client: PostgresClient,
     batch_size: int = 1000,
     limit: Optional[int] = None
-) -> int:
+) -> Dict[str, int]:
     """
-    Ingest bill texts from PostgreSQL to Neo4j.
+    Ingest bill texts from PostgreSQL to Neo4j and link them to their bills.
+
+    Rows are streamed in id order with keyset pagination, so only one batch of
+    full texts is in memory at a time. Each batch creates BillText nodes and
+    their HAS_TEXT relationships in the same write.
 
     Creates BillText nodes with properties:
         - id: Primary key from PostgreSQL
@@ -121,74 +148,66 @@ def ingest_bill_texts(
         limit: Optional limit on total records to import
 
     Returns:
-        Number of BillText nodes created
+        Dictionary with counts:
+            - bill_texts: Number of BillText nodes created
+            - has_text_links: Number of HAS_TEXT relationships merged
     """
     logger.info("Ingesting bill texts from PostgreSQL...")
 
-    # Fetch bill texts
-    query = """
-        SELECT
-            id,
-            bill_id,
-            docid,
-            created,
-            text_en,
-            text_fr,
-            summary_en
-        FROM bills_billtext
-        ORDER BY id
-    """
-
+    total = postgres_client.get_table_row_count("bills_billtext")
     if limit:
-        query += f" LIMIT {limit}"
-
-    bill_texts = postgres_client.execute_query(query)
-    logger.info(f"Fetched {len(bill_texts):,} bill texts from PostgreSQL")
+        total = min(total, limit)
 
-    if not bill_texts:
+    if total == 0:
         logger.warning("No bill texts found in PostgreSQL")
-        return 0
+        return {"bill_texts": 0, "has_text_links": 0}
 
-    # Process in batches
     progress = ProgressTracker(
-        total=len(bill_texts),
+        total=total,
         desc="Creating BillText nodes",
         unit="texts"
     )
 
-    total_created = 0
+    # Create BillText nodes and link them by the indexed Bill.postgres_id
+    cypher = """
+    UNWIND $bill_texts AS bt
+    MERGE (text:BillText {id: bt.id})
+    SET text.bill_id = bt.bill_id,
+        text.docid = bt.docid,
+        text.created = datetime(bt.created),
+        text.text_en = bt.text_en,
+        text.text_fr = bt.text_fr,
+        text.summary_en = bt.summary_en
+    WITH text, bt
+    CALL {
+        WITH text, bt
+        MATCH (b:Bill {postgres_id: bt.bill_id})
+        MERGE (b)-[:HAS_TEXT]->(text)
+        RETURN count(b) AS linked
+    }
+    RETURN count(text) AS created, sum(linked) AS linked
+    """
 
-    for i in range(0, len(bill_texts), batch_size):
-        batch = bill_texts[i:i + batch_size]
+    total_created = 0
+    total_linked = 0
 
+    for batch in postgres_client.iter_keyset(BILL_TEXT_QUERY, batch_size=batch_size, limit=limit):
         # Convert timestamps to ISO format
         for text in batch:
             if text.get("created"):
                 text["created"] = text["created"].isoformat()
 
-        # Create BillText nodes
-        cypher = """
-        UNWIND $bill_texts AS bt
-        MERGE (text:BillText {id: bt.id})
-        SET text.bill_id = bt.bill_id,
-            text.docid = bt.docid,
-            text.created = datetime(bt.created),
-            text.text_en = bt.text_en,
-            text.text_fr = bt.text_fr,
-            text.summary_en = bt.summary_en
-        RETURN count(text) as created
-        """
-
         result = neo4j_client.run_query(cypher, {"bill_texts": batch})
-        created = result[0]["created"] if result else 0
-        total_created += created
+        if result:
+            total_created += result[0]["created"]
+            total_linked += result[0]["linked"] or 0
 
         progress.update(len(batch))
 
     progress.close()
-    logger.info(f"✅ Created {total_created:,} BillText nodes")
+    logger.info(f"✅ Created {total_created:,} BillText nodes ({total_linked:,} HAS_TEXT relationships)")
 
-    return total_created
+    return {"bill_texts": total_created, "has_text_links": total_linked}
 
 
 def link_texts_to_bills(
@@ -198,14 +217,17 @@ def link_texts_to_bills(
     """
     Create HAS_TEXT relationships between Bills and BillTexts.
 
-    Matches bills by their PostgreSQL bill_id stored on BillText nodes.
+    ``ingest_bill_texts`` already links texts as it writes them; this pass
+    repairs links for texts whose Bill was imported later. BillTexts are
+    walked once in id order (keyset pagination on the unique id) and matched
+    to bills by the indexed Bill.postgres_id.
 
     Args:
         neo4j_client: Neo4j client instance
-        batch_size: Number of relationships to create per batch
+        batch_size: Number of BillText nodes to process per batch
 
     Returns:
-        Number of HAS_TEXT relationships created
+        Number of HAS_TEXT relationships merged
     """
     logger.info("Creating HAS_TEXT relationships...")
 
@@ -222,38 +244,41 @@ def link_texts_to_bills(
 
     logger.info(f"Found {total:,} BillText nodes to link")
 
-    # Create relationships in batches
     cypher = """
     MATCH (bt:BillText)
-    WHERE bt.bill_id IS NOT NULL
-    WITH bt LIMIT $batch_size
-
-    MATCH (b:Bill)
-    WHERE b.postgres_id = bt.bill_id
-
-    MERGE (b)-[r:HAS_TEXT]->(bt)
-    RETURN count(r) as created
+    WHERE bt.id > $last
+    WITH bt ORDER BY bt.id LIMIT $batch_size
+    WITH collect(bt) AS texts
+    CALL {
+        WITH texts
+        UNWIND texts AS bt
+        MATCH (b:Bill {postgres_id: bt.bill_id})
+        MERGE (b)-[r:HAS_TEXT]->(bt)
+        RETURN count(r) AS created
+    }
+    RETURN size(texts) AS scanned, texts[-1].id AS last, created
     """
 
     progress = ProgressTracker(
         total=total,
         desc="Creating HAS_TEXT relationships",
-        unit="links"
+        unit="texts"
     )
 
     total_created = 0
-    processed = 0
+    last = -1  # BillText ids are positive PostgreSQL serials
 
-    while processed < total:
-        result = neo4j_client.run_query(cypher, {"batch_size": batch_size})
-        created = result[0]["created"] if result else 0
+    while True:
+        result = neo4j_client.run_query(cypher, {"last": last, "batch_size": batch_size})
+        if not result or result[0]["scanned"] == 0:
+            break
 
-        if created == 0:
-            break  # No more relationships to create
+        total_created += result[0]["created"]
+        last = result[0]["last"]
+        progress.update(result[0]["scanned"])
 
-        total_created += created
-        processed += created
-        progress.update(created)
+        if result[0]["scanned"] < batch_size:
+            break
 
     progress.close()
     logger.info(f"✅ Created {total_created:,} HAS_TEXT relationships")
@@ -291,15 +316,12 @@ def ingest_bill_text_sample(
     # Create schema
     create_bill_text_schema(neo4j_client)
 
-    # Import bill texts
-    results["bill_texts"] = ingest_bill_texts(
+    # Import bill texts (linked to bills as they are written)
+    results.update(ingest_bill_texts(
         neo4j_client,
         postgres_client,
         limit=text_limit
-    )
-
-    # Link to bills
-    results["has_text_links"] = link_texts_to_bills(neo4j_client)
+    ))
 
     logger.info("=" * 80)
     logger.info("✅ BILL TEXT SAMPLE IMPORT COMPLETE")
@@ -335,15 +357,12 @@ def ingest_bill_text_full(
     # Create schema
     create_bill_text_schema(neo4j_client)
 
-    # Import all bill texts
-    results["bill_texts"] = ingest_bill_texts(
+    # Import all bill texts (linked to bills as they are written)
+    results.update(ingest_bill_texts(
         neo4j_client,
         postgres_client,
         limit=None
-    )
-
-    # Link to bills
-    results["has_text_links"] = link_texts_to_bills(neo4j_client)
+    ))
 
     logger.info("=" * 80)
     logger.info("✅ BILL TEXT FULL IMPORT COMPLETE")
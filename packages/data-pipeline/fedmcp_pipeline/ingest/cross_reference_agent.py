@@ -113,6 +113,15 @@ class CrossReferenceAgent:
         (r'\b(?:Vote|recorded\s+division)\s+(?:No\.?\s*)?(\d+)', 0.9),
     ]
 
+    # Node label of each entity type's MENTIONS target
+    TARGET_LABELS = {
+        EntityType.BILL: "Bill",
+        EntityType.MP: "MP",
+        EntityType.COMMITTEE: "Committee",
+        EntityType.PETITION: "Petition",
+        EntityType.VOTE: "Vote",
+    }
+
     def __init__(
         self,
         neo4j_client: Optional[Neo4jClient] = None,
@@ -131,11 +140,11 @@ class CrossReferenceAgent:
         self.resolve_entities = resolve_entities
         self.min_confidence = min_confidence
 
-        # Caches for entity resolution
-        self._bill_cache: Dict[str, str] = {}  # "C-234" -> "45-1:C-234"
-        self._mp_cache: Dict[str, str] = {}  # "Poilievre" -> MP node ID
-        self._committee_cache: Dict[str, str] = {}  # "FINA" -> Committee node ID
-        self._petition_cache: Dict[str, str] = {}  # "e-4823" -> Petition node ID
+        # Caches for entity resolution (None = known not to resolve)
+        self._bill_cache: Dict[str, Optional[str]] = {}  # "C-234" -> "45-1:C-234"
+        self._mp_cache: Dict[str, Optional[str]] = {}  # "Poilievre" -> MP node ID
+        self._committee_cache: Dict[str, Optional[str]] = {}  # "FINA" -> Committee node ID
+        self._petition_cache: Dict[str, Optional[str]] = {}  # "e-4823" -> Petition node ID
 
     def extract_mentions(
         self,
@@ -174,11 +183,15 @@ class CrossReferenceAgent:
 
         # Resolve to Neo4j nodes if enabled
         if self.resolve_entities and self.neo4j:
-            for mention in mentions:
-                self._resolve_mention(mention)
+            self.resolve_mentions(mentions)
 
         return mentions
 
+    def resolve_mentions(self, mentions: List[EntityMention]) -> None:
+        """Resolve mentions extracted elsewhere (e.g., in worker processes) to Neo4j nodes."""
+        for mention in mentions:
+            self._resolve_mention(mention)
+
     def _extract_bills(self, text: str, context_window: int) -> List[EntityMention]:
         """Extract bill mentions from text."""
         mentions = []
@@ -350,9 +363,9 @@ class CrossReferenceAgent:
             LIMIT 1
         """, {"code": bill_code})
 
-        if result:
-            mention.normalized_id = result[0]["id"]
-            self._bill_cache[bill_code] = mention.normalized_id
+        # Misses are cached too, so unresolvable codes are only queried once
+        mention.normalized_id = result[0]["id"] if result else None
+        self._bill_cache[bill_code] = mention.normalized_id
 
     def _resolve_mp(self, mention: EntityMention) -> None:
         """Resolve an MP mention to Neo4j node."""
@@ -375,9 +388,8 @@ class CrossReferenceAgent:
                 LIMIT 1
             """, {"riding": riding})
 
-            if result:
-                mention.normalized_id = result[0]["id"]
-                self._mp_cache[cache_key] = mention.normalized_id
+            mention.normalized_id = result[0]["id"] if result else None
+            self._mp_cache[cache_key] = mention.normalized_id
 
         elif name:
             # Check cache
@@ -395,9 +407,8 @@ class CrossReferenceAgent:
                 LIMIT 1
             """, {"name": name})
 
-            if result:
-                mention.normalized_id = result[0]["id"]
-                self._mp_cache[cache_key] = mention.normalized_id
+            mention.normalized_id = result[0]["id"] if result else None
+            self._mp_cache[cache_key] = mention.normalized_id
 
     def _resolve_committee(self, mention: EntityMention) -> None:
         """Resolve a committee mention to Neo4j node."""
@@ -416,9 +427,8 @@ class CrossReferenceAgent:
                 LIMIT 1
             """, {"code": code})
 
-            if result:
-                mention.normalized_id = result[0]["id"]
-                self._committee_cache[cache_key] = mention.normalized_id
+            mention.normalized_id = result[0]["id"] if result else None
+            self._committee_cache[cache_key] = mention.normalized_id
 
         elif name:
             cache_key = f"name:{name}"
@@ -433,9 +443,8 @@ class CrossReferenceAgent:
                 LIMIT 1
             """, {"name": name})
 
-            if result:
-                mention.normalized_id = result[0]["id"]
-                self._committee_cache[cache_key] = mention.normalized_id
+            mention.normalized_id = result[0]["id"] if result else None
+            self._committee_cache[cache_key] = mention.normalized_id
 
     def _resolve_petition(self, mention: EntityMention) -> None:
         """Resolve a petition mention to Neo4j node."""
@@ -463,9 +472,8 @@ class CrossReferenceAgent:
             LIMIT 1
         """, {"number": query_number, "alt_number": petition_number})
 
-        if result:
-            mention.normalized_id = result[0]["id"]
-            self._petition_cache[cache_key] = mention.normalized_id
+        mention.normalized_id = result[0]["id"] if result else None
+        self._petition_cache[cache_key] = mention.normalized_id
 
     def create_mention_relationships(
         self,
@@ -497,28 +505,12 @@ class CrossReferenceAgent:
                 continue
 
             # Determine target label
-            target_label = {
-                EntityType.BILL: "Bill",
-                EntityType.MP: "MP",
-                EntityType.COMMITTEE: "Committee",
-                EntityType.PETITION: "Petition",
-                EntityType.VOTE: "Vote",
-            }.get(mention.entity_type)
+            target_label = self.TARGET_LABELS.get(mention.entity_type)
 
             if not target_label:
                 continue
 
-            # Build relationship properties
-            rel_props = {
-                "confidence": mention.confidence,
-                "raw_text": mention.raw_text,
-                "position": mention.position,
-                **props,
-            }
-
-            # Add entity-specific properties
-            if mention.entity_type == EntityType.BILL and mention.properties.get("bill_code"):
-                rel_props["bill_code"] = mention.properties["bill_code"]
+            rel_props = self._relationship_properties(mention, props)
 
             try:
                 result = self.neo4j.run_query(f"""
@@ -541,6 +533,71 @@ class CrossReferenceAgent:
 
         return created
 
+    @staticmethod
+    def _relationship_properties(mention: EntityMention, props: Dict[str, Any]) -> Dict[str, Any]:
+        """Build MENTIONS relationship properties for a mention."""
+        rel_props = {
+            "confidence": mention.confidence,
+            "raw_text": mention.raw_text,
+            "position": mention.position,
+            **props,
+        }
+
+        # Add entity-specific properties
+        if mention.entity_type == EntityType.BILL and mention.properties.get("bill_code"):
+            rel_props["bill_code"] = mention.properties["bill_code"]
+
+        return rel_props
+
+    def create_mention_relationships_batch(
+        self,
+        source_label: str,
+        items: List[Tuple[str, List[EntityMention], Dict[str, Any]]],
+    ) -> int:
+        """Create MENTIONS relationships for many source nodes with one UNWIND per target label.
+
+        Args:
+            source_label: Label of the source nodes ("Statement", "CommitteeTestimony")
+            items: (source_id, mentions, properties) per source node; only
+                resolved mentions are used
+
+        Returns:
+            Number of relationships created or updated
+        """
+        if not self.neo4j:
+            return 0
+
+        # One row per (source, target); a later mention of the same target wins,
+        # as with create_mention_relationships
+        rows_by_label: Dict[str, Dict[Tuple[str, str], Dict[str, Any]]] = {}
+        for source_id, mentions, props in items:
+            for mention in mentions:
+                target_label = self.TARGET_LABELS.get(mention.entity_type)
+                if not mention.normalized_id or not target_label:
+                    continue
+                rows_by_label.setdefault(target_label, {})[(source_id, mention.normalized_id)] = {
+                    "source_id": source_id,
+                    "target_id": mention.normalized_id,
+                    "props": self._relationship_properties(mention, props or {}),
+                }
+
+        created = 0
+        for target_label, rows in rows_by_label.items():
+            try:
+                result = self.neo4j.run_query(f"""
+                    UNWIND $rows AS row
+                    MATCH (src:{source_label} {{id: row.source_id}})
+                    MATCH (tgt:{target_label} {{id: row.target_id}})
+                    MERGE (src)-[r:MENTIONS]->(tgt)
+                    SET r += row.props
+                    RETURN count(r) AS created
+                """, {"rows": list(rows.values())})
+                created += result[0]["created"] if result else 0
+            except Exception as e:
+                logger.warning(f"Failed to create {target_label} MENTIONS relationships: {e}")
+
+        return created
+
     def process_statement(
         self,
         statement_id: str,
@@ -1,10 +1,19 @@
-"""Financial data ingestion: MP expenses, contracts, grants, donations."""
+"""Financial data ingestion: MP expenses, contracts, grants, donations.
 
+Expense ingestion is incremental per quarter: every Expense node stores a
+``quarter_hash`` of the rows built for its (source, fiscal year, quarter), so a
+run fetches all quarters concurrently but only writes quarters that are new or
+revised. MP ids are resolved in Python with :class:`MPNameIndex` and INCURRED is
+merged in the same UNWIND that writes the Expense node.
+"""
+
+import hashlib
+import json
 import sys
-import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Add fedmcp package to path
 FEDMCP_PATH = Path(__file__).parent.parent.parent.parent / "fedmcp" / "src"
@@ -13,88 +22,242 @@ sys.path.insert(0, str(FEDMCP_PATH))
 from fedmcp.clients.expenditure import MPExpenditureClient
 from fedmcp.clients.house_officers import HouseOfficersClient
 
+from ..utils.mp_names import MPNameIndex
 from ..utils.neo4j_client import Neo4jClient
 from ..utils.progress import logger
 
 
-# Common nickname mappings for Canadian MPs
-NICKNAME_MAPPING = {
-    'bobby': 'robert',
-    'rob': 'robert',
-    'bob': 'robert',
-    'bill': 'william',
-    'dick': 'richard',
-    'jim': 'james',
-    'joe': 'joseph',
-    'mike': 'michael',
-    'tony': 'anthony',
-    'shuv': 'shuvaloy',
-}
+# Concurrent quarter downloads per expense source
+QUARTER_FETCH_WORKERS = 4
 
+# A quarter where more than this fraction of names fails to resolve (e.g., an
+# empty MP index) is not written, so it cannot replace the stored rows
+MAX_UNRESOLVED_FRACTION = 0.5
 
-def normalize_name(name: str) -> str:
-    """
-    Normalize a name for fuzzy matching by:
-    - Removing accents/diacritics
-    - Converting to lowercase
-    - Removing extra whitespace
-    - Removing punctuation like periods
+Quarter = Tuple[int, int]
 
-    Args:
-        name: Name to normalize
 
-    Returns:
-        Normalized name string
-    """
-    if not name:
-        return ""
-
-    # Remove accents: é → e, è → e, ñ → n, etc.
-    # NFD decomposes characters into base + combining characters
-    # Then filter out combining characters
-    name = ''.join(
-        char for char in unicodedata.normalize('NFD', name)
-        if unicodedata.category(char) != 'Mn'
+def quarter_hash(rows: List[Dict[str, Any]]) -> str:
+    """Hash the expense rows of one quarter (ignoring timestamps)."""
+    payload = json.dumps(
+        sorted(({k: v for k, v in row.items() if k != "updated_at"} for row in rows), key=lambda r: r["id"]),
+        sort_keys=True,
+        default=str,
     )
-
-    # Remove periods (for middle initials like "S." or "A.")
-    name = name.replace('.', '')
-
-    # Convert to lowercase and strip whitespace
-    name = name.lower().strip()
-
-    # Normalize whitespace
-    name = ' '.join(name.split())
-
-    return name
-
-
-def extract_core_name(given_name: str, family_name: str) -> str:
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _fetch_quarters(
+    fetch: Callable[[int, int], List[Any]],
+    quarters: List[Quarter],
+    label: str,
+) -> Dict[Quarter, List[Any]]:
+    """Fetch quarterly summaries concurrently; unpublished quarters are skipped."""
+
+    def fetch_one(quarter: Quarter) -> Optional[List[Any]]:
+        fiscal_year, q = quarter
+        try:
+            return fetch(fiscal_year, q)
+        except Exception as e:
+            logger.warning(f"Could not fetch {label} expenses FY {fiscal_year} Q{q}: {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=QUARTER_FETCH_WORKERS) as executor:
+        results = list(executor.map(fetch_one, quarters))
+    return {quarter: summary for quarter, summary in zip(quarters, results) if summary is not None}
+
+
+def _expense_rows(
+    summary: List[Any],
+    fiscal_year: int,
+    quarter: int,
+    source: str,
+    mp_index: MPNameIndex,
+) -> Tuple[List[Dict[str, Any]], int]:
     """
-    Extract core first and last name, removing middle names/initials.
+    Build Expense rows for one quarter, resolving each name to an MP id.
 
     Args:
-        given_name: Given/first name (may include middle names/initials)
-        family_name: Family/last name
+        summary: MPExpenditure or HouseOfficerExpenditure records
+        fiscal_year: Fiscal year
+        quarter: Quarter number (1-4)
+        source: "mp" or "officer"
+        mp_index: Name index over MP nodes
 
     Returns:
-        "FirstName LastName" with middle names removed
+        Tuple of (rows, records resolved to an MP, records skipped due to name mismatch)
+    """
+    rows = []
+    resolved = skipped = 0
+    now = datetime.utcnow().isoformat()
+
+    for record in summary:
+        # Skip vacant seats
+        if record.name == "Vacant":
+            continue
+
+        # Names come as "LastName, FirstName" with titles ("Sgro, Hon. Judy A.")
+        match = mp_index.resolve(record.name)
+        if not match:
+            logger.debug(f"Could not find MP ID for {source}: {record.name}")
+            skipped += 1
+            continue
+        mp_id = match[0]
+        resolved += 1
+
+        if source == "officer":
+            prefix = f"House Officer ({record.role}) - "
+            categories = [
+                ("salaries", record.salaries, prefix + "Staff salaries"),
+                ("travel", record.travel, prefix + "Travel expenses"),
+                ("hospitality", record.hospitality, prefix + "Hospitality"),
+                ("contracts", record.contracts, prefix + "Contract services"),
+            ]
+        else:
+            categories = [
+                ("salaries", record.salaries, "Staff salaries and benefits"),
+                ("travel", record.travel, "Travel expenses"),
+                ("hospitality", record.hospitality, "Hospitality and events"),
+                ("contracts", record.contracts, "Contract services"),
+            ]
+
+        for category, amount, description in categories:
+            if amount > 0:  # Only create records for non-zero expenses
+                row = {
+                    "id": f"exp-{source}-{mp_id}-{fiscal_year}-q{quarter}-{category}",
+                    "mp_id": mp_id,
+                    "fiscal_year": fiscal_year,
+                    "quarter": quarter,
+                    "category": category,
+                    "amount": amount,
+                    "description": description,
+                    "source": source,
+                    "updated_at": now,
+                }
+                if source == "officer":
+                    row["role"] = record.role
+                rows.append(row)
+
+    return rows, resolved, skipped
+
+
+def unresolved_quarter_reason(rows: List[Dict[str, Any]], resolved: int, skipped: int) -> Optional[str]:
     """
-    # Get first word from given name (removes middle names/initials)
-    first_only = given_name.split()[0] if given_name else ""
+    Explain why a quarter's rows must not replace the stored ones, if they must not.
 
-    # Get first word from family name (handles hyphenated surnames)
-    # e.g., "Fancy-Landry" → "Fancy"
-    last_first = family_name.split()[0].split('-')[0] if family_name else ""
+    Writing a quarter deletes its stored rows that are absent from the new set,
+    so an empty summary or a mostly unresolved one would wipe the quarter.
 
-    return f"{first_only} {last_first}".strip()
+    Returns:
+        Reason string, or None when the quarter is safe to write
+    """
+    if not rows:
+        return "no expense rows were built"
+    total = resolved + skipped
+    if total and skipped / total > MAX_UNRESOLVED_FRACTION:
+        return f"{skipped:,} of {total:,} names could not be matched to an MP"
+    return None
+
+
+def _load_quarter_hashes(neo4j_client: Neo4jClient, source: str) -> Dict[Quarter, str]:
+    """Read the stored hash of every fully hashed quarter for an expense source."""
+    result = neo4j_client.run_query("""
+        MATCH (e:Expense {source: $source})
+        RETURN e.fiscal_year AS fiscal_year, e.quarter AS quarter,
+               count(e) AS total, count(e.quarter_hash) AS hashed,
+               collect(DISTINCT e.quarter_hash) AS hashes
+    """, {"source": source})
+
+    hashes = {}
+    for row in result:
+        # Legacy (unhashed) or partially written quarters are treated as changed
+        if row["total"] == row["hashed"] and len(row["hashes"]) == 1:
+            hashes[(row["fiscal_year"], row["quarter"])] = row["hashes"][0]
+    return hashes
+
+
+def _write_quarter(
+    neo4j_client: Neo4jClient,
+    source: str,
+    quarter: Quarter,
+    rows: List[Dict[str, Any]],
+    digest: str,
+    batch_size: int,
+) -> None:
+    """Write one quarter's Expense nodes with INCURRED, then drop rows no longer present."""
+    fiscal_year, q = quarter
+    for i in range(0, len(rows), batch_size):
+        neo4j_client.run_query("""
+            UNWIND $batch AS row
+            MERGE (e:Expense {id: row.id})
+            SET e += row, e.quarter_hash = $hash
+            WITH e, row
+            MATCH (m:MP {id: row.mp_id})
+            MERGE (m)-[:INCURRED]->(e)
+        """, {"batch": rows[i:i + batch_size], "hash": digest})
+
+    # Revised quarters may have dropped rows (e.g., an amount corrected to zero)
+    neo4j_client.run_query("""
+        MATCH (e:Expense {source: $source, fiscal_year: $fiscal_year, quarter: $quarter})
+        WHERE e.quarter_hash IS NULL OR e.quarter_hash <> $hash
+        DETACH DELETE e
+    """, {"source": source, "fiscal_year": fiscal_year, "quarter": q, "hash": digest})
+
+
+def _ingest_expense_source(
+    neo4j_client: Neo4jClient,
+    fetch: Callable[[int, int], List[Any]],
+    source: str,
+    label: str,
+    quarters: List[Quarter],
+    mp_index: MPNameIndex,
+    batch_size: int,
+    full_refresh: bool,
+) -> Dict[str, int]:
+    """Fetch, diff and write all quarters of one expense source."""
+    logger.info(f"Fetching {label} expenses for {len(quarters)} quarters...")
+    summaries = _fetch_quarters(fetch, quarters, label)
+    stored = {} if full_refresh else _load_quarter_hashes(neo4j_client, source)
+
+    written = skipped_names = changed = unchanged = refused = 0
+    for quarter in sorted(summaries):
+        rows, resolved, skipped = _expense_rows(summaries[quarter], *quarter, source, mp_index)
+        skipped_names += skipped
+        reason = unresolved_quarter_reason(rows, resolved, skipped)
+        if reason:
+            logger.warning(f"  FY {quarter[0]} Q{quarter[1]}: not writing {label} expenses ({reason})")
+            refused += 1
+            continue
+
+        digest = quarter_hash(rows)
+        if stored.get(quarter) == digest:
+            unchanged += 1
+            continue
+
+        _write_quarter(neo4j_client, source, quarter, rows, digest, batch_size)
+        logger.info(f"  FY {quarter[0]} Q{quarter[1]}: wrote {len(rows):,} {label} expense records")
+        written += len(rows)
+        changed += 1
+
+    logger.info(
+        f"{label}: {changed} quarters written, {unchanged} unchanged, {refused} not written "
+        f"({skipped_names} records skipped due to name mismatch)"
+    )
+    return {
+        "written": written,
+        "changed": changed,
+        "unchanged": unchanged,
+        "refused": refused,
+        "skipped_names": skipped_names,
+    }
 
 
 def ingest_financial_data(
     neo4j_client: Neo4jClient,
     fiscal_year_start: int = 2024,
     fiscal_year_end: Optional[int] = None,
-    batch_size: int = 10000
+    batch_size: int = 10000,
+    full_refresh: bool = False,
 ) -> Dict[str, int]:
     """
     Ingest financial data: MP expenses, House Officer expenses, contracts, grants, donations.
@@ -104,9 +267,10 @@ def ingest_financial_data(
         fiscal_year_start: Starting fiscal year (default: 2024)
         fiscal_year_end: Ending fiscal year (default: current year)
         batch_size: Batch size for operations
+        full_refresh: Rewrite every quarter instead of only new/revised ones
 
     Returns:
-        Dict with counts of created entities
+        Dict with counts of written expenses and changed/unchanged quarters
     """
     if fiscal_year_end is None:
         fiscal_year_end = datetime.now().year
@@ -116,297 +280,33 @@ def ingest_financial_data(
 
     stats = {}
 
-    # Build MP name -> ID mapping from database
-    logger.info("Building MP name -> ID mapping...")
-    mp_mapping = {}
-    mp_list = []  # Store all MP records for fuzzy matching
-    mp_query_result = neo4j_client.run_query("""
-        MATCH (m:MP)
-        RETURN m.id AS id, m.name AS name, m.given_name AS given_name, m.family_name AS family_name
-    """)
-    for record in mp_query_result:
-        mp_id = record.get("id")
-        name = record.get("name")
-        given = record.get("given_name", "")
-        family = record.get("family_name", "")
-
-        # Store for fuzzy matching
-        mp_list.append({
-            "id": mp_id,
-            "name": name,
-            "given_name": given,
-            "family_name": family
-        })
-
-        # Store by full name (normalized)
-        if name:
-            mp_mapping[normalize_name(name)] = mp_id
-
-        # Store by "FirstName LastName" format (normalized)
-        if given and family:
-            normalized_full = normalize_name(f"{given} {family}")
-            mp_mapping[normalized_full] = mp_id
-
-            # Also store core name without middle names/initials
-            # e.g., "Amanpreet S. Gill" -> "amanpreet gill"
-            core_name = normalize_name(extract_core_name(given, family))
-            if core_name:
-                mp_mapping[core_name] = mp_id
-
-            # Store with nickname variations
-            first_name = given.split()[0] if given else ""
-            first_normalized = normalize_name(first_name)
-            if first_normalized in NICKNAME_MAPPING:
-                # e.g., "Bobby Morrissey" also maps as "Robert Morrissey"
-                formal_name = normalize_name(f"{NICKNAME_MAPPING[first_normalized]} {family}")
-                mp_mapping[formal_name] = mp_id
-
-                # Also store core version with formal name
-                formal_core = normalize_name(f"{NICKNAME_MAPPING[first_normalized]} {family.split()[0].split('-')[0]}")
-                mp_mapping[formal_core] = mp_id
-
-        # For compound last names, also store with just the first part
-        # e.g., "Michelle Rempel Garner" -> "Michelle Rempel"
-        if given and family and " " in family:
-            first_family = family.split()[0]
-            mp_mapping[normalize_name(f"{given} {first_family}")] = mp_id
-
-        # For hyphenated last names, also store first part only
-        # e.g., "Jessica Fancy-Landry" -> "Jessica Fancy"
-        if given and family and "-" in family:
-            first_part = family.split('-')[0]
-            mp_mapping[normalize_name(f"{given} {first_part}")] = mp_id
-            # Also core version
-            mp_mapping[normalize_name(f"{given.split()[0]} {first_part}")] = mp_id
-
-    logger.info(f"Mapped {len(mp_mapping):,} MP name variations to IDs")
+    mp_index = MPNameIndex.from_neo4j(neo4j_client)
+    logger.info(f"Indexed {mp_index.mp_count:,} MPs ({len(mp_index):,} name variations)")
+
+    quarters = [
+        (fiscal_year, quarter)
+        for fiscal_year in range(fiscal_year_start, fiscal_year_end + 1)
+        for quarter in (1, 2, 3, 4)
+    ]
 
     # 1. MP Expenses
-    logger.info(f"Fetching MP expenses for FY {fiscal_year_start}-{fiscal_year_end}...")
-    expense_client = MPExpenditureClient()
-
-    # Get expenses for specified fiscal year range
-    mp_expenses_data = []
-    mp_skipped_count = 0
-    for fiscal_year in range(fiscal_year_start, fiscal_year_end + 1):
-        for quarter in [1, 2, 3, 4]:
-            try:
-                logger.debug(f"Fetching FY {fiscal_year} Q{quarter}...")
-                summary = expense_client.get_quarterly_summary(fiscal_year, quarter)
-
-                for mp_expenses in summary:
-                    # Skip vacant seats
-                    if mp_expenses.name == "Vacant":
-                        continue
-
-                    # Parse name from "LastName, FirstName" format to "FirstName LastName"
-                    # Example: "Aboultaif,  Ziad" -> "Ziad Aboultaif"
-                    # Example: "Sgro, Hon. Judy A." -> "Hon. Judy A. Sgro"
-                    if "," in mp_expenses.name:
-                        parts = mp_expenses.name.split(",", 1)  # Split only on first comma
-                        if len(parts) == 2:
-                            last_name = parts[0].strip()
-                            first_name = parts[1].strip()
-                            full_name = f"{first_name} {last_name}"
-                        else:
-                            full_name = mp_expenses.name.strip()
-                    else:
-                        full_name = mp_expenses.name.strip()
-
-                    # Strip honorifics/titles from the name
-                    # Common titles: "Hon.", "Rt. Hon.", "Right Hon.", "Dr.", "Rev.", "Prof."
-                    honorifics = ["Right Hon.", "Rt. Hon.", "Hon.", "Dr.", "Rev.", "Prof.", "Mr.", "Mrs.", "Ms.", "Miss"]
-                    for honorific in honorifics:
-                        full_name = full_name.replace(honorific, "").strip()
-
-                    # Normalize the name (remove accents, lowercase, clean whitespace)
-                    normalized_name = normalize_name(full_name)
-
-                    # Look up MP ID from normalized name
-                    mp_id = mp_mapping.get(normalized_name)
-
-                    # If not found, try variations
-                    if not mp_id and " " in normalized_name:
-                        parts = normalized_name.split()
-
-                        # Try: first name + first word of last name
-                        # Handles: "Fancy Jessica" when DB has "Jessica Fancy-Landry"
-                        if len(parts) >= 2:
-                            first_last = f"{parts[0]} {parts[1]}"
-                            mp_id = mp_mapping.get(first_last)
-
-                        # Try: extracting just first + last (no middle names)
-                        # Handles: "Rhéal Éloi Fortin" -> "rheal fortin"
-                        if not mp_id and len(parts) >= 2:
-                            core_name = f"{parts[0]} {parts[-1]}"
-                            mp_id = mp_mapping.get(core_name)
-
-                        # Try: check if first name is a nickname, try formal version
-                        # Handles: "Robert Morrissey" when DB has "Bobby Morrissey"
-                        if not mp_id and len(parts) >= 2:
-                            first_name_norm = parts[0]
-                            # Check reverse mapping (formal -> nickname)
-                            for nickname, formal in NICKNAME_MAPPING.items():
-                                if first_name_norm == formal:
-                                    nickname_version = f"{nickname} {parts[-1]}"
-                                    mp_id = mp_mapping.get(nickname_version)
-                                    if mp_id:
-                                        break
-
-                    if not mp_id:
-                        logger.debug(f"Could not find MP ID for: {mp_expenses.name} (normalized: {normalized_name})")
-                        mp_skipped_count += 1
-                        continue
-
-                    # Create separate expense records for each category
-                    categories = [
-                        ("salaries", mp_expenses.salaries, "Staff salaries and benefits"),
-                        ("travel", mp_expenses.travel, "Travel expenses"),
-                        ("hospitality", mp_expenses.hospitality, "Hospitality and events"),
-                        ("contracts", mp_expenses.contracts, "Contract services"),
-                    ]
-
-                    for category, amount, description in categories:
-                        if amount > 0:  # Only create records for non-zero expenses
-                            expense_props = {
-                                "id": f"exp-mp-{mp_id}-{fiscal_year}-q{quarter}-{category}",
-                                "mp_id": mp_id,
-                                "fiscal_year": fiscal_year,
-                                "quarter": quarter,
-                                "category": category,
-                                "amount": amount,
-                                "description": description,
-                                "source": "mp",
-                                "updated_at": datetime.utcnow().isoformat(),
-                            }
-                            mp_expenses_data.append(expense_props)
-
-            except Exception as e:
-                logger.warning(f"Could not fetch MP expenses FY {fiscal_year} Q{quarter}: {e}")
-                continue
-
-    logger.info(f"Found {len(mp_expenses_data):,} MP expense records ({mp_skipped_count} MPs skipped due to name mismatch)")
-
-    if mp_expenses_data:
-        stats["mp_expenses"] = neo4j_client.batch_merge_nodes("Expense", mp_expenses_data, merge_keys=["id"], batch_size=batch_size)
-        logger.info(f"Created/updated {stats['mp_expenses']:,} MP expense nodes")
-    else:
-        stats["mp_expenses"] = 0
+    mp_stats = _ingest_expense_source(
+        neo4j_client, MPExpenditureClient().get_quarterly_summary, "mp", "MP",
+        quarters, mp_index, batch_size, full_refresh,
+    )
+    stats["mp_expenses"] = mp_stats["written"]
 
     # 2. House Officer Expenses
-    logger.info(f"Fetching House Officer expenses for FY {fiscal_year_start}-{fiscal_year_end}...")
-    house_officer_client = HouseOfficersClient()
-
-    # Get expenses for specified fiscal year range
-    officer_expenses_data = []
-    officer_skipped_count = 0
-    for fiscal_year in range(fiscal_year_start, fiscal_year_end + 1):
-        for quarter in [1, 2, 3, 4]:
-            try:
-                logger.debug(f"Fetching House Officer FY {fiscal_year} Q{quarter}...")
-                summary = house_officer_client.get_quarterly_summary(fiscal_year, quarter)
-
-                for officer_expenses in summary:
-                    # Skip vacant seats
-                    if officer_expenses.name == "Vacant":
-                        continue
-
-                    # Parse name from "LastName, FirstName" format to "FirstName LastName"
-                    if "," in officer_expenses.name:
-                        parts = officer_expenses.name.split(",", 1)
-                        if len(parts) == 2:
-                            last_name = parts[0].strip()
-                            first_name = parts[1].strip()
-                            full_name = f"{first_name} {last_name}"
-                        else:
-                            full_name = officer_expenses.name.strip()
-                    else:
-                        full_name = officer_expenses.name.strip()
-
-                    # Strip honorifics/titles from the name
-                    honorifics = ["Right Hon.", "Rt. Hon.", "Hon.", "Dr.", "Rev.", "Prof.", "Mr.", "Mrs.", "Ms.", "Miss"]
-                    for honorific in honorifics:
-                        full_name = full_name.replace(honorific, "").strip()
-
-                    # Normalize the name
-                    normalized_name = normalize_name(full_name)
-
-                    # Look up MP ID from normalized name
-                    mp_id = mp_mapping.get(normalized_name)
-
-                    # Try variations if not found
-                    if not mp_id and " " in normalized_name:
-                        parts = normalized_name.split()
-
-                        if len(parts) >= 2:
-                            first_last = f"{parts[0]} {parts[1]}"
-                            mp_id = mp_mapping.get(first_last)
-
-                        if not mp_id and len(parts) >= 2:
-                            core_name = f"{parts[0]} {parts[-1]}"
-                            mp_id = mp_mapping.get(core_name)
-
-                        if not mp_id and len(parts) >= 2:
-                            first_name_norm = parts[0]
-                            for nickname, formal in NICKNAME_MAPPING.items():
-                                if first_name_norm == formal:
-                                    nickname_version = f"{nickname} {parts[-1]}"
-                                    mp_id = mp_mapping.get(nickname_version)
-                                    if mp_id:
-                                        break
-
-                    if not mp_id:
-                        logger.debug(f"Could not find MP ID for House Officer: {officer_expenses.name} (normalized: {normalized_name})")
-                        officer_skipped_count += 1
-                        continue
-
-                    # Create separate expense records for each category
-                    categories = [
-                        ("salaries", officer_expenses.salaries, f"House Officer ({officer_expenses.role}) - Staff salaries"),
-                        ("travel", officer_expenses.travel, f"House Officer ({officer_expenses.role}) - Travel expenses"),
-                        ("hospitality", officer_expenses.hospitality, f"House Officer ({officer_expenses.role}) - Hospitality"),
-                        ("contracts", officer_expenses.contracts, f"House Officer ({officer_expenses.role}) - Contract services"),
-                    ]
-
-                    for category, amount, description in categories:
-                        if amount > 0:
-                            expense_props = {
-                                "id": f"exp-officer-{mp_id}-{fiscal_year}-q{quarter}-{category}",
-                                "mp_id": mp_id,
-                                "fiscal_year": fiscal_year,
-                                "quarter": quarter,
-                                "category": category,
-                                "amount": amount,
-                                "description": description,
-                                "source": "officer",
-                                "role": officer_expenses.role,
-                                "updated_at": datetime.utcnow().isoformat(),
-                            }
-                            officer_expenses_data.append(expense_props)
-
-            except Exception as e:
-                logger.warning(f"Could not fetch House Officer expenses FY {fiscal_year} Q{quarter}: {e}")
-                continue
-
-    logger.info(f"Found {len(officer_expenses_data):,} House Officer expense records ({officer_skipped_count} officers skipped due to name mismatch)")
-
-    if officer_expenses_data:
-        stats["officer_expenses"] = neo4j_client.batch_merge_nodes("Expense", officer_expenses_data, merge_keys=["id"], batch_size=batch_size)
-        logger.info(f"Created/updated {stats['officer_expenses']:,} House Officer expense nodes")
-    else:
-        stats["officer_expenses"] = 0
-
-    # Create INCURRED relationships between MPs and all Expenses
-    total_expenses = len(mp_expenses_data) + len(officer_expenses_data)
-    if total_expenses > 0:
-        logger.info("Creating INCURRED relationships...")
-        rel_query = """
-        MATCH (e:Expense)
-        MATCH (m:MP {id: e.mp_id})
-        MERGE (m)-[:INCURRED]->(e)
-        """
-        neo4j_client.run_query(rel_query)
-        logger.info("✅ Created INCURRED relationships")
+    officer_stats = _ingest_expense_source(
+        neo4j_client, HouseOfficersClient().get_quarterly_summary, "officer", "House Officer",
+        quarters, mp_index, batch_size, full_refresh,
+    )
+    stats["officer_expenses"] = officer_stats["written"]
+
+    stats["quarters_changed"] = mp_stats["changed"] + officer_stats["changed"]
+    stats["quarters_unchanged"] = mp_stats["unchanged"] + officer_stats["unchanged"]
+    stats["quarters_refused"] = mp_stats["refused"] + officer_stats["refused"]
+    stats["unmatched_names"] = mp_stats["skipped_names"] + officer_stats["skipped_names"]
 
     # TODO: Contracts, grants, donations (requires additional data sources)
     stats["contracts"] = 0
@@ -418,6 +318,10 @@ def ingest_financial_data(
     logger.info(f"MP Expenses: {stats.get('mp_expenses', 0):,}")
     logger.info(f"House Officer Expenses: {stats.get('officer_expenses', 0):,}")
     logger.info(f"Total Expenses: {stats.get('mp_expenses', 0) + stats.get('officer_expenses', 0):,}")
+    logger.info(
+        f"Quarters written: {stats['quarters_changed']} ({stats['quarters_unchanged']} unchanged, "
+        f"{stats['quarters_refused']} not written)"
+    )
     logger.info(f"Contracts: {stats['contracts']:,} (TODO)")
     logger.info(f"Grants: {stats['grants']:,} (TODO)")
     logger.info(f"Donations: {stats['donations']:,} (TODO)")
@@ -4,12 +4,12 @@ from typing import Optional, Dict, Any
 from pathlib import Path
 from datetime import datetime
 import re
-import unicodedata
 
 from ..utils.neo4j_client import Neo4jClient
 from ..utils.postgres_client import PostgresClient
 from ..utils.progress import logger, ProgressTracker
 from ..utils.keyword_extraction import extract_document_keywords
+from ..utils.mp_names import NICKNAME_MAPPING, extract_core_name, normalize_name
 
 
 # Data Quality Utilities
@@ -113,82 +113,6 @@ def sanitize_statement_content(statement_data: Dict[str, Any]) -> Dict[str, Any]
     return statement_data
 
 
-# Name Matching Utilities (for linking statements to MPs by speaker name)
-# -----------------------------------------------------------------------
-
-# Common nickname mappings for Canadian MPs
-NICKNAME_MAPPING = {
-    'bobby': 'robert',
-    'rob': 'robert',
-    'bob': 'robert',
-    'bill': 'william',
-    'dick': 'richard',
-    'jim': 'james',
-    'joe': 'joseph',
-    'mike': 'michael',
-    'tony': 'anthony',
-    'shuv': 'shuvaloy',
-}
-
-
-def normalize_name(name: str) -> str:
-    """
-    Normalize a name for fuzzy matching by:
-    - Removing accents/diacritics (é → e, è → e)
-    - Converting to lowercase
-    - Removing extra whitespace
-    - Removing punctuation like periods
-
-    Args:
-        name: Name to normalize
-
-    Returns:
-        Normalized name string
-    """
-    if not name:
-        return ""
-
-    # Remove accents: é → e, è → e, ñ → n, etc.
-    # NFD decomposes characters into base + combining characters
-    # Then filter out combining characters
-    name = ''.join(
-        char for char in unicodedata.normalize('NFD', name)
-        if unicodedata.category(char) != 'Mn'
-    )
-
-    # Remove periods (for middle initials like "S." or "A.")
-    name = name.replace('.', '')
-
-    # Convert to lowercase and strip whitespace
-    name = name.lower().strip()
-
-    # Normalize whitespace
-    name = ' '.join(name.split())
-
-    return name
-
-
-def extract_core_name(given_name: str, family_name: str) -> str:
-    """
-    Extract core first and last name, removing middle names/initials.
-
-    Args:
-        given_name: Given/first name (may include middle names/initials)
-        family_name: Family/last name
-
-    Returns:
-        "FirstName LastName" with middle names removed
-    """
-    # Get first word from given name (removes middle names/initials)
-    first_only = given_name.split()[0] if given_name else ""
-
-    # Get first word from family name (handles hyphenated surnames)
-    # e.g., "Fancy-Landry" → "Fancy"
-    last_first = family_name.split()[0].split('-')[0] if family_name else ""
-
-    return f"{first_only} {last_first}".strip()
-
-
 def ingest_hansard_documents(
     neo4j_client: Neo4jClient,
     postgres_client: PostgresClient,
@@ -1,9 +1,20 @@
-"""Lobbying data ingestion: registrations, communications, lobbyists, organizations."""
-
+"""Lobbying data ingestion: registrations, communications, lobbyists, organizations.
+
+Ingestion is diff-based by default: every LobbyRegistration/LobbyCommunication
+node stores a ``row_hash`` of its source row, so each refresh compares the new
+registry export against the previous snapshot (the graph itself) by
+REG_ID/COMLOG_ID and hash. Only inserted, updated and ended records are written,
+and records that disappeared from the export are removed. Organization and
+Lobbyist ids are derived from their names, so they are stable across runs.
+"""
+
+import hashlib
+import json
 import sys
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 
 # Add fedmcp package to path
 FEDMCP_PATH = Path(__file__).parent.parent.parent.parent / "fedmcp" / "src"
@@ -11,37 +22,191 @@ sys.path.insert(0, str(FEDMCP_PATH))
 
 from fedmcp.clients.lobbying import LobbyingRegistryClient
 
+from ..relationships.lobbying import match_contacted, stable_entity_id
+from ..utils.mp_names import MPNameIndex
 from ..utils.neo4j_client import Neo4jClient
 from ..utils.progress import logger
 
 
-def ingest_lobbying_data(neo4j_client: Neo4jClient, batch_size: int = 10000) -> Dict[str, int]:
+LOBBYING_LABELS = ["LobbyRegistration", "LobbyCommunication", "Organization", "Lobbyist"]
+
+# Largest share of the previous snapshot an incremental run may remove; more
+# than this points at a truncated or broken export rather than real deletions
+MAX_REMOVED_FRACTION = 0.10
+
+
+def row_hash(props: Dict[str, Any]) -> str:
+    """Hash a record's properties so unchanged rows can be skipped."""
+    payload = json.dumps(props, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class LobbyingDiff:
+    """Result of comparing a registry export against the previous snapshot."""
+
+    inserted: List[Dict[str, Any]] = field(default_factory=list)
+    updated: List[Dict[str, Any]] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    ended: int = 0
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> List[Dict[str, Any]]:
+        """Inserted and updated rows (everything that must be written)."""
+        return self.inserted + self.updated
+
+
+def diff_records(
+    rows: List[Dict[str, Any]],
+    previous: Dict[str, Tuple[Optional[str], Optional[bool]]],
+) -> LobbyingDiff:
     """
-    Ingest lobbying registry data.
+    Compare new rows against the previous snapshot.
 
-    Downloads ~90MB CSV data from Open Canada portal, caches locally,
-    and loads into Neo4j.
+    Args:
+        rows: New rows, each with "id", "row_hash" and "props" keys
+        previous: Mapping of id -> (row_hash, active) from the last load
+
+    Returns:
+        LobbyingDiff with inserted/updated rows, removed ids and counters.
+        ``ended`` counts updates where a previously active record became inactive.
+    """
+    diff = LobbyingDiff()
+    seen = set()
+
+    for row in rows:
+        record_id = row["id"]
+        seen.add(record_id)
+
+        if record_id not in previous:
+            diff.inserted.append(row)
+            continue
+
+        old_hash, old_active = previous[record_id]
+        if old_hash == row["row_hash"]:
+            diff.unchanged += 1
+            continue
+
+        diff.updated.append(row)
+        if old_active and row["props"].get("active") is False:
+            diff.ended += 1
+
+    diff.removed = [record_id for record_id in previous if record_id not in seen]
+    return diff
+
+
+def unsafe_removal_reason(
+    label: str,
+    rows: List[Dict[str, Any]],
+    previous: Dict[str, Any],
+    max_fraction: float = MAX_REMOVED_FRACTION,
+) -> Optional[str]:
+    """
+    Explain why applying an export's removals would be unsafe, if it would.
 
     Args:
-        neo4j_client: Neo4j client
-        batch_size: Batch size for operations
+        label: Record label, for the message
+        rows: New rows (each with an "id")
+        previous: Previous snapshot keyed by id
+        max_fraction: Largest share of the snapshot that may be removed
 
     Returns:
-        Dict with counts of created entities
+        A reason when the export is empty or removes more than max_fraction
+        of a non-empty snapshot, else None
     """
-    logger.info("=" * 60)
-    logger.info("LOBBYING DATA INGESTION")
-    logger.info("=" * 60)
+    if not previous:
+        return None
+    if not rows:
+        return f"{label} export is empty but {len(previous):,} records exist"
+    seen = {row["id"] for row in rows}
+    removed = sum(1 for record_id in previous if record_id not in seen)
+    if removed > max_fraction * len(previous):
+        return (
+            f"{label} export would remove {removed:,} of {len(previous):,} records "
+            f"(limit {max_fraction:.0%})"
+        )
+    return None
+
+
+def _registration_row(reg) -> Dict[str, Any]:
+    """Transform a LobbyingRegistration into a diffable write row."""
+    org_name = reg.client_org_name or None
+    lobbyist_name = reg.registrant_name or None
+
+    props = {
+        "reg_number": reg.reg_number,
+        "client_org_name": reg.client_org_name,
+        "registrant_name": reg.registrant_name,
+        "effective_date": reg.effective_date,
+        "end_date": reg.end_date if reg.end_date and reg.end_date != "null" else None,
+        "active": reg.is_active,
+        "subject_matters": reg.subject_matters if reg.subject_matters else [],
+        "government_institutions": reg.government_institutions if reg.government_institutions else [],
+    }
+    return {
+        # Rows without a REG_ID get an id from their identifying fields, so it
+        # does not depend on the row's position in the export
+        "id": reg.reg_id or "reg-" + row_hash({
+            key: props[key] for key in ("reg_number", "registrant_name", "client_org_name", "effective_date")
+        })[:16],
+        "row_hash": row_hash(props),
+        "props": props,
+        "org_id": stable_entity_id("org", org_name) if org_name else None,
+        "org_name": org_name,
+        "lobbyist_id": stable_entity_id("lobbyist", lobbyist_name) if lobbyist_name else None,
+        "lobbyist_name": lobbyist_name,
+    }
+
+
+def _communication_row(comm) -> Dict[str, Any]:
+    """Transform a LobbyingCommunication into a diffable write row."""
+    org_name = comm.client_org_name or None
+    lobbyist_name = comm.registrant_name or None
+
+    props = {
+        "client_org_name": comm.client_org_name,
+        "registrant_name": comm.registrant_name,
+        "date": comm.comm_date,
+        "dpoh_names": comm.dpoh_names if comm.dpoh_names else [],
+        "dpoh_titles": comm.dpoh_titles if comm.dpoh_titles else [],
+        "institutions": comm.institutions if comm.institutions else [],
+        "subject_matters": comm.subject_matters if comm.subject_matters else [],
+    }
+    return {
+        # Rows without a COMLOG_ID get an id from their identifying fields
+        "id": comm.comlog_id or "comm-" + row_hash({
+            key: props[key] for key in ("client_org_name", "registrant_name", "date", "dpoh_names")
+        })[:16],
+        "row_hash": row_hash(props),
+        "props": props,
+        "org_id": stable_entity_id("org", org_name) if org_name else None,
+        "org_name": org_name,
+        "lobbyist_id": stable_entity_id("lobbyist", lobbyist_name) if lobbyist_name else None,
+        "lobbyist_name": lobbyist_name,
+    }
+
+
+def _load_snapshot(neo4j_client: Neo4jClient, label: str) -> Tuple[Dict[str, Tuple[Optional[str], Optional[bool]]], bool]:
+    """
+    Load the previous snapshot (id -> (row_hash, active)) for a label.
 
-    # Use official source (lobbycanada.gc.ca) as the opendata URLs are outdated/broken
-    # The official site is accessible from Cloud Run without any networking issues
-    lobby_client = LobbyingRegistryClient(source="official")
+    Returns:
+        Tuple of (snapshot, is_legacy). ``is_legacy`` is True when nodes exist
+        that were loaded before row hashes were stored.
+    """
+    result = neo4j_client.run_query(
+        f"MATCH (n:{label}) RETURN n.id AS id, n.row_hash AS row_hash, n.active AS active"
+    )
+    snapshot = {r["id"]: (r["row_hash"], r["active"]) for r in result}
+    is_legacy = any(row_hash is None for row_hash, _ in snapshot.values())
+    return snapshot, is_legacy
 
-    stats = {}
 
-    # Clear existing lobbying data for full refresh (in batches to avoid Neo4j memory limits)
+def _clear_lobbying_data(neo4j_client: Neo4jClient) -> None:
+    """Delete all lobbying nodes (in batches to avoid Neo4j memory limits)."""
     logger.info("Clearing existing lobbying data...")
-    for label in ["LobbyRegistration", "LobbyCommunication", "Organization", "Lobbyist"]:
+    for label in LOBBYING_LABELS:
         while True:
             result = neo4j_client.run_query(f"MATCH (n:{label}) WITH n LIMIT 10000 DETACH DELETE n RETURN count(n) as deleted")
             deleted = result[0]["deleted"] if result else 0
@@ -50,173 +215,237 @@ def ingest_lobbying_data(neo4j_client: Neo4jClient, batch_size: int = 10000) ->
             logger.info(f"  Deleted {deleted} {label} nodes...")
     logger.info("✓ Cleared existing lobbying data")
 
-    # Track unique entities for later creation
-    unique_organizations = {}
-    unique_lobbyists = {}
 
-    # 1. Lobby Registrations
+def _run_batched(
+    neo4j_client: Neo4jClient,
+    query: str,
+    items: List[Any],
+    batch_size: int,
+    **params: Any,
+) -> None:
+    """Run an UNWIND query over ``items`` (bound to ``$batch``) in batches."""
+    for i in range(0, len(items), batch_size):
+        neo4j_client.run_query(query, {"batch": items[i:i + batch_size], **params})
+
+
+def _write_registrations(neo4j_client: Neo4jClient, diff: LobbyingDiff, batch_size: int) -> None:
+    """Write changed registrations with their Organization/Lobbyist links in one UNWIND."""
+    # Updated rows may point at a different organization/lobbyist now
+    _run_batched(neo4j_client, """
+    UNWIND $batch AS id
+    MATCH (lr:LobbyRegistration {id: id})-[old:ON_BEHALF_OF]->(:Organization)
+    DELETE old
+    """, [row["id"] for row in diff.updated], batch_size)
+    _run_batched(neo4j_client, """
+    UNWIND $batch AS id
+    MATCH (lr:LobbyRegistration {id: id})<-[old:REGISTERED_FOR]-(:Lobbyist)
+    DELETE old
+    """, [row["id"] for row in diff.updated], batch_size)
+
+    _run_batched(neo4j_client, """
+    UNWIND $batch AS row
+    MERGE (lr:LobbyRegistration {id: row.id})
+    SET lr += row.props, lr.row_hash = row.row_hash, lr.updated_at = $now
+    FOREACH (_ IN CASE WHEN row.org_id IS NULL THEN [] ELSE [1] END |
+        MERGE (o:Organization {id: row.org_id})
+        ON CREATE SET o.name = row.org_name
+        MERGE (lr)-[:ON_BEHALF_OF]->(o)
+    )
+    FOREACH (_ IN CASE WHEN row.lobbyist_id IS NULL THEN [] ELSE [1] END |
+        MERGE (l:Lobbyist {id: row.lobbyist_id})
+        ON CREATE SET l.name = row.lobbyist_name
+        MERGE (l)-[:REGISTERED_FOR]->(lr)
+    )
+    """, diff.changed, batch_size, now=datetime.utcnow().isoformat())
+
+
+def _write_communications(neo4j_client: Neo4jClient, diff: LobbyingDiff, batch_size: int) -> None:
+    """Write changed communications with their Organization/Lobbyist links in one UNWIND."""
+    _run_batched(neo4j_client, """
+    UNWIND $batch AS id
+    MATCH (lc:LobbyCommunication {id: id})-[old:COMMUNICATION_BY|CONDUCTED_BY|CONTACTED]->()
+    DELETE old
+    """, [row["id"] for row in diff.updated], batch_size)
+
+    _run_batched(neo4j_client, """
+    UNWIND $batch AS row
+    MERGE (lc:LobbyCommunication {id: row.id})
+    SET lc += row.props, lc.row_hash = row.row_hash, lc.updated_at = $now
+    FOREACH (_ IN CASE WHEN row.org_id IS NULL THEN [] ELSE [1] END |
+        MERGE (o:Organization {id: row.org_id})
+        ON CREATE SET o.name = row.org_name
+        MERGE (lc)-[:COMMUNICATION_BY]->(o)
+    )
+    FOREACH (_ IN CASE WHEN row.lobbyist_id IS NULL THEN [] ELSE [1] END |
+        MERGE (l:Lobbyist {id: row.lobbyist_id})
+        ON CREATE SET l.name = row.lobbyist_name
+        MERGE (lc)-[:CONDUCTED_BY]->(l)
+    )
+    """, diff.changed, batch_size, now=datetime.utcnow().isoformat())
+
+
+def _remove_records(neo4j_client: Neo4jClient, label: str, ids: List[str], batch_size: int) -> None:
+    """Delete records that no longer appear in the registry export."""
+    _run_batched(neo4j_client, f"""
+    UNWIND $batch AS id
+    MATCH (n:{label} {{id: id}})
+    DETACH DELETE n
+    """, ids, batch_size)
+
+
+def _prune_orphans(neo4j_client: Neo4jClient) -> None:
+    """Remove Lobbyist/Organization nodes left without any lobbying records."""
+    neo4j_client.run_query("""
+    MATCH (l:Lobbyist)
+    WHERE NOT (l)-[:REGISTERED_FOR]->() AND NOT ()-[:CONDUCTED_BY]->(l)
+    DETACH DELETE l
+    """)
+    neo4j_client.run_query("""
+    MATCH (o:Organization)
+    WHERE o.id STARTS WITH 'org-' AND NOT (o)--()
+    DELETE o
+    """)
+
+
+def ingest_lobbying_data(
+    neo4j_client: Neo4jClient,
+    batch_size: int = 10000,
+    full_refresh: bool = False,
+) -> Dict[str, int]:
+    """
+    Ingest lobbying registry data.
+
+    Downloads ~90MB CSV data from Open Canada portal, caches locally,
+    diffs it against the lobbying records already in Neo4j and writes only
+    what changed. A full refresh (delete and reload) happens when requested
+    or when the graph holds records loaded before row hashes were stored.
+
+    Unless a full refresh was requested, the run aborts before writing when
+    either export is empty or would remove more than MAX_REMOVED_FRACTION of
+    the existing records, which usually means a bad or partial download.
+
+    Args:
+        neo4j_client: Neo4j client
+        batch_size: Batch size for operations
+        full_refresh: Delete all lobbying data and reload from scratch
+
+    Returns:
+        Dict with counts of written entities and per-record diff counters
+
+    Raises:
+        RuntimeError: If the exports fail the removal sanity check
+    """
+    logger.info("=" * 60)
+    logger.info("LOBBYING DATA INGESTION")
+    logger.info("=" * 60)
+
+    # Use official source (lobbycanada.gc.ca) as the opendata URLs are outdated/broken
+    # The official site is accessible from Cloud Run without any networking issues
+    lobby_client = LobbyingRegistryClient(source="official")
+
+    stats = {}
+    requested_full_refresh = full_refresh
+    prev_regs, prev_comms = {}, {}
+
+    # 0. Previous snapshot (the graph itself)
+    if not full_refresh:
+        logger.info("Loading previous lobbying snapshot from Neo4j...")
+        prev_regs, regs_legacy = _load_snapshot(neo4j_client, "LobbyRegistration")
+        prev_comms, comms_legacy = _load_snapshot(neo4j_client, "LobbyCommunication")
+        if regs_legacy or comms_legacy:
+            logger.warning("Existing lobbying data has no row hashes - falling back to full refresh")
+            full_refresh = True
+        else:
+            logger.info(f"Snapshot: {len(prev_regs):,} registrations, {len(prev_comms):,} communications")
+
+    # 1. Fetch both exports before touching the graph
     logger.info("Fetching lobby registrations (may download 90MB on first run)...")
     registrations = lobby_client.search_registrations(active_only=False, limit=None)
     logger.info(f"Found {len(registrations):,} registrations")
+    reg_rows = [_registration_row(reg) for reg in registrations]
 
-    # Transform to Neo4j format with ALL fields
-    reg_data = []
-    for i, reg in enumerate(registrations):
-        # Extract organization
-        org_name = reg.client_org_name
-        if org_name and org_name not in unique_organizations:
-            unique_organizations[org_name] = {
-                "id": f"org-{len(unique_organizations)}",
-                "name": org_name,
-            }
-
-        # Extract lobbyist
-        lobbyist_name = reg.registrant_name
-        if lobbyist_name and lobbyist_name not in unique_lobbyists:
-            unique_lobbyists[lobbyist_name] = {
-                "id": f"lobbyist-{len(unique_lobbyists)}",
-                "name": lobbyist_name,
-            }
-
-        reg_props = {
-            "id": reg.reg_id or f"reg-{i}",
-            "reg_number": reg.reg_number,
-            "client_org_name": reg.client_org_name,
-            "registrant_name": reg.registrant_name,
-            "effective_date": reg.effective_date,
-            "end_date": reg.end_date if reg.end_date and reg.end_date != "null" else None,
-            "active": reg.is_active,
-            "subject_matters": reg.subject_matters if reg.subject_matters else [],
-            "government_institutions": reg.government_institutions if reg.government_institutions else [],
-            "updated_at": datetime.utcnow().isoformat(),
-        }
-        reg_props = {k: v for k, v in reg_props.items() if v is not None}
-        reg_data.append(reg_props)
-
-        # Log progress every 10,000 registrations
-        if (i + 1) % 10000 == 0:
-            logger.info(f"Processed {i + 1:,} registrations...")
-
-    stats["lobby_registrations"] = neo4j_client.batch_create_nodes("LobbyRegistration", reg_data, batch_size)
-
-    # 2. Lobby Communications
     logger.info("Fetching lobby communications...")
     communications = lobby_client.search_communications(limit=None)  # Process ALL
     logger.info(f"Found {len(communications):,} communications")
-
-    comm_data = []
-    for i, comm in enumerate(communications):
-        # Extract organization
-        org_name = comm.client_org_name
-        if org_name and org_name not in unique_organizations:
-            unique_organizations[org_name] = {
-                "id": f"org-{len(unique_organizations)}",
-                "name": org_name,
-            }
-
-        # Extract lobbyist
-        lobbyist_name = comm.registrant_name
-        if lobbyist_name and lobbyist_name not in unique_lobbyists:
-            unique_lobbyists[lobbyist_name] = {
-                "id": f"lobbyist-{len(unique_lobbyists)}",
-                "name": lobbyist_name,
-            }
-
-        comm_props = {
-            "id": comm.comlog_id or f"comm-{i}",
-            "client_org_name": comm.client_org_name,
-            "registrant_name": comm.registrant_name,
-            "date": comm.comm_date,
-            "dpoh_names": comm.dpoh_names if comm.dpoh_names else [],
-            "dpoh_titles": comm.dpoh_titles if comm.dpoh_titles else [],
-            "institutions": comm.institutions if comm.institutions else [],
-            "subject_matters": comm.subject_matters if comm.subject_matters else [],
-            "updated_at": datetime.utcnow().isoformat(),
-        }
-        comm_props = {k: v for k, v in comm_props.items() if v is not None}
-        comm_data.append(comm_props)
-
-        # Log progress every 10,000 communications
-        if (i + 1) % 10000 == 0:
-            logger.info(f"Processed {i + 1:,} communications...")
-
-    stats["lobby_communications"] = neo4j_client.batch_create_nodes("LobbyCommunication", comm_data, batch_size)
-
-    # 3. Create Organizations
-    logger.info(f"Creating {len(unique_organizations):,} unique organizations...")
-    org_data = list(unique_organizations.values())
-    stats["organizations"] = neo4j_client.batch_create_nodes("Organization", org_data, batch_size)
-
-    # 4. Create Lobbyists
-    logger.info(f"Creating {len(unique_lobbyists):,} unique lobbyists...")
-    lobbyist_data = list(unique_lobbyists.values())
-    stats["lobbyists"] = neo4j_client.batch_create_nodes("Lobbyist", lobbyist_data, batch_size)
-
-    # 5. Create Relationships
-    logger.info("Creating relationships between entities...")
-
-    # 5a. LobbyRegistration relationships
-    logger.info("  Creating LobbyRegistration → Organization (ON_BEHALF_OF)...")
-    reg_org_query = """
-    MATCH (lr:LobbyRegistration)
-    MATCH (o:Organization {name: lr.client_org_name})
-    MERGE (lr)-[:ON_BEHALF_OF]->(o)
-    """
-    neo4j_client.run_query(reg_org_query)
-
-    logger.info("  Creating Lobbyist → LobbyRegistration (REGISTERED_FOR)...")
-    reg_lobbyist_query = """
-    MATCH (lr:LobbyRegistration)
-    MATCH (l:Lobbyist {name: lr.registrant_name})
-    MERGE (l)-[:REGISTERED_FOR]->(lr)
-    """
-    neo4j_client.run_query(reg_lobbyist_query)
-
-    # 5b. LobbyCommunication relationships
-    logger.info("  Creating LobbyCommunication → Organization (COMMUNICATION_BY)...")
-    comm_org_query = """
-    MATCH (lc:LobbyCommunication)
-    MATCH (o:Organization {name: lc.client_org_name})
-    MERGE (lc)-[:COMMUNICATION_BY]->(o)
-    """
-    neo4j_client.run_query(comm_org_query)
-
-    logger.info("  Creating LobbyCommunication → Lobbyist (CONDUCTED_BY)...")
-    comm_lobbyist_query = """
-    MATCH (lc:LobbyCommunication)
-    WHERE lc.registrant_name IS NOT NULL
-    MATCH (l:Lobbyist {name: lc.registrant_name})
-    MERGE (lc)-[:CONDUCTED_BY]->(l)
-    """
-    neo4j_client.run_query(comm_lobbyist_query)
-
-    # 5c. LobbyCommunication → MP (CONTACTED) relationships
-    # This is the critical relationship for MP lobbying pages
-    # Use Cypher's built-in matching capabilities for better performance
-    logger.info("  Creating LobbyCommunication → MP (CONTACTED) relationships...")
-
-    # Strategy: Use UNWIND to process dpoh_names and match to MPs in Cypher
-    # This is much faster than Python loops with individual queries
-    contacted_query = """
-    MATCH (lc:LobbyCommunication)
-    WHERE lc.dpoh_names IS NOT NULL AND size(lc.dpoh_names) > 0
-    UNWIND lc.dpoh_names as dpoh_name
-    MATCH (m:MP)
-    WHERE
-        // Exact match on name
-        toLower(m.name) = toLower(dpoh_name)
-        // Or match Given + Family
-        OR toLower(m.given_name + ' ' + m.family_name) = toLower(dpoh_name)
-        // Or match Family, Given (common format)
-        OR toLower(m.family_name + ', ' + m.given_name) = toLower(dpoh_name)
-        // Or match first name + family (e.g., "John Smith" for "John Robert Smith")
-        OR (m.given_name IS NOT NULL AND m.family_name IS NOT NULL AND
-            toLower(split(m.given_name, ' ')[0] + ' ' + m.family_name) = toLower(dpoh_name))
-    MERGE (lc)-[:CONTACTED]->(m)
-    """
-    neo4j_client.run_query(contacted_query)
-
-    # Count how many CONTACTED relationships were created
+    comm_rows = [_communication_row(comm) for comm in communications]
+
+    if not requested_full_refresh:
+        for label, rows, previous in (
+            ("LobbyRegistration", reg_rows, prev_regs),
+            ("LobbyCommunication", comm_rows, prev_comms),
+        ):
+            reason = unsafe_removal_reason(label, rows, previous)
+            if reason:
+                logger.error(f"Aborting lobbying ingestion: {reason}")
+                raise RuntimeError(
+                    f"{reason}; rerun with full_refresh (LOBBYING_FULL_REFRESH=true) to apply it"
+                )
+
+    if full_refresh:
+        _clear_lobbying_data(neo4j_client)
+        prev_regs, prev_comms = {}, {}
+
+    # 2. Lobby Registrations
+    reg_diff = diff_records(reg_rows, prev_regs)
+    logger.info(
+        f"Registrations: {len(reg_diff.inserted):,} new, {len(reg_diff.updated):,} updated "
+        f"({reg_diff.ended:,} ended), {len(reg_diff.removed):,} removed, "
+        f"{reg_diff.unchanged:,} unchanged"
+    )
+
+    _write_registrations(neo4j_client, reg_diff, batch_size)
+    _remove_records(neo4j_client, "LobbyRegistration", reg_diff.removed, batch_size)
+    stats["lobby_registrations"] = len(reg_diff.changed)
+    stats["registrations_inserted"] = len(reg_diff.inserted)
+    stats["registrations_updated"] = len(reg_diff.updated)
+    stats["registrations_ended"] = reg_diff.ended
+    stats["registrations_removed"] = len(reg_diff.removed)
+
+    # 3. Lobby Communications
+    comm_diff = diff_records(comm_rows, prev_comms)
+    logger.info(
+        f"Communications: {len(comm_diff.inserted):,} new, {len(comm_diff.updated):,} updated, "
+        f"{len(comm_diff.removed):,} removed, {comm_diff.unchanged:,} unchanged"
+    )
+
+    _write_communications(neo4j_client, comm_diff, batch_size)
+    _remove_records(neo4j_client, "LobbyCommunication", comm_diff.removed, batch_size)
+    stats["lobby_communications"] = len(comm_diff.changed)
+    stats["communications_inserted"] = len(comm_diff.inserted)
+    stats["communications_updated"] = len(comm_diff.updated)
+    stats["communications_removed"] = len(comm_diff.removed)
+
+    # 4. Organizations and Lobbyists touched by this run (created via MERGE above)
+    changed_rows = reg_diff.changed + comm_diff.changed
+    stats["organizations"] = len({row["org_id"] for row in changed_rows if row["org_id"]})
+    stats["lobbyists"] = len({row["lobbyist_id"] for row in changed_rows if row["lobbyist_id"]})
+
+    if reg_diff.removed or reg_diff.updated or comm_diff.removed or comm_diff.updated:
+        logger.info("Pruning organizations/lobbyists without lobbying records...")
+        _prune_orphans(neo4j_client)
+
+    # 5. Derived relationships for changed communications only
+    changed_comm_ids = [row["id"] for row in comm_diff.changed]
+
+    # 5a. LobbyCommunication → MP (CONTACTED) relationships
+    # This is the critical relationship for MP lobbying pages. DPOH names are
+    # resolved in Python against a normalized MP name index.
+    logger.info(f"  Creating LobbyCommunication → MP (CONTACTED) for {len(changed_comm_ids):,} communications...")
+    contacted, quality = match_contacted(
+        ({"id": row["id"], "dpoh_names": row["props"]["dpoh_names"]} for row in comm_diff.changed),
+        MPNameIndex.from_neo4j(neo4j_client),
+    )
+    if contacted:
+        neo4j_client.batch_merge_relationships(
+            "CONTACTED",
+            [{"from_id": comm_id, "to_id": mp_id} for comm_id, mp_id in sorted(contacted)],
+            from_label="LobbyCommunication",
+            to_label="MP",
+            batch_size=batch_size,
+        )
+    stats["unmatched_dpoh_names"] = quality.get("unmatched", 0) + quality.get("ambiguous", 0)
+
+    # Count how many CONTACTED relationships exist
     count_query = """
     MATCH ()-[r:CONTACTED]->()
     RETURN count(r) as count
@@ -226,15 +455,16 @@ def ingest_lobbying_data(neo4j_client: Neo4jClient, batch_size: int = 10000) ->
 
     stats["contacted_relationships"] = contacted_count
 
-    logger.info(f"  ✓ Created {contacted_count:,} CONTACTED relationships")
+    logger.info(f"  ✓ {contacted_count:,} CONTACTED relationships")
 
-    # 5d. Organization → Bill (LOBBIED_ON) relationships
+    # 5b. Organization → Bill (LOBBIED_ON) relationships
     # Extract bill numbers from subject_matters and link to Bill nodes
     logger.info("  Creating Organization → Bill (LOBBIED_ON) relationships...")
 
     bill_link_query = """
-    // Find communications with bill mentions in subject matters
-    MATCH (comm:LobbyCommunication)-[:COMMUNICATION_BY]->(org:Organization)
+    // Find changed communications with bill mentions in subject matters
+    UNWIND $batch AS comm_id
+    MATCH (comm:LobbyCommunication {id: comm_id})-[:COMMUNICATION_BY]->(org:Organization)
     WHERE comm.subject_matters IS NOT NULL AND size(comm.subject_matters) > 0
 
     // Extract potential bill numbers from subject matters
@@ -257,12 +487,10 @@ def ingest_lobbying_data(neo4j_client: Neo4jClient, batch_size: int = 10000) ->
 
     // Create relationship from Organization to Bill
     MERGE (org)-[:LOBBIED_ON]->(bill)
-
-    RETURN count(DISTINCT org) + ' organizations linked to ' + count(DISTINCT bill) + ' bills' AS summary
     """
 
     try:
-        neo4j_client.run_query(bill_link_query)
+        _run_batched(neo4j_client, bill_link_query, changed_comm_ids, batch_size)
 
         # Count LOBBIED_ON relationships
         count_query = """
@@ -272,17 +500,22 @@ def ingest_lobbying_data(neo4j_client: Neo4jClient, batch_size: int = 10000) ->
         count_result = neo4j_client.run_query(count_query)
         lobbied_count = count_result[0]['count'] if count_result else 0
         stats["lobbied_on_relationships"] = lobbied_count
-        logger.info(f"  ✓ Created {lobbied_count:,} LOBBIED_ON relationships")
+        logger.info(f"  ✓ {lobbied_count:,} LOBBIED_ON relationships")
     except Exception as e:
         logger.warning(f"  ⚠ Could not create LOBBIED_ON relationships: {e}")
         stats["lobbied_on_relationships"] = 0
 
     logger.info("=" * 60)
     logger.success("✅ LOBBYING DATA INGESTION COMPLETE")
-    logger.info(f"Registrations: {stats['lobby_registrations']:,}")
-    logger.info(f"Communications: {stats['lobby_communications']:,}")
-    logger.info(f"Organizations: {stats['organizations']:,}")
-    logger.info(f"Lobbyists: {stats['lobbyists']:,}")
+    logger.info(f"Mode: {'full refresh' if full_refresh else 'incremental (diff)'}")
+    logger.info(f"Registrations written: {stats['lobby_registrations']:,} "
+                f"(+{stats['registrations_inserted']:,} / ~{stats['registrations_updated']:,} / "
+                f"-{stats['registrations_removed']:,}, {stats['registrations_ended']:,} ended)")
+    logger.info(f"Communications written: {stats['lobby_communications']:,} "
+                f"(+{stats['communications_inserted']:,} / ~{stats['communications_updated']:,} / "
+                f"-{stats['communications_removed']:,})")
+    logger.info(f"Organizations touched: {stats['organizations']:,}")
+    logger.info(f"Lobbyists touched: {stats['lobbyists']:,}")
     logger.info(f"CONTACTED Relationships: {stats.get('contacted_relationships', 0):,}")
     logger.info(f"LOBBIED_ON Relationships: {stats.get('lobbied_on_relationships', 0):,}")
     if stats.get('unmatched_dpoh_names'):
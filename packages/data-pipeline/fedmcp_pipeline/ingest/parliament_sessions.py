@@ -3,7 +3,7 @@
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 from ..utils.neo4j_client import Neo4jClient
 from ..utils.progress import logger, ProgressTracker, batch_iterator
@@ -27,6 +27,28 @@ def load_parliament_data() -> Dict[str, Any]:
     return data
 
 
+def get_current_session(neo4j_client: Neo4jClient) -> Optional[Tuple[int, int]]:
+    """
+    Return (parliament, session) of the most recently imported Hansard sitting.
+
+    The newest Document is the pipeline's definition of the current session:
+    it follows what has actually been imported, rather than curated metadata.
+
+    Returns:
+        (parliament, session), or None if no Document carries session numbers
+    """
+    result = neo4j_client.run_query("""
+        MATCH (d:Document)
+        WHERE d.parliament_number IS NOT NULL AND d.session_number IS NOT NULL
+        RETURN d.parliament_number AS parliament, d.session_number AS session
+        ORDER BY d.date DESC
+        LIMIT 1
+    """)
+    if not result:
+        return None
+    return int(result[0]["parliament"]), int(result[0]["session"])
+
+
 def ingest_parliaments(neo4j_client: Neo4jClient, batch_size: int = 50) -> int:
     """
     Ingest all 45 Canadian federal parliaments into Neo4j.
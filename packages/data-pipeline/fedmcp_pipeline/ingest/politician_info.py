@@ -44,6 +44,8 @@ def enrich_politician_info(
     Enrich existing Politician nodes with biographical info from PostgreSQL.
 
     Fetches politician info and adds properties like email, phone, twitter, website, etc.
+    Politicians are streamed in id order with keyset pagination, so memory stays
+    bounded by one batch.
 
     Args:
         neo4j_client: Neo4j client instance
@@ -56,7 +58,7 @@ def enrich_politician_info(
     """
     logger.info("Enriching politicians with biographical info...")
 
-    # Fetch politicians with their info
+    # Politicians with their info, one keyset page at a time
     query = """
         SELECT
             p.id,
@@ -69,32 +71,44 @@ def enrich_politician_info(
             ) FILTER (WHERE pi.id IS NOT NULL) as info
         FROM core_politician p
         LEFT JOIN core_politicianinfo pi ON p.id = pi.politician_id
+        WHERE %(after)s IS NULL OR p.id > %(after)s
         GROUP BY p.id, p.slug
         ORDER BY p.id
+        LIMIT %(page_size)s
     """
 
+    total = postgres_client.get_table_row_count("core_politician")
     if limit:
-        query += f" LIMIT {limit}"
+        total = min(total, limit)
 
-    politicians = postgres_client.execute_query(query)
-    logger.info(f"Fetched {len(politicians):,} politicians from PostgreSQL")
-
-    if not politicians:
+    if total == 0:
         logger.warning("No politicians found in PostgreSQL")
         return 0
 
+    # Politician nodes are matched by their PostgreSQL id
+    neo4j_client.run_query("""
+        CREATE INDEX politician_postgres_id IF NOT EXISTS
+        FOR (p:Politician) ON (p.postgres_id)
+    """)
+
     # Process in batches
     progress = ProgressTracker(
-        total=len(politicians),
+        total=total,
         desc="Enriching Politician nodes",
         unit="politicians"
     )
 
-    total_enriched = 0
+    # Update Politician nodes with info
+    cypher = """
+    UNWIND $politicians AS pol
+    MATCH (p:Politician {postgres_id: pol.id})
+    SET p += pol.properties
+    RETURN count(p) as enriched
+    """
 
-    for i in range(0, len(politicians), batch_size):
-        batch = politicians[i:i + batch_size]
+    total_enriched = 0
 
+    for batch in postgres_client.iter_keyset(query, batch_size=batch_size, limit=limit):
         # Transform info array into property map
         for pol in batch:
             if pol.get("info"):
@@ -112,15 +126,6 @@ def enrich_politician_info(
             else:
                 pol["properties"] = {}
 
-        # Update Politician nodes with info
-        cypher = """
-        UNWIND $politicians AS pol
-        MATCH (p:Politician)
-        WHERE p.postgres_id = pol.id
-        SET p += pol.properties
-        RETURN count(p) as enriched
-        """
-
         result = neo4j_client.run_query(cypher, {"politicians": batch})
         enriched = result[0]["enriched"] if result else 0
         total_enriched += enriched
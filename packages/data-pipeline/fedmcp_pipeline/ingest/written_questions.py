@@ -1,7 +1,6 @@
 """Written Questions ingestion from OurCommons to Neo4j."""
 
 import sys
-import unicodedata
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
@@ -11,65 +10,11 @@ FEDMCP_PATH = Path(__file__).parent.parent.parent.parent / "fedmcp" / "src"
 sys.path.insert(0, str(FEDMCP_PATH))
 
 from fedmcp.clients.written_questions import WrittenQuestionsClient, WrittenQuestion
+from ..utils.mp_names import NICKNAME_MAPPING, normalize_name
 from ..utils.neo4j_client import Neo4jClient
 from ..utils.progress import logger
 
 
-# Nickname mapping for MP name matching
-NICKNAME_MAPPING = {
-    'bobby': 'robert',
-    'rob': 'robert',
-    'bob': 'robert',
-    'bill': 'william',
-    'dick': 'richard',
-    'jim': 'james',
-    'joe': 'joseph',
-    'mike': 'michael',
-    'tony': 'anthony',
-    'shuv': 'shuvaloy',
-    'ed': 'edward',
-    'dan': 'daniel',
-    'dave': 'david',
-    'tom': 'thomas',
-    'chris': 'christopher',
-    'nick': 'nicholas',
-    'matt': 'matthew',
-    'pat': 'patrick',
-    'tim': 'timothy',
-    'steve': 'stephen',
-    'rick': 'richard',
-}
-
-
-def normalize_name(name: str) -> str:
-    """
-    Normalize a name for fuzzy matching by:
-    - Removing accents/diacritics
-    - Converting to lowercase
-    - Removing extra whitespace
-    - Removing punctuation
-    """
-    if not name:
-        return ""
-
-    # Remove accents: é → e, è → e, ñ → n, etc.
-    name = ''.join(
-        char for char in unicodedata.normalize('NFD', name)
-        if unicodedata.category(char) != 'Mn'
-    )
-
-    # Remove periods, commas
-    name = name.replace('.', '').replace(',', '')
-
-    # Convert to lowercase and strip whitespace
-    name = name.lower().strip()
-
-    # Normalize whitespace
-    name = ' '.join(name.split())
-
-    return name
-
-
 def build_mp_mapping(neo4j_client: Neo4jClient) -> Dict[str, str]:
     """Build MP name -> ID mapping with variations for fuzzy matching."""
     mp_mapping = {}
@@ -232,19 +177,7 @@ def ingest_written_questions(
 
     # 2b. Deduplicate questions by question_number
     # The scraper returns multiple links per question; prefer ones with asker_name
-    question_map: Dict[str, Any] = {}
-    for q in raw_questions:
-        q_num = q.question_number
-        if q_num not in question_map:
-            question_map[q_num] = q
-        elif q.asker_name and not question_map[q_num].asker_name:
-            # Prefer question with asker_name populated
-            question_map[q_num] = q
-        elif q.status and not question_map[q_num].status:
-            # Prefer question with status populated
-            question_map[q_num] = q
-
-    all_questions = list(question_map.values())
+    all_questions = client.dedupe_questions(raw_questions)
     logger.info(f"Deduplicated to {len(all_questions)} unique questions")
 
     # 3. Filter to new questions
@@ -263,36 +196,16 @@ def ingest_written_questions(
         return stats
 
     # 4. Fetch detailed data for new questions to get question_text
+    # (concurrently; unchanged answered questions come from the scrape state)
     logger.info(f"Fetching detailed data for {len(new_questions)} questions...")
-    detailed_questions = []
-    for i, q in enumerate(new_questions):
-        try:
-            # Extract question number for detail fetch
-            q_num = q.question_number.upper().replace('Q-', '').replace('Q', '')
-            detailed = client.get_question_details(parliament_session, q_num)
-            if detailed:
-                # Merge list data with detail data
-                # List data is more reliable for asker_name, date_asked, status
-                # Detail data has question_text, sessional_paper
-                if q.asker_name:
-                    detailed.asker_name = q.asker_name
-                if q.date_asked:
-                    detailed.date_asked = q.date_asked
-                if q.status:
-                    detailed.status = q.status
-                detailed_questions.append(detailed)
-            else:
-                # Fallback to list data if detail fetch fails
-                detailed_questions.append(q)
-        except Exception as e:
-            logger.warning(f"Failed to fetch details for {q.question_number}: {e}")
-            detailed_questions.append(q)
-
-        # Log progress every 50 questions
-        if (i + 1) % 50 == 0:
-            logger.info(f"  Fetched {i + 1}/{len(new_questions)} question details...")
-
-    logger.info(f"  Fetched details for {len(detailed_questions)} questions")
+    detailed_questions = client.get_questions_details(
+        parliament_session, new_questions, refresh=full_refresh,
+    )
+    sync = client.last_sync
+    logger.info(
+        f"  Fetched details for {sync['fetched']} questions "
+        f"({sync['reused']} unchanged, {sync['failed']} failed)"
+    )
 
     # 5. Build MP name mapping for linking
     logger.info("Building MP name mapping...")
@@ -437,7 +350,8 @@ def update_question_statuses(
         RETURN wq.status <> $old_status as changed
     """
 
-    for q in all_questions:
+    changed = []
+    for q in client.dedupe_questions(all_questions):
         # Get current status
         current = neo4j_client.run_query(
             "MATCH (wq:WrittenQuestion {id: $id}) RETURN wq.status as status, wq.sessional_paper as sessional_paper",
@@ -454,28 +368,33 @@ def update_question_statuses(
             status_changed = old_status != q.status
 
             if status_changed or needs_sessional_paper:
-                sessional_paper = None
-
-                # If newly answered, fetch detail page for sessional_paper
-                if needs_sessional_paper:
-                    try:
-                        q_num = q.question_number.upper().replace('Q-', '').replace('Q', '')
-                        detailed = client.get_question_details(parliament_session, q_num)
-                        if detailed and detailed.sessional_paper:
-                            sessional_paper = detailed.sessional_paper
-                            stats['newly_answered'] += 1
-                            logger.info(f"  {q.question_number} answered - sessional paper: {sessional_paper}")
-                    except Exception as e:
-                        logger.warning(f"Failed to fetch details for {q.question_number}: {e}")
-
-                neo4j_client.run_query(update_query, {
-                    "id": q.id,
-                    "status": q.status,
-                    "answer_date": q.answer_date,
-                    "sessional_paper": sessional_paper,
-                    "old_status": old_status
-                })
-                stats['updated'] += 1
+                changed.append((q, old_status, needs_sessional_paper))
+
+    # If newly answered, fetch detail pages (concurrently) for sessional_paper
+    details = {
+        d.question_number: d
+        for d in client.get_questions_details(
+            parliament_session, [q for q, _, needs in changed if needs]
+        )
+    }
+
+    for q, old_status, needs_sessional_paper in changed:
+        sessional_paper = None
+        if needs_sessional_paper:
+            detailed = details.get(q.question_number)
+            if detailed and detailed.sessional_paper:
+                sessional_paper = detailed.sessional_paper
+                stats['newly_answered'] += 1
+                logger.info(f"  {q.question_number} answered - sessional paper: {sessional_paper}")
+
+        neo4j_client.run_query(update_query, {
+            "id": q.id,
+            "status": q.status,
+            "answer_date": q.answer_date,
+            "sessional_paper": sessional_paper,
+            "old_status": old_status
+        })
+        stats['updated'] += 1
 
     logger.info(f"Updated {stats['updated']} question statuses ({stats['newly_answered']} newly answered)")
     return stats
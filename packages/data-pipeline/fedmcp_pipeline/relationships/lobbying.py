@@ -1,11 +1,76 @@
-"""Lobbying network relationships: WORKS_FOR, LOBBIED_ON, MET_WITH."""
+"""Lobbying network relationships: WORKS_FOR, LOBBIED_ON, MET_WITH.
 
-from typing import Dict, Any
+All joins are computed in Python from the already-loaded registry nodes, then
+written with batched UNWIND MERGEs keyed on node ids. Lobbyist and
+Organization ids are derived from names with :func:`stable_entity_id` (the
+same function ingestion uses), and DPOH names go through a normalized
+DPOH-name -> MP index. No Cypher cartesian products.
+"""
 
+import hashlib
+from collections import Counter
+from typing import Dict, Any, Iterable, List, Optional, Set, Tuple
+
+from ..utils.mp_names import MPNameIndex
 from ..utils.neo4j_client import Neo4jClient
 from ..utils.progress import logger
 
 
+def stable_entity_id(prefix: str, name: str) -> str:
+    """
+    Build a run-independent id for a named entity (Organization, Lobbyist).
+
+    Args:
+        prefix: Id prefix (e.g., "org", "lobbyist")
+        name: Entity name as it appears in the registry
+
+    Returns:
+        Id such as "org-3f2a9c1d0b7e4a65"
+    """
+    key = " ".join(name.lower().split())
+    return f"{prefix}-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}"
+
+
+def _as_rels(pairs: Set[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """Turn (from_id, to_id) pairs into sorted batch_merge_relationships rows."""
+    return [{"from_id": from_id, "to_id": to_id} for from_id, to_id in sorted(pairs)]
+
+
+def match_contacted(
+    communications: Iterable[Dict[str, Any]],
+    mp_index: MPNameIndex,
+) -> Tuple[Set[Tuple[str, str]], Counter]:
+    """
+    Resolve each communication's DPOH names to MPs.
+
+    Args:
+        communications: Dicts with "id" and "dpoh_names"
+        mp_index: Name index over MP nodes
+
+    Returns:
+        Tuple of ({(communication_id, mp_id)}, match quality counter). The
+        counter has one entry per DPOH name: exact, variant, fallback,
+        ambiguous or unmatched.
+    """
+    pairs: Set[Tuple[str, str]] = set()
+    quality: Counter = Counter()
+    cache: Dict[str, Tuple[Optional[str], Optional[str], bool]] = {}
+
+    for comm in communications:
+        for dpoh_name in comm.get("dpoh_names") or []:
+            if dpoh_name not in cache:
+                cache[dpoh_name] = mp_index.resolve_detailed(dpoh_name)
+            mp_id, match_type, ambiguous = cache[dpoh_name]
+
+            if mp_id:
+                pairs.add((comm["id"], mp_id))
+                quality[match_type] += 1
+            else:
+                quality["ambiguous" if ambiguous else "unmatched"] += 1
+
+    return pairs, quality
+
+
 def build_lobbying_network(neo4j_client: Neo4jClient, batch_size: int = 10000) -> Dict[str, int]:
     """
     Build lobbying network relationships.
@@ -24,7 +89,7 @@ def build_lobbying_network(neo4j_client: Neo4jClient, batch_size: int = 10000) -
         batch_size: Batch size for operations
 
     Returns:
-        Dict with counts of created relationships
+        Dict with counts of merged relationships and CONTACTED match quality
     """
     logger.info("=" * 60)
     logger.info("BUILDING LOBBYING NETWORK")
@@ -32,98 +97,89 @@ def build_lobbying_network(neo4j_client: Neo4jClient, batch_size: int = 10000) -
 
     stats = {}
 
-    # 1. Link Lobbyists to Organizations (WORKS_FOR)
-    # Match lobbyist names from registrations to link them to organizations
-    logger.info("Creating WORKS_FOR relationships (Lobbyist -> Organization)...")
-    works_for_query = """
-    MATCH (l:Lobbyist), (r:LobbyRegistration)
-    WHERE l.name = r.registrant_name
-    MATCH (o:Organization)
-    WHERE o.name = r.client_org_name
-    MERGE (l)-[:WORKS_FOR]->(o)
-    RETURN count(*) as count
-    """
-    result = neo4j_client.run_query(works_for_query)
-    stats["works_for"] = result[0]["count"] if result else 0
-    logger.info(f"Created {stats['works_for']:,} WORKS_FOR relationships")
-
-    # 2. Link Lobbyists to LobbyRegistrations (REGISTERED_FOR)
-    logger.info("Creating REGISTERED_FOR relationships (Lobbyist -> LobbyRegistration)...")
-    registered_for_query = """
-    MATCH (l:Lobbyist), (r:LobbyRegistration)
-    WHERE l.name = r.registrant_name
-    MERGE (l)-[:REGISTERED_FOR]->(r)
-    RETURN count(*) as count
-    """
-    result = neo4j_client.run_query(registered_for_query)
-    stats["registered_for"] = result[0]["count"] if result else 0
-    logger.info(f"Created {stats['registered_for']:,} REGISTERED_FOR relationships")
-
-    # 3. Link LobbyRegistrations to Organizations (ON_BEHALF_OF)
-    logger.info("Creating ON_BEHALF_OF relationships (LobbyRegistration -> Organization)...")
-    on_behalf_of_query = """
-    MATCH (r:LobbyRegistration), (o:Organization)
-    WHERE o.name = r.client_org_name
-    MERGE (r)-[:ON_BEHALF_OF]->(o)
-    RETURN count(*) as count
-    """
-    result = neo4j_client.run_query(on_behalf_of_query)
-    stats["on_behalf_of"] = result[0]["count"] if result else 0
-    logger.info(f"Created {stats['on_behalf_of']:,} ON_BEHALF_OF relationships")
-
-    # 4. Link LobbyCommunications to Organizations (COMMUNICATION_BY)
-    logger.info("Creating COMMUNICATION_BY relationships (LobbyCommunication -> Organization)...")
-    comm_by_org_query = """
-    MATCH (c:LobbyCommunication), (o:Organization)
-    WHERE o.name = c.client_org_name
-    MERGE (c)-[:COMMUNICATION_BY]->(o)
-    RETURN count(*) as count
-    """
-    result = neo4j_client.run_query(comm_by_org_query)
-    stats["communication_by"] = result[0]["count"] if result else 0
-    logger.info(f"Created {stats['communication_by']:,} COMMUNICATION_BY relationships")
-
-    # 5. Link LobbyCommunications to Lobbyists (CONDUCTED_BY)
-    logger.info("Creating CONDUCTED_BY relationships (LobbyCommunication -> Lobbyist)...")
-    conducted_by_query = """
-    MATCH (c:LobbyCommunication), (l:Lobbyist)
-    WHERE l.name = c.registrant_name
-    MERGE (c)-[:CONDUCTED_BY]->(l)
-    RETURN count(*) as count
-    """
-    result = neo4j_client.run_query(conducted_by_query)
-    stats["conducted_by"] = result[0]["count"] if result else 0
-    logger.info(f"Created {stats['conducted_by']:,} CONDUCTED_BY relationships")
-
-    # 6. Link LobbyCommunications to MPs (CONTACTED)
-    # Match DPOH names to MP names - this is fuzzy matching
-    logger.info("Creating CONTACTED relationships (LobbyCommunication -> MP)...")
-    contacted_query = """
-    MATCH (c:LobbyCommunication), (mp:MP)
-    WHERE any(dpoh IN c.dpoh_names WHERE mp.name CONTAINS dpoh OR dpoh CONTAINS mp.name)
-    MERGE (c)-[:CONTACTED]->(mp)
-    RETURN count(*) as count
-    """
-    result = neo4j_client.run_query(contacted_query)
-    stats["contacted"] = result[0]["count"] if result else 0
-    logger.info(f"Created {stats['contacted']:,} CONTACTED relationships")
-
-    # 7. Link Lobbyists to MPs (MET_WITH) with date properties from communications
-    logger.info("Creating MET_WITH relationships (Lobbyist -> MP)...")
-    met_with_query = """
-    MATCH (l:Lobbyist)-[:CONDUCTED_BY]-(c:LobbyCommunication)-[:CONTACTED]->(mp:MP)
-    MERGE (l)-[r:MET_WITH]->(mp)
-    ON CREATE SET r.first_contact = c.date, r.last_contact = c.date
-    ON MATCH SET r.last_contact = CASE
-        WHEN r.last_contact IS NULL OR c.date > r.last_contact
-        THEN c.date
-        ELSE r.last_contact
-    END
-    RETURN count(DISTINCT r) as count
-    """
-    result = neo4j_client.run_query(met_with_query)
-    stats["met_with"] = result[0]["count"] if result else 0
-    logger.info(f"Created {stats['met_with']:,} MET_WITH relationships")
+    # 0. Load the registry once (label scans only, no joins)
+    logger.info("Loading lobbying registry from Neo4j...")
+    registrations = neo4j_client.run_query("""
+        MATCH (r:LobbyRegistration)
+        RETURN r.id AS id, r.registrant_name AS registrant_name, r.client_org_name AS client_org_name
+    """)
+    communications = neo4j_client.run_query("""
+        MATCH (c:LobbyCommunication)
+        RETURN c.id AS id, c.registrant_name AS registrant_name,
+               c.client_org_name AS client_org_name, c.dpoh_names AS dpoh_names, c.date AS date
+    """)
+    mp_index = MPNameIndex.from_neo4j(neo4j_client)
+    logger.info(
+        f"Loaded {len(registrations):,} registrations, {len(communications):,} communications, "
+        f"{mp_index.mp_count:,} MPs"
+    )
+
+    # 1. Joins on name-derived ids
+    works_for: Set[Tuple[str, str]] = set()
+    registered_for: Set[Tuple[str, str]] = set()
+    on_behalf_of: Set[Tuple[str, str]] = set()
+    for reg in registrations:
+        lobbyist_id = stable_entity_id("lobbyist", reg["registrant_name"]) if reg["registrant_name"] else None
+        org_id = stable_entity_id("org", reg["client_org_name"]) if reg["client_org_name"] else None
+        if lobbyist_id:
+            registered_for.add((lobbyist_id, reg["id"]))
+        if org_id:
+            on_behalf_of.add((reg["id"], org_id))
+        if lobbyist_id and org_id:
+            works_for.add((lobbyist_id, org_id))
+
+    communication_by: Set[Tuple[str, str]] = set()
+    conducted_by: Set[Tuple[str, str]] = set()
+    comm_lobbyist: Dict[str, str] = {}
+    for comm in communications:
+        org_id = stable_entity_id("org", comm["client_org_name"]) if comm["client_org_name"] else None
+        lobbyist_id = stable_entity_id("lobbyist", comm["registrant_name"]) if comm["registrant_name"] else None
+        if org_id:
+            communication_by.add((comm["id"], org_id))
+        if lobbyist_id:
+            conducted_by.add((comm["id"], lobbyist_id))
+            comm_lobbyist[comm["id"]] = lobbyist_id
+
+    # 2. DPOH name -> MP index
+    contacted, quality = match_contacted(communications, mp_index)
+
+    # 3. MET_WITH aggregated from CONDUCTED_BY + CONTACTED
+    comm_dates = {comm["id"]: comm["date"] for comm in communications}
+    met_with: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for comm_id, mp_id in contacted:
+        lobbyist_id = comm_lobbyist.get(comm_id)
+        if not lobbyist_id:
+            continue
+        date = comm_dates.get(comm_id)
+        contact = met_with.setdefault((lobbyist_id, mp_id), {"first_contact": date, "last_contact": date})
+        if date:
+            if not contact["first_contact"] or date < contact["first_contact"]:
+                contact["first_contact"] = date
+            if not contact["last_contact"] or date > contact["last_contact"]:
+                contact["last_contact"] = date
+
+    # 4. Batched writes
+    edges = [
+        ("works_for", "WORKS_FOR", "Lobbyist", "Organization", _as_rels(works_for)),
+        ("registered_for", "REGISTERED_FOR", "Lobbyist", "LobbyRegistration", _as_rels(registered_for)),
+        ("on_behalf_of", "ON_BEHALF_OF", "LobbyRegistration", "Organization", _as_rels(on_behalf_of)),
+        ("communication_by", "COMMUNICATION_BY", "LobbyCommunication", "Organization", _as_rels(communication_by)),
+        ("conducted_by", "CONDUCTED_BY", "LobbyCommunication", "Lobbyist", _as_rels(conducted_by)),
+        ("contacted", "CONTACTED", "LobbyCommunication", "MP", _as_rels(contacted)),
+        ("met_with", "MET_WITH", "Lobbyist", "MP", [
+            {"from_id": lobbyist_id, "to_id": mp_id, "properties": props}
+            for (lobbyist_id, mp_id), props in sorted(met_with.items())
+        ]),
+    ]
+    for stat_key, rel_type, from_label, to_label, rels in edges:
+        logger.info(f"Creating {rel_type} relationships ({from_label} -> {to_label})...")
+        stats[stat_key] = neo4j_client.batch_merge_relationships(
+            rel_type, rels, from_label=from_label, to_label=to_label, batch_size=batch_size
+        ) if rels else 0
+
+    # Match quality for CONTACTED (one entry per DPOH name occurrence)
+    for match_type in ("exact", "variant", "fallback", "ambiguous", "unmatched"):
+        stats[f"dpoh_{match_type}"] = quality.get(match_type, 0)
 
     logger.info("=" * 60)
     logger.success("✅ LOBBYING NETWORK COMPLETE")
@@ -134,6 +190,12 @@ def build_lobbying_network(neo4j_client: Neo4jClient, batch_size: int = 10000) -
     logger.info(f"CONDUCTED_BY: {stats.get('conducted_by', 0):,}")
     logger.info(f"CONTACTED: {stats.get('contacted', 0):,}")
     logger.info(f"MET_WITH: {stats.get('met_with', 0):,}")
+    logger.info(
+        "DPOH match quality: "
+        f"{stats['dpoh_exact']:,} exact, {stats['dpoh_variant']:,} variant, "
+        f"{stats['dpoh_fallback']:,} fallback, {stats['dpoh_ambiguous']:,} ambiguous, "
+        f"{stats['dpoh_unmatched']:,} unmatched"
+    )
     logger.info("=" * 60)
 
     return stats
@@ -0,0 +1,263 @@
+"""MP name normalization and an in-memory name -> MP id index.
+
+Used wherever external datasets refer to MPs by name only (lobbying DPOH
+names, expense reports) so joins can be resolved in Python with dictionary
+lookups instead of string-matching Cypher over every MP. The nickname table
+and normalization helpers are shared with Hansard speaker matching and
+written question ingestion.
+"""
+
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+
+# Common nickname mappings for Canadian MPs
+NICKNAME_MAPPING = {
+    'bobby': 'robert',
+    'rob': 'robert',
+    'bob': 'robert',
+    'bill': 'william',
+    'dick': 'richard',
+    'jim': 'james',
+    'joe': 'joseph',
+    'mike': 'michael',
+    'tony': 'anthony',
+    'shuv': 'shuvaloy',
+    'ed': 'edward',
+    'dan': 'daniel',
+    'dave': 'david',
+    'tom': 'thomas',
+    'chris': 'christopher',
+    'nick': 'nicholas',
+    'matt': 'matthew',
+    'pat': 'patrick',
+    'tim': 'timothy',
+    'steve': 'stephen',
+    'rick': 'richard',
+}
+
+# Titles stripped before matching ("Hon. Judy A. Sgro" -> "Judy A. Sgro")
+HONORIFICS = ["Right Hon.", "Rt. Hon.", "Hon.", "Dr.", "Rev.", "Prof.", "Mr.", "Mrs.", "Ms.", "Miss"]
+
+_HONORIFICS_RE = re.compile(
+    r"(?<!\w)(?:" + "|".join(re.escape(h) for h in HONORIFICS) + r")(?=\s|$)"
+)
+
+# Match types, best first
+MATCH_EXACT = "exact"
+MATCH_VARIANT = "variant"
+MATCH_FALLBACK = "fallback"
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a name for fuzzy matching by:
+    - Removing accents/diacritics
+    - Converting to lowercase
+    - Removing extra whitespace
+    - Removing punctuation like periods and commas
+
+    Args:
+        name: Name to normalize
+
+    Returns:
+        Normalized name string
+    """
+    if not name:
+        return ""
+
+    # Remove accents: é → e, è → e, ñ → n, etc.
+    name = ''.join(
+        char for char in unicodedata.normalize('NFD', name)
+        if unicodedata.category(char) != 'Mn'
+    )
+
+    # Remove periods (for middle initials like "S." or "A.") and commas
+    name = name.replace('.', '').replace(',', '')
+
+    # Convert to lowercase and normalize whitespace
+    return ' '.join(name.lower().split())
+
+
+def extract_core_name(given_name: str, family_name: str) -> str:
+    """
+    Extract core first and last name, removing middle names/initials.
+
+    Args:
+        given_name: Given/first name (may include middle names/initials)
+        family_name: Family/last name
+
+    Returns:
+        "FirstName LastName" with middle names removed
+    """
+    first_only = given_name.split()[0] if given_name else ""
+
+    # First word of family name (handles hyphenated surnames: "Fancy-Landry" → "Fancy")
+    last_first = family_name.split()[0].split('-')[0] if family_name else ""
+
+    return f"{first_only} {last_first}".strip()
+
+
+def clean_person_name(name: str) -> str:
+    """
+    Turn a raw name ("Sgro, Hon. Judy A.") into "Judy A. Sgro" without titles.
+
+    Args:
+        name: Raw name in "First Last" or "Last, First" format
+
+    Returns:
+        Name in "First Last" order with honorifics removed
+    """
+    name = (name or "").strip()
+    if "," in name:
+        last_name, first_name = (part.strip() for part in name.split(",", 1))
+        name = f"{first_name} {last_name}"
+
+    return " ".join(_HONORIFICS_RE.sub("", name).split())
+
+
+class MPNameIndex:
+    """
+    Hash index from normalized name variants to MP ids.
+
+    Exact keys (full name, "given family") are kept separate from looser
+    variants (core name, nicknames, compound/hyphenated surnames). A key that
+    maps to more than one MP is ambiguous and never resolves, so matching is
+    deterministic regardless of load order.
+
+    Example:
+        >>> index = MPNameIndex([{"id": "mp-1", "name": "Judy A. Sgro",
+        ...                       "given_name": "Judy A.", "family_name": "Sgro"}])
+        >>> index.resolve("Sgro, Hon. Judy")
+        ('mp-1', 'variant')
+    """
+
+    def __init__(self, mps: Iterable[Dict[str, Any]]):
+        self._exact: Dict[str, Set[str]] = {}
+        self._variant: Dict[str, Set[str]] = {}
+        self.mp_count = 0
+
+        for mp in mps:
+            mp_id = mp.get("id")
+            if not mp_id:
+                continue
+            self.mp_count += 1
+            for key in self._exact_keys(mp):
+                self._exact.setdefault(key, set()).add(mp_id)
+            for key in self._variant_keys(mp):
+                self._variant.setdefault(key, set()).add(mp_id)
+
+    @classmethod
+    def from_neo4j(cls, neo4j_client) -> "MPNameIndex":
+        """Build the index from all MP nodes in Neo4j."""
+        result = neo4j_client.run_query("""
+            MATCH (m:MP)
+            RETURN m.id AS id, m.name AS name, m.given_name AS given_name, m.family_name AS family_name
+        """)
+        return cls(result)
+
+    @staticmethod
+    def _exact_keys(mp: Dict[str, Any]) -> List[str]:
+        name = mp.get("name") or ""
+        given = mp.get("given_name") or ""
+        family = mp.get("family_name") or ""
+
+        keys = [normalize_name(name)]
+        if given and family:
+            keys.append(normalize_name(f"{given} {family}"))
+        return [k for k in keys if k]
+
+    @staticmethod
+    def _variant_keys(mp: Dict[str, Any]) -> List[str]:
+        given = mp.get("given_name") or ""
+        family = mp.get("family_name") or ""
+        if not (given and family):
+            return []
+
+        # Core name without middle names/initials ("Amanpreet S. Gill" -> "amanpreet gill")
+        keys = [normalize_name(extract_core_name(given, family))]
+        first_name = normalize_name(given.split()[0])
+
+        # Nickname variations ("Bobby Morrissey" also maps as "Robert Morrissey")
+        if first_name in NICKNAME_MAPPING:
+            formal = NICKNAME_MAPPING[first_name]
+            keys.append(normalize_name(f"{formal} {family}"))
+            keys.append(normalize_name(f"{formal} {family.split()[0].split('-')[0]}"))
+
+        # Compound last names ("Michelle Rempel Garner" -> "Michelle Rempel")
+        if " " in family:
+            keys.append(normalize_name(f"{given} {family.split()[0]}"))
+
+        # Hyphenated last names ("Jessica Fancy-Landry" -> "Jessica Fancy")
+        if "-" in family:
+            first_part = family.split('-')[0]
+            keys.append(normalize_name(f"{given} {first_part}"))
+            keys.append(normalize_name(f"{given.split()[0]} {first_part}"))
+
+        return [k for k in keys if k]
+
+    def _lookup(self, key: str) -> Tuple[Optional[str], Optional[str], bool]:
+        """Look a key up in the exact then variant tables -> (mp_id, match_type, ambiguous)."""
+        for table, match_type in ((self._exact, MATCH_EXACT), (self._variant, MATCH_VARIANT)):
+            ids = table.get(key)
+            if ids:
+                if len(ids) > 1:
+                    return None, None, True
+                return next(iter(ids)), match_type, False
+        return None, None, False
+
+    def resolve(self, name: str) -> Optional[Tuple[str, str]]:
+        """
+        Resolve a person name to an MP id.
+
+        Args:
+            name: Raw name ("First Last" or "Last, First", titles allowed)
+
+        Returns:
+            Tuple of (mp_id, match_type) or None if unmatched or ambiguous
+        """
+        mp_id, match_type, _ = self.resolve_detailed(name)
+        return (mp_id, match_type) if mp_id else None
+
+    def resolve_detailed(self, name: str) -> Tuple[Optional[str], Optional[str], bool]:
+        """
+        Resolve a name, also reporting whether it failed because of ambiguity.
+
+        Returns:
+            Tuple of (mp_id, match_type, ambiguous)
+        """
+        normalized = normalize_name(clean_person_name(name))
+        if not normalized:
+            return None, None, False
+
+        mp_id, match_type, ambiguous = self._lookup(normalized)
+        if mp_id or ambiguous:
+            return mp_id, match_type, ambiguous
+
+        parts = normalized.split()
+        if len(parts) < 2:
+            return None, None, False
+
+        candidates = [
+            # First name + first word of last name
+            f"{parts[0]} {parts[1]}",
+            # First + last, no middle names ("Rhéal Éloi Fortin" -> "rheal fortin")
+            f"{parts[0]} {parts[-1]}",
+        ]
+        # Formal first name in source, nickname in our data ("Robert" -> "Bobby")
+        candidates.extend(
+            f"{nickname} {parts[-1]}"
+            for nickname, formal in sorted(NICKNAME_MAPPING.items())
+            if parts[0] == formal
+        )
+
+        for key in candidates:
+            mp_id, _, ambiguous = self._lookup(key)
+            if mp_id or ambiguous:
+                return mp_id, MATCH_FALLBACK if mp_id else None, ambiguous
+
+        return None, None, False
+
+    def __len__(self) -> int:
+        return len(self._exact) + len(self._variant)
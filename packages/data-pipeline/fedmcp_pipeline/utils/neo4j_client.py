@@ -3,11 +3,16 @@
 from typing import Any, Dict, List, Optional
 
 from neo4j import GraphDatabase, Driver, Session, Result
-from neo4j.exceptions import ServiceUnavailable, AuthError
+from neo4j.exceptions import ServiceUnavailable, AuthError, TransientError
 
 from .progress import logger
 
 
+# Errors worth retrying: lost connections, and deadlocks/lock timeouts between
+# concurrent pipeline stages MERGE-ing relationships onto the same MP nodes
+RETRYABLE_ERRORS = (ServiceUnavailable, TransientError)
+
+
 class Neo4jClient:
     """
     Neo4j client for batch data ingestion.
@@ -163,7 +168,7 @@ class Neo4jClient:
             properties_list: List of property dicts
             merge_keys: Properties to match on (e.g., ["id"] or ["number", "session"])
             batch_size: Nodes per transaction
-            max_retries: Maximum retry attempts for connection errors
+            max_retries: Maximum retry attempts for connection errors and deadlocks
 
         Returns:
             Total number of nodes created or updated
@@ -200,10 +205,10 @@ class Neo4jClient:
                             f"{props_set} properties set (batch {i // batch_size + 1})"
                         )
                     break  # Success, exit retry loop
-                except ServiceUnavailable as e:
+                except RETRYABLE_ERRORS as e:
                     if attempt < max_retries - 1:
                         wait_time = 2 ** attempt
-                        logger.warning(f"Connection error in batch_merge (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s")
+                        logger.warning(f"Retryable error in batch_merge (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s")
                         time.sleep(wait_time)
                     else:
                         logger.error(f"Batch merge failed after {max_retries} attempts: {e}")
@@ -284,12 +289,16 @@ class Neo4jClient:
         from_key: str = "id",
         to_key: str = "id",
         batch_size: int = 10000,
+        max_retries: int = 3,
     ) -> int:
         """
         Merge relationships (create if missing, update if exists).
 
         Same signature as batch_create_relationships but uses MERGE instead of CREATE.
+        Each batch is retried (up to ``max_retries`` attempts) on connection
+        errors and deadlocks; MERGE makes a retried batch idempotent.
         """
+        import time
         total_processed = 0
 
         query = f"""
@@ -300,18 +309,30 @@ class Neo4jClient:
         SET r += COALESCE(rel.properties, {{}})
         """
 
-        with self.driver.session() as session:
-            for i in range(0, len(relationships), batch_size):
-                batch = relationships[i : i + batch_size]
-                result = session.run(query, batch=batch)
-                summary = result.consume()
-                created = summary.counters.relationships_created
-                props_set = summary.counters.properties_set
-                total_processed += len(batch)
-                logger.debug(
-                    f"Merged {rel_type} relationships: {created} created, "
-                    f"{props_set} properties set (batch {i // batch_size + 1})"
-                )
+        for i in range(0, len(relationships), batch_size):
+            batch = relationships[i : i + batch_size]
+
+            for attempt in range(max_retries):
+                try:
+                    with self.driver.session() as session:
+                        result = session.run(query, batch=batch)
+                        summary = result.consume()
+                        created = summary.counters.relationships_created
+                        props_set = summary.counters.properties_set
+                        total_processed += len(batch)
+                        logger.debug(
+                            f"Merged {rel_type} relationships: {created} created, "
+                            f"{props_set} properties set (batch {i // batch_size + 1})"
+                        )
+                    break  # Success, exit retry loop
+                except RETRYABLE_ERRORS as e:
+                    if attempt < max_retries - 1:
+                        wait_time = 2 ** attempt
+                        logger.warning(f"Retryable error merging {rel_type} (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s: {e}")
+                        time.sleep(wait_time)
+                    else:
+                        logger.error(f"Merging {rel_type} failed after {max_retries} attempts: {e}")
+                        raise
 
         logger.info(f"Merged {total_processed:,} {rel_type} relationships total")
         return total_processed
@@ -327,7 +348,7 @@ class Neo4jClient:
         Args:
             query: Cypher query string
             parameters: Query parameters (optional)
-            max_retries: Maximum number of retry attempts for connection errors
+            max_retries: Maximum number of retry attempts for connection errors and deadlocks
 
         Returns:
             List of records as dictionaries
@@ -343,13 +364,13 @@ class Neo4jClient:
                 with self.driver.session() as session:
                     result = session.run(query, parameters or {})
                     return [dict(record) for record in result]
-            except ServiceUnavailable as e:
+            except RETRYABLE_ERRORS as e:
                 if attempt < max_retries - 1:
                     wait_time = 2 ** attempt  # Exponential backoff: 1s, 2s, 4s
-                    logger.warning(f"Connection error (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s: {e}")
+                    logger.warning(f"Retryable error (attempt {attempt + 1}/{max_retries}), retrying in {wait_time}s: {e}")
                     time.sleep(wait_time)
                 else:
-                    logger.error(f"Connection failed after {max_retries} attempts: {e}")
+                    logger.error(f"Query failed after {max_retries} attempts: {e}")
                     raise
 
     def count_nodes(self, label: str) -> int:
@@ -1,7 +1,8 @@
 """PostgreSQL client for OpenParliament database access."""
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from contextlib import contextmanager
+import itertools
 import psycopg2
 from psycopg2.extras import RealDictCursor, execute_batch
 from psycopg2.pool import SimpleConnectionPool
@@ -17,9 +18,12 @@ class PostgresClient:
     - Connection pooling
     - Named tuple results (dict-like access)
     - Batch operations
+    - Keyset-paginated streaming through server-side cursors
     - Transaction management
     """
 
+    _cursor_ids = itertools.count(1)
+
     def __init__(
         self,
         dbname: str,
@@ -107,6 +111,61 @@ class PostgresClient:
                     return [dict(row) for row in results] if dict_cursor else results
                 return []
 
+    def iter_keyset(
+        self,
+        query: str,
+        key: str = "id",
+        batch_size: int = 1000,
+        limit: Optional[int] = None,
+        after: Any = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Stream a table in key order, one batch of rows at a time.
+
+        The query must select ``key``, filter on ``%(after)s`` (NULL on the
+        first page), order by the key and end with ``LIMIT %(page_size)s``:
+
+            SELECT id, text_en FROM bills_billtext
+            WHERE %(after)s IS NULL OR id > %(after)s
+            ORDER BY id
+            LIMIT %(page_size)s
+
+        Each page is a short read executed through a server-side (named)
+        cursor, so neither PostgreSQL nor this process holds more than one
+        batch at a time and no snapshot is held open between pages.
+
+        Args:
+            query: Keyset query as described above
+            key: Column used for keyset pagination (unique, ordered)
+            batch_size: Rows per page
+            limit: Optional maximum number of rows overall
+            after: Start after this key value (e.g., to resume)
+
+        Yields:
+            Lists of rows as dictionaries
+        """
+        remaining = limit
+        while remaining is None or remaining > 0:
+            page_size = batch_size if remaining is None else min(batch_size, remaining)
+            with self.get_connection() as conn:
+                try:
+                    cursor_name = f"fedmcp_keyset_{next(self._cursor_ids)}"
+                    with conn.cursor(name=cursor_name, cursor_factory=RealDictCursor) as cur:
+                        cur.itersize = page_size
+                        cur.execute(query, {"after": after, "page_size": page_size})
+                        rows = [dict(row) for row in cur]
+                finally:
+                    conn.rollback()  # End the read transaction before returning to the pool
+
+            if not rows:
+                return
+            yield rows
+            if len(rows) < page_size:
+                return
+            after = rows[-1][key]
+            if remaining is not None:
+                remaining -= len(rows)
+
     def execute_batch(
         self,
         query: str,
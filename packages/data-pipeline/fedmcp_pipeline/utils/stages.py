@@ -0,0 +1,172 @@
+"""Dependency-ordered stage scheduler for pipeline runs.
+
+Each :class:`Stage` declares the graph resources it reads (``inputs``) and
+writes (``outputs``) - node labels or relationship types. A stage depends on
+every stage that outputs one of its inputs; inputs nobody produces are
+treated as already present. :func:`run_stages` executes the resulting DAG
+with a thread pool, so independent stages run concurrently and a full run
+takes as long as its critical path.
+
+A failing stage only takes down the stages downstream of it; independent
+branches still run to completion.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .progress import logger
+
+
+# Stage statuses
+COMPLETED = "completed"
+FAILED = "failed"
+SKIPPED = "skipped"  # An upstream stage failed
+RESUMED = "resumed"  # Already complete from a previous run
+
+
+@dataclass
+class Stage:
+    """A unit of pipeline work with declared inputs and outputs."""
+
+    name: str
+    func: Callable[[], Any]
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+
+
+@dataclass
+class StageResult:
+    """Outcome of one stage in a run."""
+
+    name: str
+    status: str
+    duration_seconds: float = 0.0
+    result: Any = None
+    error: Optional[str] = None
+    depends_on: List[str] = field(default_factory=list)
+
+
+def stage_dependencies(stages: List[Stage]) -> Dict[str, Set[str]]:
+    """
+    Derive each stage's upstream stages from declared inputs/outputs.
+
+    Raises:
+        ValueError: On duplicate stage names or a dependency cycle
+    """
+    names = [stage.name for stage in stages]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate stage names: {names}")
+
+    producers: Dict[str, Set[str]] = {}
+    for stage in stages:
+        for output in stage.outputs:
+            producers.setdefault(output, set()).add(stage.name)
+
+    deps = {
+        stage.name: {
+            producer
+            for resource in stage.inputs
+            for producer in producers.get(resource, ())
+            if producer != stage.name
+        }
+        for stage in stages
+    }
+
+    # Kahn's algorithm, only to reject cycles up front
+    remaining = {name: set(upstream) for name, upstream in deps.items()}
+    while remaining:
+        ready = [name for name, upstream in remaining.items() if not upstream]
+        if not ready:
+            raise ValueError(f"Stage dependency cycle among: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for upstream in remaining.values():
+            upstream.difference_update(ready)
+
+    return deps
+
+
+def run_stages(
+    stages: List[Stage],
+    max_workers: int = 4,
+    is_complete: Optional[Callable[[Stage], bool]] = None,
+    on_complete: Optional[Callable[[Stage, StageResult], None]] = None,
+) -> Dict[str, StageResult]:
+    """
+    Run stages in dependency order, independent stages concurrently.
+
+    Args:
+        stages: Stages to run
+        max_workers: Maximum stages running at once
+        is_complete: Optional resume check. A stage is skipped as RESUMED when
+            this returns True and none of its upstream stages ran in this call.
+        on_complete: Optional callback after each successful stage (e.g., to
+            record a completion marker)
+
+    Returns:
+        Mapping of stage name -> StageResult, in declaration order
+    """
+    deps = stage_dependencies(stages)
+    by_name = {stage.name: stage for stage in stages}
+    results: Dict[str, StageResult] = {}
+    running: Dict[Future, Tuple[Stage, float]] = {}
+    started: Set[str] = set()
+
+    def execute(stage: Stage) -> Any:
+        logger.info(f"▶ Stage {stage.name} started")
+        return stage.func()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while len(results) < len(stages):
+            # Settle every stage whose upstream stages are all finished
+            progressed = True
+            while progressed:
+                progressed = False
+                for name, upstream in deps.items():
+                    if name in results or name in started:
+                        continue
+                    if not all(dep in results for dep in upstream):
+                        continue
+
+                    stage = by_name[name]
+                    upstream_statuses = {results[dep].status for dep in upstream}
+                    if upstream_statuses & {FAILED, SKIPPED}:
+                        failed = sorted(dep for dep in upstream if results[dep].status in (FAILED, SKIPPED))
+                        logger.warning(f"⏭  Stage {name} skipped (upstream failed: {', '.join(failed)})")
+                        results[name] = StageResult(name, SKIPPED, depends_on=sorted(upstream))
+                        progressed = True
+                    elif upstream_statuses <= {RESUMED} and is_complete and is_complete(stage):
+                        logger.info(f"⏭  Stage {name} already complete, resuming past it")
+                        results[name] = StageResult(name, RESUMED, depends_on=sorted(upstream))
+                        progressed = True
+                    else:
+                        started.add(name)
+                        running[executor.submit(execute, stage)] = (stage, time.time())
+
+            if not running:
+                break  # Everything settled without running anything else
+
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, started_at = running.pop(future)
+                duration = time.time() - started_at
+                upstream = sorted(deps[stage.name])
+                try:
+                    result = StageResult(stage.name, COMPLETED, duration, future.result(), depends_on=upstream)
+                except Exception as e:
+                    logger.error(f"✗ Stage {stage.name} failed after {duration:.1f}s: {e}")
+                    logger.exception(e)
+                    results[stage.name] = StageResult(stage.name, FAILED, duration, error=str(e), depends_on=upstream)
+                    continue
+
+                logger.success(f"✓ Stage {stage.name} completed in {duration:.1f}s")
+                results[stage.name] = result
+                if on_complete:
+                    try:
+                        on_complete(stage, result)
+                    except Exception as e:
+                        logger.warning(f"Could not record completion of stage {stage.name}: {e}")
+
+    return {stage.name: results[stage.name] for stage in stages}
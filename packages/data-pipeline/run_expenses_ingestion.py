@@ -9,13 +9,14 @@ Features:
 - Imports MP office expenses (salaries, travel, hospitality, contracts)
 - Imports House Officer expenses (Speaker, Leaders, Whips, etc.)
 - Fetches CSV data from OurCommons quarterly proactive disclosure
-- Idempotent design: safe to run multiple times (skips existing expenses)
+- Incremental: quarters whose content hash is unchanged are skipped
 - Parameterizable fiscal year range for historical backfilling
 
 Environment variables:
 - NEO4J_URI: Neo4j connection URI (default: bolt://10.128.0.3:7687)
 - NEO4J_USERNAME: Neo4j username (default: neo4j)
 - NEO4J_PASSWORD: Neo4j password (required)
+- EXPENSES_FULL_REFRESH: Set to "true" to rewrite every quarter
 
 Usage:
   # Daily run (current fiscal year)
@@ -70,6 +71,7 @@ def main():
     neo4j_uri = os.getenv('NEO4J_URI', 'bolt://10.128.0.3:7687')
     neo4j_user = os.getenv('NEO4J_USERNAME', 'neo4j')
     neo4j_password = os.getenv('NEO4J_PASSWORD')
+    full_refresh = os.getenv('EXPENSES_FULL_REFRESH', 'false').lower() == 'true'
 
     if not neo4j_password:
         logger.error("NEO4J_PASSWORD environment variable not set!")
@@ -86,6 +88,7 @@ def main():
         logger.info("  - Create Expense nodes with INCURRED relationships to MPs")
         logger.info(f"  - Process {(args.fiscal_year_end - args.fiscal_year_start + 1) * 4} quarters")
         logger.info("  - Skip quarters that are not yet published (no error)")
+        logger.info("  - Skip quarters that have not changed since the last run")
         print()
 
         # Run ingestion
@@ -93,7 +96,8 @@ def main():
             neo4j_client=neo4j,
             fiscal_year_start=args.fiscal_year_start,
             fiscal_year_end=args.fiscal_year_end,
-            batch_size=10000
+            batch_size=10000,
+            full_refresh=full_refresh,
         )
 
         print()
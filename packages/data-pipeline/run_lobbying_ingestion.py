@@ -9,13 +9,14 @@ Features:
 - Downloads ~90MB CSV data from Open Canada portal
 - Caches data locally for subsequent runs
 - Imports lobby registrations and communications
-- Creates Organization and Lobbyist nodes
-- Full refresh of all lobbying data
+- Creates Organization and Lobbyist nodes (stable, name-derived ids)
+- Diff-based refresh: only new, changed, ended or removed records are written
 
 Environment variables:
 - NEO4J_URI: Neo4j connection URI (default: bolt://10.128.0.3:7687)
 - NEO4J_USERNAME: Neo4j username (default: neo4j)
 - NEO4J_PASSWORD: Neo4j password (required)
+- LOBBYING_FULL_REFRESH: Set to "true" to delete and reload all lobbying data
 """
 
 import sys
@@ -37,6 +38,7 @@ def main():
     neo4j_uri = os.getenv('NEO4J_URI', 'bolt://10.128.0.3:7687')
     neo4j_user = os.getenv('NEO4J_USERNAME', 'neo4j')
     neo4j_password = os.getenv('NEO4J_PASSWORD')
+    full_refresh = os.getenv('LOBBYING_FULL_REFRESH', 'false').lower() == 'true'
 
     if not neo4j_password:
         logger.error("NEO4J_PASSWORD environment variable not set!")
@@ -51,17 +53,20 @@ def main():
         logger.info("  - Download ~90MB CSV data from Open Canada portal")
         logger.info("  - Import lobby registrations and communications")
         logger.info("  - Create Organization and Lobbyist nodes")
-        logger.info("  - Full refresh of all lobbying data")
+        if full_refresh:
+            logger.info("  - Full refresh of all lobbying data")
+        else:
+            logger.info("  - Write only records that changed since the last run")
         print()
 
         # Run ingestion
-        stats = ingest_lobbying_data(neo4j, batch_size=10000)
+        stats = ingest_lobbying_data(neo4j, batch_size=10000, full_refresh=full_refresh)
 
         print()
-        logger.success(f"✅ Successfully imported {stats['lobby_registrations']:,} lobby registrations")
-        logger.success(f"✅ Successfully imported {stats['lobby_communications']:,} lobby communications")
-        logger.success(f"✅ Created {stats['organizations']:,} organization nodes")
-        logger.success(f"✅ Created {stats['lobbyists']:,} lobbyist nodes")
+        logger.success(f"✅ Wrote {stats['lobby_registrations']:,} new/changed lobby registrations")
+        logger.success(f"✅ Wrote {stats['lobby_communications']:,} new/changed lobby communications")
+        logger.success(f"✅ Touched {stats['organizations']:,} organization nodes")
+        logger.success(f"✅ Touched {stats['lobbyists']:,} lobbyist nodes")
 
         logger.info("=" * 80)
         logger.info("LOBBYING DATA INGESTION CLOUD RUN JOB - COMPLETED")
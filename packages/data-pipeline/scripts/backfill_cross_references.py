@@ -17,9 +17,24 @@ Usage:
     # Dry run (don't create relationships, just log what would be created)
     python scripts/backfill_cross_references.py --dry-run
 
-    # Limit processing for testing
+    # Limit processing for testing (does not touch the checkpoint)
     python scripts/backfill_cross_references.py --limit 100
 
+    # Resume is automatic; start over instead
+    python scripts/backfill_cross_references.py --reset
+
+Statements are walked newest first with keyset pagination over (time, id).
+Mentions are extracted in a process pool (--workers), resolved once per
+distinct entity, and written per batch with UNWIND. After each batch the
+cursor is saved to a checkpoint file (--checkpoint), so an interrupted run
+continues where it stopped when rerun with the same filters. Once a walk
+completes, later runs with the same filters only walk statements newer than
+the newest one it covered. Historical Hansard imported after that walk is
+older than that bound, so it is only picked up by --unprocessed-only runs,
+which start a new walk every time (the filter itself skips processed
+statements), or after --reset. Runs with --limit neither resume from nor
+write the checkpoint.
+
 Environment Variables:
     NEO4J_URI - Neo4j connection URI
     NEO4J_USERNAME - Neo4j username
@@ -27,18 +42,76 @@ Environment Variables:
 """
 
 import argparse
+import json
 import os
 import sys
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from fedmcp_pipeline.utils.neo4j_client import Neo4jClient
 from fedmcp_pipeline.utils.progress import logger, ProgressTracker
-from fedmcp_pipeline.ingest.cross_reference_agent import CrossReferenceAgent, EntityType
+from fedmcp_pipeline.ingest.cross_reference_agent import CrossReferenceAgent, EntityMention, EntityType
+
+
+# Default checkpoint file (resume position and running totals)
+DEFAULT_CHECKPOINT_PATH = Path.home() / ".cache" / "fedmcp_pipeline" / "cross_reference_backfill.json"
+
+# (time, id) of a statement; statements are walked newest first. Statement.time
+# is stored as an ISO string, so cursors and date bounds compare as strings.
+Cursor = Tuple[str, str]
+
+
+def _statement_filters(
+    *,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None,
+    unprocessed_only: bool = False,
+    after: Optional[Cursor] = None,
+    since: Optional[Cursor] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    """Build the WHERE clause and parameters shared by the page and count queries.
+
+    ``after`` continues a walk below a cursor; ``since`` restricts it to
+    statements newer than a cursor (the newest statement of a completed walk).
+    """
+    where_clauses = [
+        "s.time IS NOT NULL",
+        "s.content_en IS NOT NULL",
+        "length(s.content_en) > 50",
+    ]
+    params: Dict[str, Any] = {}
+
+    if from_date:
+        where_clauses.append("s.time >= $from_date")
+        params["from_date"] = from_date
+
+    if to_date:
+        # Inclusive of the whole to_date day ("2024-12-31T15:00:00" > "2024-12-31")
+        where_clauses.append("s.time < $before_date")
+        params["before_date"] = (date.fromisoformat(to_date) + timedelta(days=1)).isoformat()
+
+    if unprocessed_only:
+        where_clauses.append("NOT (s)-[:MENTIONS]->()")
+
+    if after:
+        # Keyset condition: strictly after the cursor in (time DESC, id DESC) order
+        where_clauses.append(
+            "(s.time < $after_time OR (s.time = $after_time AND s.id < $after_id))"
+        )
+        params["after_time"], params["after_id"] = after
+
+    if since:
+        where_clauses.append(
+            "(s.time > $since_time OR (s.time = $since_time AND s.id > $since_id))"
+        )
+        params["since_time"], params["since_id"] = since
+
+    return " AND ".join(where_clauses), params
 
 
 def get_statements_to_process(
@@ -48,9 +121,14 @@ def get_statements_to_process(
     to_date: Optional[str] = None,
     unprocessed_only: bool = False,
     limit: Optional[int] = None,
-    offset: int = 0,
+    after: Optional[Cursor] = None,
+    since: Optional[Cursor] = None,
 ) -> List[Dict[str, Any]]:
-    """Fetch statements to process from Neo4j.
+    """Fetch the next page of statements to process from Neo4j.
+
+    Pages are keyset-paginated over (time, id), newest first: each page starts
+    right after the ``after`` cursor instead of re-skipping earlier pages, so
+    every page costs the same regardless of depth.
 
     Args:
         neo4j: Neo4j client
@@ -58,46 +136,32 @@ def get_statements_to_process(
         to_date: End date (YYYY-MM-DD)
         unprocessed_only: Only fetch statements without MENTIONS relationships
         limit: Maximum number of statements to return
-        offset: Offset for pagination
+        after: (time, id) of the last statement of the previous page
+        since: Only statements newer than this (time, id)
 
     Returns:
-        List of statement dicts with id, content_en, document_date
+        List of statement dicts with id, time, content_en, h1_en, h2_en, document_date
     """
-    # Build WHERE clauses
-    where_clauses = []
-    params: Dict[str, Any] = {}
-
-    if from_date:
-        where_clauses.append("s.time >= datetime($from_date)")
-        params["from_date"] = from_date
-
-    if to_date:
-        where_clauses.append("s.time <= datetime($to_date)")
-        params["to_date"] = to_date
-
-    if unprocessed_only:
-        where_clauses.append("NOT (s)-[:MENTIONS]->()")
-
-    where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
+    where_clause, params = _statement_filters(
+        from_date=from_date, to_date=to_date, unprocessed_only=unprocessed_only, after=after, since=since,
+    )
 
     query = f"""
     MATCH (s:Statement)
     WHERE {where_clause}
-    AND s.content_en IS NOT NULL
-    AND length(s.content_en) > 50
     WITH s
-    ORDER BY s.time DESC
-    SKIP $offset
+    ORDER BY s.time DESC, s.id DESC
     LIMIT $limit
     OPTIONAL MATCH (s)-[:PART_OF]->(d:Document)
     RETURN s.id AS id,
+           s.time AS time,
            s.content_en AS content_en,
            s.h1_en AS h1_en,
            s.h2_en AS h2_en,
            d.date AS document_date
+    ORDER BY s.time DESC, s.id DESC
     """
 
-    params["offset"] = offset
     params["limit"] = limit or 1000
 
     return neo4j.run_query(query, params)
@@ -109,29 +173,17 @@ def get_total_statement_count(
     from_date: Optional[str] = None,
     to_date: Optional[str] = None,
     unprocessed_only: bool = False,
+    after: Optional[Cursor] = None,
+    since: Optional[Cursor] = None,
 ) -> int:
-    """Get total count of statements matching criteria."""
-    where_clauses = []
-    params: Dict[str, Any] = {}
-
-    if from_date:
-        where_clauses.append("s.time >= datetime($from_date)")
-        params["from_date"] = from_date
-
-    if to_date:
-        where_clauses.append("s.time <= datetime($to_date)")
-        params["to_date"] = to_date
-
-    if unprocessed_only:
-        where_clauses.append("NOT (s)-[:MENTIONS]->()")
-
-    where_clause = " AND ".join(where_clauses) if where_clauses else "1=1"
+    """Get total count of statements matching criteria (between the cursors, if given)."""
+    where_clause, params = _statement_filters(
+        from_date=from_date, to_date=to_date, unprocessed_only=unprocessed_only, after=after, since=since,
+    )
 
     query = f"""
     MATCH (s:Statement)
     WHERE {where_clause}
-    AND s.content_en IS NOT NULL
-    AND length(s.content_en) > 50
     RETURN count(s) AS total
     """
 
@@ -139,6 +191,26 @@ def get_total_statement_count(
     return result[0]["total"] if result else 0
 
 
+def load_checkpoint(path: Path, filters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Load a checkpoint written by a previous run with the same filters."""
+    try:
+        checkpoint = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if checkpoint.get("filters") != filters:
+        logger.warning(f"Ignoring checkpoint {path}: it was written for different filters")
+        return None
+    return checkpoint
+
+
+def save_checkpoint(path: Path, checkpoint: Dict[str, Any]) -> None:
+    """Persist the checkpoint atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(checkpoint, indent=2))
+    tmp_path.replace(path)
+
+
 def detect_debate_stage(h1: Optional[str], h2: Optional[str]) -> Optional[str]:
     """Detect debate stage from statement headers.
 
@@ -163,70 +235,109 @@ def detect_debate_stage(h1: Optional[str], h2: Optional[str]) -> Optional[str]:
     return None
 
 
+_extraction_agent: Optional[CrossReferenceAgent] = None
+
+
+def extract_statement_mentions(
+    statements: List[Tuple[str, str]],
+) -> List[Tuple[str, List[EntityMention]]]:
+    """Extract (unresolved) mentions from (statement_id, text) pairs.
+
+    Pure regex work with no Neo4j access, so it runs in worker processes.
+    """
+    global _extraction_agent
+    if _extraction_agent is None:
+        _extraction_agent = CrossReferenceAgent(neo4j_client=None, resolve_entities=False)
+    return [
+        (statement_id, _extraction_agent.extract_mentions(text, statement_id))
+        for statement_id, text in statements
+    ]
+
+
+def _chunks(items: List[Any], count: int) -> List[List[Any]]:
+    """Split items into at most ``count`` contiguous chunks of similar size."""
+    size = max(1, -(-len(items) // max(count, 1)))
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _empty_stats() -> Dict[str, Any]:
+    return {
+        "processed": 0,
+        "with_mentions": 0,
+        "relationships_created": 0,
+        "by_type": {
+            "bill": 0,
+            "mp": 0,
+            "committee": 0,
+            "petition": 0,
+            "vote": 0,
+        },
+    }
+
+
 def process_statement_batch(
     neo4j: Neo4jClient,
     agent: CrossReferenceAgent,
     statements: List[Dict[str, Any]],
     *,
     dry_run: bool = False,
+    executor: Optional[ProcessPoolExecutor] = None,
+    workers: int = 1,
 ) -> Dict[str, int]:
     """Process a batch of statements.
 
+    Mentions are extracted in the process pool (when given), resolved in this
+    process through the agent's caches, and written with one UNWIND per
+    target label.
+
     Args:
         neo4j: Neo4j client
-        agent: Cross-reference agent
+        agent: Cross-reference agent (used for resolution and writes)
         statements: List of statement dicts
         dry_run: If True, don't create relationships
+        executor: Optional process pool for mention extraction
+        workers: Number of chunks to split the batch into for the pool
 
     Returns:
         Statistics dict
     """
-    stats = {
-        "processed": 0,
-        "with_mentions": 0,
-        "relationships_created": 0,
-        "by_type": {
-            "bill": 0,
-            "mp": 0,
-            "committee": 0,
-            "petition": 0,
-            "vote": 0,
-        },
-    }
+    stats = _empty_stats()
+
+    texts = [(stmt["id"], stmt.get("content_en") or "") for stmt in statements]
+    if executor is not None and len(texts) > 1:
+        extracted = [
+            item
+            for chunk_result in executor.map(extract_statement_mentions, _chunks(texts, workers))
+            for item in chunk_result
+        ]
+    else:
+        extracted = extract_statement_mentions(texts)
+
+    by_id = {stmt["id"]: stmt for stmt in statements}
+    items = []
+    for statement_id, mentions in extracted:
+        stats["processed"] += 1
+        if not mentions:
+            continue
 
-    for stmt in statements:
-        statement_id = stmt["id"]
-        content = stmt.get("content_en", "")
-        h1 = stmt.get("h1_en")
-        h2 = stmt.get("h2_en")
+        agent.resolve_mentions(mentions)
+        stats["with_mentions"] += 1
 
-        # Extract mentions
-        mentions = agent.extract_mentions(content, statement_id)
+        # Count by type
+        for mention in mentions:
+            if mention.normalized_id:
+                type_key = mention.entity_type.value
+                if type_key in stats["by_type"]:
+                    stats["by_type"][type_key] += 1
 
-        stats["processed"] += 1
+        stmt = by_id[statement_id]
+        debate_stage = detect_debate_stage(stmt.get("h1_en"), stmt.get("h2_en"))
+        properties = {"debate_stage": debate_stage} if debate_stage else {}
+        items.append((statement_id, mentions, properties))
 
-        if mentions:
-            stats["with_mentions"] += 1
-
-            # Count by type
-            for mention in mentions:
-                if mention.normalized_id:
-                    type_key = mention.entity_type.value
-                    if type_key in stats["by_type"]:
-                        stats["by_type"][type_key] += 1
-
-            # Create relationships (unless dry run)
-            if not dry_run:
-                debate_stage = detect_debate_stage(h1, h2)
-                properties = {"debate_stage": debate_stage} if debate_stage else {}
-
-                created = agent.create_mention_relationships(
-                    statement_id,
-                    "Statement",
-                    mentions,
-                    properties=properties,
-                )
-                stats["relationships_created"] += created
+    # Create relationships (unless dry run)
+    if items and not dry_run:
+        stats["relationships_created"] = agent.create_mention_relationships_batch("Statement", items)
 
     return stats
 
@@ -240,17 +351,32 @@ def run_backfill(
     limit: Optional[int] = None,
     batch_size: int = 500,
     dry_run: bool = False,
+    workers: int = 1,
+    checkpoint_path: Optional[Path] = None,
+    resume: bool = True,
 ) -> Dict[str, Any]:
     """Run the cross-reference backfill process.
 
+    Statements are walked newest first with keyset pagination. After every
+    batch is written, the (time, id) cursor and running totals are saved to
+    the checkpoint file, so an interrupted run resumes where it stopped. After
+    a walk completes, the next run walks only statements newer than the newest
+    statement that walk covered - except with ``unprocessed_only``, where
+    every run after a completed walk starts over so that older statements
+    imported since are not missed. Limited runs do not use the checkpoint.
+
     Args:
         neo4j: Neo4j client
         from_date: Start date filter
         to_date: End date filter
         unprocessed_only: Only process statements without MENTIONS relationships
-        limit: Total limit on statements to process
+        limit: Total limit on statements to process in this run (for testing;
+            the checkpoint is neither read nor written)
         batch_size: Batch size for processing
-        dry_run: If True, don't create relationships
+        dry_run: If True, don't create relationships (and don't checkpoint)
+        workers: Processes used for mention extraction (1 = in-process)
+        checkpoint_path: Checkpoint file (default: ~/.cache/fedmcp_pipeline/cross_reference_backfill.json)
+        resume: Continue from the checkpoint if it matches these filters
 
     Returns:
         Overall statistics
@@ -262,12 +388,45 @@ def run_backfill(
     if dry_run:
         logger.info("DRY RUN MODE - no relationships will be created")
 
-    # Get total count
+    checkpoint_path = checkpoint_path or DEFAULT_CHECKPOINT_PATH
+    filters = {"from_date": from_date, "to_date": to_date, "unprocessed_only": unprocessed_only}
+    if limit:
+        logger.info("Limited run: the checkpoint is neither read nor written")
+    checkpoint = load_checkpoint(checkpoint_path, filters) if resume and not limit else None
+
+    cursor: Optional[Cursor] = None  # Walk position (last statement processed)
+    since: Optional[Cursor] = None  # Lower bound: newest statement of the last completed walk
+    newest: Optional[Cursor] = None  # Newest statement of the current walk
+    overall_stats = _empty_stats()
+    if checkpoint:
+        overall_stats = checkpoint.get("stats") or overall_stats
+        since = tuple(checkpoint["since"]) if checkpoint.get("since") else None
+        if checkpoint.get("completed") and unprocessed_only:
+            # The filter already skips processed statements; walking everything
+            # again also finds older statements imported since that walk
+            since = None
+            logger.info("Previous backfill complete; walking all unprocessed statements again")
+        elif checkpoint.get("completed"):
+            # Only statements ingested since that walk are left to do
+            since = tuple(checkpoint["newest"]) if checkpoint.get("newest") else None
+            if since:
+                logger.info(f"Previous backfill complete; processing statements newer than {since[1]} ({since[0]})")
+        elif checkpoint.get("cursor"):
+            cursor = tuple(checkpoint["cursor"])
+            newest = tuple(checkpoint["newest"]) if checkpoint.get("newest") else None
+            logger.info(
+                f"Resuming after statement {cursor[1]} ({cursor[0]}), "
+                f"{overall_stats['processed']:,} statements already processed"
+            )
+
+    # Get remaining count
     total = get_total_statement_count(
         neo4j,
         from_date=from_date,
         to_date=to_date,
         unprocessed_only=unprocessed_only,
+        after=cursor,
+        since=since,
     )
 
     if limit:
@@ -276,64 +435,69 @@ def run_backfill(
     logger.info(f"Found {total:,} statements to process")
 
     if total == 0:
-        return {"total": 0, "processed": 0}
+        return {"total": 0, **overall_stats}
 
     # Initialize agent
     agent = CrossReferenceAgent(neo4j, resolve_entities=True)
-
-    # Overall statistics
-    overall_stats = {
-        "total": total,
-        "processed": 0,
-        "with_mentions": 0,
-        "relationships_created": 0,
-        "by_type": {
-            "bill": 0,
-            "mp": 0,
-            "committee": 0,
-            "petition": 0,
-            "vote": 0,
-        },
-    }
+    overall_stats["total"] = total
+
+    def save(completed: bool = False) -> None:
+        if dry_run or limit:
+            return
+        save_checkpoint(checkpoint_path, {
+            "filters": filters,
+            "cursor": list(cursor) if cursor else None,
+            "since": list(since) if since else None,
+            "newest": list(newest or since) if (newest or since) else None,
+            "completed": completed,
+            "stats": {k: v for k, v in overall_stats.items() if k != "total"},
+            "updated_at": datetime.utcnow().isoformat(),
+        })
 
     # Process in batches
     progress = ProgressTracker(total=total, desc="Processing statements", unit="stmts")
-    offset = 0
     remaining = total
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
 
-    while remaining > 0:
-        current_batch_size = min(batch_size, remaining)
-
-        statements = get_statements_to_process(
-            neo4j,
-            from_date=from_date,
-            to_date=to_date,
-            unprocessed_only=unprocessed_only,
-            limit=current_batch_size,
-            offset=offset,
-        )
-
-        if not statements:
-            break
-
-        batch_stats = process_statement_batch(neo4j, agent, statements, dry_run=dry_run)
-
-        # Update overall stats
-        overall_stats["processed"] += batch_stats["processed"]
-        overall_stats["with_mentions"] += batch_stats["with_mentions"]
-        overall_stats["relationships_created"] += batch_stats["relationships_created"]
-        for type_key in overall_stats["by_type"]:
-            overall_stats["by_type"][type_key] += batch_stats["by_type"].get(type_key, 0)
-
-        progress.update(len(statements))
-        offset += len(statements)
-        remaining -= len(statements)
-
-        # Clear agent caches periodically to avoid memory buildup
-        if offset % 5000 == 0:
-            agent.clear_caches()
-
-    progress.close()
+    try:
+        while remaining > 0:
+            statements = get_statements_to_process(
+                neo4j,
+                from_date=from_date,
+                to_date=to_date,
+                unprocessed_only=unprocessed_only,
+                limit=min(batch_size, remaining),
+                after=cursor,
+                since=since,
+            )
+
+            if not statements:
+                break
+
+            batch_stats = process_statement_batch(
+                neo4j, agent, statements, dry_run=dry_run, executor=executor, workers=workers,
+            )
+
+            # Update overall stats
+            overall_stats["processed"] += batch_stats["processed"]
+            overall_stats["with_mentions"] += batch_stats["with_mentions"]
+            overall_stats["relationships_created"] += batch_stats["relationships_created"]
+            for type_key in overall_stats["by_type"]:
+                overall_stats["by_type"][type_key] += batch_stats["by_type"].get(type_key, 0)
+
+            if newest is None:
+                newest = (statements[0]["time"], statements[0]["id"])
+            cursor = (statements[-1]["time"], statements[-1]["id"])
+            save()
+
+            progress.update(len(statements))
+            remaining -= len(statements)
+
+        save(completed=True)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        progress.close()
 
     # Print summary
     logger.info("=" * 60)
@@ -373,7 +537,7 @@ def main():
         "--limit",
         type=int,
         default=None,
-        help="Limit total number of statements to process",
+        help="Limit total number of statements to process (for testing; ignores the checkpoint)",
     )
     parser.add_argument(
         "--batch-size",
@@ -386,6 +550,23 @@ def main():
         action="store_true",
         help="Don't create relationships, just log what would be created",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Processes for mention extraction (default: CPU count)",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=DEFAULT_CHECKPOINT_PATH,
+        help=f"Checkpoint file (default: {DEFAULT_CHECKPOINT_PATH})",
+    )
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Ignore any existing checkpoint and start from the newest statement",
+    )
     parser.add_argument(
         "--neo4j-uri",
         type=str,
@@ -426,6 +607,9 @@ def main():
             limit=args.limit,
             batch_size=args.batch_size,
             dry_run=args.dry_run,
+            workers=args.workers,
+            checkpoint_path=args.checkpoint,
+            resume=not args.reset,
         )
 
         return 0 if results.get("processed", 0) >= 0 else 1
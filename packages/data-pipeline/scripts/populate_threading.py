@@ -3,32 +3,45 @@
 Hansard Threading Population Script
 
 This script analyzes Statement nodes in Neo4j and populates threading metadata:
-- thread_id: UUID identifying a conversation thread
+- thread_id: Deterministic UUID identifying a conversation thread
 - parent_statement_id: ID of the statement being replied to
 - sequence_in_thread: Position in thread (0 = root, 1, 2, 3...)
 
 It also creates REPLIES_TO relationships between statements.
 
 Algorithm:
-1. Process documents in chronological order
+1. Stream every document's statements from Neo4j in document batches
 2. Within each document, group statements by topic (h2/h3)
-3. Detect conversation patterns:
+3. Detect conversation patterns (in a process pool):
    - Question → Answer sequences
    - Same speaker continuations
    - Time proximity (<= 5 minutes)
-4. Assign thread IDs and create relationships
+4. Assign thread IDs and write properties + relationships with UNWIND batches
+
+Thread IDs are derived from the root statement ID (UUIDv5), so reruns produce
+the same IDs and MERGE the same REPLIES_TO edges - the script is idempotent.
+Each document's previous REPLIES_TO edges and thread properties are cleared
+in the same write, so threads that changed on a rerun leave nothing stale.
+Threaded documents are stamped with ``threaded_at`` so ``--incremental`` only
+processes newly imported documents. A document that fails thread detection is
+logged, counted as failed and left unstamped, so the next run retries it.
 
 Usage:
-    python populate_threading.py
+    python populate_threading.py                      # Thread every document
+    python populate_threading.py --incremental        # Only documents not yet threaded
     python populate_threading.py --document-id 12345  # Process specific document
+    python populate_threading.py --workers 8          # Size of the detection process pool
     python populate_threading.py --dry-run            # Preview without writing
 """
 
 import argparse
 import logging
+import os
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
+from functools import partial
+from typing import Any, Iterator, List, Dict, Optional, Tuple
 from collections import defaultdict
 
 from neo4j import GraphDatabase
@@ -41,6 +54,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Namespace for deterministic thread IDs (uuid5 of the root statement ID)
+THREAD_ID_NAMESPACE = uuid.UUID('6f1c2a4e-5b0d-4c8e-9a57-3e2d1f0b7c61')
+
+
+def make_thread_id(root_statement_id: Any) -> str:
+    """Derive a stable thread ID from the thread's root statement ID."""
+    return str(uuid.uuid5(THREAD_ID_NAMESPACE, str(root_statement_id)))
+
+
+def thread_document(document_id: int, statements: List[Dict]) -> Tuple[int, List[Dict], int]:
+    """
+    Detect threads for one document and flatten them into write rows.
+
+    Module-level so it can be shipped to a ProcessPoolExecutor worker.
+
+    Args:
+        document_id: Document ID the statements belong to
+        statements: Statement dicts ordered by time (times already parsed)
+
+    Returns:
+        Tuple of (document_id, rows, thread_count) where each row has
+        id, thread_id, sequence and parent_id keys
+    """
+    rows = []
+    thread_count = 0
+
+    for group_statements in ThreadingAnalyzer._group_by_topic(statements).values():
+        for thread in ThreadingAnalyzer._detect_threads(group_statements):
+            thread_id = make_thread_id(thread[0]['id'])
+            thread_count += 1
+            for idx, stmt in enumerate(thread):
+                rows.append({
+                    'id': stmt['id'],
+                    'thread_id': thread_id,
+                    'sequence': idx,
+                    'parent_id': thread[idx - 1]['id'] if idx > 0 else None,
+                })
+
+    return document_id, rows, thread_count
+
 
 class ThreadingAnalyzer:
     """Analyzes statements and detects conversational threading patterns."""
@@ -54,53 +107,32 @@ class ThreadingAnalyzer:
     # Statement types that are replies
     REPLY_TYPES = {'answer', 'interjection'}
 
-    def __init__(self, driver):
+    # Documents whose statements are fetched per streaming query
+    DOCUMENT_BATCH_SIZE = 50
+
+    # Statement rows per UNWIND write (whole documents; a batch may run over)
+    WRITE_BATCH_SIZE = 5000
+
+    def __init__(self, driver, workers: Optional[int] = None):
         self.driver = driver
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
 
-    def process_all_documents(self, dry_run: bool = False) -> Dict[str, int]:
+    def process_all_documents(self, dry_run: bool = False, incremental: bool = False) -> Dict[str, int]:
         """
         Process all documents and populate threading.
 
+        Args:
+            dry_run: If True, detect threads but don't write to the database
+            incremental: If True, only process documents without ``threaded_at``
+
         Returns:
-            Dict with statistics: threads_created, relationships_created
+            Dict with statistics: threads_created, relationships_created,
+            documents_processed, documents_failed
         """
-        stats = {'threads_created': 0, 'relationships_created': 0, 'documents_processed': 0}
-
-        with self.driver.session() as session:
-            # Get all documents ordered by date
-            result = session.run("""
-                MATCH (d:Document)
-                WHERE d.public = true
-                RETURN d.id AS id, d.date AS date, d.document_type AS type
-                ORDER BY d.date DESC
-                LIMIT 100
-            """)
-
-            documents = list(result)
-            logger.info(f"Found {len(documents)} documents to process")
-
-            for idx, record in enumerate(documents, 1):
-                doc_id = record['id']
-                doc_date = record['date']
-                doc_type = record['type']
-
-                logger.info(f"[{idx}/{len(documents)}] Processing document {doc_id} "
-                           f"({doc_type}, {doc_date})")
-
-                try:
-                    doc_stats = self.process_document(doc_id, dry_run=dry_run)
-                    stats['threads_created'] += doc_stats['threads']
-                    stats['relationships_created'] += doc_stats['relationships']
-                    stats['documents_processed'] += 1
-
-                    logger.info(f"  Created {doc_stats['threads']} threads, "
-                               f"{doc_stats['relationships']} relationships")
-
-                except Exception as e:
-                    logger.error(f"  Error processing document {doc_id}: {e}")
-                    continue
-
-        return stats
+        document_ids = self._get_document_ids(incremental=incremental)
+        logger.info(f"Found {len(document_ids):,} documents to process"
+                    f"{' (incremental)' if incremental else ''}")
+        return self.process_documents(document_ids, dry_run=dry_run)
 
     def process_document(self, document_id: int, dry_run: bool = False) -> Dict[str, int]:
         """
@@ -113,56 +145,178 @@ class ThreadingAnalyzer:
         Returns:
             Dict with statistics: threads, relationships
         """
-        stats = {'threads': 0, 'relationships': 0}
+        stats = self.process_documents([document_id], dry_run=dry_run)
+        return {'threads': stats['threads_created'], 'relationships': stats['relationships_created']}
 
-        with self.driver.session() as session:
-            # Get all statements for this document, ordered by time
-            result = session.run("""
-                MATCH (s:Statement)-[:PART_OF]->(d:Document {id: $doc_id})
-                RETURN
-                    s.id AS id,
-                    s.time AS time,
-                    s.statement_type AS type,
-                    s.who_en AS who,
-                    s.politician_id AS politician_id,
-                    s.h1_en AS h1,
-                    s.h2_en AS h2,
-                    s.h3_en AS h3,
-                    s.procedural AS procedural,
-                    s.wordcount AS wordcount
-                ORDER BY s.time ASC
-            """, doc_id=document_id)
-
-            statements = [dict(record) for record in result]
+    def process_documents(self, document_ids: List[int], dry_run: bool = False) -> Dict[str, int]:
+        """
+        Stream statements for the given documents, detect threads in a process
+        pool and write the results in UNWIND batches.
 
-            if not statements:
-                logger.warning(f"  No statements found for document {document_id}")
-                return stats
+        Args:
+            document_ids: Document IDs to process
+            dry_run: If True, don't write changes to database
 
-            logger.info(f"  Analyzing {len(statements)} statements...")
+        Returns:
+            Dict with statistics: threads_created, relationships_created,
+            documents_processed, documents_failed
+        """
+        stats = {'threads_created': 0, 'relationships_created': 0, 'documents_processed': 0, 'documents_failed': 0}
+        if not document_ids:
+            return stats
+
+        executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        pending_docs: List[Dict] = []  # {'id': document_id, 'rows': [...]}
+        pending_row_count = 0
+
+        try:
+            for batch_start in range(0, len(document_ids), self.DOCUMENT_BATCH_SIZE):
+                batch_ids = document_ids[batch_start:batch_start + self.DOCUMENT_BATCH_SIZE]
+                documents = list(self._stream_statements(batch_ids))
+
+                for doc_id, result in self._thread_documents(executor, documents):
+                    if result is None:
+                        stats['documents_failed'] += 1
+                        continue
+                    _, rows, thread_count = result
+                    stats['threads_created'] += thread_count
+                    stats['relationships_created'] += len(rows) - thread_count
+                    stats['documents_processed'] += 1
+                    pending_docs.append({'id': doc_id, 'rows': rows})
+                    pending_row_count += len(rows)
 
-            # Group statements by topic (h2) for better threading
-            topic_groups = self._group_by_topic(statements)
+                # Documents with no statements are still marked as threaded
+                seen = {doc_id for doc_id, _ in documents}
+                pending_docs.extend({'id': doc_id, 'rows': []} for doc_id in batch_ids if doc_id not in seen)
 
-            # Detect threads within each topic group
-            all_threads = []
-            for topic, group_statements in topic_groups.items():
-                threads = self._detect_threads(group_statements)
-                all_threads.extend(threads)
-                logger.debug(f"    Topic '{topic[:50]}': {len(threads)} threads detected")
+                if not dry_run and pending_row_count >= self.WRITE_BATCH_SIZE:
+                    self._write_documents(pending_docs)
+                    pending_docs, pending_row_count = [], 0
 
-            logger.info(f"  Total threads detected: {len(all_threads)}")
+                done = min(batch_start + self.DOCUMENT_BATCH_SIZE, len(document_ids))
+                logger.info(f"[{done:,}/{len(document_ids):,}] documents analyzed - "
+                           f"{stats['threads_created']:,} threads, "
+                           f"{stats['relationships_created']:,} relationships, "
+                           f"{stats['documents_failed']:,} failed")
 
-            if not dry_run:
-                # Write threading metadata to database
-                for thread in all_threads:
-                    self._write_thread(session, thread)
-                    stats['threads'] += 1
-                    stats['relationships'] += len(thread) - 1  # n-1 relationships for n statements
+            if not dry_run and pending_docs:
+                self._write_documents(pending_docs)
+        finally:
+            if executor:
+                executor.shutdown()
 
         return stats
 
-    def _group_by_topic(self, statements: List[Dict]) -> Dict[str, List[Dict]]:
+    @staticmethod
+    def _thread_documents(
+        executor: Optional[ProcessPoolExecutor],
+        documents: List[Tuple[int, List[Dict]]],
+    ) -> Iterator[Tuple[int, Optional[Tuple[int, List[Dict], int]]]]:
+        """
+        Run thread_document for each document, in the pool when there is one.
+
+        Yields:
+            (document_id, thread_document result), with None as the result
+            when detection raised for that document
+        """
+        if executor:
+            futures = [(doc_id, executor.submit(thread_document, doc_id, stmts)) for doc_id, stmts in documents]
+            calls = [(doc_id, future.result) for doc_id, future in futures]
+        else:
+            calls = [(doc_id, partial(thread_document, doc_id, stmts)) for doc_id, stmts in documents]
+
+        for doc_id, call in calls:
+            try:
+                yield doc_id, call()
+            except Exception as e:
+                logger.error(f"  Error processing document {doc_id}: {e}")
+                yield doc_id, None
+
+    def _get_document_ids(self, incremental: bool = False) -> List[int]:
+        """Return public document IDs (optionally only unthreaded ones), oldest first."""
+        where = "d.public = true"
+        if incremental:
+            where += " AND d.threaded_at IS NULL"
+
+        with self.driver.session() as session:
+            result = session.run(f"""
+                MATCH (d:Document)
+                WHERE {where}
+                RETURN d.id AS id
+                ORDER BY d.date ASC
+            """)
+            return [record['id'] for record in result]
+
+    def _stream_statements(self, document_ids: List[int]) -> Iterator[Tuple[int, List[Dict]]]:
+        """
+        Yield (document_id, statements) for a batch of documents.
+
+        Statements are ordered by time with times converted to Python datetimes
+        so they can be pickled to worker processes.
+        """
+        with self.driver.session() as session:
+            result = session.run("""
+                UNWIND $doc_ids AS doc_id
+                MATCH (s:Statement)-[:PART_OF]->(:Document {id: doc_id})
+                WITH doc_id, s
+                ORDER BY s.time ASC
+                RETURN doc_id, collect({
+                    id: s.id,
+                    time: s.time,
+                    type: s.statement_type,
+                    who: s.who_en,
+                    politician_id: s.politician_id,
+                    h1: s.h1_en,
+                    h2: s.h2_en,
+                    h3: s.h3_en,
+                    procedural: s.procedural,
+                    wordcount: s.wordcount
+                }) AS statements
+            """, doc_ids=document_ids)
+
+            for record in result:
+                statements = record['statements']
+                for stmt in statements:
+                    stmt['time'] = self._parse_time(stmt.get('time'))
+                yield record['doc_id'], statements
+
+    def _write_documents(self, documents: List[Dict]):
+        """
+        Replace the threading of whole documents in one UNWIND: clear each
+        document's REPLIES_TO edges and thread properties, write the new ones
+        and stamp the document as threaded.
+
+        Args:
+            documents: Dicts with the document ``id`` and its thread ``rows``
+        """
+        with self.driver.session() as session:
+            session.run("""
+                UNWIND $docs AS doc
+                MATCH (d:Document {id: doc.id})
+                CALL {
+                    WITH d
+                    MATCH (s:Statement)-[:PART_OF]->(d)
+                    OPTIONAL MATCH (s)-[r:REPLIES_TO]->()
+                    DELETE r
+                    REMOVE s.thread_id, s.sequence_in_thread, s.parent_statement_id
+                }
+                CALL {
+                    WITH doc
+                    UNWIND doc.rows AS row
+                    MATCH (s:Statement {id: row.id})
+                    SET s.thread_id = row.thread_id,
+                        s.sequence_in_thread = row.sequence,
+                        s.parent_statement_id = row.parent_id
+                    WITH s, row
+                    WHERE row.parent_id IS NOT NULL
+                    MATCH (parent:Statement {id: row.parent_id})
+                    MERGE (s)-[:REPLIES_TO]->(parent)
+                }
+                SET d.threaded_at = datetime()
+            """, docs=documents).consume()
+
+    @staticmethod
+    def _group_by_topic(statements: List[Dict]) -> Dict[str, List[Dict]]:
         """
         Group statements by topic heading (h2).
 
@@ -178,7 +332,8 @@ class ThreadingAnalyzer:
 
         return dict(groups)
 
-    def _detect_threads(self, statements: List[Dict]) -> List[List[Dict]]:
+    @classmethod
+    def _detect_threads(cls, statements: List[Dict]) -> List[List[Dict]]:
         """
         Detect conversation threads within a group of statements.
 
@@ -196,14 +351,12 @@ class ThreadingAnalyzer:
         threads = []
         current_thread = []
         last_time = None
-        last_speaker = None
 
         for stmt in statements:
-            stmt_type = stmt.get('type', '').lower()
-            stmt_time = self._parse_time(stmt.get('time'))
-            stmt_speaker = stmt.get('politician_id')
+            stmt_type = (stmt.get('type') or '').lower()
+            stmt_time = cls._parse_time(stmt.get('time'))
             is_procedural = stmt.get('procedural', False)
-            wordcount = stmt.get('wordcount', 0)
+            wordcount = stmt.get('wordcount') or 0
 
             # Skip very short procedural statements (likely "Hear, hear!" etc.)
             if is_procedural and wordcount < 20:
@@ -216,19 +369,19 @@ class ThreadingAnalyzer:
                 # No current thread, start new one
                 should_start_new_thread = True
 
-            elif stmt_type in self.THREAD_ROOT_TYPES:
+            elif stmt_type in cls.THREAD_ROOT_TYPES:
                 # Questions and debate statements always start new threads
                 should_start_new_thread = True
 
             elif last_time and stmt_time:
                 # Check time gap
-                time_gap = self._time_difference_minutes(last_time, stmt_time)
-                if time_gap > self.MAX_THREAD_GAP_MINUTES:
+                time_gap = cls._time_difference_minutes(last_time, stmt_time)
+                if time_gap > cls.MAX_THREAD_GAP_MINUTES:
                     should_start_new_thread = True
 
             # Special case: If current thread only has 1 statement and this is an answer,
             # it's likely a Q&A pair - keep in same thread
-            if len(current_thread) == 1 and stmt_type in self.REPLY_TYPES:
+            if len(current_thread) == 1 and stmt_type in cls.REPLY_TYPES:
                 should_start_new_thread = False
 
             if should_start_new_thread and current_thread:
@@ -239,62 +392,16 @@ class ThreadingAnalyzer:
             # Add statement to current thread
             current_thread.append(stmt)
             last_time = stmt_time
-            last_speaker = stmt_speaker
 
         # Don't forget the last thread
         if current_thread:
             threads.append(current_thread)
 
         # Filter out single-statement "threads" unless they're substantive
-        threads = [t for t in threads if len(t) > 1 or t[0].get('wordcount', 0) > 100]
+        threads = [t for t in threads if len(t) > 1 or (t[0].get('wordcount') or 0) > 100]
 
         return threads
 
-    def _write_thread(self, session, thread: List[Dict]):
-        """
-        Write thread metadata to Neo4j.
-
-        Creates:
-        - thread_id for all statements in thread
-        - parent_statement_id for replies
-        - sequence_in_thread (0, 1, 2, ...)
-        - REPLIES_TO relationships
-        """
-        if not thread:
-            return
-
-        # Generate unique thread ID
-        thread_id = str(uuid.uuid4())
-
-        # Process each statement in the thread
-        for idx, stmt in enumerate(thread):
-            statement_id = stmt['id']
-            parent_id = thread[idx - 1]['id'] if idx > 0 else None
-
-            # Update statement properties
-            session.run("""
-                MATCH (s:Statement {id: $stmt_id})
-                SET s.thread_id = $thread_id,
-                    s.sequence_in_thread = $sequence,
-                    s.parent_statement_id = $parent_id
-            """,
-                stmt_id=statement_id,
-                thread_id=thread_id,
-                sequence=idx,
-                parent_id=parent_id
-            )
-
-            # Create REPLIES_TO relationship if this is a reply
-            if parent_id:
-                session.run("""
-                    MATCH (reply:Statement {id: $reply_id})
-                    MATCH (parent:Statement {id: $parent_id})
-                    MERGE (reply)-[:REPLIES_TO]->(parent)
-                """,
-                    reply_id=statement_id,
-                    parent_id=parent_id
-                )
-
     @staticmethod
     def _parse_time(time_value) -> Optional[datetime]:
         """Parse Neo4j DateTime to Python datetime."""
@@ -341,6 +448,10 @@ def main():
                        help='Neo4j password')
     parser.add_argument('--document-id', type=int,
                        help='Process specific document ID only')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Only process documents that have not been threaded yet')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                       help='Worker processes for thread detection (1 = in-process)')
     parser.add_argument('--dry-run', action='store_true',
                        help='Preview changes without writing to database')
     parser.add_argument('--verbose', action='store_true',
@@ -364,7 +475,7 @@ def main():
         logger.info("✓ Connected to Neo4j")
 
         # Create analyzer
-        analyzer = ThreadingAnalyzer(driver)
+        analyzer = ThreadingAnalyzer(driver, workers=args.workers)
 
         # Process documents
         if args.document_id:
@@ -374,11 +485,15 @@ def main():
                        f"{stats['relationships']} relationships")
         else:
             logger.info("Processing all documents...")
-            stats = analyzer.process_all_documents(dry_run=args.dry_run)
+            stats = analyzer.process_all_documents(
+                dry_run=args.dry_run,
+                incremental=args.incremental
+            )
             logger.info(f"\n{'DRY RUN ' if args.dry_run else ''}COMPLETE")
             logger.info(f"Documents processed: {stats['documents_processed']}")
             logger.info(f"Threads created: {stats['threads_created']}")
             logger.info(f"Relationships created: {stats['relationships_created']}")
+            logger.info(f"Documents failed: {stats['documents_failed']}")
 
     except Exception as e:
         logger.error(f"Error: {e}", exc_info=True)
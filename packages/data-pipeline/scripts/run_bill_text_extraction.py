@@ -40,7 +40,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "fedmcp" / "src"))
 
 from fedmcp_pipeline.utils.neo4j_client import Neo4jClient
 from fedmcp_pipeline.ingest.bill_structure import ingest_bill_structure
+from fedmcp_pipeline.ingest.parliament_sessions import get_current_session
 from fedmcp_pipeline.utils.progress import logger
+from fedmcp.clients.bill_text_xml import BillTextXMLClient
 
 
 def get_bills_from_neo4j(neo4j_client: Neo4jClient, session: str) -> list:
@@ -105,6 +107,7 @@ def extract_bill_text(
     session: int,
     bill_number: str,
     verbose: bool = True,
+    client: BillTextXMLClient = None,
 ) -> dict:
     """Extract full text for a single bill.
 
@@ -114,6 +117,7 @@ def extract_bill_text(
         session: Session number
         bill_number: Bill number
         verbose: Print detailed logs
+        client: Shared bill XML client (reused across bills in a run)
 
     Returns:
         Result dictionary with extraction status
@@ -132,6 +136,7 @@ def extract_bill_text(
             is_government=is_gov,
             include_all_versions=False,  # Don't need all versions for full text
             include_full_text=True,  # Enable full text extraction
+            client=client,
         )
 
         return result
@@ -196,6 +201,9 @@ def main():
         password=os.getenv("NEO4J_PASSWORD", "password"),
     )
 
+    # One XML client for the run (shared HTTP session and version cache)
+    client = BillTextXMLClient(current_session=get_current_session(neo4j))
+
     # Track results
     results = {
         "total": len(bills),
@@ -217,6 +225,7 @@ def main():
             session=session_num,
             bill_number=bill_number,
             verbose=args.verbose,
+            client=client,
         )
 
         # Track results
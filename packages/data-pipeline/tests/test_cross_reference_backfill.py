@@ -0,0 +1,136 @@
+"""Unit tests for keyset pagination and checkpoints in the cross-reference backfill."""
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add packages to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import backfill_cross_references as backfill
+
+
+class FakeNeo4j:
+    """Evaluates the backfill's statement filters over in-memory statements.
+
+    Statement.time is an ISO string, as written by Hansard ingestion, and the
+    filters are applied with the same string comparisons as the Cypher.
+    """
+
+    def __init__(self, statements):
+        self.statements = statements
+        self.mentioned = set()  # Statement ids with MENTIONS relationships
+
+    def _matching(self, query, params):
+        rows = []
+        for s in self.statements:
+            key = (s["time"], s["id"])
+            if "[:MENTIONS]" in query and s["id"] in self.mentioned:
+                continue
+            if "from_date" in params and s["time"] < params["from_date"]:
+                continue
+            if "before_date" in params and s["time"] >= params["before_date"]:
+                continue
+            if "after_time" in params and not key < (params["after_time"], params["after_id"]):
+                continue
+            if "since_time" in params and not key > (params["since_time"], params["since_id"]):
+                continue
+            rows.append(s)
+        return sorted(rows, key=lambda s: (s["time"], s["id"]), reverse=True)
+
+    def run_query(self, query, params=None):
+        params = params or {}
+        for value in params.values():
+            assert not hasattr(value, "isoformat"), "time bounds must be strings"
+        rows = self._matching(query, params)
+        if "count(s)" in query:
+            return [{"total": len(rows)}]
+        return [{**s, "content_en": "", "h1_en": None, "h2_en": None, "document_date": None}
+                for s in rows[:params["limit"]]]
+
+
+class FakeAgent:
+    def __init__(self, *args, **kwargs):
+        pass
+
+
+def statement(i, day="2024-05-01"):
+    return {"id": f"s{i:03d}", "time": f"{day}T10:{i % 60:02d}:00"}
+
+
+def run(neo4j, tmp_path, monkeypatch, processed, interrupt_after=None, **kwargs):
+    monkeypatch.setattr(backfill, "CrossReferenceAgent", FakeAgent)
+
+    def fake_batch(neo4j, agent, statements, **kw):
+        if interrupt_after is not None and len(processed) >= interrupt_after:
+            raise KeyboardInterrupt
+        processed.extend(s["id"] for s in statements)
+        neo4j.mentioned.update(s["id"] for s in statements)
+        return backfill._empty_stats()
+
+    monkeypatch.setattr(backfill, "process_statement_batch", fake_batch)
+    return backfill.run_backfill(neo4j, batch_size=3, checkpoint_path=tmp_path / "cp.json", **kwargs)
+
+
+def test_walks_every_page_newest_first(tmp_path, monkeypatch):
+    neo4j = FakeNeo4j([statement(i) for i in range(8)])
+    processed = []
+    run(neo4j, tmp_path, monkeypatch, processed)
+    assert processed == [f"s{i:03d}" for i in reversed(range(8))]
+
+
+def test_completed_backfill_picks_up_new_statements(tmp_path, monkeypatch):
+    statements = [statement(i) for i in range(5)]
+    neo4j = FakeNeo4j(statements)
+    processed = []
+    run(neo4j, tmp_path, monkeypatch, processed)
+    assert len(processed) == 5
+
+    # Nothing new: nothing processed
+    processed.clear()
+    run(neo4j, tmp_path, monkeypatch, processed)
+    assert processed == []
+
+    # Statements ingested later are processed, and only those
+    statements.extend(statement(i, day="2024-05-02") for i in range(5, 9))
+    run(neo4j, tmp_path, monkeypatch, processed)
+    assert processed == [f"s{i:03d}" for i in reversed(range(5, 9))]
+
+
+def test_interrupted_backfill_resumes_at_cursor(tmp_path, monkeypatch):
+    neo4j = FakeNeo4j([statement(i) for i in range(7)])
+    processed = []
+    with pytest.raises(KeyboardInterrupt):
+        run(neo4j, tmp_path, monkeypatch, processed, interrupt_after=3)
+    run(neo4j, tmp_path, monkeypatch, processed)
+    assert processed == [f"s{i:03d}" for i in reversed(range(7))]
+
+
+def test_limited_run_leaves_no_checkpoint(tmp_path, monkeypatch):
+    neo4j = FakeNeo4j([statement(i) for i in range(7)])
+    processed = []
+    run(neo4j, tmp_path, monkeypatch, processed, limit=3)
+    assert processed == ["s006", "s005", "s004"]
+    assert not (tmp_path / "cp.json").exists()
+
+
+def test_unprocessed_only_picks_up_older_statements(tmp_path, monkeypatch):
+    statements = [statement(i, day="2024-05-02") for i in range(4)]
+    neo4j = FakeNeo4j(statements)
+    processed = []
+    run(neo4j, tmp_path, monkeypatch, processed, unprocessed_only=True)
+    assert len(processed) == 4
+
+    # Historical Hansard imported after the completed walk
+    processed.clear()
+    statements.append(statement(9, day="2023-11-20"))
+    run(neo4j, tmp_path, monkeypatch, processed, unprocessed_only=True)
+    assert processed == ["s009"]
+
+
+def test_to_date_includes_the_whole_day(tmp_path, monkeypatch):
+    neo4j = FakeNeo4j([statement(1, "2024-05-01"), statement(2, "2024-05-02")])
+    processed = []
+    run(neo4j, tmp_path, monkeypatch, processed, to_date="2024-05-01")
+    assert processed == ["s001"]
@@ -0,0 +1,77 @@
+"""Unit tests for diff-based lobbying ingestion."""
+import sys
+from pathlib import Path
+
+# Add packages to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "fedmcp" / "src"))
+
+from fedmcp_pipeline.ingest.lobbying import (
+    diff_records,
+    row_hash,
+    stable_entity_id,
+    unsafe_removal_reason,
+)
+
+
+def _row(record_id, **props):
+    return {"id": record_id, "row_hash": row_hash(props), "props": props}
+
+
+def test_stable_entity_id_is_deterministic():
+    """Ids depend only on the (case/whitespace-normalized) name."""
+    assert stable_entity_id("org", "Acme Corp") == stable_entity_id("org", "Acme Corp")
+    assert stable_entity_id("org", "Acme  Corp") == stable_entity_id("org", "acme corp")
+    assert stable_entity_id("org", "Acme Corp") != stable_entity_id("org", "Acme Inc")
+    assert stable_entity_id("lobbyist", "Jane Doe").startswith("lobbyist-")
+
+
+def test_row_hash_ignores_key_order():
+    """Row hashes are stable regardless of dict ordering."""
+    assert row_hash({"a": 1, "b": [1, 2]}) == row_hash({"b": [1, 2], "a": 1})
+    assert row_hash({"a": 1}) != row_hash({"a": 2})
+
+
+def test_diff_records():
+    """Inserted, updated, ended, removed and unchanged records are detected."""
+    unchanged = _row("1", name="Same", active=True)
+    updated = _row("2", name="New name", active=True)
+    ended = _row("3", name="Ending", active=False)
+    inserted = _row("4", name="Brand new", active=True)
+
+    previous = {
+        "1": (unchanged["row_hash"], True),
+        "2": (row_hash({"name": "Old name", "active": True}), True),
+        "3": (row_hash({"name": "Ending", "active": True}), True),
+        "5": ("gone", True),
+    }
+
+    diff = diff_records([unchanged, updated, ended, inserted], previous)
+
+    assert [r["id"] for r in diff.inserted] == ["4"]
+    assert [r["id"] for r in diff.updated] == ["2", "3"]
+    assert diff.ended == 1
+    assert diff.removed == ["5"]
+    assert diff.unchanged == 1
+    assert [r["id"] for r in diff.changed] == ["4", "2", "3"]
+
+
+def test_diff_records_empty_snapshot():
+    """Without a previous snapshot every record is an insert."""
+    rows = [_row("1", name="A"), _row("2", name="B")]
+    diff = diff_records(rows, {})
+
+    assert len(diff.inserted) == 2
+    assert diff.updated == []
+    assert diff.removed == []
+
+
+def test_unsafe_removal_reason():
+    """Empty or heavily truncated exports are refused; small removals are fine."""
+    previous = {str(i): ("h", True) for i in range(100)}
+    rows = [_row(str(i), name=str(i)) for i in range(100)]
+
+    assert unsafe_removal_reason("LobbyRegistration", rows[:95], previous) is None
+    assert "empty" in unsafe_removal_reason("LobbyRegistration", [], previous)
+    assert "remove 50" in unsafe_removal_reason("LobbyRegistration", rows[:50], previous)
+    assert unsafe_removal_reason("LobbyRegistration", [], {}) is None
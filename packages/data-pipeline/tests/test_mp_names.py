@@ -0,0 +1,74 @@
+"""Unit tests for MP name matching used by lobbying/expense joins."""
+import sys
+from pathlib import Path
+
+# Add packages to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "fedmcp" / "src"))
+
+from fedmcp_pipeline.utils.mp_names import MPNameIndex, clean_person_name, normalize_name
+from fedmcp_pipeline.ingest.finances import unresolved_quarter_reason
+from fedmcp_pipeline.relationships.lobbying import match_contacted
+
+
+MPS = [
+    {"id": "judy-sgro", "name": "Judy A. Sgro", "given_name": "Judy A.", "family_name": "Sgro"},
+    {"id": "bobby-morrissey", "name": "Bobby Morrissey", "given_name": "Bobby", "family_name": "Morrissey"},
+    {"id": "jessica-fancy", "name": "Jessica Fancy-Landry", "given_name": "Jessica", "family_name": "Fancy-Landry"},
+    {"id": "rheal-fortin", "name": "Rhéal Fortin", "given_name": "Rhéal", "family_name": "Fortin"},
+    {"id": "john-smith-1", "name": "John Smith", "given_name": "John", "family_name": "Smith"},
+    {"id": "john-smith-2", "name": "John Smith", "given_name": "John", "family_name": "Smith"},
+]
+
+
+def test_normalize_and_clean():
+    """Accents, periods, titles and "Last, First" order are normalized."""
+    assert normalize_name("  Rhéal  É. Fortin ") == "rheal e fortin"
+    assert clean_person_name("Sgro, Hon. Judy A.") == "Judy A. Sgro"
+    assert clean_person_name("Right Hon. Justin Trudeau") == "Justin Trudeau"
+    # Titles are only stripped as whole words
+    assert clean_person_name("Missy Miss Smith") == "Missy Smith"
+
+
+def test_resolve_match_types():
+    """Exact keys win over variants, which win over fallback heuristics."""
+    index = MPNameIndex(MPS)
+
+    assert index.resolve("Judy A. Sgro") == ("judy-sgro", "exact")
+    assert index.resolve("Hon. Judy Sgro") == ("judy-sgro", "variant")
+    assert index.resolve("Robert Morrissey") == ("bobby-morrissey", "variant")
+    assert index.resolve("Jessica Fancy") == ("jessica-fancy", "variant")
+    assert index.resolve("Rheal Eloi Fortin") == ("rheal-fortin", "fallback")
+    assert index.resolve("Nobody Here") is None
+
+
+def test_ambiguous_names_never_resolve():
+    """Names shared by several MPs are reported as ambiguous."""
+    index = MPNameIndex(MPS)
+
+    assert index.resolve("John Smith") is None
+    assert index.resolve_detailed("John Smith") == (None, None, True)
+
+
+def test_match_contacted_quality_stats():
+    """CONTACTED pairs are de-duplicated and every DPOH name is classified."""
+    index = MPNameIndex(MPS)
+    communications = [
+        {"id": "c1", "dpoh_names": ["Judy A. Sgro", "John Smith"]},
+        {"id": "c2", "dpoh_names": ["Robert Morrissey", "Some Official", "Judy A. Sgro"]},
+        {"id": "c3", "dpoh_names": None},
+    ]
+
+    pairs, quality = match_contacted(communications, index)
+
+    assert pairs == {("c1", "judy-sgro"), ("c2", "bobby-morrissey"), ("c2", "judy-sgro")}
+    assert quality == {"exact": 2, "variant": 1, "ambiguous": 1, "unmatched": 1}
+
+
+def test_unresolved_expense_quarters_are_not_written():
+    """Empty or mostly unmatched quarters must not replace the stored rows."""
+    rows = [{"id": "exp-mp-judy-sgro-2024-q1-travel"}]
+
+    assert unresolved_quarter_reason(rows, resolved=300, skipped=5) is None
+    assert "no expense rows" in unresolved_quarter_reason([], resolved=0, skipped=0)
+    assert "could not be matched" in unresolved_quarter_reason(rows, resolved=2, skipped=338)
@@ -0,0 +1,52 @@
+"""Unit tests for deterministic Hansard thread detection."""
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add packages to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from populate_threading import make_thread_id, thread_document
+
+
+def statement(stmt_id, minute, stmt_type, h2="Oral Questions", wordcount=150):
+    return {
+        "id": stmt_id,
+        "time": datetime(2024, 5, 1, 14, minute),
+        "type": stmt_type,
+        "h2": h2,
+        "procedural": False,
+        "wordcount": wordcount,
+    }
+
+
+STATEMENTS = [
+    statement(1, 0, "question"),
+    statement(2, 1, "answer"),
+    statement(3, 2, "interjection"),
+    statement(4, 4, "question"),
+    statement(5, 5, "answer"),
+    statement(6, 30, "debate", h2="Government Orders"),
+]
+
+
+def test_make_thread_id_is_stable():
+    """Thread ids depend only on the root statement id."""
+    assert make_thread_id(1) == make_thread_id("1")
+    assert make_thread_id(1) != make_thread_id(2)
+
+
+def test_thread_document_is_deterministic():
+    """Rerunning detection yields the same threads, ids and parents."""
+    doc_id, rows, thread_count = thread_document(42, STATEMENTS)
+
+    assert doc_id == 42
+    assert thread_count == 3
+    assert thread_document(42, [dict(s) for s in STATEMENTS]) == (doc_id, rows, thread_count)
+
+    by_id = {row["id"]: row for row in rows}
+    assert by_id[1]["thread_id"] == by_id[3]["thread_id"] == make_thread_id(1)
+    assert [by_id[i]["parent_id"] for i in (1, 2, 3)] == [None, 1, 2]
+    assert [by_id[i]["sequence"] for i in (4, 5)] == [0, 1]
+    assert by_id[6]["thread_id"] == make_thread_id(6)
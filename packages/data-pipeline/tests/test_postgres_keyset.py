@@ -0,0 +1,80 @@
+"""Unit tests for keyset-paginated streaming in PostgresClient."""
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add packages to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fedmcp_pipeline.utils.postgres_client import PostgresClient
+
+
+class FakeCursor:
+    def __init__(self, table, log):
+        self.table = table
+        self.log = log
+        self.rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params):
+        self.log.append(params)
+        after, page_size = params["after"], params["page_size"]
+        self.rows = [r for r in self.table if after is None or r["id"] > after][:page_size]
+
+    def __iter__(self):
+        return iter(self.rows)
+
+
+class FakeConnection:
+    def __init__(self, table, log):
+        self.table = table
+        self.log = log
+        self.cursor_names = []
+
+    def cursor(self, name=None, cursor_factory=None):
+        self.cursor_names.append(name)
+        return FakeCursor(self.table, self.log)
+
+    def rollback(self):
+        pass
+
+
+def make_client(table):
+    client = PostgresClient.__new__(PostgresClient)
+    log = []
+    conn = FakeConnection(table, log)
+
+    @contextmanager
+    def get_connection():
+        yield conn
+
+    client.get_connection = get_connection
+    return client, conn, log
+
+
+def test_iter_keyset_pages_by_last_key():
+    """Each page starts after the last key of the previous one; every row is read once."""
+    table = [{"id": i} for i in range(1, 8)]
+    client, conn, log = make_client(table)
+
+    batches = list(client.iter_keyset("SELECT ...", batch_size=3))
+
+    assert [[r["id"] for r in b] for b in batches] == [[1, 2, 3], [4, 5, 6], [7]]
+    assert [p["after"] for p in log] == [None, 3, 6]
+    assert all(name for name in conn.cursor_names)  # Server-side (named) cursors
+
+
+def test_iter_keyset_respects_limit_and_resume():
+    """The overall limit shrinks the last page and `after` resumes mid-table."""
+    table = [{"id": i} for i in range(1, 11)]
+    client, _, log = make_client(table)
+
+    batches = list(client.iter_keyset("SELECT ...", batch_size=4, limit=6, after=2))
+
+    assert [[r["id"] for r in b] for b in batches] == [[3, 4, 5, 6], [7, 8]]
+    assert [p["page_size"] for p in log] == [4, 2]
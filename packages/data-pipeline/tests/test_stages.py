@@ -0,0 +1,111 @@
+"""Unit tests for the pipeline stage scheduler."""
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+from neo4j.exceptions import TransientError
+
+# Add packages to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fedmcp_pipeline.utils.neo4j_client import Neo4jClient
+from fedmcp_pipeline.utils.stages import Stage, run_stages, stage_dependencies
+
+
+def test_dependencies_follow_inputs_and_outputs():
+    """A stage depends on the producers of its inputs; cycles are rejected."""
+    stages = [
+        Stage("a", lambda: None, outputs=("MP",)),
+        Stage("b", lambda: None, outputs=("Lobbyist",)),
+        Stage("c", lambda: None, inputs=("MP", "Lobbyist", "External"), outputs=("CONTACTED",)),
+    ]
+    assert stage_dependencies(stages) == {"a": set(), "b": set(), "c": {"a", "b"}}
+
+    with pytest.raises(ValueError):
+        stage_dependencies([
+            Stage("x", lambda: None, inputs=("Y",), outputs=("X",)),
+            Stage("y", lambda: None, inputs=("X",), outputs=("Y",)),
+        ])
+
+
+def test_independent_stages_run_concurrently():
+    """Stages without shared resources overlap in time."""
+    barrier = threading.Barrier(2, timeout=5)
+    stages = [
+        Stage("lobbying", barrier.wait, outputs=("Lobbyist",)),
+        Stage("parliament", barrier.wait, outputs=("MP",)),
+    ]
+    results = run_stages(stages, max_workers=2)
+    assert all(r.status == "completed" for r in results.values())
+
+
+def test_failure_isolation_and_resume():
+    """A failure skips only downstream stages; resume reruns stages after a rerun upstream."""
+    ran = []
+
+    def work(name, fail=False):
+        def func():
+            ran.append(name)
+            if fail:
+                raise RuntimeError("boom")
+            return name
+        return func
+
+    stages = [
+        Stage("parliament", work("parliament"), outputs=("MP",)),
+        Stage("lobbying", work("lobbying", fail=True), outputs=("Lobbyist",)),
+        Stage("finances", work("finances"), inputs=("MP",), outputs=("Expense",)),
+        Stage("network", work("network"), inputs=("MP", "Lobbyist"), outputs=("MET_WITH",)),
+    ]
+    results = run_stages(stages)
+    assert {n: r.status for n, r in results.items()} == {
+        "parliament": "completed", "lobbying": "failed", "finances": "completed", "network": "skipped",
+    }
+    assert "network" not in ran
+
+    # Resume: everything except lobbying/network was complete
+    ran.clear()
+    stages[1] = Stage("lobbying", work("lobbying"), outputs=("Lobbyist",))
+    done = {"parliament", "finances", "network"}
+    results = run_stages(stages, is_complete=lambda stage: stage.name in done)
+    assert sorted(ran) == ["lobbying", "network"]
+    assert results["finances"].status == "resumed"
+
+
+class _DeadlockOnceDriver:
+    """Fake driver whose first query fails with a deadlock, like two stages MERGE-ing on one MP."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def session(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, query, parameters=None, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            raise TransientError("Neo.TransientError.Transaction.DeadlockDetected")
+        return [{"merged": 1}]
+
+
+def test_stage_survives_transient_deadlock(monkeypatch):
+    """A stage whose query deadlocks once is retried by the client and completes."""
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    client = Neo4jClient.__new__(Neo4jClient)
+    client.driver = _DeadlockOnceDriver()
+
+    stages = [
+        Stage("political_structure", lambda: client.run_query("MERGE ..."), inputs=("MP",), outputs=("MEMBER_OF",)),
+    ]
+    results = run_stages(stages)
+
+    assert results["political_structure"].status == "completed"
+    assert results["political_structure"].result == [{"merged": 1}]
+    assert client.driver.calls == 2
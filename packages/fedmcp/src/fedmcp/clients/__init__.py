@@ -1,7 +1,10 @@
 """Client modules for accessing Canadian parliamentary and legal data sources."""
 
 from .openparliament import OpenParliamentClient
+from .vote_catalogue import VoteCatalogue
 from .ourcommons import OurCommonsHansardClient, HansardSitting, HansardSection, HansardSpeech
+from .hansard_sittings import HansardSittingIndex, SittingEntry
+from .hansard_index import HansardSpeechIndex
 from .legisinfo import LegisInfoClient
 from .canlii import CanLIIClient
 from .represent import RepresentClient
@@ -32,10 +35,14 @@ from .bill_text_xml import (
 
 __all__ = [
     "OpenParliamentClient",
+    "VoteCatalogue",
     "OurCommonsHansardClient",
     "HansardSitting",
     "HansardSection",
     "HansardSpeech",
+    "HansardSittingIndex",
+    "SittingEntry",
+    "HansardSpeechIndex",
     "LegisInfoClient",
     "CanLIIClient",
     "RepresentClient",
@@ -10,14 +10,26 @@ Amendment Tracking:
 - Bill versions (1, 2, 3...) represent different readings/amendments
 - "As amended by committee" is typically version 3
 - Detailed amendment text comes from committee reports (HTML, not structured)
+
+Version discovery:
+- Version lists come from LEGISinfo publication metadata (one small JSON request),
+  falling back to concurrent HEAD probes of the XML URLs - bodies are only
+  downloaded when a version is actually parsed
+- Discovered versions (including "no versions") are cached on disk; answers for
+  closed sessions never expire, answers for the current session expire after
+  VERSION_CACHE_TTL seconds
 """
 from __future__ import annotations
 
+import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from xml.etree import ElementTree as ET
 
 from fedmcp.http import RateLimitedSession
@@ -26,6 +38,18 @@ from fedmcp.http import RateLimitedSession
 PARL_BASE = "https://www.parl.ca"
 LEGISINFO_BASE = "https://www.parl.ca/LegisInfo/en"
 
+# Cache directory for discovered bill versions
+CACHE_DIR = Path.home() / ".cache" / "fedmcp" / "bill_versions"
+
+# Version lists for open sessions are re-checked after this many seconds
+VERSION_CACHE_TTL = 6 * 3600
+
+# Highest version number probed when LEGISinfo metadata is unavailable
+MAX_PROBE_VERSION = 5
+
+# Marks a version probe that failed instead of answering 200/404
+_PROBE_FAILED = object()
+
 
 class BillStage(Enum):
     """Legislative stages/readings for bill versions."""
@@ -246,9 +270,28 @@ class BillTextXMLClient:
         *,
         session: Optional[RateLimitedSession] = None,
         base_url: str = PARL_BASE,
+        cache_dir: Optional[Path] = None,
+        current_session: Optional[Tuple[int, int]] = None,
+        max_workers: int = MAX_PROBE_VERSION,
     ) -> None:
+        """
+        Initialize the bill XML client.
+
+        Args:
+            session: Optional HTTP session
+            base_url: Parliament.ca base URL
+            cache_dir: Directory for the version discovery cache
+            current_session: (parliament, session) still sitting; earlier
+                sessions are closed and their cached versions never expire.
+                When omitted every session is treated as open.
+            max_workers: Concurrent HEAD probes during version discovery
+        """
         self.session = session or RateLimitedSession()
         self.base_url = base_url.rstrip("/")
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.current_session = current_session
+        self.max_workers = max_workers
 
     def build_xml_url(
         self,
@@ -288,37 +331,178 @@ class BillTextXMLClient:
         bill_number: str,
         *,
         is_government: bool = False,
+        refresh: bool = False,
+        metadata: Optional[Dict[str, Any]] = None,
     ) -> List[BillVersion]:
-        """Discover available versions of a bill.
+        """Discover available versions of a bill without downloading their XML.
 
-        Attempts to fetch versions 1-5 and returns those that exist.
+        Uses the cached answer when it is still valid (always, for closed
+        sessions), otherwise LEGISinfo publication metadata, and finally
+        concurrent HEAD requests against versions 1-5.
+
+        Args:
+            parliament: Parliament number (e.g., 45)
+            session: Session number (e.g., 1)
+            bill_number: Bill code (e.g., "C-234")
+            is_government: True for government bills
+            refresh: Ignore any cached answer
+            metadata: LEGISinfo metadata the caller already fetched
+
+        Returns:
+            Available versions ordered by version number (empty if none exist)
+        """
+        if not refresh:
+            cached = self._load_cached_versions(parliament, session, bill_number, is_government)
+            if cached is not None:
+                return cached
+
+        versions: List[BillVersion] = []
+        # Only definitive answers are cached: a failed metadata fetch followed
+        # by a failed probe must not become a permanent "no versions"
+        definitive = False
+        try:
+            if metadata is None:
+                metadata = self.get_legisinfo_metadata(parliament, session, bill_number)
+            if metadata:
+                versions = self.extract_versions_from_legisinfo(
+                    metadata, parliament, session, bill_number, is_government=is_government
+                )
+                definitive = bool(versions)
+        except Exception:
+            pass  # Fall back to probing
+
+        if not versions:
+            versions, definitive = self._probe_versions(
+                parliament, session, bill_number, is_government=is_government
+            )
+
+        if definitive and (versions or not self.is_session_closed(parliament, session)):
+            self._store_cached_versions(parliament, session, bill_number, is_government, versions)
+        return versions
+
+    def _probe_versions(
+        self,
+        parliament: int,
+        session: int,
+        bill_number: str,
+        *,
+        is_government: bool = False,
+    ) -> Tuple[List[BillVersion], bool]:
+        """HEAD versions 1-MAX_PROBE_VERSION concurrently and keep those that exist.
+
+        Returns:
+            Tuple of (versions, definitive). ``definitive`` is False when any
+            probe failed (network error or server error) rather than getting
+            a 200 or a 404/410, so the result may be incomplete.
         """
-        versions = []
         bill_upper = bill_number.upper()
         bill_type = "Government" if is_government else "Private"
         parl_str = f"{parliament}{session}"
 
-        # Try versions 1-5 (covers most bills)
-        for v in range(1, 6):
+        def exists(v: int) -> Optional[BillVersion]:
             xml_url = (
                 f"{self.base_url}/Content/Bills/{parl_str}/{bill_type}/"
                 f"{bill_upper}/{bill_upper}_{v}/{bill_upper}_E.xml"
             )
             try:
-                response = self.session.get(xml_url, timeout=10)
-                if response.status_code == 200:
-                    stage = BillStage.from_path_segment(f"{bill_upper}_{v}")
-                    versions.append(BillVersion(
-                        stage=stage or BillStage.FIRST_READING,
-                        version_number=v,
-                        xml_url=xml_url,
-                        pdf_url=xml_url.replace("_E.xml", f"_{v}.PDF"),
-                    ))
+                response = self.session.request("HEAD", xml_url, timeout=10, allow_redirects=True)
             except Exception:
-                pass  # Version doesn't exist
+                return _PROBE_FAILED
+            if response.status_code in (404, 410):
+                return None
+            if response.status_code != 200:
+                return _PROBE_FAILED
+            stage = BillStage.from_path_segment(f"{bill_upper}_{v}")
+            return BillVersion(
+                stage=stage or BillStage.FIRST_READING,
+                version_number=v,
+                xml_url=xml_url,
+                pdf_url=xml_url.replace("_E.xml", f"_{v}.PDF"),
+            )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(exists, range(1, MAX_PROBE_VERSION + 1)))
+        versions = [result for result in results if isinstance(result, BillVersion)]
+        return versions, _PROBE_FAILED not in results
 
+    # ------------------------------------------------------------------
+    # Version cache
+    # ------------------------------------------------------------------
+
+    def is_session_closed(self, parliament: int, session: int) -> bool:
+        """True if the session is older than ``current_session`` (its bills can no longer change)."""
+        if self.current_session is None:
+            return False
+        return (parliament, session) < tuple(self.current_session)
+
+    def _version_cache_path(
+        self, parliament: int, session: int, bill_number: str, is_government: bool
+    ) -> Path:
+        bill_type = "gov" if is_government else "private"
+        return self.cache_dir / f"{parliament}-{session}_{bill_number.upper()}_{bill_type}.json"
+
+    def _load_cached_versions(
+        self, parliament: int, session: int, bill_number: str, is_government: bool
+    ) -> Optional[List[BillVersion]]:
+        """Return cached versions, or None if missing or expired."""
+        path = self._version_cache_path(parliament, session, bill_number, is_government)
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return None
+
+        if not self.is_session_closed(parliament, session):
+            if time.time() - data.get("checked_at", 0) > VERSION_CACHE_TTL:
+                return None
+
+        versions = []
+        for item in data.get("versions", []):
+            pub_date = item.get("publication_date")
+            versions.append(BillVersion(
+                stage=BillStage(item["stage"]),
+                version_number=item["version_number"],
+                xml_url=item["xml_url"],
+                pdf_url=item.get("pdf_url"),
+                publication_type_id=item.get("publication_type_id"),
+                publication_type_name=item.get("publication_type_name"),
+                publication_date=datetime.fromisoformat(pub_date) if pub_date else None,
+                has_amendments=item.get("has_amendments", False),
+            ))
         return versions
 
+    def _store_cached_versions(
+        self,
+        parliament: int,
+        session: int,
+        bill_number: str,
+        is_government: bool,
+        versions: List[BillVersion],
+    ) -> None:
+        """Persist a discovery result (an empty list is a valid, cacheable answer)."""
+        payload = {
+            "checked_at": time.time(),
+            "versions": [
+                {
+                    "stage": v.stage.value,
+                    "version_number": v.version_number,
+                    "xml_url": v.xml_url,
+                    "pdf_url": v.pdf_url,
+                    "publication_type_id": v.publication_type_id,
+                    "publication_type_name": v.publication_type_name,
+                    "publication_date": v.publication_date.isoformat() if v.publication_date else None,
+                    "has_amendments": v.has_amendments,
+                }
+                for v in versions
+            ],
+        }
+        path = self._version_cache_path(parliament, session, bill_number, is_government)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(payload))
+            tmp_path.replace(path)
+        except OSError:
+            pass  # Cache is best-effort
+
     def fetch_xml(self, url: str) -> str:
         """Fetch raw XML content from a URL."""
         response = self.session.get(url, timeout=60)
@@ -724,7 +908,7 @@ class BillTextXMLClient:
         data = response.json()
         # LEGISinfo returns a list with one item
         if isinstance(data, list) and len(data) > 0:
-            return data[0]
+            data = data[0]
         return data
 
     def extract_versions_from_legisinfo(
@@ -939,13 +1123,17 @@ class BillTextXMLClient:
         # Fetch LEGISinfo metadata for version and amendment history
         try:
             metadata = self.get_legisinfo_metadata(parliament, session, bill_number)
+        except Exception:
+            # LEGISinfo metadata is optional, continue without it
+            metadata = {}
 
-            # Extract version information
-            if include_all_versions:
-                bill.available_versions = self.extract_versions_from_legisinfo(
-                    metadata, parliament, session, bill_number, is_government=is_government
-                )
+        # Extract version information (cached, falling back to HEAD probes)
+        if include_all_versions:
+            bill.available_versions = self.list_available_versions(
+                parliament, session, bill_number, is_government=is_government, metadata=metadata
+            )
 
+        if metadata:
             # Extract amendment events
             bill.amendment_events = self.extract_amendment_events(metadata)
 
@@ -959,10 +1147,6 @@ class BillTextXMLClient:
             # Set LEGISinfo URL
             bill.legisinfo_url = f"{LEGISINFO_BASE}/bill/{parliament}-{session}/{bill_number.lower()}"
 
-        except Exception:
-            # LEGISinfo metadata is optional, continue without it
-            pass
-
         return bill
 
 
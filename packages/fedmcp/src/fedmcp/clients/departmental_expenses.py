@@ -1,14 +1,32 @@
-"""Client for accessing Canadian federal departmental travel and hospitality expenses (open.canada.ca)."""
+"""Client for accessing Canadian federal departmental travel and hospitality expenses (open.canada.ca).
+
+Each dataset is stored on disk as year-partitioned shards of typed records
+(one JSON line per record, ``<dataset>/<year>.jsonl``). The source CSVs only
+grow, so a refresh requests just the bytes past the offset already ingested,
+verifies that the bytes before it are unchanged, and appends the new rows to
+their year shards. Rows are keyed by organization + reference number; a later
+row with a known key is an amendment and replaces the stored record. Searches
+prune shards by year and filter each record in a single pass.
+"""
 from __future__ import annotations
 
 import csv
-from dataclasses import dataclass
+import hashlib
+import heapq
+import io
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
 
 from fedmcp.http import RateLimitedSession
 
+logger = logging.getLogger(__name__)
+
 
 # Travel expenses dataset
 TRAVEL_URL = "https://open.canada.ca/data/dataset/009f9a49-c2d9-4d29-a6d4-1a228da335ce/resource/23144a1f-3e5d-4a78-916d-b59c7ab5595f/download/travelq.csv"
@@ -19,6 +37,15 @@ HOSPITALITY_URL = "https://open.canada.ca/data/dataset/b9f51ef4-4605-4ef2-8231-6
 # Cache directory
 CACHE_DIR = Path.home() / ".cache" / "fedmcp" / "departmental_expenses"
 
+# Days before a dataset is refreshed when auto_update is enabled (quarterly updates)
+REFRESH_DAYS = 30
+
+# Bytes before the ingested offset that must be unchanged for an append-only refresh
+FINGERPRINT_BYTES = 4096
+
+# Shard holding records without a parseable start date
+UNDATED_SHARD = "undated"
+
 
 @dataclass
 class DepartmentalTravel:
@@ -148,40 +175,21 @@ class DepartmentalExpensesClient:
         Args:
             session: Optional HTTP session
             cache_dir: Directory for caching expense data
-            auto_update: If True, check for updates and redownload if older than 30 days
+            auto_update: If True, append new rows when a dataset is older than 30 days
         """
         self.session = session or RateLimitedSession()
         self.cache_dir = cache_dir or CACHE_DIR
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.auto_update = auto_update
 
-        # Cached data
-        self._travel: Optional[List[DepartmentalTravel]] = None
-        self._hospitality: Optional[List[DepartmentalHospitality]] = None
-
-    def _should_download(self, file_path: Path) -> bool:
-        """Check if file should be downloaded."""
-        if not file_path.exists():
-            return True
-        if not self.auto_update:
-            return False
-        # Redownload if older than 30 days (quarterly updates)
-        age_days = (datetime.now().timestamp() - file_path.stat().st_mtime) / 86400
-        return age_days > 30
-
-    def _download_file(self, url: str, filename: str) -> Path:
-        """Download CSV to cache."""
-        csv_path = self.cache_dir / filename
-
-        if self._should_download(csv_path):
-            print(f"Downloading {filename} (~20MB)...")
-            response = self.session.get(url, timeout=300)
-            response.raise_for_status()
-            csv_path.write_bytes(response.content)
-            print(f"Downloaded {len(response.content) / 1024 / 1024:.1f} MB")
-
-        return csv_path
+        # Parsed shards kept in memory: dataset -> shard name -> records
+        self._shards: Dict[str, Dict[str, List[Any]]] = {"travel": {}, "hospitality": {}}
+        self._ready: Set[str] = set()
+        self._lock = threading.RLock()
 
+    # ------------------------------------------------------------------
+    # Row parsing
+    # ------------------------------------------------------------------
     def _parse_amount(self, value: str) -> float:
         """Parse monetary amount from string."""
         if not value or value.strip() == '':
@@ -200,77 +208,370 @@ class DepartmentalExpensesClient:
         except ValueError:
             return None
 
-    def _load_travel(self) -> List[DepartmentalTravel]:
-        """Load travel data from cache or download if needed."""
-        if self._travel is not None:
-            return self._travel
-
-        csv_path = self._download_file(TRAVEL_URL, "travel.csv")
-
-        travel_records = []
-        with open(csv_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                record = DepartmentalTravel(
-                    owner_org=row.get('owner_org', ''),
-                    owner_org_title=row.get('owner_org_title', ''),
-                    ref_number=row.get('ref_number', ''),
-                    disclosure_group=row.get('disclosure_group', ''),
-                    title_en=row.get('title_en'),
-                    title_fr=row.get('title_fr'),
-                    name=row.get('name', ''),
-                    purpose_en=row.get('purpose_en'),
-                    purpose_fr=row.get('purpose_fr'),
-                    start_date=row.get('start_date'),
-                    end_date=row.get('end_date'),
-                    destination_en=row.get('destination_en'),
-                    destination_fr=row.get('destination_fr'),
-                    airfare=self._parse_amount(row.get('airfare', '0')),
-                    other_transport=self._parse_amount(row.get('other_transport', '0')),
-                    lodging=self._parse_amount(row.get('lodging', '0')),
-                    meals=self._parse_amount(row.get('meals', '0')),
-                    other_expenses=self._parse_amount(row.get('other_expenses', '0')),
-                    total=self._parse_amount(row.get('total', '0')),
+    def _travel_record(self, row: Dict[str, str]) -> DepartmentalTravel:
+        return DepartmentalTravel(
+            owner_org=row.get('owner_org', ''),
+            owner_org_title=row.get('owner_org_title', ''),
+            ref_number=row.get('ref_number', ''),
+            disclosure_group=row.get('disclosure_group', ''),
+            title_en=row.get('title_en'),
+            title_fr=row.get('title_fr'),
+            name=row.get('name', ''),
+            purpose_en=row.get('purpose_en'),
+            purpose_fr=row.get('purpose_fr'),
+            start_date=row.get('start_date'),
+            end_date=row.get('end_date'),
+            destination_en=row.get('destination_en'),
+            destination_fr=row.get('destination_fr'),
+            airfare=self._parse_amount(row.get('airfare', '0')),
+            other_transport=self._parse_amount(row.get('other_transport', '0')),
+            lodging=self._parse_amount(row.get('lodging', '0')),
+            meals=self._parse_amount(row.get('meals', '0')),
+            other_expenses=self._parse_amount(row.get('other_expenses', '0')),
+            total=self._parse_amount(row.get('total', '0')),
+        )
+
+    def _hospitality_record(self, row: Dict[str, str]) -> DepartmentalHospitality:
+        return DepartmentalHospitality(
+            owner_org=row.get('owner_org', ''),
+            owner_org_title=row.get('owner_org_title', ''),
+            ref_number=row.get('ref_number', ''),
+            disclosure_group=row.get('disclosure_group', ''),
+            title_en=row.get('title_en'),
+            title_fr=row.get('title_fr'),
+            name=row.get('name', ''),
+            purpose_en=row.get('purpose_en'),
+            purpose_fr=row.get('purpose_fr'),
+            start_date=row.get('start_date'),
+            end_date=row.get('end_date'),
+            attendees=self._parse_int(row.get('attendees')),
+            location_en=row.get('location_en'),
+            location_fr=row.get('location_fr'),
+            total=self._parse_amount(row.get('total', '0')),
+        )
+
+    def _dataset(self, dataset: str) -> Dict[str, Any]:
+        """Source URL, legacy CSV name, record type and row parser of a dataset."""
+        if dataset == "travel":
+            return {"url": TRAVEL_URL, "csv": "travel.csv", "type": DepartmentalTravel,
+                    "parse": self._travel_record}
+        if dataset == "hospitality":
+            return {"url": HOSPITALITY_URL, "csv": "hospitality.csv", "type": DepartmentalHospitality,
+                    "parse": self._hospitality_record}
+        raise ValueError(f"Unknown dataset: {dataset}")
+
+    @staticmethod
+    def _row_key(row: Dict[str, str]) -> str:
+        """Stable key of a CSV row: organization + reference number (or a content hash)."""
+        if row.get('ref_number'):
+            return f"{row.get('owner_org', '')}|{row['ref_number']}"
+        return hashlib.sha1(json.dumps(row, sort_keys=True).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _record_key(record: Dict[str, Any]) -> Optional[str]:
+        """Row key of a stored record, when it has a reference number."""
+        if record.get('ref_number'):
+            return f"{record.get('owner_org', '')}|{record['ref_number']}"
+        return None
+
+    @staticmethod
+    def _shard_name(start_date: Optional[str]) -> str:
+        if start_date and len(start_date) >= 4 and start_date[:4].isdigit():
+            return start_date[:4]
+        return UNDATED_SHARD
+
+    # ------------------------------------------------------------------
+    # Shard storage
+    # ------------------------------------------------------------------
+    def _dataset_dir(self, dataset: str) -> Path:
+        return self.cache_dir / dataset
+
+    def _load_manifest(self, dataset: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads((self._dataset_dir(dataset) / "manifest.json").read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _save_manifest(self, dataset: str, manifest: Dict[str, Any]) -> None:
+        path = self._dataset_dir(dataset) / "manifest.json"
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(manifest))
+        tmp_path.replace(path)
+
+    def _load_keys(self, dataset: str) -> Set[str]:
+        try:
+            return set((self._dataset_dir(dataset) / "keys.txt").read_text().splitlines())
+        except OSError:
+            return set()
+
+    def _ingest(
+        self,
+        dataset: str,
+        data: bytes,
+        *,
+        fieldnames: Optional[List[str]],
+        keys: Set[str],
+    ) -> Dict[str, Any]:
+        """
+        Parse CSV bytes and add their rows to the shards.
+
+        A row whose key is already known (in ``keys`` or earlier in ``data``)
+        is an amendment: the latest row wins and the stored record is replaced.
+        Rows without a reference number are keyed by content, so a repeat is
+        an exact duplicate and skipped.
+
+        Only complete lines are parsed; the returned ``consumed`` is the number
+        of bytes ingested, i.e. up to the last newline.
+        """
+        consumed = data.rfind(b"\n") + 1
+        text = data[:consumed].decode('utf-8-sig')
+        reader = csv.DictReader(io.StringIO(text), fieldnames=fieldnames)
+
+        spec = self._dataset(dataset)
+        records: Dict[str, Any] = {}
+        for row in reader:
+            key = self._row_key(row)
+            if key in keys and not row.get('ref_number'):
+                continue
+            records[key] = spec["parse"](row)
+
+        new_keys = [key for key in records if key not in keys]
+        replaced = {key for key in records if key in keys}
+        keys.update(new_keys)
+
+        directory = self._dataset_dir(dataset)
+        changed = self._drop_records(dataset, replaced) if replaced else set()
+
+        by_shard: Dict[str, List[str]] = {}
+        for record in records.values():
+            by_shard.setdefault(self._shard_name(record.start_date), []).append(json.dumps(asdict(record)))
+        for shard, lines in by_shard.items():
+            with open(directory / f"{shard}.jsonl", 'a', encoding='utf-8') as f:
+                f.write("\n".join(lines) + "\n")
+        if new_keys:
+            with open(directory / "keys.txt", 'a', encoding='utf-8') as f:
+                f.write("\n".join(new_keys) + "\n")
+
+        # Changed shards are re-read on next use
+        changed.update(by_shard)
+        for shard in changed:
+            self._shards[dataset].pop(shard, None)
+
+        return {
+            "consumed": consumed,
+            "fieldnames": reader.fieldnames,
+            "added": len(new_keys),
+            "replaced": len(replaced),
+            "shards": sorted(changed),
+        }
+
+    def _drop_records(self, dataset: str, keys: Set[str]) -> Set[str]:
+        """Remove the stored records with these row keys; returns the shards rewritten."""
+        changed = set()
+        for path in self._dataset_dir(dataset).glob("*.jsonl"):
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = [line for line in f if line.strip()]
+            kept = [line for line in lines if self._record_key(json.loads(line)) not in keys]
+            if len(kept) == len(lines):
+                continue
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text("".join(kept), encoding='utf-8')
+            tmp_path.replace(path)
+            changed.add(path.stem)
+        return changed
+
+    def _rebuild(self, dataset: str, data: bytes) -> Dict[str, Any]:
+        """Replace a dataset's shards with the rows of a full CSV."""
+        directory = self._dataset_dir(dataset)
+        directory.mkdir(parents=True, exist_ok=True)
+        for path in list(directory.glob("*.jsonl")) + [directory / "keys.txt"]:
+            path.unlink(missing_ok=True)
+        self._shards[dataset].clear()
+
+        result = self._ingest(dataset, data, fieldnames=None, keys=set())
+        consumed = result["consumed"]
+        manifest = {
+            "fieldnames": result["fieldnames"],
+            "offset": consumed,
+            "fingerprint": hashlib.sha1(data[max(0, consumed - FINGERPRINT_BYTES):consumed]).hexdigest(),
+            "fingerprint_bytes": min(consumed, FINGERPRINT_BYTES),
+            "rows": result["added"],
+            "refreshed_at": time.time(),
+        }
+        self._save_manifest(dataset, manifest)
+        logger.info(f"Indexed {result['added']:,} departmental {dataset} records into {len(result['shards'])} year shards")
+        return manifest
+
+    def refresh(self, dataset: str) -> int:
+        """
+        Append new rows of a dataset from open.canada.ca.
+
+        Requests only the bytes past the ingested offset (plus a fingerprint of
+        the bytes just before it). If the server ignores the range, the
+        fingerprint no longer matches, or the file shrank, the dataset is
+        rebuilt from the full download instead.
+
+        Returns:
+            Number of rows added
+        """
+        with self._lock:
+            spec = self._dataset(dataset)
+            manifest = self._load_manifest(dataset)
+            if manifest is None:
+                manifest = self._rebuild(dataset, self._fetch(spec["url"]))
+                return manifest["rows"]
+
+            offset = manifest["offset"]
+            start = offset - manifest["fingerprint_bytes"]
+            response = self.session.get(spec["url"], headers={"Range": f"bytes={start}-"}, timeout=300)
+            if response.status_code == 416:
+                manifest["refreshed_at"] = time.time()  # Nothing past the offset
+                self._save_manifest(dataset, manifest)
+                return 0
+            response.raise_for_status()
+
+            content = response.content
+            full_download = None
+            if response.status_code != 206:
+                # Range ignored: the whole file came back
+                full_download = content
+                content = content[start:] if len(content) >= offset else b""
+            prefix, tail = content[:manifest["fingerprint_bytes"]], content[manifest["fingerprint_bytes"]:]
+            if (
+                len(prefix) < manifest["fingerprint_bytes"]
+                or hashlib.sha1(prefix).hexdigest() != manifest["fingerprint"]
+            ):
+                # Rewritten upstream rather than appended to
+                logger.info(f"Departmental {dataset} data changed upstream, rebuilding shards...")
+                before = manifest["rows"]
+                manifest = self._rebuild(dataset, full_download or self._fetch(spec["url"]))
+                return max(0, manifest["rows"] - before)
+
+            result = self._ingest(dataset, tail, fieldnames=manifest["fieldnames"], keys=self._load_keys(dataset))
+            consumed_to = offset + result["consumed"]
+            manifest.update({
+                "offset": consumed_to,
+                "rows": manifest["rows"] + result["added"],
+                "refreshed_at": time.time(),
+            })
+            window = content[max(0, len(prefix) + result["consumed"] - FINGERPRINT_BYTES):len(prefix) + result["consumed"]]
+            manifest["fingerprint"] = hashlib.sha1(window).hexdigest()
+            manifest["fingerprint_bytes"] = len(window)
+            self._save_manifest(dataset, manifest)
+            if result["added"] or result["replaced"]:
+                logger.info(
+                    f"Appended {result['added']:,} departmental {dataset} records "
+                    f"({result['replaced']:,} amended records replaced)"
                 )
-                travel_records.append(record)
+            return result["added"]
+
+    def _fetch(self, url: str) -> bytes:
+        logger.info(f"Downloading {url.rsplit('/', 1)[-1]} (~20MB)...")
+        response = self.session.get(url, timeout=300)
+        response.raise_for_status()
+        logger.info(f"Downloaded {len(response.content) / 1024 / 1024:.1f} MB")
+        return response.content
+
+    def _ensure(self, dataset: str) -> None:
+        """Build the shards on first use and refresh them when stale (auto_update)."""
+        if dataset in self._ready:
+            return
+        with self._lock:
+            if dataset in self._ready:
+                return
+            spec = self._dataset(dataset)
+            manifest = self._load_manifest(dataset)
+            if manifest is None:
+                legacy_csv = self.cache_dir / spec["csv"]
+                if legacy_csv.exists():
+                    # CSV downloaded by an earlier version: shard it without downloading
+                    manifest = self._rebuild(dataset, legacy_csv.read_bytes())
+                    manifest["refreshed_at"] = legacy_csv.stat().st_mtime
+                    self._save_manifest(dataset, manifest)
+                else:
+                    self.refresh(dataset)
+                    manifest = self._load_manifest(dataset)
+            if self.auto_update and manifest and time.time() - manifest["refreshed_at"] > REFRESH_DAYS * 86400:
+                self.refresh(dataset)
+            self._ready.add(dataset)
+
+    def _shard_names(self, dataset: str, year: Optional[int]) -> List[str]:
+        """Shards that can hold records of ``year`` (all shards when None)."""
+        if year is not None:
+            return [str(year)]
+        return sorted(path.stem for path in self._dataset_dir(dataset).glob("*.jsonl"))
+
+    def _read_shard(self, dataset: str, shard: str) -> List[Any]:
+        with self._lock:
+            records = self._shards[dataset].get(shard)
+            if records is None:
+                record_type = self._dataset(dataset)["type"]
+                path = self._dataset_dir(dataset) / f"{shard}.jsonl"
+                records = []
+                if path.exists():
+                    with open(path, 'r', encoding='utf-8') as f:
+                        records = [record_type(**json.loads(line)) for line in f if line.strip()]
+                self._shards[dataset][shard] = records
+            return records
+
+    def _iter_records(self, dataset: str, year: Optional[int] = None) -> Iterator[Any]:
+        """Stream the records of a dataset, reading only the shards ``year`` can be in."""
+        self._ensure(dataset)
+        for shard in self._shard_names(dataset, year):
+            yield from self._read_shard(dataset, shard)
 
-        self._travel = travel_records
-        print(f"Loaded {len(travel_records):,} departmental travel records")
-        return self._travel
+    def _load_travel(self) -> List[DepartmentalTravel]:
+        """Load all travel records."""
+        return list(self._iter_records("travel"))
 
     def _load_hospitality(self) -> List[DepartmentalHospitality]:
-        """Load hospitality data from cache or download if needed."""
-        if self._hospitality is not None:
-            return self._hospitality
-
-        csv_path = self._download_file(HOSPITALITY_URL, "hospitality.csv")
-
-        hospitality_records = []
-        with open(csv_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                record = DepartmentalHospitality(
-                    owner_org=row.get('owner_org', ''),
-                    owner_org_title=row.get('owner_org_title', ''),
-                    ref_number=row.get('ref_number', ''),
-                    disclosure_group=row.get('disclosure_group', ''),
-                    title_en=row.get('title_en'),
-                    title_fr=row.get('title_fr'),
-                    name=row.get('name', ''),
-                    purpose_en=row.get('purpose_en'),
-                    purpose_fr=row.get('purpose_fr'),
-                    start_date=row.get('start_date'),
-                    end_date=row.get('end_date'),
-                    attendees=self._parse_int(row.get('attendees')),
-                    location_en=row.get('location_en'),
-                    location_fr=row.get('location_fr'),
-                    total=self._parse_amount(row.get('total', '0')),
-                )
-                hospitality_records.append(record)
+        """Load all hospitality records."""
+        return list(self._iter_records("hospitality"))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _matcher(
+        department: Optional[str],
+        name: Optional[str],
+        place: Optional[str],
+        place_fields: tuple,
+        min_amount: Optional[float],
+        max_amount: Optional[float],
+        disclosure_group: Optional[str],
+    ) -> Callable[[Any], bool]:
+        """Combine the search filters into one predicate (one pass per record)."""
+        dept_lower = department.lower() if department else None
+        name_lower = name.lower() if name else None
+        place_lower = place.lower() if place else None
+        group_lower = disclosure_group.lower() if disclosure_group else None
+
+        def matches(r: Any) -> bool:
+            if dept_lower and dept_lower not in r.owner_org_title.lower() and dept_lower not in r.owner_org.lower():
+                return False
+            if name_lower and name_lower not in r.name.lower():
+                return False
+            if place_lower and not any(
+                getattr(r, f) and place_lower in getattr(r, f).lower() for f in place_fields
+            ):
+                return False
+            if min_amount is not None and r.total < min_amount:
+                return False
+            if max_amount is not None and r.total > max_amount:
+                return False
+            if group_lower and group_lower not in r.disclosure_group.lower():
+                return False
+            return True
 
-        self._hospitality = hospitality_records
-        print(f"Loaded {len(hospitality_records):,} departmental hospitality records")
-        return self._hospitality
+        return matches
+
+    @staticmethod
+    def _top(records: Iterator[Any], limit: Optional[int]) -> List[Any]:
+        """Sort by total (descending), keeping only the top ``limit`` when given."""
+        if limit:
+            return heapq.nlargest(limit, records, key=lambda x: x.total)
+        return sorted(records, key=lambda x: x.total, reverse=True)
 
     def search_travel(
         self,
@@ -292,55 +593,18 @@ class DepartmentalExpensesClient:
             destination: Destination to search for
             min_amount: Minimum expense amount
             max_amount: Maximum expense amount
-            year: Travel year
+            year: Travel year (only that year's shard is read)
             disclosure_group: Disclosure group (e.g., "Minister", "Deputy Minister")
             limit: Maximum number of results
 
         Returns:
             List of matching travel records
         """
-        records = self._load_travel()
-        results = records
-
-        if department:
-            dept_lower = department.lower()
-            results = [
-                r for r in results
-                if dept_lower in r.owner_org_title.lower() or dept_lower in r.owner_org.lower()
-            ]
-
-        if name:
-            name_lower = name.lower()
-            results = [r for r in results if name_lower in r.name.lower()]
-
-        if destination:
-            dest_lower = destination.lower()
-            results = [
-                r for r in results
-                if (r.destination_en and dest_lower in r.destination_en.lower()) or
-                   (r.destination_fr and dest_lower in r.destination_fr.lower())
-            ]
-
-        if min_amount is not None:
-            results = [r for r in results if r.total >= min_amount]
-
-        if max_amount is not None:
-            results = [r for r in results if r.total <= max_amount]
-
-        if year is not None:
-            results = [r for r in results if r.travel_year == year]
-
-        if disclosure_group:
-            group_lower = disclosure_group.lower()
-            results = [r for r in results if group_lower in r.disclosure_group.lower()]
-
-        # Sort by total (descending)
-        results = sorted(results, key=lambda x: x.total, reverse=True)
-
-        if limit:
-            results = results[:limit]
-
-        return results
+        matches = self._matcher(
+            department, name, destination, ("destination_en", "destination_fr"),
+            min_amount, max_amount, disclosure_group,
+        )
+        return self._top((r for r in self._iter_records("travel", year) if matches(r)), limit)
 
     def search_hospitality(
         self,
@@ -362,55 +626,35 @@ class DepartmentalExpensesClient:
             location: Location to search for
             min_amount: Minimum expense amount
             max_amount: Maximum expense amount
-            year: Hospitality year
+            year: Hospitality year (only that year's shard is read)
             disclosure_group: Disclosure group (e.g., "Minister", "Deputy Minister")
             limit: Maximum number of results
 
         Returns:
             List of matching hospitality records
         """
-        records = self._load_hospitality()
-        results = records
-
-        if department:
-            dept_lower = department.lower()
-            results = [
-                r for r in results
-                if dept_lower in r.owner_org_title.lower() or dept_lower in r.owner_org.lower()
-            ]
-
-        if name:
-            name_lower = name.lower()
-            results = [r for r in results if name_lower in r.name.lower()]
-
-        if location:
-            loc_lower = location.lower()
-            results = [
-                r for r in results
-                if (r.location_en and loc_lower in r.location_en.lower()) or
-                   (r.location_fr and loc_lower in r.location_fr.lower())
-            ]
-
-        if min_amount is not None:
-            results = [r for r in results if r.total >= min_amount]
-
-        if max_amount is not None:
-            results = [r for r in results if r.total <= max_amount]
-
-        if year is not None:
-            results = [r for r in results if r.hospitality_year == year]
+        matches = self._matcher(
+            department, name, location, ("location_en", "location_fr"),
+            min_amount, max_amount, disclosure_group,
+        )
+        return self._top((r for r in self._iter_records("hospitality", year) if matches(r)), limit)
 
-        if disclosure_group:
-            group_lower = disclosure_group.lower()
-            results = [r for r in results if group_lower in r.disclosure_group.lower()]
-
-        # Sort by total (descending)
-        results = sorted(results, key=lambda x: x.total, reverse=True)
+    def _department_spending(self, dataset: str, year: Optional[int], limit: Optional[int]) -> List[Dict[str, Any]]:
+        # Sum by department
+        dept_totals: Dict[str, float] = {}
+        for record in self._iter_records(dataset, year):
+            dept = record.owner_org_title or record.owner_org
+            dept_totals[dept] = dept_totals.get(dept, 0) + record.total
 
+        # Sort and return top N
+        sorted_depts = sorted(dept_totals.items(), key=lambda x: x[1], reverse=True)
         if limit:
-            results = results[:limit]
+            sorted_depts = sorted_depts[:limit]
 
-        return results
+        return [
+            {"department": name, "total_spending": value}
+            for name, value in sorted_depts
+        ]
 
     def get_department_travel_spending(
         self,
@@ -427,26 +671,7 @@ class DepartmentalExpensesClient:
         Returns:
             List of dicts with department and total_spending
         """
-        records = self._load_travel()
-
-        if year is not None:
-            records = [r for r in records if r.travel_year == year]
-
-        # Sum by department
-        dept_totals: Dict[str, float] = {}
-        for record in records:
-            dept = record.owner_org_title or record.owner_org
-            dept_totals[dept] = dept_totals.get(dept, 0) + record.total
-
-        # Sort and return top N
-        sorted_depts = sorted(dept_totals.items(), key=lambda x: x[1], reverse=True)
-        if limit:
-            sorted_depts = sorted_depts[:limit]
-
-        return [
-            {"department": name, "total_spending": value}
-            for name, value in sorted_depts
-        ]
+        return self._department_spending("travel", year, limit)
 
     def get_department_hospitality_spending(
         self,
@@ -463,26 +688,7 @@ class DepartmentalExpensesClient:
         Returns:
             List of dicts with department and total_spending
         """
-        records = self._load_hospitality()
-
-        if year is not None:
-            records = [r for r in records if r.hospitality_year == year]
-
-        # Sum by department
-        dept_totals: Dict[str, float] = {}
-        for record in records:
-            dept = record.owner_org_title or record.owner_org
-            dept_totals[dept] = dept_totals.get(dept, 0) + record.total
-
-        # Sort and return top N
-        sorted_depts = sorted(dept_totals.items(), key=lambda x: x[1], reverse=True)
-        if limit:
-            sorted_depts = sorted_depts[:limit]
-
-        return [
-            {"department": name, "total_spending": value}
-            for name, value in sorted_depts
-        ]
+        return self._department_spending("hospitality", year, limit)
 
     def get_top_travelers(
         self,
@@ -501,21 +707,13 @@ class DepartmentalExpensesClient:
         Returns:
             List of dicts with name, department, and total_spending
         """
-        records = self._load_travel()
-
-        if year is not None:
-            records = [r for r in records if r.travel_year == year]
-
-        if department:
-            dept_lower = department.lower()
-            records = [
-                r for r in records
-                if dept_lower in r.owner_org_title.lower() or dept_lower in r.owner_org.lower()
-            ]
+        dept_lower = department.lower() if department else None
 
         # Sum by name and department
         traveler_data: Dict[tuple, Dict[str, Any]] = {}
-        for record in records:
+        for record in self._iter_records("travel", year):
+            if dept_lower and dept_lower not in record.owner_org_title.lower() and dept_lower not in record.owner_org.lower():
+                continue
             key = (record.name, record.owner_org_title)
             if key not in traveler_data:
                 traveler_data[key] = {'total_spending': 0.0}
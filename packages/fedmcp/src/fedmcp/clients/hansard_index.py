@@ -0,0 +1,292 @@
+"""Local full-text index of Hansard speeches (SQLite FTS5, BM25 ranking).
+
+Parsed sittings are added as they are fetched (see
+``OurCommonsHansardClient(index=...)``), by the daily Hansard import
+(``--index-speeches``) or in bulk with :meth:`HansardSpeechIndex.index_sittings`.
+Searches are then ranked phrase queries over every indexed sitting, filtered
+by date range, speaker or party, without downloading or parsing Hansard XML
+again.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from fedmcp.clients.hansard_sittings import parse_sitting_date
+
+
+# Cache directory for the speech index
+CACHE_DIR = Path.home() / ".cache" / "fedmcp" / "hansard_index"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sittings (
+    xml_url TEXT PRIMARY KEY,
+    kind TEXT,
+    date TEXT,
+    number TEXT,
+    parliament INTEGER,
+    session INTEGER,
+    speeches INTEGER,
+    indexed_at REAL
+);
+CREATE TABLE IF NOT EXISTS speeches (
+    id INTEGER PRIMARY KEY,
+    xml_url TEXT NOT NULL,
+    kind TEXT,
+    date TEXT,
+    sitting_number TEXT,
+    speaker TEXT,
+    party TEXT,
+    riding TEXT,
+    intervention_id TEXT,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS speeches_xml_url ON speeches(xml_url);
+CREATE INDEX IF NOT EXISTS speeches_date ON speeches(date);
+CREATE VIRTUAL TABLE IF NOT EXISTS speech_fts USING fts5(
+    text,
+    content='speeches',
+    content_rowid='id',
+    tokenize='porter unicode61 remove_diacritics 2'
+);
+"""
+
+
+def document_kind(xml_url: str) -> str:
+    """Classify a Hansard XML URL: House "debates" or committee "evidence"."""
+    return "debates" if "/debates/" in xml_url.lower() else "evidence"
+
+
+def phrase_query(*phrases: str) -> str:
+    """Build an FTS5 query matching any of the given phrases.
+
+    Each phrase is quoted, so punctuation ("C-3") and FTS5 operators in user
+    input are matched literally rather than parsed.
+    """
+    quoted = ['"' + phrase.replace('"', '""') + '"' for phrase in phrases if phrase and phrase.strip()]
+    return " OR ".join(quoted)
+
+
+class HansardSpeechIndex:
+    """Inverted index of Hansard speeches with speaker, party and date columns.
+
+    Example:
+        >>> index = HansardSpeechIndex()
+        >>> index.add_sitting(client.get_sitting("latest/hansard"))
+        >>> index.search(phrase_query("carbon tax"), date_from="2025-01-01")
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """
+        Initialize the index.
+
+        Args:
+            path: SQLite database file (default: ~/.cache/fedmcp/hansard_index/speeches.db)
+        """
+        if path is None:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            path = CACHE_DIR / "speeches.db"
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+    def has_sitting(self, xml_url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM sittings WHERE xml_url = ?", (xml_url,)).fetchone()
+        return row is not None
+
+    def indexed_sittings(self, xml_urls: Iterable[str]) -> Set[str]:
+        """The subset of ``xml_urls`` already in the index."""
+        urls = list(xml_urls)
+        if not urls:
+            return set()
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT xml_url FROM sittings WHERE xml_url IN ({', '.join('?' * len(urls))})", urls
+            ).fetchall()
+        return {row["xml_url"] for row in rows}
+
+    def index_sittings(self, client: Any, xml_urls: Iterable[str], *, max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Fetch and index every sitting in ``xml_urls`` that is not indexed yet.
+
+        Args:
+            client: OurCommonsHansardClient used to fetch and parse sittings
+            xml_urls: Hansard XML URLs (e.g., from HansardSittingIndex.sittings())
+            max_workers: Sittings fetched concurrently
+
+        Returns:
+            Dict with "indexed" (sittings added) and "failed" (xml_url -> error message)
+        """
+        urls = list(dict.fromkeys(xml_urls))
+        indexed = self.indexed_sittings(urls)
+        missing = [url for url in urls if url not in indexed]
+
+        def fetch(url: str) -> Any:
+            try:
+                return client.get_sitting(url, parse=True)
+            except Exception as e:
+                return e
+
+        result: Dict[str, Any] = {"indexed": 0, "failed": {}}
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            for url, sitting in zip(missing, executor.map(fetch, missing)):
+                if isinstance(sitting, Exception):
+                    result["failed"][url] = str(sitting)
+                    continue
+                # No-op when the client already added it (OurCommonsHansardClient(index=self))
+                self.add_sitting(sitting)
+                result["indexed"] += 1
+        return result
+
+    def add_sitting(self, sitting: Any, *, replace: bool = False) -> int:
+        """
+        Index every speech of a parsed sitting (HansardSitting).
+
+        Sittings are keyed by their XML URL and indexed once unless replace=True.
+
+        Returns:
+            Number of speeches indexed
+        """
+        xml_url = sitting.source_xml_url
+        kind = document_kind(xml_url)
+        date = parse_sitting_date(sitting.date)
+        rows = [
+            (xml_url, kind, date, sitting.number, speech.speaker_name, speech.party,
+             speech.riding, speech.intervention_id, speech.text)
+            for section in sitting.sections
+            for speech in section.speeches
+            if speech.text
+        ]
+
+        with self._lock, self._conn:
+            if self._conn.execute("SELECT 1 FROM sittings WHERE xml_url = ?", (xml_url,)).fetchone():
+                if not replace:
+                    return 0
+                self._delete(xml_url)
+
+            for row in rows:
+                cursor = self._conn.execute(
+                    "INSERT INTO speeches (xml_url, kind, date, sitting_number, speaker, party, riding, intervention_id, text) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    row,
+                )
+                self._conn.execute("INSERT INTO speech_fts (rowid, text) VALUES (?, ?)", (cursor.lastrowid, row[-1]))
+
+            self._conn.execute(
+                "INSERT INTO sittings (xml_url, kind, date, number, parliament, session, speeches, indexed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (xml_url, kind, date, sitting.number, sitting.parliament_number, sitting.session_number,
+                 len(rows), time.time()),
+            )
+        return len(rows)
+
+    def _delete(self, xml_url: str) -> None:
+        # External-content FTS tables need the old values to delete entries
+        self._conn.execute(
+            "INSERT INTO speech_fts (speech_fts, rowid, text) "
+            "SELECT 'delete', id, text FROM speeches WHERE xml_url = ?",
+            (xml_url,),
+        )
+        self._conn.execute("DELETE FROM speeches WHERE xml_url = ?", (xml_url,))
+        self._conn.execute("DELETE FROM sittings WHERE xml_url = ?", (xml_url,))
+
+    # ------------------------------------------------------------------
+    # Searching
+    # ------------------------------------------------------------------
+    def search(
+        self,
+        match: str,
+        *,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        speaker: Optional[str] = None,
+        party: Optional[str] = None,
+        kind: Optional[str] = None,
+        xml_urls: Optional[Iterable[str]] = None,
+        limit: int = 10,
+    ) -> List[Dict[str, Any]]:
+        """
+        Ranked full-text search over indexed speeches.
+
+        Args:
+            match: FTS5 query (see :func:`phrase_query`)
+            date_from: Earliest sitting date (YYYY-MM-DD)
+            date_to: Latest sitting date (YYYY-MM-DD)
+            speaker: Case-insensitive substring of the speaker name
+            party: Case-insensitive substring of the party
+            kind: "debates" (House) or "evidence" (committees)
+            xml_urls: Restrict to these sittings
+            limit: Maximum results
+
+        Returns:
+            Speech dicts (date, sitting_number, speaker, party, riding,
+            intervention_id, xml_url, context, score), best match first
+        """
+        if not match:
+            return []
+
+        where = ["speech_fts MATCH ?"]
+        params: List[Any] = [match]
+        if date_from:
+            where.append("s.date >= ?")
+            params.append(date_from)
+        if date_to:
+            where.append("s.date <= ?")
+            params.append(date_to)
+        if speaker:
+            where.append("s.speaker LIKE ?")
+            params.append(f"%{speaker}%")
+        if party:
+            where.append("s.party LIKE ?")
+            params.append(f"%{party}%")
+        if kind:
+            where.append("s.kind = ?")
+            params.append(kind)
+        if xml_urls is not None:
+            urls = list(xml_urls)
+            if not urls:
+                return []
+            where.append(f"s.xml_url IN ({', '.join('?' * len(urls))})")
+            params.extend(urls)
+        params.append(limit)
+
+        query = f"""
+            SELECT s.date, s.sitting_number, s.speaker, s.party, s.riding,
+                   s.intervention_id, s.xml_url,
+                   snippet(speech_fts, 0, '', '', '', 64) AS context,
+                   bm25(speech_fts) AS score
+            FROM speech_fts
+            JOIN speeches s ON s.id = speech_fts.rowid
+            WHERE {' AND '.join(where)}
+            ORDER BY score
+            LIMIT ?
+        """
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(query, params)]
+
+    def coverage(self, kind: Optional[str] = None) -> Dict[str, Any]:
+        """Number of indexed sittings/speeches and their date range."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT count(*) AS sittings, coalesce(sum(speeches), 0) AS speeches, "
+                "min(date) AS first_date, max(date) AS last_date FROM sittings "
+                "WHERE ? IS NULL OR kind = ?",
+                (kind, kind),
+            ).fetchone()
+        return dict(row)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,275 @@
+"""Sitting calendar index for House of Commons Hansard (Debates) publications.
+
+Hansard XML for a sitting lives at a predictable URL keyed by parliament,
+session and sitting number. Instead of blindly probing ranges of sitting
+numbers every run, :class:`HansardSittingIndex` keeps a persisted
+number -> (date, XML URL) calendar per session, can be seeded from sittings
+already known locally, and is refreshed incrementally by probing only the
+numbers it does not know yet, concurrently.
+"""
+from __future__ import annotations
+
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from fedmcp.http import PRIORITY_BULK, RateLimitedSession
+
+
+HANSARD_XML_URL = "https://www.ourcommons.ca/Content/House/{parliament}{session}/Debates/{number:03d}/HAN{number:03d}-E.XML"
+
+# Cache directory for sitting calendars
+CACHE_DIR = Path.home() / ".cache" / "fedmcp" / "hansard_sittings"
+
+# The sitting date sits in the ExtractedInformation header near the top of the XML
+_HEADER_BYTES = 16384
+_DATE_RE = re.compile(r'<ExtractedItem\s+Name="Date"\s*>([^<]+)</ExtractedItem>')
+
+
+@dataclass
+class SittingEntry:
+    """A published Hansard sitting."""
+
+    number: int
+    date: Optional[str]  # ISO date (YYYY-MM-DD)
+    xml_url: str
+
+
+def parse_sitting_date(value: Optional[str]) -> Optional[str]:
+    """Convert a Hansard date ("Monday, November 17, 2025" or ISO) to YYYY-MM-DD."""
+    if not value:
+        return None
+    value = value.strip()
+    for fmt in ("%A, %B %d, %Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+
+class HansardSittingIndex:
+    """Persisted, incrementally refreshed calendar of Hansard sittings for one session.
+
+    Example:
+        >>> index = HansardSittingIndex(45, 1)
+        >>> index.refresh()
+        >>> index.missing_between("2025-11-01", "2025-11-30", have_dates={"2025-11-03"})
+    """
+
+    def __init__(
+        self,
+        parliament: int,
+        session: int,
+        *,
+        http: Optional[RateLimitedSession] = None,
+        cache_dir: Optional[Path] = None,
+        max_workers: int = 8,
+        probe_window: int = 5,
+    ) -> None:
+        """
+        Initialize the sitting index.
+
+        Args:
+            parliament: Parliament number (e.g., 45)
+            session: Session number (e.g., 1)
+            http: Optional HTTP session
+            cache_dir: Directory where the calendar JSON is persisted
+            max_workers: Concurrent probes per refresh
+            probe_window: Sitting numbers probed past the highest known sitting
+        """
+        self.parliament = parliament
+        self.session = session
+        self.http = http or RateLimitedSession(max_attempts=2)
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
+        self.probe_window = probe_window
+        self.requests_made = 0
+
+        self._sittings: Dict[int, SittingEntry] = {}
+        self._load()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    @property
+    def cache_path(self) -> Path:
+        return self.cache_dir / f"{self.parliament}-{self.session}.json"
+
+    def _load(self) -> None:
+        if not self.cache_path.exists():
+            return
+        try:
+            data = json.loads(self.cache_path.read_text())
+        except (OSError, ValueError):
+            return
+        for item in data.get("sittings", []):
+            entry = SittingEntry(**item)
+            self._sittings[entry.number] = entry
+
+    def save(self) -> None:
+        """Persist the calendar to the cache directory."""
+        payload = {
+            "parliament": self.parliament,
+            "session": self.session,
+            "updated_at": datetime.now().isoformat(),
+            "sittings": [asdict(entry) for entry in self.sittings()],
+        }
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(payload, indent=1))
+        tmp_path.replace(self.cache_path)
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+    def xml_url(self, number: int) -> str:
+        """URL of the English Hansard XML for a sitting number."""
+        return HANSARD_XML_URL.format(parliament=self.parliament, session=self.session, number=number)
+
+    def add_known(self, sittings: Iterable[Tuple[int, Optional[str]]]) -> int:
+        """
+        Seed the index with sittings already known locally (e.g., imported Documents).
+
+        Args:
+            sittings: (sitting_number, date) pairs; dates may be ISO or Hansard format
+
+        Returns:
+            Number of sittings added or completed
+        """
+        added = 0
+        for number, date in sittings:
+            iso_date = parse_sitting_date(date)
+            existing = self._sittings.get(number)
+            if existing and existing.date:
+                continue
+            self._sittings[number] = SittingEntry(number=number, date=iso_date, xml_url=self.xml_url(number))
+            added += 1
+        return added
+
+    def _probe(self, number: int) -> Optional[SittingEntry]:
+        """Check whether a sitting is published and read its date from the XML header."""
+        url = self.xml_url(number)
+        self.requests_made += 1
+        try:
+            response = self.http.get(
+                url,
+                headers={"Accept": "application/xml", "Range": f"bytes=0-{_HEADER_BYTES - 1}"},
+                stream=True,
+                timeout=15,
+                priority=PRIORITY_BULK,
+            )
+        except Exception:
+            return None
+
+        try:
+            if response.status_code not in (200, 206):
+                return None
+            header = b""
+            for chunk in response.iter_content(chunk_size=4096):
+                header += chunk
+                if len(header) >= _HEADER_BYTES:
+                    break
+        finally:
+            response.close()
+
+        match = _DATE_RE.search(header.decode("utf-8-sig", errors="ignore"))
+        return SittingEntry(
+            number=number,
+            date=parse_sitting_date(match.group(1)) if match else None,
+            xml_url=url,
+        )
+
+    def _probe_many(self, numbers: List[int]) -> List[SittingEntry]:
+        """Probe sitting numbers concurrently and record the ones that exist."""
+        if not numbers:
+            return []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self._probe, numbers))
+        found = [entry for entry in results if entry is not None]
+        for entry in found:
+            self._sittings[entry.number] = entry
+        return found
+
+    def refresh(self) -> List[SittingEntry]:
+        """
+        Discover sittings not yet in the index.
+
+        Probes (concurrently) any gaps below the highest known sitting, sittings
+        known without a date, and a window past the highest known sitting -
+        extending the window while new sittings keep appearing.
+
+        Returns:
+            Newly discovered sittings
+        """
+        highest = max(self._sittings, default=0)
+        to_probe = [
+            n for n in range(1, highest + 1)
+            if n not in self._sittings or not self._sittings[n].date
+        ]
+        to_probe.extend(range(highest + 1, highest + self.probe_window + 1))
+
+        discovered = self._probe_many(to_probe)
+        while discovered and max(e.number for e in discovered) > highest:
+            highest = max(self._sittings)
+            more = self._probe_many(list(range(highest + 1, highest + self.probe_window + 1)))
+            discovered.extend(more)
+            if not more:
+                break
+
+        self.save()
+        return sorted(discovered, key=lambda e: e.number)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def sittings(self) -> List[SittingEntry]:
+        """All known sittings ordered by number."""
+        return [self._sittings[n] for n in sorted(self._sittings)]
+
+    def get(self, number: int) -> Optional[SittingEntry]:
+        return self._sittings.get(number)
+
+    def latest(self, limit: int = 1) -> List[SittingEntry]:
+        """The most recent ``limit`` known sittings, newest first."""
+        return [self._sittings[n] for n in sorted(self._sittings, reverse=True)[:limit]]
+
+    def sittings_between(self, start_date: str, end_date: str) -> List[SittingEntry]:
+        """Known sittings whose date falls in [start_date, end_date] (ISO dates)."""
+        return [
+            entry for entry in self.sittings()
+            if entry.date and start_date <= entry.date <= end_date
+        ]
+
+    def missing_between(
+        self,
+        start_date: str,
+        end_date: str,
+        have_dates: Iterable[str] = (),
+        have_numbers: Iterable[int] = (),
+    ) -> List[SittingEntry]:
+        """
+        Sittings published between two dates that are not available locally.
+
+        Args:
+            start_date: First date (YYYY-MM-DD)
+            end_date: Last date (YYYY-MM-DD)
+            have_dates: Sitting dates already imported
+            have_numbers: Sitting numbers already imported
+
+        Returns:
+            Missing sittings ordered by number
+        """
+        have_dates = set(have_dates)
+        have_numbers = set(have_numbers)
+        return [
+            entry for entry in self.sittings_between(start_date, end_date)
+            if entry.date not in have_dates and entry.number not in have_numbers
+        ]
+
+    def __len__(self) -> int:
+        return len(self._sittings)
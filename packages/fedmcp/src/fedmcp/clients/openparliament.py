@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterator, Optional
 
-from fedmcp.http import RateLimitedSession, merge_params, paginate
+from fedmcp.http import PRIORITY_BULK, RateLimitedSession, merge_params, paginate
 
 
 DEFAULT_BASE_URL = "https://api.openparliament.ca"
@@ -60,7 +60,8 @@ class OpenParliamentClient:
             # Handle relative URLs from pagination
             if next_url.startswith('/'):
                 next_url = f"{self.base_url}{next_url}"
-            response = self.session.get(next_url, headers=self.headers)
+            # Later pages of a listing yield to interactive requests
+            response = self.session.get(next_url, headers=self.headers, priority=PRIORITY_BULK)
             response.raise_for_status()
             return response.json()
 
@@ -1,18 +1,45 @@
-"""Helpers for fetching Hansard XML exports from the House of Commons."""
+"""Helpers for fetching Hansard XML exports from the House of Commons.
+
+Parsed sittings are cached in memory (LRU) and on disk, keyed by the resolved
+XML URL. A published sitting never changes, so cached sittings do not expire;
+only the DocumentViewer slug -> XML URL resolution of "latest" aliases is
+refreshed after a short TTL. Concurrent requests for the same slug share one
+fetch and parse.
+"""
 from __future__ import annotations
 
+import hashlib
+import json
 import re
-from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
 from fedmcp.http import RateLimitedSession
 
+if TYPE_CHECKING:
+    from fedmcp.clients.hansard_index import HansardSpeechIndex
+
 
 DOCUMENTVIEWER_BASE = "https://www.ourcommons.ca/DocumentViewer/en/house/"
 
+# Cache directory for parsed sittings
+CACHE_DIR = Path.home() / ".cache" / "fedmcp" / "hansard"
+
+# Seconds a "latest" slug stays resolved to the same sitting
+LATEST_TTL = 5 * 60
+
+# Parsed sittings kept in memory / on disk
+MEMORY_CACHE_SIZE = 16
+DISK_CACHE_SIZE = 500
+
 
 @dataclass
 class HansardSpeech:
@@ -61,6 +88,18 @@ class HansardSitting:
     session_number: Optional[int] = None  # Session number (e.g., 1)
     volume: Optional[str] = None  # Hansard volume number
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "HansardSitting":
+        """Rebuild a sitting from :func:`dataclasses.asdict` output."""
+        sections = [
+            HansardSection(
+                title=section["title"],
+                speeches=[HansardSpeech(**speech) for speech in section["speeches"]],
+            )
+            for section in data.get("sections", [])
+        ]
+        return cls(**{**data, "sections": sections})
+
 
 class OurCommonsHansardClient:
     """Retrieve and parse the Commons Hansard XML exports."""
@@ -69,8 +108,40 @@ class OurCommonsHansardClient:
         self,
         *,
         session: Optional[RateLimitedSession] = None,
+        cache_dir: Optional[Path] = None,
+        use_cache: bool = True,
+        latest_ttl: float = LATEST_TTL,
+        memory_cache_size: int = MEMORY_CACHE_SIZE,
+        disk_cache_size: int = DISK_CACHE_SIZE,
+        index: Optional["HansardSpeechIndex"] = None,
     ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            session: Optional HTTP session
+            cache_dir: Directory where parsed sittings are persisted
+            use_cache: Cache parsed sittings (get_sitting with parse=True)
+            latest_ttl: Seconds before a "latest" slug is resolved again
+            memory_cache_size: Parsed sittings kept in memory
+            disk_cache_size: Parsed sittings kept on disk
+            index: Optional speech index that parsed sittings are added to
+        """
         self.session = session or RateLimitedSession()
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir or CACHE_DIR
+        if use_cache:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.latest_ttl = latest_ttl
+        self.memory_cache_size = memory_cache_size
+        self.disk_cache_size = disk_cache_size
+        self.index = index
+
+        self._sittings: "OrderedDict[str, HansardSitting]" = OrderedDict()
+        self._resolved: Dict[str, Tuple[str, float]] = {}  # page URL -> (xml URL, resolved_at)
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._load_resolved()
 
     def build_documentviewer_url(self, slug: str) -> str:
         """Normalise a DocumentViewer slug into a fully-qualified URL."""
@@ -104,13 +175,50 @@ class OurCommonsHansardClient:
         return urljoin("https://www.ourcommons.ca", href)
 
     def fetch_sitting_xml(self, slug_or_url: str) -> Tuple[str, str]:
-        html = self.fetch_documentviewer(slug_or_url)
-        xml_url = self.find_xml_link(html)
+        xml_url = self.resolve_xml_url(slug_or_url, refresh=True)
+        return self._fetch_xml(xml_url), xml_url
+
+    def _fetch_xml(self, xml_url: str) -> str:
         response = self.session.get(xml_url, headers={"Accept": "application/xml"})
         response.raise_for_status()
         # Decode with utf-8-sig to automatically strip BOM
-        xml_text = response.content.decode('utf-8-sig')
-        return xml_text, xml_url
+        return response.content.decode('utf-8-sig')
+
+    def _page_url(self, slug_or_url: str) -> str:
+        return (
+            slug_or_url
+            if slug_or_url.startswith("http")
+            else self.build_documentviewer_url(slug_or_url)
+        )
+
+    @staticmethod
+    def _is_alias(page_url: str) -> bool:
+        """Whether a DocumentViewer URL points at a moving target ("latest")."""
+        return "latest" in page_url.lower()
+
+    def resolve_xml_url(self, slug_or_url: str, *, refresh: bool = False) -> str:
+        """
+        Resolve a DocumentViewer slug or URL to its XML download URL.
+
+        Resolutions are remembered: permanently for specific sittings, for
+        ``latest_ttl`` seconds for "latest" aliases. Direct XML URLs resolve to
+        themselves.
+        """
+        page_url = self._page_url(slug_or_url)
+        if page_url.lower().endswith(".xml"):
+            return page_url
+        cached = self._resolved.get(page_url)
+        if cached and not refresh:
+            xml_url, resolved_at = cached
+            if not self._is_alias(page_url) or time.time() - resolved_at < self.latest_ttl:
+                return xml_url
+
+        xml_url = self.find_xml_link(self.fetch_documentviewer(page_url))
+        with self._lock:
+            self._resolved[page_url] = (xml_url, time.time())
+            if self.use_cache:
+                self._save_resolved()
+        return xml_url
 
     # ------------------------------------------------------------------
     # Parsing helpers
@@ -328,13 +436,120 @@ class OurCommonsHansardClient:
             intervention_type=intervention_type,
         )
 
+    # ------------------------------------------------------------------
+    # Sitting cache
+    # ------------------------------------------------------------------
+    def _sitting_path(self, xml_url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(xml_url.encode('utf-8')).hexdigest()}.json"
+
+    def _load_resolved(self) -> None:
+        if not self.use_cache:
+            return
+        try:
+            data = json.loads((self.cache_dir / "resolved.json").read_text())
+        except (OSError, ValueError):
+            return
+        # Only specific sittings are reused across processes
+        self._resolved.update({
+            page_url: (xml_url, 0.0)
+            for page_url, xml_url in data.items()
+            if not self._is_alias(page_url)
+        })
+
+    def _save_resolved(self) -> None:
+        data = {page_url: xml_url for page_url, (xml_url, _) in self._resolved.items() if not self._is_alias(page_url)}
+        tmp_path = self.cache_dir / "resolved.tmp"
+        try:
+            tmp_path.write_text(json.dumps(data, indent=1))
+            tmp_path.replace(self.cache_dir / "resolved.json")
+        except OSError:
+            pass  # Cache is best-effort
+
+    def _cached_sitting(self, xml_url: str) -> Optional[HansardSitting]:
+        with self._lock:
+            sitting = self._sittings.get(xml_url)
+            if sitting is not None:
+                self._sittings.move_to_end(xml_url)
+                return sitting
+        try:
+            sitting = HansardSitting.from_dict(json.loads(self._sitting_path(xml_url).read_text()))
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+        self._remember(xml_url, sitting)
+        return sitting
+
+    def _remember(self, xml_url: str, sitting: HansardSitting) -> None:
+        with self._lock:
+            self._sittings[xml_url] = sitting
+            self._sittings.move_to_end(xml_url)
+            while len(self._sittings) > self.memory_cache_size:
+                self._sittings.popitem(last=False)
+
+    def _store_sitting(self, xml_url: str, sitting: HansardSitting) -> None:
+        self._remember(xml_url, sitting)
+        path = self._sitting_path(xml_url)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(asdict(sitting)))
+            tmp_path.replace(path)
+            files = sorted(self.cache_dir.glob("*.json"), key=lambda f: f.stat().st_mtime)
+            files = [f for f in files if f.name != "resolved.json"]
+            for stale in files[:max(0, len(files) - self.disk_cache_size)]:
+                stale.unlink()
+        except OSError:
+            pass  # Cache is best-effort
+
+    def _load_sitting(self, slug_or_url: str) -> HansardSitting:
+        xml_url = self.resolve_xml_url(slug_or_url)
+        sitting = self._cached_sitting(xml_url)
+        if sitting is None:
+            sitting = self.parse_sitting(self._fetch_xml(xml_url), source_url=xml_url)
+            self._store_sitting(xml_url, sitting)
+        if self.index is not None:
+            try:
+                self.index.add_sitting(sitting)
+            except Exception:
+                pass  # Indexing is best-effort
+        return sitting
+
     # ------------------------------------------------------------------
     # Convenience API
     # ------------------------------------------------------------------
     def get_sitting(
         self, slug_or_url: str, *, parse: bool = True
     ) -> HansardSitting | str:
-        xml_text, xml_url = self.fetch_sitting_xml(slug_or_url)
-        if not parse:
-            return xml_text
-        return self.parse_sitting(xml_text, source_url=xml_url)
+        """
+        Fetch a sitting (or committee evidence) by DocumentViewer slug or URL,
+        or directly by Hansard XML URL.
+
+        With parse=True the parsed sitting is served from the cache when
+        possible. Concurrent calls for the same slug wait for a single fetch.
+        Cached sittings are shared objects and should not be modified.
+        """
+        if not parse or not self.use_cache:
+            xml_text, xml_url = self.fetch_sitting_xml(slug_or_url)
+            if not parse:
+                return xml_text
+            return self.parse_sitting(xml_text, source_url=xml_url)
+
+        key = self._page_url(slug_or_url)
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return future.result()
+
+        try:
+            sitting = self._load_sitting(slug_or_url)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(sitting)
+            return sitting
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
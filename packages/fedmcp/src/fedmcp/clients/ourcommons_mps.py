@@ -1,14 +1,30 @@
-"""Helpers for fetching MP XML exports from the House of Commons."""
+"""Helpers for fetching MP XML exports from the House of Commons.
+
+The MemberOfParliament export is loaded once into an :class:`MPRoster` with
+hash indexes (person id, party, honorific, current status), persisted to disk
+and revalidated with conditional GETs after a TTL, so the accessors below are
+dictionary lookups rather than a download per call.
+"""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Optional
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
 
 from fedmcp.http import RateLimitedSession
 
 
 MP_SEARCH_XML_URL = "https://www.ourcommons.ca/Members/en/search/xml"
 
+# Cache directory for the persisted MP roster
+CACHE_DIR = Path.home() / ".cache" / "fedmcp" / "ourcommons_mps"
+
+# Seconds before the roster is revalidated against the XML export
+ROSTER_TTL = 6 * 3600
+
 
 @dataclass
 class MPRecord:
@@ -37,6 +53,29 @@ class MPRecord:
         return f"{self.first_name} {self.last_name}"
 
 
+class MPRoster:
+    """Immutable set of MP records with hash indexes for the client accessors."""
+
+    def __init__(self, mps: Iterable[MPRecord]) -> None:
+        self.mps: List[MPRecord] = list(mps)
+        self.by_person_id: Dict[int, MPRecord] = {}
+        self.by_party: Dict[str, List[MPRecord]] = {}
+        self.by_honorific: Dict[str, List[MPRecord]] = {}
+        self.current: List[MPRecord] = []
+
+        for mp in self.mps:
+            # First record wins, matching the old linear-scan behaviour
+            self.by_person_id.setdefault(mp.person_id, mp)
+            self.by_party.setdefault(mp.party.lower(), []).append(mp)
+            if mp.honorific:
+                self.by_honorific.setdefault(mp.honorific, []).append(mp)
+            if mp.is_current:
+                self.current.append(mp)
+
+    def __len__(self) -> int:
+        return len(self.mps)
+
+
 class OurCommonsMPsClient:
     """Retrieve and parse MP data from OurCommons XML."""
 
@@ -44,8 +83,27 @@ class OurCommonsMPsClient:
         self,
         *,
         session: Optional[RateLimitedSession] = None,
+        cache_dir: Optional[Path] = None,
+        roster_ttl: float = ROSTER_TTL,
     ) -> None:
+        """
+        Initialize the MPs client.
+
+        Args:
+            session: Optional HTTP session
+            cache_dir: Directory for the persisted roster
+            roster_ttl: Seconds before the roster is revalidated
+        """
         self.session = session or RateLimitedSession()
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.roster_ttl = roster_ttl
+
+        self._roster: Optional[MPRoster] = None
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._checked_at = 0.0
+        self._roster_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Fetch helpers
@@ -56,6 +114,81 @@ class OurCommonsMPsClient:
         response.raise_for_status()
         return response.content.decode('utf-8-sig')
 
+    # ------------------------------------------------------------------
+    # Roster store
+    # ------------------------------------------------------------------
+    @property
+    def roster_cache_path(self) -> Path:
+        return self.cache_dir / "roster.json"
+
+    def _load_roster(self) -> None:
+        try:
+            data = json.loads(self.roster_cache_path.read_text())
+        except (OSError, ValueError):
+            return
+        self._roster = MPRoster(MPRecord(**item) for item in data.get("mps", []))
+        self._etag = data.get("etag")
+        self._last_modified = data.get("last_modified")
+        self._checked_at = data.get("checked_at", 0.0)
+
+    def _save_roster(self) -> None:
+        payload = {
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+            "checked_at": self._checked_at,
+            "mps": [asdict(mp) for mp in self._roster.mps],
+        }
+        tmp_path = self.roster_cache_path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(payload))
+            tmp_path.replace(self.roster_cache_path)
+        except OSError:
+            pass  # Cache is best-effort
+
+    def refresh_roster(self) -> bool:
+        """
+        Revalidate the roster with a conditional GET.
+
+        Returns:
+            True if a new export was downloaded, False if unchanged (304)
+        """
+        with self._roster_lock:
+            headers = {"Accept": "application/xml"}
+            if self._roster is not None:
+                if self._etag:
+                    headers["If-None-Match"] = self._etag
+                if self._last_modified:
+                    headers["If-Modified-Since"] = self._last_modified
+
+            response = self.session.get(MP_SEARCH_XML_URL, headers=headers)
+            self._checked_at = time.time()
+            if response.status_code == 304 and self._roster is not None:
+                self._save_roster()
+                return False
+            response.raise_for_status()
+
+            self._roster = MPRoster(self.parse_mps(response.content.decode('utf-8-sig')))
+            self._etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
+            self._save_roster()
+            return True
+
+    def get_roster(self, refresh: bool = False) -> MPRoster:
+        """
+        Get the indexed roster, loading or revalidating it only when needed.
+
+        Args:
+            refresh: Revalidate now instead of waiting for the TTL
+        """
+        if self._roster is None:
+            with self._roster_lock:
+                if self._roster is None:
+                    self._load_roster()
+
+        if refresh or self._roster is None or time.time() - self._checked_at > self.roster_ttl:
+            self.refresh_roster()
+        return self._roster
+
     # ------------------------------------------------------------------
     # Parsing helpers
     # ------------------------------------------------------------------
@@ -113,24 +246,19 @@ class OurCommonsMPsClient:
     # ------------------------------------------------------------------
     def get_all_mps(self) -> List[MPRecord]:
         """Get all MPs from XML (current and former)."""
-        xml = self.fetch_mps_xml()
-        return self.parse_mps(xml)
+        return list(self.get_roster().mps)
 
     def get_current_mps(self) -> List[MPRecord]:
         """Get only current MPs (no term end date)."""
-        all_mps = self.get_all_mps()
-        return [mp for mp in all_mps if mp.is_current]
+        return list(self.get_roster().current)
 
     def get_mp_by_person_id(self, person_id: int) -> Optional[MPRecord]:
         """Get a specific MP by their PersonId."""
-        all_mps = self.get_all_mps()
-        matching = [mp for mp in all_mps if mp.person_id == person_id]
-        return matching[0] if matching else None
+        return self.get_roster().by_person_id.get(person_id)
 
     def get_mps_by_party(self, party: str) -> List[MPRecord]:
         """Get all MPs from a specific party."""
-        all_mps = self.get_all_mps()
-        return [mp for mp in all_mps if mp.party.lower() == party.lower()]
+        return list(self.get_roster().by_party.get(party.lower(), []))
 
     def get_mps_with_honorific(self, honorific: str) -> List[MPRecord]:
         """
@@ -142,8 +270,7 @@ class OurCommonsMPsClient:
         Returns:
             List of MPs with that honorific
         """
-        all_mps = self.get_all_mps()
-        return [mp for mp in all_mps if mp.honorific and mp.honorific == honorific]
+        return list(self.get_roster().by_honorific.get(honorific, []))
 
     def get_former_pms(self) -> List[MPRecord]:
         """Get MPs with 'Right Hon.' honorific (former Prime Ministers)."""
@@ -1,8 +1,19 @@
-"""Helpers for fetching Votes XML exports from the House of Commons."""
+"""Helpers for fetching Votes XML exports from the House of Commons.
+
+Vote summaries (subject, bill number, vote type) only exist in the bulk votes
+XML. The client keeps them in an index keyed by (parliament, session,
+vote_number) that is loaded once per client, persisted to disk, and
+revalidated with conditional GETs (ETag / Last-Modified) so per-vote metadata
+lookups never re-download the bulk file.
+"""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+import json
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 from fedmcp.http import RateLimitedSession
@@ -10,6 +21,17 @@ from fedmcp.http import RateLimitedSession
 
 VOTES_BASE = "https://www.ourcommons.ca/Members/en/votes"
 
+# Cache directory for the persisted vote summary index
+CACHE_DIR = Path.home() / ".cache" / "fedmcp" / "votes"
+
+# Seconds before the summary index is revalidated against the bulk XML
+SUMMARY_INDEX_TTL = 15 * 60
+
+# Minimum seconds between revalidations triggered by index misses
+MISS_REFRESH_INTERVAL = 60
+
+VoteKey = Tuple[int, int, int]
+
 
 @dataclass
 class Ballot:
@@ -72,8 +94,28 @@ class OurCommonsVotesClient:
         self,
         *,
         session: Optional[RateLimitedSession] = None,
+        cache_dir: Optional[Path] = None,
+        summary_ttl: float = SUMMARY_INDEX_TTL,
     ) -> None:
+        """
+        Initialize the votes client.
+
+        Args:
+            session: Optional HTTP session
+            cache_dir: Directory for the persisted vote summary index
+            summary_ttl: Seconds before the summary index is revalidated
+        """
         self.session = session or RateLimitedSession()
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.summary_ttl = summary_ttl
+
+        self._summary_index: Optional[Dict[VoteKey, VoteSummary]] = None
+        self._latest_keys: List[VoteKey] = []  # Votes in the most recent bulk XML, in order
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._checked_at = 0.0
+        self._index_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Fetch helpers
@@ -216,13 +258,129 @@ class OurCommonsVotesClient:
             num_paired=num_paired
         )
 
+    # ------------------------------------------------------------------
+    # Summary index
+    # ------------------------------------------------------------------
+    @property
+    def summary_cache_path(self) -> Path:
+        return self.cache_dir / "vote_summaries.json"
+
+    def _load_summary_index(self) -> None:
+        """Load the persisted index (if any) into memory."""
+        self._summary_index = {}
+        try:
+            data = json.loads(self.summary_cache_path.read_text())
+        except (OSError, ValueError):
+            return
+
+        for item in data.get("summaries", []):
+            summary = VoteSummary(**item)
+            key = (summary.parliament_number, summary.session_number, summary.vote_number)
+            self._summary_index[key] = summary
+        self._latest_keys = [tuple(key) for key in data.get("latest", [])]
+        self._etag = data.get("etag")
+        self._last_modified = data.get("last_modified")
+        self._checked_at = data.get("checked_at", 0.0)
+
+    def _save_summary_index(self) -> None:
+        payload = {
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+            "checked_at": self._checked_at,
+            "latest": [list(key) for key in self._latest_keys],
+            "summaries": [asdict(summary) for summary in self._summary_index.values()],
+        }
+        tmp_path = self.summary_cache_path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(payload))
+            tmp_path.replace(self.summary_cache_path)
+        except OSError:
+            pass  # Cache is best-effort
+
+    def refresh_summary_index(self) -> int:
+        """
+        Revalidate the summary index against the bulk votes XML.
+
+        Sends a conditional GET; a 304 costs no download or parsing. Otherwise
+        the new summaries are merged into the index (votes from earlier
+        sessions that have left the bulk file are kept).
+
+        Returns:
+            Number of votes added to the index
+        """
+        with self._index_lock:
+            if self._summary_index is None:
+                self._load_summary_index()
+
+            headers = {"Accept": "application/xml"}
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
+            response = self.session.get(f"{VOTES_BASE}/xml", headers=headers)
+            self._checked_at = time.time()
+            if response.status_code == 304:
+                self._save_summary_index()
+                return 0
+            response.raise_for_status()
+
+            summaries = self.parse_bulk_votes(response.content.decode('utf-8-sig'))
+            added = 0
+            latest_keys = []
+            for summary in summaries:
+                key = (summary.parliament_number, summary.session_number, summary.vote_number)
+                if key not in self._summary_index:
+                    added += 1
+                self._summary_index[key] = summary
+                latest_keys.append(key)
+
+            self._latest_keys = latest_keys
+            self._etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
+            self._save_summary_index()
+            return added
+
+    def get_summary_index(self, refresh: bool = False) -> Dict[VoteKey, VoteSummary]:
+        """
+        Get the (parliament, session, vote_number) -> VoteSummary index.
+
+        Args:
+            refresh: Revalidate now instead of waiting for the TTL
+
+        Returns:
+            Mapping of vote keys to summaries
+        """
+        if self._summary_index is None:
+            with self._index_lock:
+                if self._summary_index is None:
+                    self._load_summary_index()
+
+        if refresh or not self._latest_keys or time.time() - self._checked_at > self.summary_ttl:
+            self.refresh_summary_index()
+        return self._summary_index
+
+    def get_vote_summary(self, parliament: int, session: int, vote_number: int) -> Optional[VoteSummary]:
+        """
+        Look up one vote's summary.
+
+        A miss triggers a (rate-limited) revalidation so votes published since
+        the last refresh are picked up.
+        """
+        key = (parliament, session, vote_number)
+        summary = self.get_summary_index().get(key)
+        if summary is None and time.time() - self._checked_at > MISS_REFRESH_INTERVAL:
+            self.refresh_summary_index()
+            summary = self._summary_index.get(key)
+        return summary
+
     # ------------------------------------------------------------------
     # Convenience API
     # ------------------------------------------------------------------
     def get_vote_summaries(self) -> List[VoteSummary]:
-        """Get all vote summaries from bulk XML (no ballots)."""
-        xml = self.fetch_bulk_votes_xml()
-        return self.parse_bulk_votes(xml)
+        """Get all vote summaries currently in the bulk XML (no ballots)."""
+        index = self.get_summary_index()
+        return [index[key] for key in self._latest_keys]
 
     def get_vote(
         self,
@@ -238,7 +396,7 @@ class OurCommonsVotesClient:
             parliament: Parliament number (e.g., 45)
             session: Session number (e.g., 1)
             vote_number: Vote/division number
-            include_metadata: If True, fetch bulk XML to get subject/bill info
+            include_metadata: If True, add subject/bill info from the summary index
 
         Returns:
             Vote object with ballots and optional metadata
@@ -246,17 +404,10 @@ class OurCommonsVotesClient:
         xml = self.fetch_vote_xml(parliament, session, vote_number)
         vote = self.parse_vote(xml)
 
-        # Enrich with metadata from bulk XML if requested
+        # Enrich with metadata from the summary index if requested
         if include_metadata:
-            summaries = self.get_vote_summaries()
-            matching = [
-                s for s in summaries
-                if s.parliament_number == parliament
-                and s.session_number == session
-                and s.vote_number == vote_number
-            ]
-            if matching:
-                summary = matching[0]
+            summary = self.get_vote_summary(parliament, session, vote_number)
+            if summary:
                 vote.subject = summary.subject
                 vote.bill_number = summary.bill_number
                 vote.vote_type = summary.vote_type
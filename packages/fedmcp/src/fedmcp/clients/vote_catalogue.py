@@ -0,0 +1,199 @@
+"""Local catalogue of OpenParliament vote metadata.
+
+Tools that show many votes at once (an MP's voting history, for example) only
+need each vote's date, description and result. Instead of one ``get_vote``
+request per ballot, :class:`VoteCatalogue` bulk-loads every vote of a session
+through the paginated ``list_votes`` endpoint, persists it keyed by vote URL,
+and refreshes it incrementally (only votes dated on or after the newest one
+already known are re-listed). Votes still missing after a refresh fall back to
+individual ``get_vote`` calls.
+"""
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from fedmcp.clients.openparliament import OpenParliamentClient
+
+
+# Cache directory for vote catalogues (one JSON file per session)
+CACHE_DIR = Path.home() / ".cache" / "fedmcp" / "vote_catalogue"
+
+# Seconds before a session catalogue is refreshed
+CATALOGUE_TTL = 30 * 60
+
+# Page size requested from list_votes when bulk loading
+PAGE_SIZE = 500
+
+_SESSION_RE = re.compile(r"^/votes/(\d+-\d+)/\d+/?$")
+
+
+def vote_session(vote_url: str) -> Optional[str]:
+    """Extract the session ("45-1") from a vote URL such as "/votes/45-1/43/"."""
+    match = _SESSION_RE.match(vote_url or "")
+    return match.group(1) if match else None
+
+
+class VoteCatalogue:
+    """Per-session vote metadata keyed by vote URL.
+
+    Example:
+        >>> catalogue = VoteCatalogue(OpenParliamentClient())
+        >>> votes = catalogue.get_many(["/votes/45-1/43/", "/votes/45-1/42/"])
+        >>> votes["/votes/45-1/43/"]["description"]["en"]
+    """
+
+    def __init__(
+        self,
+        client: Optional[OpenParliamentClient] = None,
+        *,
+        cache_dir: Optional[Path] = None,
+        ttl: float = CATALOGUE_TTL,
+    ) -> None:
+        """
+        Initialize the catalogue.
+
+        Args:
+            client: OpenParliament client used for listing and fallback fetches
+            cache_dir: Directory where session catalogues are persisted
+            ttl: Seconds before a session is refreshed
+        """
+        self.client = client or OpenParliamentClient()
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.requests_made = 0
+
+        self._sessions: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def _cache_path(self, session: str) -> Path:
+        return self.cache_dir / f"{session}.json"
+
+    def _load(self, session: str) -> Dict[str, Any]:
+        if session not in self._sessions:
+            try:
+                data = json.loads(self._cache_path(session).read_text())
+            except (OSError, ValueError):
+                data = {}
+            self._sessions[session] = {
+                "refreshed_at": data.get("refreshed_at", 0.0),
+                "votes": data.get("votes", {}),
+            }
+        return self._sessions[session]
+
+    def _save(self, session: str) -> None:
+        tmp_path = self._cache_path(session).with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(self._sessions[session]))
+            tmp_path.replace(self._cache_path(session))
+        except OSError:
+            pass  # Cache is best-effort
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+    def refresh_session(self, session: str) -> int:
+        """
+        Bulk-load new votes for a session.
+
+        The first load lists the whole session; later loads only list votes
+        dated on or after the newest known vote. The listing runs outside the
+        catalogue lock; its votes are merged and persisted under it.
+
+        Returns:
+            Number of votes added
+        """
+        with self._lock:
+            votes = self._load(session)["votes"]
+            params: Dict[str, Any] = {"session": session, "limit": PAGE_SIZE}
+            latest = max((v.get("date") or "" for v in votes.values()), default="")
+            if latest:
+                params["date__gte"] = latest
+            self.requests_made += 1
+
+        # Crawl without the lock so lookups in other sessions are not blocked
+        listed = [vote for vote in self.client.list_votes(**params) if vote.get("url")]
+
+        with self._lock:
+            entry = self._load(session)
+            votes = entry["votes"]
+            added = sum(1 for vote in listed if vote["url"] not in votes)
+            votes.update((vote["url"], vote) for vote in listed)
+            entry["refreshed_at"] = time.time()
+            self._save(session)
+        return added
+
+    def _ensure_session(self, session: str, wanted: Iterable[str]) -> None:
+        """Refresh a session if it is stale or lacks any of the wanted votes."""
+        with self._lock:
+            entry = self._load(session)
+            stale = time.time() - entry["refreshed_at"] > self.ttl
+            missing = any(url not in entry["votes"] for url in wanted)
+        if stale or missing:
+            self.refresh_session(session)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def get_many(self, vote_urls: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up metadata for many votes at once.
+
+        Args:
+            vote_urls: Vote URLs (e.g., "/votes/45-1/43/")
+
+        Returns:
+            Mapping of vote URL -> vote dict. Votes that cannot be fetched are
+            omitted.
+        """
+        by_session: Dict[str, List[str]] = {}
+        unknown_session: List[str] = []
+        for url in dict.fromkeys(vote_urls):
+            session = vote_session(url)
+            if session:
+                by_session.setdefault(session, []).append(url)
+            elif url:
+                unknown_session.append(url)
+
+        found: Dict[str, Dict[str, Any]] = {}
+        unseen: List[str] = list(unknown_session)
+        for session, urls in by_session.items():
+            try:
+                self._ensure_session(session, urls)
+            except Exception:
+                pass  # Fall back to single fetches below
+            with self._lock:
+                votes = self._load(session)["votes"]
+                for url in urls:
+                    if url in votes:
+                        found[url] = votes[url]
+                    else:
+                        unseen.append(url)
+
+        # Only votes the bulk listing does not know are fetched one by one
+        for url in unseen:
+            try:
+                self.requests_made += 1
+                vote = self.client.get_vote(url)
+            except Exception:
+                continue
+            found[url] = vote
+            session = vote_session(url)
+            if session:
+                with self._lock:
+                    self._load(session)["votes"][url] = vote
+                    self._save(session)
+
+        return found
+
+    def get(self, vote_url: str) -> Optional[Dict[str, Any]]:
+        """Look up a single vote's metadata."""
+        return self.get_many([vote_url]).get(vote_url)
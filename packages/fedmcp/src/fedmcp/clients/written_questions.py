@@ -1,17 +1,42 @@
-"""Client for scraping Written Questions from House of Commons website."""
+"""Client for scraping Written Questions from House of Commons website.
+
+Detail pages are fetched concurrently (the shared session enforces the host
+rate limit) and parsed in a process pool, with lxml when it is installed.
+Per-question scrape state is persisted per session, so later runs only
+re-fetch questions that are still unanswered or whose list-page status
+changed.
+"""
 from __future__ import annotations
 
+import json
+import os
 import re
-from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
 from datetime import datetime
 
 from bs4 import BeautifulSoup
-from fedmcp.http import RateLimitedSession
+from fedmcp.http import PRIORITY_BULK, RateLimitedSession
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:  # lxml is optional (pip install fedmcp[html])
+    HTML_PARSER = "html.parser"
 
 
 BASE_URL = "https://www.ourcommons.ca/written-questions"
 
+# Cache directory for per-question scrape state (one JSON file per session)
+CACHE_DIR = Path.home() / ".cache" / "fedmcp" / "written_questions"
+
+# Statuses after which a question's detail page no longer changes
+FINAL_STATUSES = ("answered", "withdrawn")
+
 
 @dataclass
 class WrittenQuestion:
@@ -45,6 +70,18 @@ class WrittenQuestion:
         num = self.question_number.upper().replace('Q-', '').replace('Q', '')
         return f"wq-{self.session_id}-{num}"
 
+    @property
+    def is_final(self) -> bool:
+        """True once the question is answered or withdrawn."""
+        status = (self.status or "").lower()
+        return any(final in status for final in FINAL_STATUSES)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WrittenQuestion":
+        """Rebuild a question from :meth:`to_dict` output."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for Neo4j."""
         return {
@@ -74,12 +111,33 @@ class WrittenQuestionsClient:
         self,
         *,
         session: Optional[RateLimitedSession] = None,
-        min_request_interval: float = 0.5  # 2 req/sec rate limit
+        min_request_interval: float = 0.5,  # 2 req/sec rate limit
+        cache_dir: Optional[Path] = None,
+        max_workers: int = 4,
+        parse_workers: Optional[int] = None,
     ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            session: Optional HTTP session
+            min_request_interval: Minimum seconds between requests to the host
+            cache_dir: Directory where per-question scrape state is persisted
+            max_workers: Concurrent page downloads
+            parse_workers: Processes parsing detail pages (default: CPU count,
+                at most 4; 0 parses in the download threads)
+        """
         self.session = session or RateLimitedSession(
             min_request_interval=min_request_interval
         )
         self.base_url = BASE_URL
+        self.cache_dir = cache_dir or CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
+        self.parse_workers = min(os.cpu_count() or 1, 4) if parse_workers is None else parse_workers
+        self.last_sync: Dict[str, int] = {}
+
+        self._state_lock = threading.Lock()
 
     def list_questions(
         self,
@@ -101,24 +159,24 @@ class WrittenQuestionsClient:
         questions = []
         page = 1
 
-        while True:
-            page_questions = self._fetch_page(
-                parliament_session,
-                page,
-                status
-            )
+        # Pages are fetched in concurrent waves until one comes back empty
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                pages = range(page, page + self.max_workers)
+                results = list(executor.map(
+                    lambda p: self._fetch_page(parliament_session, p, status), pages
+                ))
 
-            if not page_questions:
-                break
+                for page_questions in results:
+                    if not page_questions:
+                        return questions
 
-            questions.extend(page_questions)
+                    questions.extend(page_questions)
 
-            if limit and len(questions) >= limit:
-                return questions[:limit]
+                    if limit and len(questions) >= limit:
+                        return questions[:limit]
 
-            page += 1
-
-        return questions
+                page += self.max_workers
 
     def _fetch_page(
         self,
@@ -151,7 +209,7 @@ class WrittenQuestionsClient:
         parliament_session: str
     ) -> List[WrittenQuestion]:
         """Parse question list from HTML."""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
         questions = []
 
         # Parse parliament/session from parameter
@@ -315,15 +373,164 @@ class WrittenQuestionsClient:
 
         return self._parse_detail_page(response.text, parliament_session, q_num, url)
 
-    def _parse_detail_page(
+    # ------------------------------------------------------------------
+    # Incremental detail scraping
+    # ------------------------------------------------------------------
+    def _state_path(self, parliament_session: str) -> Path:
+        return self.cache_dir / f"{parliament_session}.json"
+
+    def _load_state(self, parliament_session: str) -> Dict[str, Dict[str, Any]]:
+        try:
+            return json.loads(self._state_path(parliament_session).read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self, parliament_session: str, state: Dict[str, Dict[str, Any]]) -> None:
+        path = self._state_path(parliament_session)
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            tmp_path.write_text(json.dumps(state))
+            tmp_path.replace(path)
+        except OSError:
+            pass  # State is best-effort
+
+    @staticmethod
+    def dedupe_questions(questions: Iterable[WrittenQuestion]) -> List[WrittenQuestion]:
+        """Collapse list-page duplicates (several links per card), preferring populated fields."""
+        question_map: Dict[str, WrittenQuestion] = {}
+        for q in questions:
+            existing = question_map.get(q.question_number)
+            if existing is None:
+                question_map[q.question_number] = q
+            elif q.asker_name and not existing.asker_name:
+                question_map[q.question_number] = q
+            elif q.status and not existing.status:
+                question_map[q.question_number] = q
+        return list(question_map.values())
+
+    def get_questions_details(
         self,
+        parliament_session: str,
+        questions: Iterable[WrittenQuestion],
+        *,
+        refresh: bool = False,
+    ) -> List[WrittenQuestion]:
+        """
+        Detailed records for many list-page questions, scraping only what changed.
+
+        A question's detail page is fetched when it has never been scraped, is
+        still unanswered, or its list-page status differs from the one seen at
+        the last scrape. Everything else is served from the persisted state.
+        Fetches run concurrently; parsing runs in a process pool.
+
+        List-page data is more reliable for asker_name, date_asked and status,
+        so it overrides the detail page for those fields. Questions whose
+        detail fetch fails are returned with their list-page data.
+
+        Args:
+            parliament_session: e.g., "45-1"
+            questions: Questions from :meth:`list_questions`
+            refresh: Re-fetch every question regardless of state
+
+        Returns:
+            Detailed questions, in input order
+        """
+        questions = self.dedupe_questions(questions)
+        with self._state_lock:
+            state = self._load_state(parliament_session)
+
+        to_fetch = []
+        for q in questions:
+            entry = state.get(q.question_number)
+            if (
+                refresh
+                or entry is None
+                or entry.get("list_status") != q.status
+                or not WrittenQuestion.from_dict(entry["question"]).is_final
+            ):
+                to_fetch.append(q)
+
+        fetch_numbers = {q.question_number for q in to_fetch}
+        fetched = self._fetch_details(parliament_session, [q.question_number for q in to_fetch])
+
+        results = []
+        failed = 0
+        for q in questions:
+            detailed = fetched.get(q.question_number)
+            if detailed is None and q.question_number not in fetch_numbers:
+                detailed = WrittenQuestion.from_dict(state[q.question_number]["question"])
+            if detailed is None:
+                failed += 1
+                results.append(q)
+                continue
+
+            if q.asker_name:
+                detailed.asker_name = q.asker_name
+            if q.date_asked:
+                detailed.date_asked = q.date_asked
+            if q.status:
+                detailed.status = q.status
+            results.append(detailed)
+
+            if q.question_number in fetched:
+                state[q.question_number] = {
+                    "list_status": q.status,
+                    "question": detailed.to_dict(),
+                    "fetched_at": time.time(),
+                }
+
+        with self._state_lock:
+            self._save_state(parliament_session, state)
+
+        self.last_sync = {
+            "fetched": len(to_fetch) - failed,
+            "reused": len(questions) - len(to_fetch),
+            "failed": failed,
+        }
+        return results
+
+    def _fetch_details(self, parliament_session: str, question_numbers: List[str]) -> Dict[str, WrittenQuestion]:
+        """Download detail pages concurrently and parse them in a process pool."""
+        if not question_numbers:
+            return {}
+
+        def download(question_number: str) -> Optional[tuple]:
+            q_num = str(question_number).lower().replace('q-', '').replace('q', '')
+            url = f"{self.base_url}/{parliament_session}/q-{q_num}"
+            try:
+                response = self.session.get(url, priority=PRIORITY_BULK)
+                response.raise_for_status()
+            except Exception:
+                return None
+            return response.text, parliament_session, q_num, url
+
+        parser = ProcessPoolExecutor(max_workers=self.parse_workers) if self.parse_workers > 0 else None
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as downloader:
+                pages = list(downloader.map(download, question_numbers))
+            jobs = [(number, page) for number, page in zip(question_numbers, pages) if page is not None]
+            if parser is not None:
+                parsed = parser.map(_parse_detail_args, [page for _, page in jobs], chunksize=8)
+            else:
+                parsed = map(_parse_detail_args, [page for _, page in jobs])
+            return {
+                number: question
+                for (number, _), question in zip(jobs, parsed)
+                if question is not None
+            }
+        finally:
+            if parser is not None:
+                parser.shutdown()
+
+    @staticmethod
+    def _parse_detail_page(
         html: str,
         parliament_session: str,
         q_num: str,
         source_url: str
     ) -> Optional[WrittenQuestion]:
         """Parse detailed question page."""
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, HTML_PARSER)
 
         # Parse parliament/session
         parts = parliament_session.split('-')
@@ -405,7 +612,7 @@ class WrittenQuestionsClient:
         # Extract full question text
         # The question text is typically in a content section after "With regard to..."
         # or starts with specific patterns
-        question_text = self._extract_question_text(soup)
+        question_text = WrittenQuestionsClient._extract_question_text(soup)
 
         # Look for topics (usually in tag links or a topics section)
         topic_links = soup.find_all('a', href=re.compile(r'topic'))
@@ -430,7 +637,8 @@ class WrittenQuestionsClient:
             ourcommons_url=source_url,
         )
 
-    def _extract_question_text(self, soup: BeautifulSoup) -> Optional[str]:
+    @staticmethod
+    def _extract_question_text(soup: BeautifulSoup) -> Optional[str]:
         """Extract the full question text from the detail page.
 
         The question text is typically in a content area and starts with
@@ -445,7 +653,7 @@ class WrittenQuestionsClient:
 
         for container in content_containers:
             text = container.get_text(separator=' ', strip=True)
-            question = self._find_question_in_text(text)
+            question = WrittenQuestionsClient._find_question_in_text(text)
             if question:
                 return question
 
@@ -453,21 +661,22 @@ class WrittenQuestionsClient:
         paragraphs = soup.find_all('p')
         for p in paragraphs:
             text = p.get_text(strip=True)
-            if self._is_question_text(text):
+            if WrittenQuestionsClient._is_question_text(text):
                 # Get full question which may span multiple paragraphs
                 parent = p.find_parent(['div', 'section'])
                 if parent:
                     full_text = parent.get_text(separator=' ', strip=True)
-                    question = self._find_question_in_text(full_text)
+                    question = WrittenQuestionsClient._find_question_in_text(full_text)
                     if question:
                         return question
                 return text
 
         # Pattern 3: Search entire page text for question patterns
         page_text = soup.get_text(separator=' ', strip=True)
-        return self._find_question_in_text(page_text)
+        return WrittenQuestionsClient._find_question_in_text(page_text)
 
-    def _is_question_text(self, text: str) -> bool:
+    @staticmethod
+    def _is_question_text(text: str) -> bool:
         """Check if text looks like the start of a written question."""
         if not text or len(text) < 20:
             return False
@@ -491,7 +700,8 @@ class WrittenQuestionsClient:
                 return True
         return False
 
-    def _find_question_in_text(self, text: str) -> Optional[str]:
+    @staticmethod
+    def _find_question_in_text(text: str) -> Optional[str]:
         """Find and extract the question from a block of text."""
         if not text:
             return None
@@ -536,7 +746,7 @@ class WrittenQuestionsClient:
         response = self.session.get(url, params=params)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, HTML_PARSER)
 
         # Look for "Results X of Y" or similar count text
         count_match = re.search(r'of\s+(\d+)', soup.get_text())
@@ -544,3 +754,11 @@ class WrittenQuestionsClient:
             return int(count_match.group(1))
 
         return 0
+
+
+def _parse_detail_args(args: tuple) -> Optional[WrittenQuestion]:
+    """Process-pool entry point for :meth:`WrittenQuestionsClient._parse_detail_page`."""
+    try:
+        return WrittenQuestionsClient._parse_detail_page(*args)
+    except Exception:
+        return None
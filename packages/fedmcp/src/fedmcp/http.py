@@ -1,12 +1,43 @@
 """HTTP utility helpers shared across client implementations."""
 from __future__ import annotations
 
+import heapq
+import itertools
+import threading
 import time
-from typing import Any, Callable, Dict, Iterator, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 import requests
 
 
+# Priority lanes of the rate limiter; lower values are served first
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BULK = "bulk"
+LANES = {PRIORITY_INTERACTIVE: 0, PRIORITY_BULK: 1}
+
+# Request options that may vary between coalesced GETs without changing the response
+_COALESCE_IGNORED = {"timeout"}
+_COALESCE_KEYED = {"params", "headers", "allow_redirects"}
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of request params/headers for the coalescing key."""
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value if isinstance(value, (str, int, float, bool, type(None), bytes)) else repr(value)
+
+
+class _InFlight:
+    """A GET being performed on behalf of every caller asking for it."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.response: Optional[requests.Response] = None
+        self.error: Optional[BaseException] = None
+
+
 class RateLimitedSession:
     """A thin wrapper around :class:`requests.Session` with retry/backoff and rate limiting support.
 
@@ -16,6 +47,15 @@ class RateLimitedSession:
     For CanLII API compliance:
     - Set min_request_interval=0.5 (enforces 2 requests per second limit)
     - Only 1 concurrent request is allowed (handled by synchronous execution)
+
+    The minimum interval holds across threads sharing one session. Waiting
+    requests are served by lane (``priority="interactive"`` before
+    ``priority="bulk"``), then in arrival order, so tool calls do not queue
+    behind long paginations.
+
+    Identical GETs issued while one is already in flight (same URL, params and
+    headers, not streamed) share that request and its response instead of
+    each taking a rate-limit slot.
     """
 
     def __init__(
@@ -26,6 +66,8 @@ class RateLimitedSession:
         min_request_interval: Optional[float] = None,
         default_timeout: float = 30.0,
         session: Optional[requests.Session] = None,
+        default_priority: str = PRIORITY_INTERACTIVE,
+        coalesce: bool = True,
     ) -> None:
         """Initialize the rate-limited session.
 
@@ -36,31 +78,133 @@ class RateLimitedSession:
                 For CanLII: use 0.5 (2 requests per second)
             default_timeout: Default timeout in seconds for all requests (default: 30.0)
             session: Optional existing requests.Session to wrap
+            default_priority: Lane for requests that do not pass priority= (default: "interactive")
+            coalesce: Share identical in-flight GETs (default: True)
         """
+        if default_priority not in LANES:
+            raise ValueError(f"Unknown priority: {default_priority}")
         self.session = session or requests.Session()
         self.backoff_factor = backoff_factor
         self.max_attempts = max_attempts
         self.min_request_interval = min_request_interval
         self.default_timeout = default_timeout
-        self._last_request_time: Optional[float] = None
+        self.default_priority = default_priority
+        self.coalesce = coalesce
+        self._next_slot: Optional[float] = None
+        self._rate_lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._rate_lock)
+        self._queue: List[Tuple[int, int]] = []  # Heap of (lane, ticket) waiting for a slot
+        self._tickets = itertools.count()
+        self._in_flight: Dict[Tuple, _InFlight] = {}
+        self._in_flight_lock = threading.Lock()
+        self._stats: Dict[str, Any] = {
+            "requests": 0,
+            "coalesced": 0,
+            "lanes": {lane: {"requests": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0} for lane in LANES},
+        }
 
-    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+    # ------------------------------------------------------------------
+    # Rate limiting
+    # ------------------------------------------------------------------
+    def _acquire_slot(self, priority: str) -> None:
+        """Wait for this request's turn: lane first, then arrival order."""
+        started = time.time()
+        with self._rate_lock:
+            if self.min_request_interval is not None:
+                ticket = (LANES[priority], next(self._tickets))
+                heapq.heappush(self._queue, ticket)
+                while True:
+                    now = time.time()
+                    if self._queue[0] == ticket and (self._next_slot is None or now >= self._next_slot):
+                        heapq.heappop(self._queue)
+                        self._next_slot = now + self.min_request_interval
+                        self._slot_freed.notify_all()
+                        break
+                    timeout = None
+                    if self._queue[0] == ticket:
+                        timeout = self._next_slot - now
+                    self._slot_freed.wait(timeout)
+
+            waited = time.time() - started
+            lane = self._stats["lanes"][priority]
+            lane["requests"] += 1
+            lane["wait_seconds"] += waited
+            lane["max_wait_seconds"] = max(lane["max_wait_seconds"], waited)
+            self._stats["requests"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters: requests sent, GETs served by coalescing, and queue waits per lane."""
+        with self._rate_lock:
+            return {
+                "requests": self._stats["requests"],
+                "coalesced": self._stats["coalesced"],
+                "lanes": {
+                    name: {
+                        **lane,
+                        "avg_wait_seconds": lane["wait_seconds"] / lane["requests"] if lane["requests"] else 0.0,
+                    }
+                    for name, lane in self._stats["lanes"].items()
+                },
+            }
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+    def request(self, method: str, url: str, *, priority: Optional[str] = None, **kwargs: Any) -> requests.Response:
         """Perform a request with rate limiting and retry logic.
 
-        Enforces minimum interval between requests if configured, then performs
-        the request with automatic retry and exponential backoff for 429/5xx errors.
+        Waits for a rate-limit slot in the request's priority lane if a minimum
+        interval is configured, then performs the request with automatic retry
+        and exponential backoff for 429/5xx errors.
 
         The default timeout can be overridden by passing timeout= in kwargs.
         """
-        # Proactive rate limiting: enforce minimum interval between requests
-        if self.min_request_interval is not None and self._last_request_time is not None:
-            time_since_last = time.time() - self._last_request_time
-            if time_since_last < self.min_request_interval:
-                sleep_time = self.min_request_interval - time_since_last
-                time.sleep(sleep_time)
-
-        # Update last request time
-        self._last_request_time = time.time()
+        priority = priority or self.default_priority
+        if priority not in LANES:
+            raise ValueError(f"Unknown priority: {priority}")
+
+        key = self._coalesce_key(method, url, kwargs)
+        if key is None:
+            return self._send(method, url, priority, kwargs)
+
+        with self._in_flight_lock:
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = _InFlight()
+
+        if not leader:
+            flight.done.wait()
+            with self._rate_lock:
+                self._stats["coalesced"] += 1
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+
+        try:
+            response = self._send(method, url, priority, kwargs)
+            response.content  # Read the body once so every caller can use it
+            flight.response = response
+            return response
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+            flight.done.set()
+
+    def _coalesce_key(self, method: str, url: str, kwargs: Dict[str, Any]) -> Optional[Tuple]:
+        """Key identifying equivalent GETs, or None if this request must not be shared."""
+        if not self.coalesce or method.upper() != "GET" or kwargs.get("stream"):
+            return None
+        if set(kwargs) - _COALESCE_KEYED - _COALESCE_IGNORED - {"stream"}:
+            return None  # auth, cookies, data, ...: keep it private
+        return (url, _freeze(kwargs.get("params")), _freeze(kwargs.get("headers")), kwargs.get("allow_redirects", True))
+
+    def _send(self, method: str, url: str, priority: str, kwargs: Dict[str, Any]) -> requests.Response:
+        # Proactive rate limiting: wait for a slot in this request's lane
+        self._acquire_slot(priority)
 
         # Set default timeout if not provided
         if 'timeout' not in kwargs:
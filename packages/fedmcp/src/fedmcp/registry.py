@@ -0,0 +1,211 @@
+"""Lazily constructed clients with optional background warm-up for the MCP server.
+
+Clients are registered with a factory and built on first use, so importing the
+server does not construct (or open caches for) every data source. Clients
+backed by large datasets also register a warm-up function that downloads and
+parses them; :meth:`ClientRegistry.warm_up` runs those in worker threads once
+the server is accepting requests. The first tool call into a preloadable
+client goes through the same warm-up (in the call's worker thread), so a call
+racing a running warm-up waits for it instead of loading the dataset a second
+time.
+
+Warm-up functions run with stdout redirected to stderr: the stdio server
+speaks JSON-RPC on stdout, and several loaders print progress.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import functools
+import logging
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Client states reported by ClientRegistry.status()
+NOT_CREATED = "not_created"
+CREATED = "created"
+WARMING = "warming"
+READY = "ready"
+FAILED = "failed"
+
+_stdout_lock = threading.Lock()
+_stdout_users = 0
+_saved_stdout = None
+
+
+@contextlib.contextmanager
+def _stdout_to_stderr():
+    """Redirect sys.stdout to stderr; nests across threads and restores stdout once."""
+    global _stdout_users, _saved_stdout
+    with _stdout_lock:
+        if _stdout_users == 0:
+            _saved_stdout, sys.stdout = sys.stdout, sys.stderr
+        _stdout_users += 1
+    try:
+        yield
+    finally:
+        with _stdout_lock:
+            _stdout_users -= 1
+            if _stdout_users == 0:
+                sys.stdout = _saved_stdout
+
+
+@dataclass
+class _Entry:
+    factory: Callable[[], Any]
+    warm: Optional[Callable[[Any], Any]] = None
+    client: Any = None
+    state: str = NOT_CREATED
+    error: Optional[str] = None
+    warm_seconds: Optional[float] = None
+    create_lock: threading.Lock = field(default_factory=threading.Lock)
+    warm_lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class LazyClient:
+    """Stand-in for a registered client; the client is built on first attribute access."""
+
+    __slots__ = ("_registry", "_name")
+
+    def __init__(self, registry: "ClientRegistry", name: str) -> None:
+        self._registry = registry
+        self._name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        registry, name = self._registry, self._name
+        value = getattr(registry.get(name), attr)
+        if callable(value) and registry.needs_warm(name):
+            # Load the data (or wait for a running warm-up) where the call runs,
+            # a worker thread, so the dataset is only ever loaded by warm()
+            @functools.wraps(value)
+            def call(*args: Any, **kwargs: Any) -> Any:
+                registry.warm(name)
+                return value(*args, **kwargs)
+            return call
+        return value
+
+    def __repr__(self) -> str:
+        return f"<LazyClient {self._name}>"
+
+
+class ClientRegistry:
+    """Named client factories, constructed on first use.
+
+    Example:
+        >>> clients = ClientRegistry()
+        >>> contracts = clients.register("contracts", FederalContractsClient, warm=lambda c: c._load_contracts())
+        >>> await clients.warm_up()
+        >>> clients.status()["contracts"]["state"]
+        'ready'
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, _Entry] = {}
+
+    def register(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        *,
+        warm: Optional[Callable[[Any], Any]] = None,
+    ) -> LazyClient:
+        """
+        Register a client.
+
+        Args:
+            name: Registry name (e.g., "lobbying")
+            factory: Builds the client
+            warm: Optional function loading the client's data ahead of use
+
+        Returns:
+            A stand-in that builds the client on first attribute access
+        """
+        if name in self._entries:
+            raise ValueError(f"Client already registered: {name}")
+        self._entries[name] = _Entry(factory, warm)
+        return LazyClient(self, name)
+
+    def get(self, name: str) -> Any:
+        """The client registered as ``name``, constructing it if needed."""
+        entry = self._entries[name]
+        if entry.client is None:
+            with entry.create_lock:
+                if entry.client is None:
+                    entry.client = entry.factory()
+                    entry.state = CREATED
+                    logger.info(f"Created client {name}")
+        return entry.client
+
+    def needs_warm(self, name: str) -> bool:
+        """True if ``name`` has a warm function that has not completed yet."""
+        entry = self._entries[name]
+        return entry.warm is not None and entry.state != READY
+
+    def warm(self, name: str) -> None:
+        """Build a client and load its data now (blocking). No-op without a warm function."""
+        entry = self._entries[name]
+        if entry.warm is None:
+            return
+        with entry.warm_lock:
+            if entry.state == READY:
+                return
+            client = self.get(name)
+            entry.state = WARMING
+            started = time.time()
+            try:
+                with _stdout_to_stderr():
+                    entry.warm(client)
+            except Exception as e:
+                entry.state = FAILED
+                entry.error = str(e)
+                raise
+            entry.warm_seconds = time.time() - started
+            entry.error = None
+            entry.state = READY
+
+    async def warm_up(self, names: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        Warm up clients concurrently in worker threads.
+
+        Args:
+            names: Clients to warm (default: every client with a warm function)
+
+        Returns:
+            Mapping of client name -> final state
+        """
+        if names is None:
+            names = [name for name, entry in self._entries.items() if entry.warm is not None]
+        names = [name for name in names if name in self._entries]
+        if not names:
+            return {}
+        logger.info(f"Warming up clients in the background: {', '.join(names)}")
+
+        async def warm_one(name: str) -> None:
+            try:
+                await asyncio.to_thread(self.warm, name)
+            except Exception as e:
+                logger.warning(f"Warm-up of {name} failed: {e}")
+                return
+            entry = self._entries[name]
+            if entry.warm_seconds is not None:
+                logger.info(f"Client {name} ready ({entry.warm_seconds:.1f}s)")
+
+        await asyncio.gather(*(warm_one(name) for name in names))
+        return {name: self._entries[name].state for name in names}
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Readiness of every registered client."""
+        return {
+            name: {
+                "state": entry.state,
+                "preloadable": entry.warm is not None,
+                "warm_seconds": entry.warm_seconds,
+                "error": entry.error,
+            }
+            for name, entry in self._entries.items()
+        }
@@ -35,7 +35,10 @@ from .clients import (
     LegisInfoClient,
     CanLIIClient,
     RepresentClient,
+    VoteCatalogue,
+    HansardSpeechIndex,
 )
+from .clients.hansard_index import phrase_query
 from .clients.expenditure import MPExpenditureClient
 from .clients.petitions import PetitionsClient
 from .clients.lobbying import LobbyingRegistryClient
@@ -43,23 +46,44 @@ from .clients.federal_contracts import FederalContractsClient
 from .clients.political_contributions import PoliticalContributionsClient
 from .clients.grants_contributions import GrantsContributionsClient
 from .clients.departmental_expenses import DepartmentalExpensesClient
-
-# Initialize clients
-op_client = OpenParliamentClient()
-hansard_client = OurCommonsHansardClient()
-legis_client = LegisInfoClient()
-represent_client = RepresentClient()
-expenditure_client = MPExpenditureClient()
-petitions_client = PetitionsClient()
-lobbying_client = LobbyingRegistryClient()
-contracts_client = FederalContractsClient()
-political_contrib_client = PoliticalContributionsClient()
-grants_client = GrantsContributionsClient()
-dept_expenses_client = DepartmentalExpensesClient()
+from .registry import ClientRegistry
+
+# Clients are constructed on first use; dataset-backed ones can be loaded in
+# the background at startup (see FEDMCP_WARMUP and main())
+clients = ClientRegistry()
+op_client = clients.register("openparliament", OpenParliamentClient)
+vote_catalogue = clients.register("vote_catalogue", lambda: VoteCatalogue(clients.get("openparliament")))
+speech_index = clients.register("hansard_index", HansardSpeechIndex)
+hansard_client = clients.register(
+    "hansard", lambda: OurCommonsHansardClient(index=clients.get("hansard_index"))
+)
+legis_client = clients.register("legisinfo", LegisInfoClient)
+represent_client = clients.register("represent", RepresentClient)
+expenditure_client = clients.register("expenditure", MPExpenditureClient)
+petitions_client = clients.register("petitions", PetitionsClient)
+lobbying_client = clients.register(
+    "lobbying", LobbyingRegistryClient,
+    warm=lambda c: (c._load_registrations(), c._load_communications()),
+)
+contracts_client = clients.register("contracts", FederalContractsClient, warm=lambda c: c._load_contracts())
+political_contrib_client = clients.register(
+    "political_contributions", PoliticalContributionsClient, warm=lambda c: c._load_contributions()
+)
+grants_client = clients.register("grants", GrantsContributionsClient, warm=lambda c: c._load_grants())
+dept_expenses_client = clients.register(
+    "departmental_expenses", DepartmentalExpensesClient,
+    warm=lambda c: (c._load_travel(), c._load_hospitality()),
+)
 
 # Initialize CanLII client if API key is available
 canlii_api_key = os.getenv("CANLII_API_KEY")
-canlii_client = CanLIIClient(api_key=canlii_api_key) if canlii_api_key else None
+canlii_client = (
+    clients.register("canlii", lambda: CanLIIClient(api_key=canlii_api_key)) if canlii_api_key else None
+)
+
+# Clients to warm up in the background at startup: "all", or comma-separated
+# registry names (e.g. "lobbying,contracts"). Unset: load on first use only.
+WARMUP = os.getenv("FEDMCP_WARMUP", "").strip()
 
 # Create server instance with Canadian flag icon (SVG data URI)
 # Using SVG to ensure compatibility with Claude Desktop UI
@@ -81,12 +105,48 @@ app = Server(
 )
 
 
+# Event-loop lag (seconds) above which a stall is logged
+LOOP_LAG_THRESHOLD = float(os.getenv("FEDMCP_LOOP_LAG_THRESHOLD", "0.25"))
+LOOP_LAG_INTERVAL = 0.5
+
+# Sponsored bills listed per MP for scorecard counts (bounds the page crawl)
+SPONSORED_BILLS_MAX = 200
+
+
 # Helper functions
 async def run_sync(func, *args, **kwargs):
     """Run a synchronous function in a thread pool to avoid blocking the event loop."""
     return await asyncio.to_thread(func, *args, **kwargs)
 
 
+async def run_iter(func, *args, max_items: Optional[int] = None, **kwargs) -> list:
+    """Call a function returning an iterator and drain up to max_items items, all in a worker thread."""
+    return await asyncio.to_thread(lambda: list(islice(func(*args, **kwargs), max_items)))
+
+
+async def monitor_event_loop_lag(
+    threshold: float = LOOP_LAG_THRESHOLD,
+    interval: float = LOOP_LAG_INTERVAL,
+) -> None:
+    """Log whenever the event loop was held longer than threshold seconds.
+
+    A ticker sleeps for interval and measures how late it wakes up. The loop's
+    slow-callback reporting is also enabled when FEDMCP_ASYNCIO_DEBUG is set,
+    which names the offending callback (at some overhead).
+    """
+    loop = asyncio.get_running_loop()
+    if os.getenv("FEDMCP_ASYNCIO_DEBUG"):
+        loop.set_debug(True)
+        loop.slow_callback_duration = threshold
+
+    while True:
+        started = loop.time()
+        await asyncio.sleep(interval)
+        lag = loop.time() - started - interval
+        if lag > threshold:
+            logger.warning(f"Event loop blocked for {lag:.3f}s (threshold {threshold:.3f}s)")
+
+
 def validate_limit(limit: Optional[int], min_val: int = 1, max_val: int = 50, default: int = 10) -> int:
     """Validate and normalize limit parameter.
 
@@ -187,7 +247,7 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="search_hansard",
-            description="Search House of Commons Hansard transcripts for quotes or keywords. Returns matching speeches with full context. Can search latest or specific sitting.",
+            description="Search House of Commons Hansard transcripts for quotes or keywords. Returns matching speeches ranked by relevance with context. Can search the latest sitting, a specific sitting, or every locally indexed sitting in a date range.",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -197,7 +257,23 @@ async def list_tools() -> list[Tool]:
                     },
                     "sitting": {
                         "type": "string",
-                        "description": "Optional: Specific sitting to search (e.g., '45-1/sitting-48/hansard' or 'latest/hansard'). Defaults to 'latest/hansard'.",
+                        "description": "Optional: Specific sitting to search (e.g., '45-1/sitting-48/hansard' or 'latest/hansard'). Defaults to 'latest/hansard' unless a date range is given.",
+                    },
+                    "date_from": {
+                        "type": "string",
+                        "description": "Optional: Search indexed sittings on or after this date (YYYY-MM-DD)",
+                    },
+                    "date_to": {
+                        "type": "string",
+                        "description": "Optional: Search indexed sittings on or before this date (YYYY-MM-DD)",
+                    },
+                    "speaker": {
+                        "type": "string",
+                        "description": "Optional: Only speeches by this speaker (partial name match)",
+                    },
+                    "party": {
+                        "type": "string",
+                        "description": "Optional: Only speeches by members of this party (partial match)",
                     },
                     "limit": {
                         "type": "integer",
@@ -212,7 +288,7 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="search_bill_debates",
-            description="Search Hansard transcripts for debates about a specific bill. Retrieves debate dates from LEGISinfo, then searches those Hansards for the bill. Returns MP speeches with context.",
+            description="Search Hansard transcripts for debates about a specific bill. Retrieves debate dates from LEGISinfo, then searches those Hansards for the bill. Returns MP speeches ranked by relevance with context.",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -1000,6 +1076,14 @@ async def list_tools() -> list[Tool]:
                 "required": ["topic"],
             },
         ),
+        Tool(
+            name="get_server_status",
+            description="Report which data sources are loaded and ready. Large datasets (lobbying, contracts, contributions, grants, departmental expenses) load on first use or in the background at startup; tools using a dataset that is still loading wait for it.",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+            },
+        ),
     ]
 
     # Add CanLII tools if client is available
@@ -1837,46 +1921,50 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         elif name == "search_hansard":
             try:
                 query = arguments["query"]
+                date_from = arguments.get("date_from")
+                date_to = arguments.get("date_to")
+                speaker = arguments.get("speaker")
+                party = arguments.get("party")
+                by_date = bool(date_from or date_to) and not arguments.get("sitting")
                 sitting_url = arguments.get("sitting", "latest/hansard")
                 limit = validate_limit(arguments.get("limit"), default=5, max_val=20)
-                logger.info(f"search_hansard called with query='{query}', sitting='{sitting_url}', limit={limit}")
-
-                sitting = await run_sync(hansard_client.get_sitting, sitting_url, parse=True)
-
-                if not sitting or not sitting.sections:
-                    return [TextContent(
-                        type="text",
-                        text=f"No Hansard data available or no matches found for '{query}'"
-                    )]
-
-                matches = []
-                query_lower = query.lower()
-
-                for section in sitting.sections:
-                    for speech in section.speeches:
-                        if len(matches) >= limit:
-                            break
-
-                        if speech.text and query_lower in speech.text.lower():
-                            text_lower = speech.text.lower()
-                            match_idx = text_lower.find(query_lower)
-
-                            start = max(0, match_idx - 200)
-                            end = min(len(speech.text), match_idx + len(query) + 200)
-                            context = speech.text[start:end]
-
-                            matches.append({
-                                "speaker": speech.speaker_name,
-                                "party": speech.party,
-                                "riding": speech.riding,
-                                "context": context,
-                            })
+                logger.info(f"search_hansard called with query='{query}', sitting='{sitting_url}', date_from={date_from}, date_to={date_to}, limit={limit}")
+
+                if by_date:
+                    # Ranked search over every sitting already in the local index
+                    matches = await run_sync(
+                        speech_index.search, phrase_query(query),
+                        date_from=date_from, date_to=date_to, speaker=speaker, party=party,
+                        kind="debates", limit=limit,
+                    )
+                    coverage = await run_sync(speech_index.coverage, "debates")
+                    header = (
+                        f"Hansard {date_from or 'earliest'} to {date_to or 'latest'} "
+                        f"({coverage['sittings']} sitting(s) indexed, "
+                        f"{coverage['first_date'] or 'n/a'} to {coverage['last_date'] or 'n/a'})\n"
+                    )
+                else:
+                    # Fetching the sitting adds it to the index
+                    sitting = await run_sync(hansard_client.get_sitting, sitting_url, parse=True)
+
+                    if not sitting or not sitting.sections:
+                        return [TextContent(
+                            type="text",
+                            text=f"No Hansard data available or no matches found for '{query}'"
+                        )]
+
+                    matches = await run_sync(
+                        speech_index.search, phrase_query(query),
+                        speaker=speaker, party=party, xml_urls=[sitting.source_xml_url], limit=limit,
+                    )
+                    header = f"Hansard Date: {sitting.date}\n"
 
                 return [TextContent(
                     type="text",
-                    text=f"Hansard Date: {sitting.date}\n" +
+                    text=header +
                          f"Found {len(matches)} speech(es) matching '{query}':\n\n" +
                          "\n\n---\n\n".join([
+                             (f"Date: {m['date']} (Sitting #{m['sitting_number']})\n" if by_date else "") +
                              f"Speaker: {m['speaker']} ({m['party']}, {m['riding']})\nContext: ...{m['context']}..."
                              for m in matches
                          ])
@@ -1940,79 +2028,31 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                         text=f"No debate sittings found for Bill {bill_number} in session {found_session}."
                     )]
 
-                # Search each debate sitting for the bill
-                all_matches = []
+                # Build direct XML URLs for the debate sittings
+                # Format: https://www.ourcommons.ca/Content/House/{parl}{sess}/Debates/{sitting_padded}/HAN{sitting_padded}-E.XML
+                parl_num, sess_num = found_session.split('-')[:2]
                 for sitting_info in debate_sittings:
-                    sitting_date = sitting_info['date'][:10]  # YYYY-MM-DD
-                    sitting_number = sitting_info['number']
+                    sitting_padded = sitting_info['number'].zfill(3)
+                    sitting_info['xml_url'] = f"https://www.ourcommons.ca/Content/House/{parl_num}{sess_num}/Debates/{sitting_padded}/HAN{sitting_padded}-E.XML"
 
-                    # Build direct XML URL for this sitting
-                    # Format: https://www.ourcommons.ca/Content/House/{parl}{sess}/Debates/{sitting_padded}/HAN{sitting_padded}-E.XML
-                    parl_num = found_session.split('-')[0]
-                    sess_num = found_session.split('-')[1]
-                    sitting_padded = sitting_number.zfill(3)
-                    xml_url = f"https://www.ourcommons.ca/Content/House/{parl_num}{sess_num}/Debates/{sitting_padded}/HAN{sitting_padded}-E.XML"
-
-                    try:
-                        # Fetch and parse XML directly
-                        def _fetch_and_parse():
-                            response = hansard_client.session.get(xml_url, headers={'Accept': 'application/xml'})
-                            response.raise_for_status()
-                            xml_text = response.content.decode('utf-8-sig')
-                            return hansard_client.parse_sitting(xml_text, source_url=xml_url)
-
-                        sitting = await run_sync(_fetch_and_parse)
-
-                        if not sitting or not sitting.sections:
-                            continue
-
-                        # Build search terms: bill number + optional search query
-                        search_terms = [bill_number.lower(), f"bill {bill_code}"]
-                        if search_query:
-                            search_terms.append(search_query.lower())
-
-                        sitting_matches = []
-                        for section in sitting.sections:
-                            for speech in section.speeches:
-                                if len(sitting_matches) >= limit:
-                                    break
-
-                                if not speech.text:
-                                    continue
-
-                                text_lower = speech.text.lower()
-
-                                # Check if any search term is in the speech
-                                match_found = any(term in text_lower for term in search_terms)
-
-                                if match_found:
-                                    # Find context around bill mention
-                                    match_idx = text_lower.find(bill_code)
-                                    if match_idx == -1:
-                                        match_idx = text_lower.find(bill_number.lower())
-
-                                    if match_idx >= 0:
-                                        start = max(0, match_idx - 200)
-                                        end = min(len(speech.text), match_idx + len(bill_number) + 200)
-                                        context = speech.text[start:end]
-                                    else:
-                                        # If searching by keyword, show beginning of speech
-                                        context = speech.text[:400]
-
-                                    sitting_matches.append({
-                                        "date": sitting_date,
-                                        "sitting_number": sitting_number,
-                                        "speaker": speech.speaker_name,
-                                        "party": speech.party,
-                                        "riding": speech.riding,
-                                        "context": context,
-                                    })
-
-                        all_matches.extend(sitting_matches)
+                # Fetch (and index) only sittings not already in the speech index, concurrently
+                indexing = await run_sync(
+                    speech_index.index_sittings, hansard_client, [s['xml_url'] for s in debate_sittings],
+                )
+                for xml_url, error in indexing["failed"].items():
+                    logger.warning(f"Could not fetch Hansard sitting {xml_url}: {error}")
 
-                    except Exception as e:
-                        logger.warning(f"Could not fetch Hansard for sitting {sitting_number}: {e}")
-                        continue
+                # Ranked search of each debate sitting: bill number + optional search query
+                match = phrase_query(bill_number, f"bill {bill_code}", search_query)
+                all_matches = []
+                for sitting_info in debate_sittings:
+                    sitting_matches = await run_sync(
+                        speech_index.search, match, xml_urls=[sitting_info['xml_url']], limit=limit,
+                    )
+                    for m in sitting_matches:
+                        m["date"] = sitting_info['date'][:10]  # YYYY-MM-DD
+                        m["sitting_number"] = sitting_info['number']
+                    all_matches.extend(sitting_matches)
 
                 if not all_matches:
                     return [TextContent(
@@ -2153,8 +2193,8 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 if date_before:
                     params['date__lte'] = date_before
 
-                # Use islice to properly limit results (limit param only controls page size, not total)
-                debates = await run_sync(lambda: list(islice(op_client.list_debates(**params), limit)))
+                # max_items bounds the total (the limit param only controls page size)
+                debates = await run_iter(op_client.list_debates, max_items=limit, **params)
 
                 return [TextContent(
                     type="text",
@@ -2259,8 +2299,8 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 limit = validate_limit(arguments.get("limit"), default=10, max_val=100)
                 logger.info(f"list_mps called with limit={limit}")
 
-                # Use islice to properly limit results (limit param only controls page size, not total)
-                mps = await run_sync(lambda: list(islice(op_client.list_mps(), limit)))
+                # max_items bounds the total (the limit param only controls page size)
+                mps = await run_iter(op_client.list_mps, max_items=limit)
 
                 return [TextContent(
                     type="text",
@@ -2405,9 +2445,8 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 if result:
                     params['result'] = result
 
-                # Run synchronous API call in thread pool to avoid blocking
-                # Use islice to properly limit results (limit param only controls page size, not total)
-                votes = await asyncio.to_thread(lambda: list(islice(op_client.list_votes(**params), limit)))
+                # max_items bounds the total (the limit param only controls page size)
+                votes = await run_iter(op_client.list_votes, max_items=limit, **params)
 
                 return [TextContent(
                     type="text",
@@ -2431,9 +2470,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 limit = validate_limit(arguments.get("limit"), default=10, max_val=100)
                 logger.info(f"list_committees called with limit={limit}")
 
-                # Run synchronous API call in thread pool to avoid blocking
-                # Use islice to properly limit results
-                committees = await asyncio.to_thread(lambda: list(islice(op_client.list_committees(), limit)))
+                committees = await run_iter(op_client.list_committees, max_items=limit)
 
                 return [TextContent(
                     type="text",
@@ -3000,9 +3037,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
 
                 if not politician_url:
                     # Search for politician
-                    def search_pol():
-                        return list(op_client.search_politician(mp_name))
-                    politicians = await run_sync(search_pol)
+                    politicians = await run_iter(op_client.search_politician, mp_name)
 
                     if not politicians:
                         return [TextContent(type="text", text=f"No MP found matching '{mp_name}'.")]
@@ -3013,10 +3048,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                     pol_name = mp_name or "MP"
 
                 # Get bills sponsored by this politician
-                def get_bills():
-                    return list(op_client.list_bills(sponsor=politician_url, limit=limit))
-
-                bills = await run_sync(get_bills)
+                bills = await run_iter(op_client.list_bills, sponsor=politician_url, limit=limit, max_items=limit)
 
                 if not bills:
                     return [TextContent(type="text", text=f"No bills found sponsored by {pol_name}.")]
@@ -3073,12 +3105,8 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 limit = validate_limit(arguments.get("limit"), default=50, max_val=100)
                 logger.info(f"compare_party_bills called with session={session}, limit={limit}")
 
-                # Get bills
-                def get_bills():
-                    params = {'limit': limit}
-                    return list(op_client.list_bills(**params))
-
-                bills = await run_sync(get_bills)
+                # Get the most recent bills
+                bills = await run_iter(op_client.list_bills, limit=limit, max_items=limit)
 
                 if not bills:
                     return [TextContent(type="text", text="No bills found.")]
@@ -3217,9 +3245,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                     return [TextContent(type="text", text="Please provide either mp_name or politician_url.")]
 
                 if not politician_url:
-                    def search_pol():
-                        return list(op_client.search_politician(mp_name))
-                    politicians = await run_sync(search_pol)
+                    politicians = await run_iter(op_client.search_politician, mp_name)
 
                     if not politicians:
                         return [TextContent(type="text", text=f"No MP found matching '{mp_name}'.")]
@@ -3235,9 +3261,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 output += "=" * 60 + "\n\n"
 
                 # Bills sponsored
-                def get_bills():
-                    return list(op_client.list_bills(sponsor=politician_url, limit=50))
-                bills = await run_sync(get_bills)
+                bills = await run_iter(op_client.list_bills, sponsor=politician_url, limit=50, max_items=SPONSORED_BILLS_MAX)
                 output += f"📜 Legislative Activity:\n"
                 output += f"  Bills Sponsored: {len(bills)}\n"
                 if bills:
@@ -3303,13 +3327,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 logger.info(f"track_committee_activity called for committee={committee}")
 
                 # Search for committees
-                def get_committees():
-                    if committee:
-                        return list(op_client.list_committees(limit=limit))
-                    else:
-                        return list(op_client.list_committees(limit=limit))
-
-                committees = await run_sync(get_committees)
+                committees = await run_iter(op_client.list_committees, limit=limit)
 
                 # Filter if committee name provided
                 if committee:
@@ -3531,9 +3549,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
 
                 for mp_name in mp_names:
                     # Search for politician
-                    def search_pol():
-                        return list(op_client.search_politician(mp_name))
-                    politicians = await run_sync(search_pol)
+                    politicians = await run_iter(op_client.search_politician, mp_name)
 
                     if not politicians:
                         output += f"⚠️  {mp_name}: Not found\n\n"
@@ -3547,9 +3563,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                     data = {"name": pol_name}
 
                     # Bills
-                    def get_bills():
-                        return list(op_client.list_bills(sponsor=politician_url, limit=50))
-                    bills = await run_sync(get_bills)
+                    bills = await run_iter(op_client.list_bills, sponsor=politician_url, limit=50, max_items=SPONSORED_BILLS_MAX)
                     data["bills_total"] = len(bills)
                     data["bills_passed"] = sum(1 for b in bills if 'royal assent' in b.get('status', '').lower())
 
@@ -3715,14 +3729,17 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                         text=f"No recent voting records found for {mp_name}."
                     )]
 
-                # Fetch vote details for each ballot to get descriptions
+                # Vote descriptions come from the local vote catalogue in one
+                # bulk lookup; only votes it has never seen are fetched singly
+                votes = await run_sync(vote_catalogue.get_many, [b.get('vote_url', '') for b in ballots])
+
                 vote_records = []
                 for ballot in ballots:
                     vote_url = ballot.get('vote_url', '')
                     ballot_value = ballot.get('ballot', 'Unknown')
+                    vote = votes.get(vote_url)
 
-                    try:
-                        vote = await run_sync(op_client.get_vote, vote_url)
+                    if vote:
                         vote_records.append({
                             'date': vote.get('date', 'Unknown'),
                             'ballot': ballot_value,
@@ -3730,7 +3747,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                             'result': vote.get('result', 'Unknown'),
                             'vote_url': vote_url
                         })
-                    except:
+                    else:
                         # If we can't get vote details, just include what we have
                         vote_records.append({
                             'date': 'Unknown',
@@ -3885,8 +3902,10 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 vote_url = arguments["vote_url"]
                 logger.info(f"analyze_party_discipline called with vote_url={vote_url}")
 
-                # Get vote details
-                vote = await run_sync(op_client.get_vote, vote_url)
+                # Get vote details (date/description/result only, so the catalogue suffices)
+                vote = await run_sync(vote_catalogue.get, vote_url)
+                if vote is None:
+                    vote = await run_sync(op_client.get_vote, vote_url)
 
                 # Get all individual ballots (limit 350 covers all MPs)
                 ballots = await run_sync(op_client.get_vote_ballots, vote_url, 350)
@@ -4178,7 +4197,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
 
                     # If not found via LEGISinfo or not a bill number, try OpenParliament
                     if not bills:
-                        bills = list(islice(await run_sync(op_client.list_bills, q=topic), limit))
+                        bills = await run_iter(op_client.list_bills, q=topic, max_items=limit)
 
                     if bills:
                         for i, bill in enumerate(bills, 1):
@@ -4199,7 +4218,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 response_parts.append(f"DEBATES\n")
                 response_parts.append(f"-" * 50 + "\n")
                 try:
-                    debates = list(islice(await run_sync(op_client.list_debates, q=topic), limit))
+                    debates = await run_iter(op_client.list_debates, q=topic, max_items=limit)
                     if debates:
                         for i, debate in enumerate(debates, 1):
                             speaker = debate.get('attribution', 'Unknown')
@@ -4216,7 +4235,7 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 response_parts.append(f"VOTES\n")
                 response_parts.append(f"-" * 50 + "\n")
                 try:
-                    votes = list(islice(await run_sync(op_client.list_votes, q=topic), limit))
+                    votes = await run_iter(op_client.list_votes, q=topic, max_items=limit)
                     if votes:
                         for i, vote in enumerate(votes, 1):
                             desc = vote.get('description', {}).get('en', 'N/A')[:80]
@@ -5179,6 +5198,20 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
                 logger.exception(f"Error in conflict_of_interest_check")
                 return [TextContent(type="text", text=f"Error checking conflicts: {sanitize_error_message(e)}")]
 
+        elif name == "get_server_status":
+            status = clients.status()
+            output = "# Server Status\n\n"
+            for client_name, info in status.items():
+                line = f"- **{client_name}**: {info['state'].replace('_', ' ')}"
+                if info["warm_seconds"] is not None:
+                    line += f" (loaded in {info['warm_seconds']:.1f}s)"
+                if info["error"]:
+                    line += f" - last load failed: {sanitize_error_message(Exception(info['error']))}"
+                output += line + "\n"
+            preloadable = [n for n, info in status.items() if info["preloadable"]]
+            output += f"\nBackground warm-up: {WARMUP or 'off'} (preloadable: {', '.join(preloadable)})\n"
+            return [TextContent(type="text", text=output)]
+
         else:
             logger.warning(f"Unknown tool requested: {name}")
             return [TextContent(type="text", text=f"Unknown tool: {name}")]
@@ -5188,14 +5221,31 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         return [TextContent(type="text", text=f"Error executing {name}: {sanitize_error_message(e)}")]
 
 
+def warmup_targets(value: str) -> Optional[list]:
+    """Parse FEDMCP_WARMUP: None for every preloadable client, else a list of names."""
+    if value.lower() in ("1", "true", "all"):
+        return None
+    return [name.strip() for name in value.split(",") if name.strip()]
+
+
 async def main():
     """Run the MCP server."""
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
-        )
+    lag_monitor = asyncio.create_task(monitor_event_loop_lag())
+    warmup = None
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            if WARMUP:
+                # Runs in worker threads while the server answers requests
+                warmup = asyncio.create_task(clients.warm_up(warmup_targets(WARMUP)))
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options()
+            )
+    finally:
+        lag_monitor.cancel()
+        if warmup:
+            warmup.cancel()
 
 
 if __name__ == "__main__":
@@ -1,10 +1,18 @@
 #!/usr/bin/env python3
-"""Daily committee meeting import job - discovers and imports new committee meetings."""
+"""Daily committee meeting import job - discovers and imports new committee meetings.
+
+Dates are fetched concurrently through one shared rate-limited session (pages are
+parsed in the worker threads) and all meetings are written with a single batched
+UNWIND, so wide backfills (e.g., a whole session) run in minutes:
+
+    python scripts/daily-committee-import.py --start-date 2025-05-26 --end-date 2025-12-12
+"""
 
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, Any, List, Optional
 import re
 import requests
@@ -12,11 +20,25 @@ from bs4 import BeautifulSoup
 
 # Add packages to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'packages' / 'data-pipeline'))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'packages' / 'fedmcp' / 'src'))
 
+from fedmcp.http import RateLimitedSession
 from fedmcp_pipeline.utils.neo4j_client import Neo4jClient
 from fedmcp_pipeline.utils.progress import logger
 
 
+FILTERED_MEETINGS_URL = "https://www.ourcommons.ca/committees/en/FilteredMeetings?meetingDate={date}"
+
+# Concurrent date fetches (the shared session's connection pool is sized to match)
+FETCH_WORKERS = 8
+
+# Minimum seconds between requests across all workers (same pace as CommitteesClient)
+MIN_REQUEST_INTERVAL = 0.5
+
+# Meetings written per UNWIND
+WRITE_BATCH_SIZE = 1000
+
+
 def parse_meeting_html(html: str, meeting_date: str) -> List[Dict[str, Any]]:
     """Parse FilteredMeetings HTML to extract meeting metadata."""
     soup = BeautifulSoup(html, 'html.parser')
@@ -25,7 +47,7 @@ def parse_meeting_html(html: str, meeting_date: str) -> List[Dict[str, Any]]:
     # Find all meeting items
     meeting_items = soup.find_all('div', class_=re.compile(r'accordion-item meeting-item'))
 
-    logger.info(f"Found {len(meeting_items)} meeting items in HTML")
+    logger.debug(f"Found {len(meeting_items)} meeting items in HTML")
 
     for item in meeting_items:
         try:
@@ -77,17 +99,31 @@ def parse_meeting_html(html: str, meeting_date: str) -> List[Dict[str, Any]]:
     return meetings
 
 
-def fetch_meetings_for_date(date_str: str) -> List[Dict[str, Any]]:
+def create_http_session(max_workers: int = FETCH_WORKERS) -> RateLimitedSession:
+    """Rate-limited session whose connection pool can serve max_workers threads.
+
+    The request interval is shared by every worker, so concurrency overlaps
+    latency without raising the request rate on ourcommons.ca.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=max_workers)
+    session.mount("https://", adapter)
+    return RateLimitedSession(session=session, max_attempts=3, min_request_interval=MIN_REQUEST_INTERVAL)
+
+
+def fetch_meetings_for_date(date_str: str, http: Optional[RateLimitedSession] = None) -> List[Dict[str, Any]]:
     """Fetch committee meetings for a specific date using FilteredMeetings endpoint."""
-    url = f"https://www.ourcommons.ca/committees/en/FilteredMeetings?meetingDate={date_str}"
+    url = FILTERED_MEETINGS_URL.format(date=date_str)
+    http = http or RateLimitedSession()
 
     try:
-        logger.info(f"Fetching meetings for {date_str}: {url}")
-        response = requests.get(url, timeout=30)
+        logger.debug(f"Fetching meetings for {date_str}: {url}")
+        response = http.get(url, timeout=30)
         response.raise_for_status()
 
         meetings = parse_meeting_html(response.text, date_str)
-        logger.info(f"Found {len(meetings)} meetings on {date_str}")
+        if meetings:
+            logger.info(f"Found {len(meetings)} meetings on {date_str}")
 
         return meetings
 
@@ -96,94 +132,140 @@ def fetch_meetings_for_date(date_str: str) -> List[Dict[str, Any]]:
         return []
 
 
-def import_meeting_to_neo4j(neo4j: Neo4jClient, meeting: Dict[str, Any]):
-    """Import or update a meeting in Neo4j."""
-
-    # Check if meeting already exists
-    check_query = """
-        MATCH (m:Meeting {ourcommons_meeting_id: $meeting_id})
-        RETURN m.ourcommons_meeting_id as id
+def fetch_meetings_for_range(
+    start_date: str,
+    end_date: str,
+    max_workers: int = FETCH_WORKERS,
+    http: Optional[RateLimitedSession] = None,
+) -> List[Dict[str, Any]]:
     """
-    result = neo4j.run_query(check_query, {"meeting_id": meeting['meeting_id']})
+    Fetch and parse committee meetings for every date in [start_date, end_date].
 
-    if result and len(result) > 0:
-        logger.info(f"Meeting {meeting['meeting_id']} already exists, skipping")
-        return False
+    Dates are fetched (and their HTML parsed) concurrently through one shared
+    session. Meetings are de-duplicated by meeting id and ordered by date.
 
-    # Ensure committee exists
-    committee_query = """
-        MERGE (c:Committee {code: $code})
-        ON CREATE SET c.created_at = datetime()
-        RETURN c.code as code
-    """
-    neo4j.run_query(committee_query, {"code": meeting['committee_acronym']})
-
-    # Create meeting node
-    meeting_data = {
-        'ourcommons_meeting_id': meeting['meeting_id'],
-        'committee_code': meeting['committee_acronym'],
-        'date': meeting['date'],
-        'time_description': meeting['time_str'],
-        'subject': meeting['subject'],
-        'status': meeting['status'],
-        'webcast_available': meeting['webcast'],
-        'source': 'ourcommons_filtered_meetings',
-        'imported_at': datetime.utcnow().isoformat(),
-    }
-
-    # Parse meeting number if available (will be null initially)
-    meeting_data['number'] = None
-
-    create_query = """
-        CREATE (m:Meeting)
-        SET m = $meeting_data
-        SET m.created_at = datetime()
-
-        WITH m
-        MATCH (c:Committee {code: $committee_code})
-        MERGE (c)-[:HELD_MEETING]->(m)
+    Args:
+        start_date: First date (YYYY-MM-DD)
+        end_date: Last date (YYYY-MM-DD)
+        max_workers: Concurrent date fetches
+        http: Optional shared HTTP session
 
-        RETURN m.ourcommons_meeting_id as id
+    Returns:
+        List of meeting dicts (see parse_meeting_html)
+    """
+    first = date.fromisoformat(start_date)
+    last = date.fromisoformat(end_date)
+    dates = [(first + timedelta(days=i)).isoformat() for i in range((last - first).days + 1)]
+    http = http or create_http_session(max_workers)
+
+    meetings: Dict[str, Dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(fetch_meetings_for_date, date_str, http) for date_str in dates]
+        for future in as_completed(futures):
+            for meeting in future.result():
+                meetings.setdefault(meeting['meeting_id'], meeting)
+
+    logger.info(f"Fetched {len(dates)} dates: {len(meetings)} meetings")
+    return sorted(meetings.values(), key=lambda m: (m['date'], m['meeting_id']))
+
+
+def import_meetings_to_neo4j(
+    neo4j: Neo4jClient,
+    meetings: List[Dict[str, Any]],
+    batch_size: int = WRITE_BATCH_SIZE,
+) -> int:
     """
+    Create missing Meeting nodes and their HELD_MEETING links in batched UNWINDs.
 
-    result = neo4j.run_query(create_query, {
-        "meeting_data": meeting_data,
-        "committee_code": meeting['committee_acronym']
-    })
+    Meetings are merged by ourcommons_meeting_id; existing meetings are left
+    untouched, so re-running over the same dates is a no-op.
 
-    logger.success(f"✓ Created Meeting {meeting['meeting_id']} for {meeting['committee_acronym']}")
-    return True
+    Returns:
+        Number of meetings created
+    """
+    imported_at = datetime.utcnow().isoformat()
+    rows = [
+        {
+            'ourcommons_meeting_id': meeting['meeting_id'],
+            'committee_code': meeting['committee_acronym'],
+            'date': meeting['date'],
+            'time_description': meeting['time_str'],
+            'subject': meeting['subject'],
+            'status': meeting['status'],
+            'webcast_available': meeting['webcast'],
+            'source': 'ourcommons_filtered_meetings',
+            'imported_at': imported_at,
+            # Meeting number is not on the listing page (filled in later)
+            'number': None,
+        }
+        for meeting in meetings
+    ]
+
+    neo4j.run_query("""
+        CREATE INDEX meeting_ourcommons_id IF NOT EXISTS
+        FOR (m:Meeting) ON (m.ourcommons_meeting_id)
+    """)
+
+    query = """
+        UNWIND $meetings AS row
+        MERGE (c:Committee {code: row.committee_code})
+        ON CREATE SET c.created_at = datetime()
+        MERGE (m:Meeting {ourcommons_meeting_id: row.ourcommons_meeting_id})
+        WITH c, m, row, m.created_at IS NULL AS is_new
+        FOREACH (_ IN CASE WHEN is_new THEN [1] ELSE [] END |
+            SET m += row, m.created_at = datetime()
+        )
+        MERGE (c)-[:HELD_MEETING]->(m)
+        RETURN sum(CASE WHEN is_new THEN 1 ELSE 0 END) AS created
+    """
 
+    created = 0
+    for i in range(0, len(rows), batch_size):
+        result = neo4j.run_query(query, {"meetings": rows[i:i + batch_size]})
+        created += result[0]['created'] if result else 0
 
-def check_and_import_recent_meetings(neo4j: Neo4jClient, lookback_days: int = 7):
-    """Check for and import any missing committee meetings from the last N days."""
-    imported_count = 0
+    logger.info(f"Created {created} new meetings ({len(rows) - created} already imported)")
+    return created
 
-    # Get dates to check (last N days, including weekends since committees can meet then)
-    dates_to_check = []
-    for i in range(lookback_days, -1, -1):
-        date = datetime.now() - timedelta(days=i)
-        dates_to_check.append(date.strftime('%Y-%m-%d'))
 
-    logger.info(f"Checking for committee meetings on {len(dates_to_check)} dates")
-    logger.info(f"Date range: {dates_to_check[0]} to {dates_to_check[-1]}")
+def check_and_import_recent_meetings(
+    neo4j: Neo4jClient,
+    lookback_days: int = 7,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    max_workers: int = FETCH_WORKERS,
+) -> int:
+    """Check for and import any missing committee meetings from the last N days (or a date range)."""
+    # Include weekends since committees can meet then
+    end_date = end_date or datetime.now().strftime('%Y-%m-%d')
+    start_date = start_date or (
+        date.fromisoformat(end_date) - timedelta(days=lookback_days)
+    ).isoformat()
 
-    # Fetch meetings for each date
-    for date_str in dates_to_check:
-        meetings = fetch_meetings_for_date(date_str)
+    logger.info(f"Checking for committee meetings from {start_date} to {end_date}")
 
-        for meeting in meetings:
-            try:
-                if import_meeting_to_neo4j(neo4j, meeting):
-                    imported_count += 1
-            except Exception as e:
-                logger.error(f"Failed to import meeting {meeting.get('meeting_id')}: {e}")
+    meetings = fetch_meetings_for_range(start_date, end_date, max_workers=max_workers)
+    if not meetings:
+        return 0
 
-    return imported_count
+    return import_meetings_to_neo4j(neo4j, meetings)
 
 
 def main():
     """Main entry point for daily committee import job."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Daily committee meeting import job')
+    parser.add_argument('--lookback-days', type=int, default=7,
+                        help='Number of days to look back (default: 7)')
+    parser.add_argument('--start-date', type=str, default=None,
+                        help='First date to import (YYYY-MM-DD), e.g. the start of a session')
+    parser.add_argument('--end-date', type=str, default=None,
+                        help='Last date to import (YYYY-MM-DD, default: today)')
+    parser.add_argument('--workers', type=int, default=FETCH_WORKERS,
+                        help=f'Concurrent date fetches (default: {FETCH_WORKERS})')
+    args = parser.parse_args()
+
     logger.info("=" * 80)
     logger.info("DAILY COMMITTEE MEETING IMPORT JOB")
     logger.info(f"Started at: {datetime.now().isoformat()}")
@@ -201,8 +283,13 @@ def main():
     neo4j = Neo4jClient(uri=neo4j_uri, user=neo4j_user, password=neo4j_password)
 
     try:
-        # Check for meetings from last 7 days
-        imported = check_and_import_recent_meetings(neo4j, lookback_days=7)
+        imported = check_and_import_recent_meetings(
+            neo4j,
+            lookback_days=args.lookback_days,
+            start_date=args.start_date,
+            end_date=args.end_date,
+            max_workers=args.workers,
+        )
 
         logger.info("=" * 80)
         if imported > 0:
@@ -16,7 +16,11 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'packages' / 'fedmcp' / 's
 from fedmcp_pipeline.utils.neo4j_client import Neo4jClient
 from fedmcp_pipeline.utils.progress import logger
 from fedmcp.clients.ourcommons import OurCommonsHansardClient
+from fedmcp.clients.hansard_index import HansardSpeechIndex
+from fedmcp.clients.hansard_sittings import HansardSittingIndex, parse_sitting_date
+from fedmcp.http import RateLimitedSession
 from fedmcp_pipeline.ingest.hansard import link_statements_to_mps_by_name, extract_hansard_keywords
+from fedmcp_pipeline.ingest.parliament_sessions import get_current_session
 
 
 def parse_hansard_with_enhanced_metadata(xml_text: str, source_url: str) -> Dict[str, Any]:
@@ -104,6 +108,8 @@ def parse_hansard_with_enhanced_metadata(xml_text: str, source_url: str) -> Dict
         "parliament_number": sitting.parliament_number,
         "session_number": sitting.session_number,
         "volume": sitting.volume,
+        # Parsed sitting, for the local speech index
+        "sitting": sitting,
     }
 
 
@@ -292,139 +298,136 @@ def get_latest_document_id(neo4j: Neo4jClient) -> int:
     return result[0]['max_id'] if result and result[0]['max_id'] else 25000
 
 
-def check_and_import_recent_debates(neo4j: Neo4jClient, lookback_days: int = 7, target_month: str = None):
+def build_sitting_index(neo4j: Neo4jClient, parliament: int, session: int) -> HansardSittingIndex:
+    """Build the sitting calendar: seed from imported Documents, then probe only unknown sittings."""
+    index = HansardSittingIndex(parliament, session)
+
+    # Seed with sittings we already imported for this session
+    result = neo4j.run_query("""
+        MATCH (d:Document)
+        WHERE d.parliament_number = $parliament AND d.session_number = $session
+          AND d.number IS NOT NULL
+        RETURN d.number AS number, d.date AS date
+    """, {"parliament": parliament, "session": session})
+
+    known = []
+    for row in result:
+        # Handle both old format ("No. 069") and new format (69)
+        num_val = row['number']
+        try:
+            number = int(num_val.replace('No. ', '').strip()) if isinstance(num_val, str) else int(num_val)
+        except ValueError:
+            continue
+        known.append((number, row['date']))
+    seeded = index.add_known(known)
+
+    discovered = index.refresh()
+    logger.info(
+        f"Sitting index {parliament}-{session}: {len(index)} sittings known "
+        f"({seeded} seeded from Neo4j, {len(discovered)} newly discovered, "
+        f"{index.requests_made} probe requests)"
+    )
+    return index
+
+
+def check_and_import_recent_debates(
+    neo4j: Neo4jClient,
+    lookback_days: int = 7,
+    target_month: str = None,
+    parliament: Optional[int] = None,
+    session: Optional[int] = None,
+    speech_index: Optional[HansardSpeechIndex] = None,
+):
     """Check for and import any missing debates from the last N days or a specific month.
 
+    Uses the Hansard sitting calendar index to answer "which sittings exist in
+    this date range and which are missing locally" in one call, so only the
+    sittings that actually need importing are downloaded.
+
     Args:
         neo4j: Neo4j client
         lookback_days: Number of days to look back (default: 7)
-        target_month: Optional month in YYYY-MM format (e.g., '2025-11') to check all weekdays in that month
+        target_month: Optional month in YYYY-MM format (e.g., '2025-11') to check the whole month
+        parliament: Parliament number (default: from latest imported Document)
+        session: Session number (default: from latest imported Document)
+        speech_index: Optional local speech index (used by the fedmcp server's
+            Hansard search) that imported sittings are also added to
     """
     imported_count = 0
 
-    # Get dates to check
-    dates_to_check = []
-
     if target_month:
-        # Generate all weekdays in the specified month
         year, month = map(int, target_month.split('-'))
         from calendar import monthrange
-        days_in_month = monthrange(year, month)[1]
+        start_date = f"{year:04d}-{month:02d}-01"
+        end_date = f"{year:04d}-{month:02d}-{monthrange(year, month)[1]:02d}"
+    else:
+        start_date = (datetime.now() - timedelta(days=lookback_days)).strftime('%Y-%m-%d')
+        end_date = datetime.now().strftime('%Y-%m-%d')
 
-        for day in range(1, days_in_month + 1):
-            date = datetime(year, month, day)
-            # Skip weekends (House doesn't sit on weekends)
-            if date.weekday() < 5:  # Monday = 0, Friday = 4
-                dates_to_check.append(date.strftime('%Y-%m-%d'))
+    logger.info(f"Checking for debates between {start_date} and {end_date}")
 
-        logger.info(f"Checking for debates in {target_month}: {len(dates_to_check)} weekdays")
-    else:
-        # Original logic: last N days
-        for i in range(lookback_days, -1, -1):
-            date = datetime.now() - timedelta(days=i)
-            # Skip weekends (House doesn't sit on weekends)
-            if date.weekday() < 5:  # Monday = 0, Friday = 4
-                dates_to_check.append(date.strftime('%Y-%m-%d'))
+    if parliament is None or session is None:
+        parliament, session = get_current_session(neo4j) or (45, 1)
 
-    logger.info(f"Checking for debates on dates: {dates_to_check}")
+    index = build_sitting_index(neo4j, parliament, session)
 
     # Check which dates already exist
     result = neo4j.run_query("""
         MATCH (d:Document)
-        WHERE d.date IN $dates
+        WHERE d.date >= $start AND d.date <= $end
         RETURN d.date as date
-    """, {"dates": dates_to_check})
-
+    """, {"start": start_date, "end": end_date})
     existing_dates = {row['date'] for row in result}
-    missing_dates = [d for d in dates_to_check if d not in existing_dates]
 
-    logger.info(f"Already imported: {existing_dates}")
-    logger.info(f"Missing dates to check: {missing_dates}")
+    published = index.sittings_between(start_date, end_date)
+    missing = index.missing_between(start_date, end_date, have_dates=existing_dates)
 
-    # Get the latest sitting number we have to estimate range
-    result = neo4j.run_query("""
-        MATCH (d:Document)
-        WHERE d.number IS NOT NULL
-        WITH d.number as num
-        ORDER BY d.date DESC
-        LIMIT 1
-        RETURN num
-    """)
+    logger.info(f"Published sittings in range: {[f'{e.number:03d} ({e.date})' for e in published]}")
+    logger.info(f"Already imported: {sorted(existing_dates)}")
+    logger.info(f"Missing sittings to import: {[f'{e.number:03d} ({e.date})' for e in missing]}")
 
-    if result and result[0]['num']:
-        # Handle both old format ("No. 069") and new format (69)
-        num_val = result[0]['num']
-        if isinstance(num_val, str):
-            latest_sitting = int(num_val.replace('No. ', '').strip())
-        else:
-            latest_sitting = int(num_val)
-        # Search backward and forward: from (latest - 15) to (latest + 15)
-        search_range = range(max(1, latest_sitting - 15), latest_sitting + 16)
-    else:
-        # Fallback: search from sitting 040 to 070
-        search_range = range(40, 71)
+    http = RateLimitedSession()
+    for entry in missing:
+        sitting_str = str(entry.number).zfill(3)
 
-    logger.info(f"Searching sitting numbers: {search_range.start} to {search_range.stop - 1}")
+        try:
+            response = http.get(entry.xml_url, headers={"Accept": "application/xml"})
+            response.raise_for_status()
+            xml_text = response.content.decode('utf-8-sig')
 
-    # Try each sitting number in range
-    for sitting_num in search_range:
-        sitting_str = str(sitting_num).zfill(3)
-        xml_url = f"https://www.ourcommons.ca/Content/House/451/Debates/{sitting_str}/HAN{sitting_str}-E.XML"
+            hansard_data = parse_hansard_with_enhanced_metadata(xml_text, source_url=entry.xml_url)
 
-        try:
-            # Check if XML exists
-            response = requests.head(xml_url, timeout=10)
-            if response.status_code != 200:
+            # Prefer the date in the full document over the indexed one
+            iso_date = parse_sitting_date(hansard_data['date']) or entry.date
+            if iso_date in existing_dates:
+                logger.info(f"⏭  Sitting {sitting_str} ({iso_date}) already imported, skipping")
                 continue
 
-            # Fetch and parse to get actual date
-            response = requests.get(xml_url, headers={"Accept": "application/xml"})
-            response.raise_for_status()
-            xml_text = response.content.decode('utf-8-sig')
+            logger.success(f"✓ Found sitting {sitting_str} for missing date {iso_date}")
 
-            hansard_data = parse_hansard_with_enhanced_metadata(xml_text, source_url=xml_url)
+            # Get next document ID
+            latest_doc_id = get_latest_document_id(neo4j)
+            document_id = latest_doc_id + 1
 
-            # Parse the verbose date from XML to ISO format
-            try:
-                # Parse date like "Monday, November 17, 2025" to ISO "2025-11-17"
-                parsed_date = datetime.strptime(hansard_data['date'], '%A, %B %d, %Y')
-                iso_date = parsed_date.strftime('%Y-%m-%d')
-
-                # Skip if not in our target date range
-                if iso_date not in missing_dates:
-                    logger.info(f"⏭  Sitting {sitting_str} ({iso_date}) not in missing dates, skipping")
-                    continue
-
-                # Skip if already imported (by date check)
-                if iso_date in existing_dates:
-                    logger.info(f"⏭  Sitting {sitting_str} ({iso_date}) already imported, skipping")
-                    continue
-
-                logger.success(f"✓ Found sitting {sitting_str} for missing date {iso_date}")
-
-                # Get next document ID
-                latest_doc_id = get_latest_document_id(neo4j)
-                document_id = latest_doc_id + 1
-
-                # Import
-                stmt_count, linked_count = import_hansard_to_neo4j(
-                    neo4j, hansard_data, iso_date,
-                    document_id, sitting_str
-                )
-                logger.success(f"✅ Imported sitting {sitting_str} ({iso_date}): {stmt_count} statements, {linked_count} linked")
-                imported_count += 1
+            # Import
+            stmt_count, linked_count = import_hansard_to_neo4j(
+                neo4j, hansard_data, iso_date,
+                document_id, sitting_str
+            )
+            logger.success(f"✅ Imported sitting {sitting_str} ({iso_date}): {stmt_count} statements, {linked_count} linked")
+            imported_count += 1
 
-                # Mark as imported
-                existing_dates.add(iso_date)
+            if speech_index is not None:
+                try:
+                    speech_index.add_sitting(hansard_data["sitting"])
+                except Exception as e:
+                    logger.warning(f"⚠️  Could not add sitting {sitting_str} to the speech index: {e}")
 
-            except (ValueError, TypeError) as e:
-                logger.warning(f"Could not parse date '{hansard_data['date']}': {e}")
+            # Mark as imported
+            existing_dates.add(iso_date)
 
         except requests.exceptions.RequestException as e:
-            if hasattr(e.response, 'status_code') and e.response.status_code == 404:
-                # 404 is expected for sitting numbers that don't exist
-                continue
-            logger.error(f"Error fetching {xml_url}: {e}")
+            logger.error(f"Error fetching {entry.xml_url}: {e}")
 
     return imported_count
 
@@ -437,7 +440,13 @@ def main():
     parser.add_argument('--lookback-days', type=int, default=30,
                         help='Number of days to look back (default: 30)')
     parser.add_argument('--month', type=str, default=None,
-                        help='Target month in YYYY-MM format (e.g., 2025-11) to check all weekdays')
+                        help='Target month in YYYY-MM format (e.g., 2025-11) to check all sittings')
+    parser.add_argument('--parliament', type=int, default=None,
+                        help='Parliament number (default: from latest imported sitting)')
+    parser.add_argument('--session', type=int, default=None,
+                        help='Session number (default: from latest imported sitting)')
+    parser.add_argument('--index-speeches', action='store_true',
+                        help='Also add imported sittings to the local Hansard speech index used by the fedmcp server')
     args = parser.parse_args()
 
     logger.info("=" * 80)
@@ -461,7 +470,10 @@ def main():
         imported = check_and_import_recent_debates(
             neo4j,
             lookback_days=args.lookback_days,
-            target_month=args.month
+            target_month=args.month,
+            parliament=args.parliament,
+            session=args.session,
+            speech_index=HansardSpeechIndex() if args.index_speeches else None,
         )
 
         # Extract keywords for newly imported documents
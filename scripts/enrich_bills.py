@@ -15,21 +15,31 @@ This script fetches detailed bill information from LEGISinfo and populates:
 
 Committee relationships are also created if available in bill stages.
 
+The LEGISinfo overview export is downloaded once per session and joined to
+the Bill nodes in memory. Individual bill detail requests are only made
+(concurrently) for bills still missing what the export lacks - the
+legislative summary and committee stages. All updates are written with
+batched UNWIND statements.
+
 Usage:
-    python scripts/enrich_bills.py [--limit N] [--dry-run]
+    python scripts/enrich_bills.py [--limit N] [--dry-run] [--workers N] [--export-only]
 
 Options:
     --limit N: Only process first N bills (for testing)
     --dry-run: Show what would be updated without making changes
+    --workers N: Concurrent bill detail requests (default: 8)
+    --export-only: Only use the overview export, skip bill detail requests
 """
 
 import sys
 import os
 import time
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 # Add packages to path
 SCRIPT_DIR = Path(__file__).parent
@@ -42,27 +52,48 @@ from fedmcp.clients.legisinfo import LegisInfoClient
 from fedmcp_pipeline.utils.neo4j_client import Neo4jClient
 
 
+# Rows per UNWIND write
+WRITE_BATCH_SIZE = 1000
+
+# Overview export field names mapped to their bill detail equivalents
+EXPORT_FIELD_ALIASES = {
+    "BillTypeEn": "BillDocumentTypeNameEn",
+    "BillTypeFr": "BillDocumentTypeNameFr",
+    "OriginatingChamberEn": "OriginatingChamberNameEn",
+    "OriginatingChamberFr": "OriginatingChamberNameFr",
+    "LatestActivityEn": "LatestBillEventTypeName",
+}
+
+BillKey = Tuple[str, str]  # (session, number)
+
+
 class BillEnricher:
     """Enriches bill data from LEGISinfo API."""
 
-    def __init__(self, neo4j_client: Neo4jClient, dry_run: bool = False):
+    def __init__(self, neo4j_client: Neo4jClient, dry_run: bool = False, workers: int = 8):
         self.neo4j = neo4j_client
         self.legis = LegisInfoClient()
         self.dry_run = dry_run
+        self.workers = workers
         self.stats = {
             "total_bills": 0,
             "enriched": 0,
             "already_complete": 0,
             "errors": 0,
             "committee_relationships": 0,
+            "from_export": 0,
+            "detail_requests": 0,
         }
+        # fetch_bill_detail runs on the worker pool
+        self._stats_lock = threading.Lock()
 
     def get_bills_needing_enrichment(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get bills from database that need enrichment (missing summary or bill_type)."""
         query = """
         MATCH (b:Bill)
         WHERE b.summary IS NULL OR b.bill_type IS NULL
-        RETURN b.number AS number, b.session AS session
+        RETURN b.number AS number, b.session AS session, b.summary IS NOT NULL AS has_summary,
+               exists((b)-[:REFERRED_TO]->()) AS has_committee
         ORDER BY b.introduced_date DESC
         """
 
@@ -73,70 +104,111 @@ class BillEnricher:
         print(f"\n📊 Found {len(results):,} bills needing enrichment")
         return results
 
-    def enrich_bill(self, bill_number: str, session: str) -> bool:
+    def load_overview_exports(self, sessions: List[str]) -> Dict[BillKey, Dict[str, Any]]:
+        """
+        Download the overview export once per session.
+
+        Returns:
+            Mapping of (session, bill number) -> export row, with export field
+            names aliased to their bill detail equivalents
         """
-        Fetch detailed bill data and update the database.
+        def fetch(session: str) -> List[Dict[str, Any]]:
+            data = self.legis.list_bills(params={"parlsession": session})
+            if isinstance(data, dict):
+                data = data.get("Bills") or []
+            return data
+
+        rows: Dict[BillKey, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=min(self.workers, max(len(sessions), 1))) as executor:
+            futures = {executor.submit(fetch, session): session for session in sessions}
+            for future in as_completed(futures):
+                session = futures[future]
+                try:
+                    export = future.result()
+                except Exception as e:
+                    print(f"   ⚠️  Could not download overview export for {session}: {e}")
+                    continue
+
+                matched = 0
+                for row in export:
+                    row_session = row.get("ParlSessionCode") or f"{row.get('ParliamentNumber')}-{row.get('SessionNumber')}"
+                    number = row.get("BillNumberFormatted")
+                    if row_session != session or not number:
+                        continue  # The export may ignore the session filter
+                    for export_name, detail_name in EXPORT_FIELD_ALIASES.items():
+                        if row.get(export_name) is not None and row.get(detail_name) is None:
+                            row[detail_name] = row[export_name]
+                    rows[(session, number)] = row
+                    matched += 1
+                print(f"   📥 {session}: {matched:,} bills in overview export")
+        return rows
+
+    def _count_error(self):
+        with self._stats_lock:
+            self._count_error()
+
+    def fetch_bill_detail(self, bill_number: str, session: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one bill's detail JSON.
 
         Returns:
-            True if bill was enriched, False if skipped or error
+            Bill detail dict, or None if unavailable (counted as an error)
         """
         try:
-            # Fetch detailed bill data from LEGISinfo
             bill_data = self.legis.get_bill(session, bill_number)
 
             # Handle case where API returns a list instead of dict
             if isinstance(bill_data, list):
                 if not bill_data:
                     print(f"   ⚠️  Empty list returned for {bill_number}")
-                    self.stats["errors"] += 1
-                    return False
+                    self._count_error()
+                    return None
                 # Take the first bill if multiple returned (likely different versions)
                 bill_data = bill_data[0]
 
             # Validate we have a dict
             if not bill_data or not isinstance(bill_data, dict):
                 print(f"   ⚠️  Invalid data type for {bill_number}: {type(bill_data)}")
-                self.stats["errors"] += 1
-                return False
-
-            # Extract enrichment fields
-            updates = self._extract_enrichment_fields(bill_data)
-
-            if not updates:
-                print(f"   ✓ {bill_number} already complete")
-                self.stats["already_complete"] += 1
-                return False
-
-            # Update database
-            if self.dry_run:
-                print(f"   [DRY RUN] Would update {bill_number} with: {list(updates.keys())}")
-            else:
-                self._update_bill(bill_number, session, updates)
-
-            # Extract and create committee relationships
-            committees = self._extract_committees(bill_data)
-            if committees and not self.dry_run:
-                self._create_committee_relationships(bill_number, session, committees)
-            elif committees:
-                print(f"   [DRY RUN] Would create {len(committees)} committee relationships")
+                self._count_error()
+                return None
 
-            self.stats["enriched"] += 1
-            return True
+            return bill_data
 
         except ValueError as e:
             # JSON decode errors - older bills may not have data available
             if "Expecting value" in str(e) or "JSON" in str(e):
-                print(f"   ⚠️  No JSON data available for {bill_number} (likely too old)")
-                self.stats["errors"] += 1
-                return False
+                print(f"   ⚠️  No JSON data available for {session}/{bill_number} (likely too old)")
             else:
-                print(f"   ❌ ValueError enriching {bill_number}: {e}")
-                self.stats["errors"] += 1
-                return False
+                print(f"   ❌ ValueError enriching {session}/{bill_number}: {e}")
+            self._count_error()
+            return None
         except Exception as e:
-            print(f"   ❌ Error enriching {bill_number}: {e}")
-            self.stats["errors"] += 1
-            return False
+            print(f"   ❌ Error enriching {session}/{bill_number}: {e}")
+            self._count_error()
+            return None
+
+    def fetch_bill_details(self, bills: List[Dict[str, Any]]) -> Dict[BillKey, Dict[str, Any]]:
+        """Fetch bill details concurrently; bills that fail are omitted."""
+        details: Dict[BillKey, Dict[str, Any]] = {}
+        if not bills:
+            return details
+
+        start_time = time.time()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(self.fetch_bill_detail, bill["number"], bill["session"]): (bill["session"], bill["number"])
+                for bill in bills
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                detail = future.result()
+                if detail is not None:
+                    details[futures[future]] = detail
+                if i % 50 == 0 or i == len(bills):
+                    elapsed = time.time() - start_time
+                    rate = i / elapsed if elapsed > 0 else 0
+                    print(f"   📊 Details: {i}/{len(bills)} ({i/len(bills)*100:.1f}%) | Rate: {rate:.1f} bills/sec")
+        self.stats["detail_requests"] += len(bills)
+        return details
 
     def _extract_enrichment_fields(self, bill_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract fields to enrich from bill detail JSON."""
@@ -232,75 +304,61 @@ class BillEnricher:
 
         return committees
 
-    def _update_bill(self, bill_number: str, session: str, updates: Dict[str, Any]):
-        """Update bill in Neo4j with enrichment fields."""
-        # Build SET clause
-        set_parts = [f"b.{key} = ${key}" for key in updates.keys()]
-        set_parts.append("b.updated_at = $updated_at")
-        set_clause = ", ".join(set_parts)
-
-        query = f"""
-        MATCH (b:Bill {{number: $number, session: $session}})
-        SET {set_clause}
-        RETURN b
+    def _update_bills(self, rows: List[Dict[str, Any]]):
+        """Update bills in Neo4j with enrichment fields, in UNWIND batches."""
+        query = """
+        UNWIND $rows AS row
+        MATCH (b:Bill {number: row.number, session: row.session})
+        SET b += row.updates, b.updated_at = $updated_at
         """
+        updated_at = datetime.utcnow().isoformat()
+        for i in range(0, len(rows), WRITE_BATCH_SIZE):
+            self.neo4j.run_query(query, {"rows": rows[i:i + WRITE_BATCH_SIZE], "updated_at": updated_at})
+        print(f"   ✅ Updated {len(rows):,} bills")
 
-        params = {
-            "number": bill_number,
-            "session": session,
-            "updated_at": datetime.utcnow().isoformat(),
-            **updates
-        }
-
-        self.neo4j.run_query(query, params)
-        print(f"   ✅ Enriched {bill_number} with {len(updates)} fields")
-
-    def _create_committee_relationships(
-        self,
-        bill_number: str,
-        session: str,
-        committees: List[Dict[str, str]]
-    ):
-        """Create REFERRED_TO relationships between bills and committees."""
+    def _create_committee_relationships(self, rows: List[Dict[str, str]]):
+        """Create REFERRED_TO relationships between bills and committees, in UNWIND batches."""
+        query = """
+        UNWIND $rows AS row
+        MATCH (b:Bill {number: row.number, session: row.session})
+        MERGE (c:Committee {code: row.code})
+        ON CREATE SET
+            c.name = row.name,
+            c.chamber = row.chamber,
+            c.created_at = datetime()
+        MERGE (b)-[r:REFERRED_TO]->(c)
+        ON CREATE SET
+            r.stage = row.stage,
+            r.created_at = datetime()
+        """
+        for i in range(0, len(rows), WRITE_BATCH_SIZE):
+            self.neo4j.run_query(query, {"rows": rows[i:i + WRITE_BATCH_SIZE]})
+        self.stats["committee_relationships"] += len(rows)
+        print(f"   ✅ Merged {len(rows):,} committee relationships")
+
+    @staticmethod
+    def _committee_rows(bill_number: str, session: str, committees: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """Build REFERRED_TO rows for one bill (one per committee code)."""
+        rows = {}
         for committee in committees:
-            if not committee.get("code"):
+            if not committee.get("code") or committee["code"] in rows:
                 continue
 
             # Infer chamber from committee name
             name = committee.get("name", "")
-            if "Senate" in name:
-                chamber = "Senate"
-            elif "Committee of the Whole" in name:
-                chamber = "House"
-            else:
-                chamber = "House"
-
-            query = """
-            MATCH (b:Bill {number: $number, session: $session})
-            MERGE (c:Committee {code: $code})
-            ON CREATE SET
-                c.name = $name,
-                c.chamber = $chamber,
-                c.created_at = datetime()
-            MERGE (b)-[r:REFERRED_TO]->(c)
-            ON CREATE SET
-                r.stage = $stage,
-                r.created_at = datetime()
-            """
-
-            params = {
+            chamber = "Senate" if "Senate" in name else "House"
+
+            rows[committee["code"]] = {
                 "number": bill_number,
                 "session": session,
                 "code": committee["code"],
-                "name": committee["name"],
+                "name": name,
                 "chamber": chamber,
                 "stage": committee["stage"],
             }
+        return list(rows.values())
 
-            self.neo4j.run_query(query, params)
-            self.stats["committee_relationships"] += 1
-
-    def run(self, limit: Optional[int] = None):
+    def run(self, limit: Optional[int] = None, fetch_details: bool = True):
         """Run the enrichment process."""
         print("=" * 80)
         print("BILLS DATA ENRICHMENT")
@@ -317,27 +375,53 @@ class BillEnricher:
             print("\n✅ All bills already enriched!")
             return
 
-        print(f"\n🔄 Enriching {len(bills):,} bills...")
-        print("")
-
-        # Process each bill
         start_time = time.time()
-        for i, bill in enumerate(bills, 1):
-            if i % 10 == 0:
-                elapsed = time.time() - start_time
-                rate = i / elapsed if elapsed > 0 else 0
-                remaining = (len(bills) - i) / rate if rate > 0 else 0
-                print(f"\n📊 Progress: {i}/{len(bills)} ({i/len(bills)*100:.1f}%) | "
-                      f"Rate: {rate:.1f} bills/sec | ETA: {remaining/60:.1f}min")
-
-            bill_number = bill["number"]
-            session = bill["session"]
 
-            print(f"{i:4d}. Enriching {session}/{bill_number}...", end="")
-            self.enrich_bill(bill_number, session)
-
-            # Be respectful of LEGISinfo (no explicit rate limit, but don't hammer)
-            time.sleep(0.1)
+        # 1. One overview export per session, joined in memory
+        sessions = sorted({bill["session"] for bill in bills if bill["session"]})
+        print(f"\n📥 Downloading overview exports for {len(sessions)} session(s)...")
+        export = self.load_overview_exports(sessions)
+
+        updates: Dict[BillKey, Dict[str, Any]] = {}
+        for bill in bills:
+            key = (bill["session"], bill["number"])
+            if key in export:
+                updates[key] = self._extract_enrichment_fields(export[key])
+                self.stats["from_export"] += 1
+
+        # 2. Bill details only for what the export lacks: the summary, and the
+        #    committee stages behind REFERRED_TO (never in the export)
+        committee_rows: List[Dict[str, str]] = []
+        if fetch_details:
+            need_detail = [
+                bill for bill in bills
+                if not bill.get("has_committee")
+                or (not bill.get("has_summary") and "summary" not in updates.get((bill["session"], bill["number"]), {}))
+            ]
+            print(f"\n🔄 Fetching details for {len(need_detail):,} bills ({self.workers} workers)...")
+            details = self.fetch_bill_details(need_detail)
+            for (session, number), detail in details.items():
+                updates[(session, number)] = {**updates.get((session, number), {}), **self._extract_enrichment_fields(detail)}
+                committee_rows.extend(self._committee_rows(number, session, self._extract_committees(detail)))
+
+        bill_rows = [
+            {"number": number, "session": session, "updates": fields}
+            for (session, number), fields in updates.items()
+            if fields
+        ]
+        self.stats["enriched"] = len(bill_rows)
+        self.stats["already_complete"] = sum(1 for fields in updates.values() if not fields)
+
+        # 3. Batched writes
+        if self.dry_run:
+            print(f"\n[DRY RUN] Would update {len(bill_rows):,} bills")
+            for row in bill_rows[:10]:
+                print(f"   {row['session']}/{row['number']}: {list(row['updates'].keys())}")
+            print(f"[DRY RUN] Would create {len(committee_rows):,} committee relationships")
+        else:
+            print("\n💾 Writing updates...")
+            self._update_bills(bill_rows)
+            self._create_committee_relationships(committee_rows)
 
         # Print summary
         elapsed = time.time() - start_time
@@ -345,6 +429,8 @@ class BillEnricher:
         print("ENRICHMENT COMPLETE")
         print("=" * 80)
         print(f"Total bills processed: {self.stats['total_bills']:,}")
+        print(f"Matched in overview export: {self.stats['from_export']:,}")
+        print(f"Bill detail requests: {self.stats['detail_requests']:,}")
         print(f"Bills enriched: {self.stats['enriched']:,}")
         print(f"Already complete: {self.stats['already_complete']:,}")
         print(f"Errors: {self.stats['errors']:,}")
@@ -359,6 +445,8 @@ def main():
     parser = argparse.ArgumentParser(description="Enrich bills with detailed LEGISinfo data")
     parser.add_argument("--limit", type=int, help="Only process first N bills (for testing)")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be updated without making changes")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent bill detail requests (default: 8)")
+    parser.add_argument("--export-only", action="store_true", help="Only use the overview export, skip bill detail requests")
     parser.add_argument("--env-file", default=None, help="Path to .env file (default: packages/data-pipeline/.env)")
 
     args = parser.parse_args()
@@ -379,8 +467,8 @@ def main():
     )
 
     # Run enrichment
-    enricher = BillEnricher(neo4j_client, dry_run=args.dry_run)
-    enricher.run(limit=args.limit)
+    enricher = BillEnricher(neo4j_client, dry_run=args.dry_run, workers=args.workers)
+    enricher.run(limit=args.limit, fetch_details=not args.export_only)
 
     # Cleanup
     neo4j_client.close()
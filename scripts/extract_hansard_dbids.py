@@ -14,10 +14,10 @@ Future Hansard imports will use exact hansard_db_id matching.
 
 import sys
 import os
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Set, List, Tuple
+from typing import Dict, Set, List, Optional, Tuple
 from collections import defaultdict
 
 # Add packages to path
@@ -27,42 +27,48 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'packages' / 'fedmcp' / 's
 from fedmcp_pipeline.utils.neo4j_client import Neo4jClient
 from fedmcp_pipeline.utils.progress import logger
 from fedmcp.clients.ourcommons import OurCommonsHansardClient
-from fedmcp_pipeline.ingest.hansard import normalize_name, NICKNAME_MAPPING
+from fedmcp.clients.hansard_sittings import HansardSittingIndex
+from fedmcp.http import RateLimitedSession
+from fedmcp_pipeline.utils.mp_names import normalize_name, NICKNAME_MAPPING
 
 
-def fetch_recent_hansard_xmls(limit: int = 50) -> List[Tuple[str, str]]:
+def fetch_recent_hansard_xmls(limit: int = 50, parliament: int = 45, session: int = 1) -> List[Tuple[str, str]]:
     """
     Fetch recent Hansard XMLs to extract DbIds.
 
+    Uses the sitting calendar index to find which sittings are published,
+    then downloads only those XMLs (concurrently).
+
     Args:
         limit: Number of recent sittings to fetch
+        parliament: Parliament number
+        session: Session number
 
     Returns:
         List of (sitting_number, xml_text) tuples
     """
     logger.info(f"Fetching {limit} recent Hansard XMLs...")
 
-    xmls = []
-    sitting_num = 60  # Start from recent sitting
+    index = HansardSittingIndex(parliament, session)
+    index.refresh()
+    entries = index.latest(limit)
+    logger.info(f"Sitting index knows {len(index)} sittings ({index.requests_made} probe requests)")
 
-    for _ in range(limit):
-        sitting_str = str(sitting_num).zfill(3)
-        xml_url = f"https://www.ourcommons.ca/Content/House/451/Debates/{sitting_str}/HAN{sitting_str}-E.XML"
+    http = RateLimitedSession()
 
+    def fetch(entry) -> Optional[Tuple[str, str]]:
+        sitting_str = str(entry.number).zfill(3)
         try:
-            response = requests.get(xml_url, headers={"Accept": "application/xml"}, timeout=30)
-            if response.status_code == 200:
-                xml_text = response.content.decode('utf-8-sig')
-                xmls.append((sitting_str, xml_text))
-                logger.info(f"  ✓ Fetched sitting {sitting_str}")
-            else:
-                logger.debug(f"  ✗ Sitting {sitting_str} not available (HTTP {response.status_code})")
+            response = http.get(entry.xml_url, headers={"Accept": "application/xml"}, timeout=30)
+            response.raise_for_status()
+            logger.info(f"  ✓ Fetched sitting {sitting_str}")
+            return sitting_str, response.content.decode('utf-8-sig')
         except Exception as e:
             logger.warning(f"  ✗ Error fetching sitting {sitting_str}: {e}")
+            return None
 
-        sitting_num -= 1
-        if sitting_num < 1:
-            break
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        xmls = [result for result in executor.map(fetch, entries) if result]
 
     logger.info(f"Successfully fetched {len(xmls)} Hansard XMLs")
     return xmls
@@ -65,6 +65,9 @@ FOR (c:Committee) REQUIRE c.code IS UNIQUE;
 CREATE CONSTRAINT petition_number IF NOT EXISTS
 FOR (p:Petition) REQUIRE p.number IS UNIQUE;
 
+CREATE CONSTRAINT bill_text_id IF NOT EXISTS
+FOR (bt:BillText) REQUIRE bt.id IS UNIQUE;
+
 // Financial Entities
 CREATE CONSTRAINT expense_id IF NOT EXISTS
 FOR (e:Expense) REQUIRE e.id IS UNIQUE;
@@ -85,5 +88,9 @@ FOR (c:Case) REQUIRE c.id IS UNIQUE;
 CREATE CONSTRAINT legislation_id IF NOT EXISTS
 FOR (l:Legislation) REQUIRE l.id IS UNIQUE;
 
+// Pipeline Bookkeeping (full pipeline resume markers)
+CREATE CONSTRAINT pipeline_stage_name IF NOT EXISTS
+FOR (s:PipelineStage) REQUIRE s.name IS UNIQUE;
+
 // Verify all constraints were created
 SHOW CONSTRAINTS;
@@ -70,6 +70,10 @@ FOR (b:Bill) ON (b.sponsor_mp_id);
 CREATE INDEX bill_number IF NOT EXISTS
 FOR (b:Bill) ON (b.number);
 
+-- BillText.bill_id -> Bill joins (HAS_TEXT)
+CREATE INDEX bill_postgres_id IF NOT EXISTS
+FOR (b:Bill) ON (b.postgres_id);
+
 // ============================================================
 // Vote Indexes (list_votes, analyze_voting_patterns)
 // ============================================================
@@ -113,6 +117,10 @@ FOR (e:Expense) ON (e.amount);
 CREATE INDEX expense_category IF NOT EXISTS
 FOR (e:Expense) ON (e.category);
 
+-- Incremental ingestion (per-source quarter hashes and rewrites)
+CREATE INDEX expense_source_quarter IF NOT EXISTS
+FOR (e:Expense) ON (e.source, e.fiscal_year, e.quarter);
+
 // ============================================================
 // Lobbying Indexes (transparency/accountability queries)
 // ============================================================
@@ -178,6 +186,10 @@ FOR (c:Committee) ON (c.chamber);
 CREATE INDEX committee_active IF NOT EXISTS
 FOR (c:Committee) ON (c.active);
 
+-- Daily meeting import (MERGE by House of Commons meeting id)
+CREATE INDEX meeting_ourcommons_id IF NOT EXISTS
+FOR (m:Meeting) ON (m.ourcommons_meeting_id);
+
 // ============================================================
 // Debate/Statement Indexes (Hansard queries)
 // ============================================================
@@ -198,6 +210,25 @@ FOR (d:Debate) ON (d.parliament);
 CREATE INDEX statement_time IF NOT EXISTS
 FOR (s:Statement) ON (s.time);
 
+-- Hansard/committee sitting date ranges (SPOKE_AT backfill, latest-date stats)
+CREATE INDEX document_date IF NOT EXISTS
+FOR (d:Document) ON (d.date);
+
+CREATE INDEX committee_evidence_date IF NOT EXISTS
+FOR (e:CommitteeEvidence) ON (e.date);
+
+-- Hansard documents by session (daily import sitting index)
+CREATE INDEX document_parliament_session IF NOT EXISTS
+FOR (d:Document) ON (d.parliament_number, d.session_number);
+
+// ============================================================
+// Pipeline Bookkeeping
+// ============================================================
+
+-- Completed stages of a full pipeline run (--resume)
+CREATE INDEX pipeline_stage_run_id IF NOT EXISTS
+FOR (s:PipelineStage) ON (s.run_id);
+
 // ============================================================
 // Verify all indexes
 // ============================================================
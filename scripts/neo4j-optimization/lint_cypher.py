@@ -0,0 +1,586 @@
+#!/usr/bin/env python3
+"""
+Static Cypher Query Linter
+
+Extracts Cypher string literals (including f-strings and concatenations) from
+Python sources and checks them against the indexes and constraints declared in
+this directory's *.cypher scripts. No database connection is needed.
+
+Rules:
+    unindexed-lookup   MATCH/MERGE whose only entry point filters on a property
+                       with no index or uniqueness constraint (label scan)
+    cartesian-product  Disconnected patterns that are not each anchored by an
+                       index lookup or a previously bound variable
+    unbounded-scan     Pattern with no label and no bound variable (all-nodes scan)
+    tolower-contains   toLower(x.prop) CONTAINS ... (never index-backed)
+
+A pattern is "anchored" when one of its nodes is bound by an earlier clause, or
+filters (=, IN, STARTS WITH, range) on an indexed property with a parameter,
+literal or earlier-bound value. Only the first property of a composite index
+counts. The analysis is heuristic: it does not plan queries, it flags shapes
+that force a scan.
+
+Findings are compared with a baseline file (counts per rule, file, enclosing
+function and detail, so unrelated edits and line moves do not re-flag), and
+the run fails only on findings not in the baseline.
+
+Usage:
+    python lint_cypher.py                        # Lint the default source trees
+    python lint_cypher.py packages/data-pipeline # Lint specific files/directories
+    python lint_cypher.py --no-baseline          # Report every finding
+    python lint_cypher.py --update-baseline      # Accept current findings
+    python lint_cypher.py --inline-ddl           # Also count CREATE INDEX found in sources
+
+Requirements:
+    Python 3.9+ (standard library only)
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent.parent
+
+DEFAULT_PATHS = [
+    "packages/data-pipeline",
+    "packages/fedmcp/src",
+    "packages/canadagpt-neo4j-mcp/src",
+    "scripts",
+]
+DEFAULT_BASELINE = SCRIPT_DIR / "cypher-lint-baseline.json"
+SKIP_DIRS = {"__pycache__", ".venv", "venv", "node_modules", ".git", "build", "dist"}
+
+# Placeholder for interpolated parts of f-strings and concatenations
+DYNAMIC = "__dynamic__"
+
+_CYPHER_RE = re.compile(r"\b(?:OPTIONAL\s+MATCH|MATCH|MERGE)\s*\(|\bCREATE\s+(?:\w+\s+)?(?:INDEX|CONSTRAINT)\b", re.I)
+
+_CLAUSE_RE = re.compile(
+    r"(?<![\w.$])("
+    r"ON\s+CREATE\s+SET|ON\s+MATCH\s+SET|OPTIONAL\s+MATCH|DETACH\s+DELETE|ORDER\s+BY|"
+    r"MATCH|MERGE|WHERE|WITH|RETURN|UNWIND|CREATE|SET|DELETE|REMOVE|SKIP|LIMIT|UNION|CALL|YIELD|FOREACH"
+    r")\b",
+    re.I,
+)
+
+_NODE_RE = re.compile(
+    r"\(\s*([A-Za-z_]\w*)?\s*((?:\s*:\s*(?:`[^`]+`|\{\w*\}|[\w|&!%]+))*)\s*(\{[^{}]*\})?\s*\)"
+)
+_REL_RE = re.compile(r"\[\s*([A-Za-z_]\w*)?\s*((?::\s*[\w|`!]+)*)")
+_MAP_ENTRY_RE = re.compile(r"([A-Za-z_]\w*|`[^`]+`)\s*:\s*([^,}]+)")
+
+_OPERAND = r"\$\w+|''|-?\d[\w.]*|\[|[A-Za-z_]\w*(?:\.\w+)*(?:\s*\()?"
+_COMPARISON_RE = re.compile(
+    rf"(?<![\w.$])({_OPERAND})\s*(=~|<>|<=|>=|=|<|>|\bIN\b|\bSTARTS_WITH\b)\s*({_OPERAND})",
+    re.I,
+)
+_PROPERTY_RE = re.compile(r"^([A-Za-z_]\w*)\.(\w+)$")
+_TOLOWER_CONTAINS_RE = re.compile(r"\btoLower\s*\(\s*([A-Za-z_]\w*)\.(\w+)\s*\)\s*CONTAINS\b", re.I)
+
+# Operators an index can serve as a seek
+_SEEKABLE = {"=", "<", ">", "<=", ">=", "IN", "STARTS_WITH"}
+
+_INDEX_RE = re.compile(
+    r"CREATE\s+(?:(RANGE|TEXT|POINT|FULLTEXT|BTREE)\s+)?INDEX(?:\s+(?!IF\b|ON\b|FOR\b)(\w+))?[^;]*?"
+    r"(?:FOR|ON)\s*\(\s*\w*\s*:\s*([\w|`]+)\s*\)\s*ON\s*(?:EACH\s*)?[\[(]([^\])]*)[\])]",
+    re.I | re.S,
+)
+_LEGACY_INDEX_RE = re.compile(r"CREATE\s+INDEX\s+ON\s*:\s*(\w+)\s*\(([^)]*)\)", re.I)
+_CONSTRAINT_RE = re.compile(
+    r"CREATE\s+CONSTRAINT\b[^;]*?(?:FOR|ON)\s*\(\s*\w*\s*:\s*(\w+)\s*\)\s*(?:REQUIRE|ASSERT)\s*"
+    r"\(?([\w.,\s]+?)\)?\s+IS\s+(?:UNIQUE|NODE\s+KEY|KEY)",
+    re.I | re.S,
+)
+
+
+# ============================================================
+# Schema
+# ============================================================
+
+@dataclass
+class Schema:
+    """Indexed (label, property) pairs declared in Cypher DDL."""
+
+    indexed: Set[Tuple[str, str]] = field(default_factory=set)
+    fulltext: Dict[Tuple[str, str], str] = field(default_factory=dict)
+
+    def add_ddl(self, text: str) -> None:
+        text = "\n".join(
+            line for line in text.splitlines()
+            if not line.lstrip().startswith(("//", "--"))
+        )
+        for kind, name, labels, props in _INDEX_RE.findall(text):
+            properties = [p.strip().split(".")[-1] for p in props.split(",") if p.strip()]
+            for label in labels.replace("`", "").split("|"):
+                if kind.upper() in ("FULLTEXT", "TEXT"):
+                    for prop in properties:
+                        self.fulltext[(label, prop)] = name or kind.lower()
+                elif properties:
+                    self.indexed.add((label, properties[0]))
+        for label, props in _LEGACY_INDEX_RE.findall(text):
+            self.indexed.add((label, props.split(",")[0].strip()))
+        for label, props in _CONSTRAINT_RE.findall(text):
+            self.indexed.add((label, props.split(",")[0].strip().split(".")[-1]))
+
+    def is_indexed(self, labels: List[str], prop: str) -> bool:
+        return any((label, prop) in self.indexed for label in labels)
+
+
+def load_schema(paths: List[Path]) -> Schema:
+    schema = Schema()
+    for path in paths:
+        schema.add_ddl(path.read_text())
+    return schema
+
+
+# ============================================================
+# Extraction
+# ============================================================
+
+@dataclass
+class CypherLiteral:
+    """A Cypher string found in Python source."""
+
+    path: str
+    line: int
+    scope: str
+    text: str
+
+
+class _LiteralCollector(ast.NodeVisitor):
+    def __init__(self) -> None:
+        self.scope: List[str] = []
+        self.found: List[Tuple[int, str, str]] = []
+        self._skip: Set[int] = set()
+
+    def _visit_scope(self, node: ast.AST) -> None:
+        self.scope.append(node.name)
+        self.generic_visit(node)
+        self.scope.pop()
+
+    visit_FunctionDef = visit_AsyncFunctionDef = visit_ClassDef = _visit_scope
+
+    def visit_Expr(self, node: ast.Expr) -> None:
+        # Docstrings and bare string statements are not queries
+        if isinstance(node.value, ast.Constant) and isinstance(node.value.value, str):
+            return
+        self.generic_visit(node)
+
+    def _text(self, node: ast.AST) -> Optional[str]:
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            return node.value
+        if isinstance(node, ast.JoinedStr):
+            return "".join(
+                v.value if isinstance(v, ast.Constant) else DYNAMIC
+                for v in node.values
+            )
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+            left, right = self._text(node.left), self._text(node.right)
+            if left is None and right is None:
+                return None
+            return (left if left is not None else DYNAMIC) + (right if right is not None else DYNAMIC)
+        return None
+
+    def _record(self, node: ast.AST) -> None:
+        text = self._text(node)
+        if text is not None and _CYPHER_RE.search(text):
+            self.found.append((node.lineno, ".".join(self.scope) or "<module>", text))
+        for child in ast.walk(node):
+            self._skip.add(id(child))
+
+    def visit_BinOp(self, node: ast.BinOp) -> None:
+        if id(node) not in self._skip and self._text(node) is not None:
+            self._record(node)
+        self.generic_visit(node)
+
+    def visit_JoinedStr(self, node: ast.JoinedStr) -> None:
+        if id(node) not in self._skip:
+            self._record(node)
+
+    def visit_Constant(self, node: ast.Constant) -> None:
+        if id(node) not in self._skip and isinstance(node.value, str):
+            self._record(node)
+
+
+def extract_cypher(path: Path, display_path: str) -> List[CypherLiteral]:
+    """Cypher literals of a Python file, with line and enclosing function."""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    collector = _LiteralCollector()
+    collector.visit(tree)
+    return [CypherLiteral(display_path, line, scope, text) for line, scope, text in collector.found]
+
+
+def iter_python_files(paths: List[Path]) -> Iterator[Path]:
+    for path in paths:
+        if path.is_file():
+            yield path
+            continue
+        for file in sorted(path.rglob("*.py")):
+            if not SKIP_DIRS.intersection(file.relative_to(path).parts):
+                yield file
+
+
+# ============================================================
+# Analysis
+# ============================================================
+
+@dataclass
+class Finding:
+    rule: str
+    path: str
+    line: int
+    scope: str
+    detail: str
+    message: str
+
+    @property
+    def fingerprint(self) -> str:
+        key = f"{self.rule}|{self.path}|{self.scope}|{self.detail}"
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class _Node:
+    var: Optional[str]
+    labels: List[str]
+    dynamic: bool
+    props: List[Tuple[str, str]]
+
+
+def _clean(text: str) -> str:
+    """Blank out string literals and comments (keeping newlines for line numbers)."""
+    out = []
+    i, n = 0, len(text)
+    while i < n:
+        c = text[i]
+        if c in "'\"":
+            j = i + 1
+            while j < n and text[j] != c:
+                j += 2 if text[j] == "\\" else 1
+            out.append("''" + "\n" * text[i:j + 1].count("\n"))
+            i = j + 1
+        elif text.startswith("//", i):
+            j = text.find("\n", i)
+            i = n if j == -1 else j
+        elif text.startswith("/*", i):
+            j = text.find("*/", i)
+            j = n if j == -1 else j + 2
+            out.append("\n" * text[i:j].count("\n"))
+            i = j
+        else:
+            out.append(c)
+            i += 1
+    cleaned = "".join(out)
+    cleaned = re.sub(r"\bSTARTS\s+WITH\b", "STARTS_WITH", cleaned, flags=re.I)
+    return re.sub(r"\bENDS\s+WITH\b", "ENDS_WITH", cleaned, flags=re.I)
+
+
+def _split_top_level(text: str, sep: str = ",") -> List[str]:
+    parts, depth, start = [], 0, 0
+    for i, c in enumerate(text):
+        if c in "([{":
+            depth += 1
+        elif c in ")]}":
+            depth -= 1
+        elif c == sep and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+
+def _parse_nodes(pattern: str) -> List[_Node]:
+    nodes = []
+    for var, label_text, props in _NODE_RE.findall(pattern):
+        labels = [l for l in re.split(r"[:|&!%\s`]+", label_text) if l]
+        dynamic = any(DYNAMIC in l or "{" in l for l in labels)
+        entries = [(k.strip("`"), v.strip()) for k, v in _MAP_ENTRY_RE.findall(props[1:-1])] if props else []
+        nodes.append(_Node(var or None, [l for l in labels if "{" not in l], dynamic, entries))
+    return nodes
+
+
+class _QueryLinter:
+    def __init__(self, literal: CypherLiteral, schema: Schema) -> None:
+        self.literal = literal
+        self.schema = schema
+        self.text = _clean(literal.text)
+        self.findings: List[Finding] = []
+        self.bound: Set[str] = set()
+        self.labels: Dict[str, List[str]] = {}
+
+    def finding(self, rule: str, offset: int, detail: str, message: str) -> None:
+        line = self.literal.line + self.text.count("\n", 0, offset)
+        self.findings.append(Finding(rule, self.literal.path, line, self.literal.scope, detail, message))
+
+    def value_kind(self, value: str, new_vars: Set[str]) -> str:
+        """'const' (parameter, literal or earlier-bound value) or 'join' (same-clause variable)."""
+        head = value.split(".")[0].strip()
+        if value.rstrip().endswith("(") or not re.match(r"[A-Za-z_]", head):
+            return "const"
+        if head in new_vars and head not in self.bound:
+            return "join"
+        return "const"
+
+    def run(self) -> List[Finding]:
+        clauses = [(m.group(1).upper(), m.start(), m.end()) for m in _CLAUSE_RE.finditer(self.text)]
+        for i, (keyword, start, end) in enumerate(clauses):
+            body = self.text[end:clauses[i + 1][1] if i + 1 < len(clauses) else len(self.text)]
+            keyword = re.sub(r"\s+", " ", keyword)
+            if keyword in ("MATCH", "OPTIONAL MATCH", "MERGE"):
+                where = ""
+                if keyword != "MERGE" and i + 1 < len(clauses) and clauses[i + 1][0] == "WHERE":
+                    nxt = clauses[i + 2][1] if i + 2 < len(clauses) else len(self.text)
+                    where = self.text[clauses[i + 1][2]:nxt]
+                self.check_pattern(keyword, start, body, where)
+            elif keyword == "CREATE":
+                for node in _parse_nodes(body):
+                    if node.var:
+                        self.bound.add(node.var)
+                self.bound.update(v for v, _ in _REL_RE.findall(body) if v)
+            elif keyword in ("UNWIND", "WITH", "RETURN"):
+                self.bound.update(re.findall(r"\bAS\s+([A-Za-z_]\w*)", body, re.I))
+            elif keyword == "YIELD":
+                for item in _split_top_level(body.split(" WHERE ")[0]):
+                    names = re.findall(r"[A-Za-z_]\w*", item)
+                    if names:
+                        self.bound.add(names[-1])
+            elif keyword == "FOREACH":
+                self.bound.update(re.findall(r"\(\s*([A-Za-z_]\w*)\s+IN\b", body, re.I))
+
+        for match in _TOLOWER_CONTAINS_RE.finditer(self.text):
+            var, prop = match.groups()
+            labels = self.labels.get(var) or [var]
+            subject = f"{labels[0]}.{prop}"
+            fulltext = next(
+                (self.schema.fulltext[(l, prop)] for l in labels if (l, prop) in self.schema.fulltext), None
+            )
+            hint = f"; query the '{fulltext}' full-text index instead" if fulltext else ""
+            self.finding(
+                "tolower-contains", match.start(), f"toLower({subject}) CONTAINS",
+                f"toLower({subject}) CONTAINS cannot use an index and scans every candidate{hint}",
+            )
+        return self.findings
+
+    def check_pattern(self, keyword: str, offset: int, body: str, where: str) -> None:
+        parts = []
+        for part in _split_top_level(body):
+            part = re.sub(r"^\s*[A-Za-z_]\w*\s*=\s*", "", part)  # Named path
+            nodes = _parse_nodes(part)
+            rels = _REL_RE.findall(part)
+            if not nodes:
+                continue
+            part_vars = {n.var for n in nodes if n.var} | {v for v, _ in rels if v}
+            parts.append({"nodes": nodes, "vars": part_vars, "typed_rels": any(t for _, t in rels)})
+        if not parts:
+            return
+
+        new_vars = set().union(*(p["vars"] for p in parts)) - self.bound
+        for part in parts:
+            for node in part["nodes"]:
+                if node.var and node.labels:
+                    self.labels.setdefault(node.var, node.labels)
+
+        # Predicates per variable: inline property maps, then WHERE comparisons
+        predicates: Dict[str, List[Tuple[str, str, str]]] = {}
+        for part in parts:
+            for node in part["nodes"]:
+                if node.var:
+                    for prop, value in node.props:
+                        predicates.setdefault(node.var, []).append((prop, "=", self.value_kind(value, new_vars)))
+        for left, op, right in _COMPARISON_RE.findall(where):
+            op = op.upper()
+            for subject, value in ((left, right), (right, left)):
+                match = _PROPERTY_RE.match(subject.strip())
+                if match and match.group(1) in new_vars:
+                    predicates.setdefault(match.group(1), []).append(
+                        (match.group(2), op, self.value_kind(value, new_vars) if op in _SEEKABLE else "none")
+                    )
+
+        # Group pattern parts into connected components
+        components: List[Dict] = []
+        for part in parts:
+            merged = [c for c in components if c["vars"] & part["vars"]]
+            component = {"nodes": list(part["nodes"]), "vars": set(part["vars"]), "typed_rels": part["typed_rels"]}
+            for other in merged:
+                components.remove(other)
+                component["nodes"] += other["nodes"]
+                component["vars"] |= other["vars"]
+                component["typed_rels"] = component["typed_rels"] or other["typed_rels"]
+            components.append(component)
+
+        unanchored = []
+        for component in components:
+            anchored = bool(component["vars"] & self.bound)
+            unindexed: List[str] = []
+            anonymous_lookup = False
+            for node in component["nodes"]:
+                if node.dynamic:
+                    anchored = True  # Label chosen at runtime; cannot check
+                    continue
+                if not node.var:
+                    if node.props:
+                        if any(self.schema.is_indexed(node.labels, p) for p, _ in node.props):
+                            anchored = True
+                        elif node.labels:
+                            unindexed += [f"{node.labels[0]}.{p}" for p, _ in node.props]
+                            anonymous_lookup = True
+                    continue
+                for prop, op, kind in predicates.get(node.var, []):
+                    if kind != "const" or op not in _SEEKABLE:
+                        continue
+                    if self.schema.is_indexed(node.labels, prop):
+                        anchored = True
+                    elif node.labels:
+                        unindexed.append(f"{node.labels[0]}.{prop}")
+
+            if anchored:
+                continue
+            unanchored.append(component)
+            labelled = any(n.labels for n in component["nodes"])
+            if not labelled and not component["typed_rels"]:
+                var = next((n.var for n in component["nodes"] if n.var), "")
+                self.finding(
+                    "unbounded-scan", offset, f"({var})",
+                    f"{keyword} ({var}) has no label or bound variable and scans every node",
+                )
+            elif unindexed or anonymous_lookup:
+                detail = ", ".join(sorted(set(unindexed)))
+                self.finding(
+                    "unindexed-lookup", offset, f"{keyword} {detail}",
+                    f"{keyword} looks up {detail} with no index or uniqueness constraint (label scan)",
+                )
+
+        if len(components) > 1 and unanchored:
+            described = []
+            for component in components:
+                node = next((n for n in component["nodes"] if n.labels), component["nodes"][0])
+                described.append(f"({node.var or ''}:{node.labels[0]})" if node.labels else f"({node.var or ''})")
+            detail = ", ".join(described)
+            self.finding(
+                "cartesian-product", offset, detail,
+                f"{keyword} {detail} joins disconnected patterns without an index lookup on each side",
+            )
+
+        self.bound |= new_vars
+
+
+def lint_literal(literal: CypherLiteral, schema: Schema) -> List[Finding]:
+    return _QueryLinter(literal, schema).run()
+
+
+# ============================================================
+# Baseline
+# ============================================================
+
+def load_baseline(path: Path) -> Dict[str, Dict]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text()).get("findings", {})
+
+
+def save_baseline(path: Path, findings: List[Finding]) -> None:
+    entries: Dict[str, Dict] = {}
+    for finding in findings:
+        entry = entries.setdefault(finding.fingerprint, {
+            "rule": finding.rule,
+            "path": finding.path,
+            "scope": finding.scope,
+            "detail": finding.detail,
+            "count": 0,
+        })
+        entry["count"] += 1
+    payload = {"version": 1, "findings": dict(sorted(entries.items(), key=lambda kv: (
+        kv[1]["path"], kv[1]["scope"], kv[1]["rule"], kv[1]["detail"]
+    )))}
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def new_findings(findings: List[Finding], baseline: Dict[str, Dict]) -> List[Finding]:
+    """Findings beyond the count recorded in the baseline for their fingerprint."""
+    allowed = Counter({fp: entry.get("count", 1) for fp, entry in baseline.items()})
+    fresh = []
+    for finding in findings:
+        if allowed[finding.fingerprint] > 0:
+            allowed[finding.fingerprint] -= 1
+        else:
+            fresh.append(finding)
+    return fresh
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+def _display_path(path: Path) -> str:
+    try:
+        return path.resolve().relative_to(REPO_ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Lint Cypher queries embedded in Python sources")
+    parser.add_argument("paths", nargs="*", help="Files or directories to lint (default: maintained packages and scripts)")
+    parser.add_argument("--schema", action="append", type=Path,
+                        help="Cypher DDL file with indexes/constraints (repeatable; default: *.cypher in this directory)")
+    parser.add_argument("--inline-ddl", action="store_true",
+                        help="Also count CREATE INDEX/CONSTRAINT statements found in the linted sources")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline file of accepted findings")
+    parser.add_argument("--no-baseline", action="store_true", help="Report every finding")
+    parser.add_argument("--update-baseline", action="store_true", help="Write current findings to the baseline")
+    parser.add_argument("--rule", action="append", help="Only report these rules (repeatable)")
+    args = parser.parse_args()
+
+    paths = [Path(p) for p in args.paths] or [REPO_ROOT / p for p in DEFAULT_PATHS]
+    schema = load_schema(args.schema or sorted(SCRIPT_DIR.glob("*.cypher")))
+
+    literals: List[CypherLiteral] = []
+    for file in iter_python_files(paths):
+        try:
+            literals.extend(extract_cypher(file, _display_path(file)))
+        except (SyntaxError, UnicodeDecodeError) as e:
+            print(f"⚠️  Skipping {_display_path(file)}: {e}", file=sys.stderr)
+
+    if args.inline_ddl:
+        for literal in literals:
+            schema.add_ddl(literal.text)
+
+    findings = [f for literal in literals for f in lint_literal(literal, schema)]
+    if args.rule:
+        findings = [f for f in findings if f.rule in args.rule]
+    findings.sort(key=lambda f: (f.path, f.line, f.rule))
+
+    if args.update_baseline:
+        save_baseline(args.baseline, findings)
+        print(f"✅ Baseline updated: {len(findings)} findings in {args.baseline}")
+        return 0
+
+    baseline = {} if args.no_baseline else load_baseline(args.baseline)
+    fresh = new_findings(findings, baseline)
+    for finding in fresh:
+        print(f"{finding.path}:{finding.line}: {finding.rule}: {finding.message}")
+
+    by_rule = Counter(f.rule for f in findings)
+    summary = ", ".join(f"{rule}: {count}" for rule, count in sorted(by_rule.items())) or "none"
+    print(f"\nLinted {len(literals)} Cypher literals ({len(schema.indexed)} indexed properties declared)")
+    print(f"Findings: {len(findings)} ({summary})")
+    if baseline:
+        print(f"Baselined: {len(findings) - len(fresh)}, new: {len(fresh)}")
+
+    if fresh:
+        print(f"❌ {len(fresh)} new Cypher performance finding(s)")
+        return 1
+    print("✅ No new findings")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())